@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Benchmark for appointment slot availability calculation.
+
+This script compares the original nested-loop slot search, which checks every
+candidate slot against every existing appointment, with the sweep-line
+AppointmentSlotEngine used by get_available_appointment_slots, for a busy
+multi-veterinarian clinic over a range of dates.
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+# Add the src directory to the path so we can import vet_core
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from vet_core.utils.datetime_utils import (
+    AppointmentSlotEngine,
+    BusinessHours,
+    DayOfWeek,
+    parse_clinic_operating_hours,
+)
+
+
+def legacy_get_available_appointment_slots(
+    date_to_check: date,
+    business_hours: Dict[DayOfWeek, BusinessHours],
+    appointment_duration: timedelta = timedelta(minutes=30),
+    buffer_time: timedelta = timedelta(minutes=15),
+    existing_appointments: Optional[List[Tuple[datetime, datetime]]] = None,
+    timezone: str = "UTC",
+) -> List[datetime]:
+    """Original O(slots x appointments) implementation, kept for comparison."""
+    day_of_week = DayOfWeek(date_to_check.weekday())
+
+    if day_of_week not in business_hours or business_hours[day_of_week].is_closed:
+        return []
+
+    hours = business_hours[day_of_week]
+    start_datetime = datetime.combine(
+        date_to_check, hours.open_time, ZoneInfo(timezone)
+    )
+    end_datetime = datetime.combine(date_to_check, hours.close_time, ZoneInfo(timezone))
+
+    available_slots = []
+    current_slot = start_datetime
+    slot_duration = appointment_duration + buffer_time
+
+    while current_slot + appointment_duration <= end_datetime:
+        slot_end = current_slot + appointment_duration
+
+        is_available = True
+        if existing_appointments:
+            for existing_start, existing_end in existing_appointments:
+                if current_slot < existing_end and slot_end > existing_start:
+                    is_available = False
+                    break
+
+        if is_available:
+            available_slots.append(current_slot)
+
+        current_slot += slot_duration
+
+    return available_slots
+
+
+def build_business_hours() -> Dict[DayOfWeek, BusinessHours]:
+    """Build a typical Monday-Saturday clinic schedule without breaks."""
+    schedule = {
+        day: {"is_open": True, "open_time": "07:00", "close_time": "21:00"}
+        for day in ("monday", "tuesday", "wednesday", "thursday", "friday")
+    }
+    schedule["saturday"] = {
+        "is_open": True,
+        "open_time": "08:00",
+        "close_time": "16:00",
+    }
+    schedule["sunday"] = {"is_open": False}
+    return parse_clinic_operating_hours(schedule)
+
+
+def build_appointments(
+    start_date: date, days: int, per_day: int, seed: int
+) -> List[Tuple[datetime, datetime]]:
+    """Generate random booked appointments spread over the date range."""
+    rng = random.Random(seed)
+    tz = ZoneInfo("UTC")
+    appointments = []
+    for day_offset in range(days):
+        day = start_date + timedelta(days=day_offset)
+        for _ in range(per_day):
+            minute = rng.randrange(7 * 60, 20 * 60, 5)
+            start = datetime.combine(day, datetime.min.time(), tz) + timedelta(
+                minutes=minute
+            )
+            appointments.append(
+                (start, start + timedelta(minutes=rng.choice([15, 30, 45])))
+            )
+    rng.shuffle(appointments)
+    return appointments
+
+
+def run_benchmark(days: int, per_day: int, slot_minutes: int, repeat: int) -> None:
+    """Run both implementations over the same data and report timings."""
+    business_hours = build_business_hours()
+    start_date = date(2030, 1, 7)
+    appointments = build_appointments(start_date, days, per_day, seed=42)
+    duration = timedelta(minutes=slot_minutes)
+    buffer_time = timedelta(0)
+    dates = [start_date + timedelta(days=offset) for offset in range(days)]
+
+    legacy_result: Dict[date, List[datetime]] = {}
+    started = time.perf_counter()
+    for _ in range(repeat):
+        legacy_result = {
+            day: legacy_get_available_appointment_slots(
+                day,
+                business_hours,
+                appointment_duration=duration,
+                buffer_time=buffer_time,
+                existing_appointments=appointments,
+            )
+            for day in dates
+        }
+    legacy_time = (time.perf_counter() - started) / repeat
+
+    engine_result: Dict[date, List[datetime]] = {}
+    started = time.perf_counter()
+    for _ in range(repeat):
+        engine = AppointmentSlotEngine(
+            business_hours,
+            appointments,
+            appointment_duration=duration,
+            buffer_time=buffer_time,
+        )
+        engine_result = engine.get_slots_for_range(dates[0], dates[-1])
+    engine_time = (time.perf_counter() - started) / repeat
+
+    if engine_result != legacy_result:
+        print("ERROR: implementations returned different slots")
+        sys.exit(1)
+
+    total_slots = sum(len(slots) for slots in engine_result.values())
+    print(f"Days: {days}, appointments: {len(appointments)}, free slots: {total_slots}")
+    print(f"Nested loop:  {legacy_time * 1000:10.2f} ms")
+    print(f"Sweep engine: {engine_time * 1000:10.2f} ms")
+    print(f"Speedup:      {legacy_time / engine_time:10.1f}x")
+
+
+def main() -> None:
+    """Parse command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=90, help="Days in the range")
+    parser.add_argument(
+        "--per-day", type=int, default=60, help="Booked appointments per day"
+    )
+    parser.add_argument(
+        "--slot-minutes", type=int, default=15, help="Appointment slot length"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions")
+    args = parser.parse_args()
+
+    run_benchmark(args.days, args.per_day, args.slot_minutes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
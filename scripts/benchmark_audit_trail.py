@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark for SecurityAuditTrail database writes.
+
+This script logs a burst of vulnerability detection events, as a large scan
+does, and compares the original approach of opening a connection and
+committing once per event with the buffered, batched writes over a
+persistent WAL-mode connection now used by SecurityAuditTrail.
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List
+
+# Add the src directory to the path so we can import vet_core
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from vet_core.security.audit_trail import (
+    AuditEvent,
+    AuditEventType,
+    SecurityAuditTrail,
+)
+from vet_core.security.models import VulnerabilitySeverity
+
+
+def legacy_log_to_database(db_path: Path, event: AuditEvent) -> None:
+    """Original implementation: one connection and one commit per event."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            INSERT INTO audit_events (
+                event_id, event_type, timestamp, vulnerability_id, package_name,
+                severity, action_taken, outcome, user_id, system_component,
+                details, metadata
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                event.event_id,
+                event.event_type.value,
+                event.timestamp.isoformat(),
+                event.vulnerability_id,
+                event.package_name,
+                event.severity.value if event.severity else None,
+                event.action_taken,
+                event.outcome,
+                event.user_id,
+                event.system_component,
+                json.dumps(event.details),
+                json.dumps(event.metadata),
+            ),
+        )
+        conn.commit()
+
+
+def build_events(count: int) -> List[AuditEvent]:
+    """Build vulnerability detection events like those logged during a scan."""
+    return [
+        AuditEvent(
+            event_type=AuditEventType.VULNERABILITY_DETECTED,
+            timestamp=datetime.now(),
+            vulnerability_id=f"PYSEC-2024-{i}",
+            package_name=f"package-{i % 50}",
+            severity=VulnerabilitySeverity.HIGH,
+            action_taken="vulnerability_detected",
+            outcome="pending_assessment",
+            details={"cvss_score": 7.5, "fix_versions": ["1.2.3"]},
+        )
+        for i in range(count)
+    ]
+
+
+def time_run(log: Callable[[AuditEvent], None], events: List[AuditEvent]) -> float:
+    """Log every event and return the elapsed time in seconds."""
+    started = time.perf_counter()
+    for event in events:
+        log(event)
+    return time.perf_counter() - started
+
+
+def run_benchmark(count: int, batch_size: int) -> None:
+    """Log the same events with both approaches and report throughput."""
+    with tempfile.TemporaryDirectory() as directory:
+        directory_path = Path(directory)
+
+        legacy_trail = SecurityAuditTrail(
+            audit_db_path=directory_path / "legacy.db",
+            log_file_path=directory_path / "legacy.log",
+        )
+        legacy_trail.close()
+        legacy_time = time_run(
+            lambda event: legacy_log_to_database(legacy_trail.audit_db_path, event),
+            build_events(count),
+        )
+
+        audit_trail = SecurityAuditTrail(
+            audit_db_path=directory_path / "buffered.db",
+            log_file_path=directory_path / "buffered.log",
+            batch_size=batch_size,
+        )
+        # Include the final flush performed by close() in the timing
+        buffered_time = time_run(audit_trail._log_to_database, build_events(count))
+        started = time.perf_counter()
+        audit_trail.close()
+        buffered_time += time.perf_counter() - started
+
+        with sqlite3.connect(audit_trail.audit_db_path) as conn:
+            stored = conn.execute("SELECT COUNT(*) FROM audit_events").fetchone()[0]
+        if stored != count:
+            print(f"ERROR: expected {count} stored events, found {stored}")
+            sys.exit(1)
+
+    print(f"Events: {count}, batch size: {batch_size}")
+    print(f"Connection per event: {count / legacy_time:12.0f} events/s")
+    print(f"Buffered WAL writes:  {count / buffered_time:12.0f} events/s")
+    print(f"Speedup:              {legacy_time / buffered_time:12.1f}x")
+
+
+def main() -> None:
+    """Parse command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=2000, help="Events to log")
+    parser.add_argument(
+        "--batch-size", type=int, default=100, help="Buffered events per write"
+    )
+    args = parser.parse_args()
+
+    run_benchmark(args.events, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
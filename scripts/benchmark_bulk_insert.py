@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark for bulk model inserts.
+
+This script writes the same batch of pets into a temporary SQLite database
+twice: once by adding Pet objects to the session and flushing, as an import
+job would today, and once with bulk_insert, which writes plain row
+dictionaries with batched executemany inserts. On PostgreSQL with asyncpg,
+bulk_insert uses the COPY protocol instead.
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add the src directory to the path so we can import vet_core
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from vet_core.database import bulk_insert
+from vet_core.models import Pet, PetSpecies, User
+from vet_core.models.base import Base
+
+SPECIES = (PetSpecies.DOG, PetSpecies.CAT, PetSpecies.RABBIT, PetSpecies.BIRD)
+
+
+def build_rows(owner_id: uuid.UUID, count: int) -> List[Dict[str, Any]]:
+    """Build pet rows as an import job would read them."""
+    return [
+        {
+            "owner_id": owner_id,
+            "name": f"Pet {i}",
+            "species": SPECIES[i % len(SPECIES)],
+            "breed": "Mixed",
+            "microchip_id": f"MC{i:012d}",
+        }
+        for i in range(count)
+    ]
+
+
+async def orm_insert(session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+    """Original approach: one Pet object per row and a unit-of-work flush."""
+    session.add_all(Pet(**row) for row in rows)
+    await session.flush()
+
+
+async def run_benchmark(rows: int, batch_size: int) -> None:
+    """Populate two databases and time both insert implementations."""
+    timings = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("session.add", "bulk_insert"):
+            engine = create_async_engine(f"sqlite+aiosqlite:///{directory}/{name}.db")
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+            async with session_factory() as session:
+                owner = User(
+                    clerk_user_id="bench_owner",
+                    email="owner@example.com",
+                    first_name="Bench",
+                    last_name="Owner",
+                )
+                session.add(owner)
+                await session.commit()
+                pet_rows = build_rows(owner.id, rows)
+
+                started = time.perf_counter()
+                if name == "bulk_insert":
+                    await bulk_insert(session, Pet, pet_rows, batch_size=batch_size)
+                else:
+                    await orm_insert(session, pet_rows)
+                await session.commit()
+                timings[name] = time.perf_counter() - started
+
+                written = await session.scalar(select(func.count()).select_from(Pet))
+                if written != rows:
+                    print(f"ERROR: {name} wrote {written} of {rows} rows")
+                    sys.exit(1)
+
+            await engine.dispose()
+
+    print(f"Rows: {rows}, batch size: {batch_size}")
+    for name, elapsed in timings.items():
+        print(f"{name + ':':14}{elapsed * 1000:10.2f} ms{rows / elapsed:12.0f} rows/s")
+
+
+def main() -> None:
+    """Parse command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000, help="Pets to insert")
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="Rows per bulk statement"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.rows, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
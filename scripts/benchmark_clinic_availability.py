@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Benchmark for clinic-wide appointment availability.
+
+This script fills a temporary SQLite database with a clinic, its
+veterinarians and their booked appointments, then compares building the
+booking calendar one veterinarian at a time (one appointment query per
+veterinarian and a slot search per day) with get_clinic_availability, which
+uses one roster query and one appointment query for the whole clinic.
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List
+
+# Add the src directory to the path so we can import vet_core
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from vet_core.models import Appointment, Clinic, User, UserRole, Veterinarian
+from vet_core.models.appointment import AppointmentStatus, ServiceType
+from vet_core.models.base import Base
+from vet_core.repositories import get_clinic_availability
+from vet_core.schemas.appointment import ClinicSlotAvailability
+from vet_core.utils.datetime_utils import (
+    get_available_appointment_slots,
+    intersect_business_hours,
+    parse_clinic_operating_hours,
+    parse_veterinarian_availability,
+)
+
+START = datetime(2030, 1, 7, tzinfo=timezone.utc)
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday")
+
+
+async def populate(
+    session: AsyncSession, veterinarians: int, days: int, per_day: int
+) -> uuid.UUID:
+    """Create a clinic with veterinarians and random appointments."""
+    rng = random.Random(42)
+    clinic = Clinic(
+        name="Benchmark Clinic",
+        phone_number="555-123-4567",
+        address_line1="1 Main Street",
+        city="Springfield",
+        state="IL",
+        postal_code="62701",
+        timezone="UTC",
+        operating_hours={
+            day: {
+                "is_open": True,
+                "open_time": "07:00",
+                "close_time": "20:00",
+                "lunch_break": {"start": "12:00", "end": "13:00"},
+            }
+            for day in WEEKDAYS
+        },
+    )
+    session.add(clinic)
+    await session.flush()
+
+    for index in range(veterinarians):
+        user = User(
+            clerk_user_id=f"user_{index}",
+            email=f"vet{index}@example.com",
+            first_name="Bench",
+            last_name=f"Vet {index}",
+            role=UserRole.VETERINARIAN,
+        )
+        session.add(user)
+        await session.flush()
+
+        start_hour = rng.choice([7, 8, 9])
+        veterinarian = Veterinarian(
+            user_id=user.id,
+            clinic_id=clinic.id,
+            license_number=f"BENCH{index:04d}",
+            license_state="IL",
+            availability={
+                day: {
+                    "is_available": True,
+                    "start_time": f"{start_hour:02d}:00",
+                    "end_time": f"{start_hour + 9:02d}:00",
+                    "breaks": [{"start": "15:00", "end": "15:15"}],
+                }
+                for day in WEEKDAYS
+            },
+        )
+        session.add(veterinarian)
+        await session.flush()
+
+        for day_offset in range(days):
+            day_start = START + timedelta(days=day_offset)
+            for _ in range(per_day):
+                scheduled_at = day_start + timedelta(
+                    minutes=rng.randrange(7 * 60, 19 * 60, 15)
+                )
+                session.add(
+                    Appointment(
+                        pet_id=uuid.uuid4(),
+                        veterinarian_id=veterinarian.id,
+                        clinic_id=clinic.id,
+                        scheduled_at=scheduled_at,
+                        duration_minutes=rng.choice([15, 30, 45]),
+                        service_type=ServiceType.WELLNESS_EXAM,
+                        status=rng.choice(
+                            [AppointmentStatus.SCHEDULED, AppointmentStatus.CANCELLED]
+                        ),
+                    )
+                )
+
+    await session.commit()
+    return clinic.id
+
+
+async def per_veterinarian_calendar(
+    session: AsyncSession, request: ClinicSlotAvailability
+) -> Dict[uuid.UUID, Dict[date, List[datetime]]]:
+    """Build the calendar with one appointment query per veterinarian."""
+    clinic = await session.get(Clinic, request.clinic_id)
+    clinic_hours = parse_clinic_operating_hours(clinic.operating_hours)
+    veterinarians = (
+        await session.execute(
+            select(Veterinarian).where(Veterinarian.clinic_id == request.clinic_id)
+        )
+    ).scalars()
+
+    calendar: Dict[uuid.UUID, Dict[date, List[datetime]]] = {}
+    for veterinarian in veterinarians:
+        appointments = (
+            await session.execute(
+                select(Appointment).where(
+                    Appointment.veterinarian_id == veterinarian.id,
+                    Appointment.status != AppointmentStatus.CANCELLED,
+                )
+            )
+        ).scalars()
+        booked = []
+        for appointment in appointments:
+            start = appointment.scheduled_at.replace(tzinfo=timezone.utc)
+            booked.append(
+                (start, start + timedelta(minutes=appointment.duration_minutes))
+            )
+
+        hours = intersect_business_hours(
+            clinic_hours, parse_veterinarian_availability(veterinarian.availability)
+        )
+        days = (request.end_date.date() - request.start_date.date()).days
+        calendar[veterinarian.id] = {}
+        for offset in range(days + 1):
+            day = request.start_date.date() + timedelta(days=offset)
+            calendar[veterinarian.id][day] = [
+                slot
+                for slot in get_available_appointment_slots(
+                    day,
+                    hours,
+                    appointment_duration=timedelta(minutes=request.duration_minutes),
+                    existing_appointments=booked,
+                )
+                if request.start_date <= slot
+                and slot + timedelta(minutes=request.duration_minutes)
+                <= request.end_date
+            ]
+
+    return calendar
+
+
+async def run_benchmark(
+    veterinarians: int, days: int, per_day: int, repeat: int
+) -> None:
+    """Populate a database and time both calendar implementations."""
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{directory}/benchmark.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with session_factory() as session:
+            clinic_id = await populate(session, veterinarians, days, per_day)
+
+        request = ClinicSlotAvailability(
+            clinic_id=clinic_id,
+            start_date=START,
+            end_date=START + timedelta(days=days),
+        )
+
+        timings = {}
+        results = {}
+        for name, build in (
+            ("Per veterinarian", per_veterinarian_calendar),
+            ("Bulk calendar", get_clinic_availability),
+        ):
+            started = time.perf_counter()
+            for _ in range(repeat):
+                async with session_factory() as session:
+                    results[name] = await build(session, request)
+            timings[name] = (time.perf_counter() - started) / repeat
+
+        await engine.dispose()
+
+    legacy, bulk = results.values()
+    if legacy != bulk:
+        print("ERROR: implementations returned different slots")
+        sys.exit(1)
+
+    total_slots = sum(
+        len(slots) for by_date in bulk.values() for slots in by_date.values()
+    )
+    print(
+        f"Veterinarians: {veterinarians}, days: {days}, "
+        f"appointments: {veterinarians * days * per_day}, free slots: {total_slots}"
+    )
+    for name, elapsed in timings.items():
+        print(f"{name + ':':18}{elapsed * 1000:10.2f} ms")
+
+
+def main() -> None:
+    """Parse command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--veterinarians", type=int, default=30, help="Veterinarians in the clinic"
+    )
+    parser.add_argument("--days", type=int, default=14, help="Days in the range")
+    parser.add_argument(
+        "--per-day", type=int, default=8, help="Appointments per veterinarian per day"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.veterinarians, args.days, args.per_day, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark for streaming appointment exports.
+
+This script fills a temporary SQLite database with appointments and
+exports them to NDJSON twice: once by loading the whole result set with
+session.execute() and serializing the ORM objects, as the nightly reports
+do today, and once with export_rows, which streams chunks of rows through a
+server-side cursor. It reports the time and the peak traced memory of each;
+run it with different --rows values to see the streaming peak stay flat.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Tuple
+
+# Add the src directory to the path so we can import vet_core
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from vet_core.database import bulk_insert, export_rows
+from vet_core.models import Appointment, ServiceType
+from vet_core.models.base import Base
+
+START = datetime(2030, 1, 7, tzinfo=timezone.utc)
+
+
+async def populate(session: AsyncSession, rows: int) -> None:
+    """Insert appointments spread over several clinics."""
+    clinics = [uuid.uuid4() for _ in range(10)]
+    await bulk_insert(
+        session,
+        Appointment,
+        (
+            {
+                "pet_id": uuid.uuid4(),
+                "veterinarian_id": uuid.uuid4(),
+                "clinic_id": clinics[i % len(clinics)],
+                "scheduled_at": START + timedelta(minutes=15 * i),
+                "service_type": ServiceType.WELLNESS_EXAM,
+                "reason": "Annual wellness exam and vaccination review",
+            }
+            for i in range(rows)
+        ),
+    )
+    await session.commit()
+
+
+async def load_all_export(session: AsyncSession, path: Path) -> int:
+    """Original approach: load every appointment, then serialize them."""
+    appointments = (await session.execute(select(Appointment))).scalars().all()
+    with open(path, "w", encoding="utf-8") as file:
+        for appointment in appointments:
+            record = appointment.to_dict()
+            file.write(json.dumps(record, default=lambda value: value.value) + "\n")
+    return len(appointments)
+
+
+async def streaming_export(session: AsyncSession, path: Path) -> int:
+    """Stream appointments through a server-side cursor."""
+    return await export_rows(session, select(Appointment), path)
+
+
+async def measure(
+    export: Callable[[AsyncSession, Path], Awaitable[int]],
+    session_factory: Any,
+    path: Path,
+) -> Tuple[int, float, int]:
+    """Run an export and return its row count, time and peak memory."""
+    async with session_factory() as session:
+        tracemalloc.start()
+        started = time.perf_counter()
+        count = await export(session, path)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return count, elapsed, peak
+
+
+async def run_benchmark(rows: int) -> None:
+    """Populate a database and measure both export implementations."""
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{directory}/benchmark.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with session_factory() as session:
+            await populate(session, rows)
+
+        results = {}
+        for name, export in (
+            ("Load all", load_all_export),
+            ("Streaming", streaming_export),
+        ):
+            results[name] = await measure(
+                export, session_factory, Path(directory) / f"{name}.ndjson"
+            )
+
+        await engine.dispose()
+
+    print(f"Appointments: {rows}")
+    for name, (count, elapsed, peak) in results.items():
+        if count != rows:
+            print(f"ERROR: {name} exported {count} of {rows} rows")
+            sys.exit(1)
+        print(f"{name + ':':12}{elapsed * 1000:10.2f} ms{peak / 2**20:10.1f} MiB peak")
+
+
+def main() -> None:
+    """Parse command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows", type=int, default=20_000, help="Appointments to export"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Benchmark for JSONType bind and result processing.
+
+This script builds pet payloads with long vaccination_records and
+medical_history values and compares the original processing, which copied
+every record and scanned the date fields separately for each record shape,
+with the single-pass, copy-on-change normalization and the orjson codec now
+used by JSONType on SQLite. Both the read path (decode and normalize) and
+the write path (normalize and encode) are timed.
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add the src directory to the path so we can import vet_core
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy.dialects import sqlite
+
+from vet_core.database import types
+from vet_core.database.types import JSONType
+
+LEGACY_DATE_FIELDS = ["date", "next_due_date", "date_discovered", "date_recorded"]
+
+
+def legacy_format_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Original record formatting: always copy, then fix the date fields."""
+    formatted = record.copy()
+    for field_name in LEGACY_DATE_FIELDS:
+        if field_name in formatted and formatted[field_name]:
+            date_value = formatted[field_name]
+            if isinstance(date_value, str) and "T" in date_value:
+                formatted[field_name] = date_value.split("T")[0]
+    return formatted
+
+
+def legacy_process(value: Any) -> Any:
+    """Original JSONType processing, identical on the bind and result paths."""
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [
+            legacy_format_record(item) if isinstance(item, dict) else item
+            for item in value
+        ]
+    if isinstance(value, dict):
+        formatted = legacy_format_record(value)
+        if "records" in formatted and isinstance(formatted["records"], list):
+            formatted["records"] = [
+                legacy_format_record(record) if isinstance(record, dict) else record
+                for record in formatted["records"]
+            ]
+        return formatted
+    return value
+
+
+def build_pet_payloads(count: int, records: int) -> List[Dict[str, Any]]:
+    """Build JSON column values like those stored for long-lived pets."""
+    rng = random.Random(42)
+    vaccines = ["Rabies", "DHPP", "Bordetella", "Leptospirosis", "FVRCP"]
+    start = date(2015, 1, 1)
+    payloads = []
+    for _ in range(count):
+        vaccinations = []
+        history = []
+        for index in range(records):
+            given = start + timedelta(days=rng.randint(0, 3000))
+            vaccinations.append(
+                {
+                    "vaccine_type": rng.choice(vaccines),
+                    "date": given.isoformat(),
+                    "veterinarian": f"Dr. {rng.choice(['Smith', 'Lee', 'Patel'])}",
+                    "batch_number": f"VAC{rng.randint(100000, 999999)}",
+                    "next_due_date": (given + timedelta(days=365)).isoformat(),
+                    "notes": "No adverse reactions",
+                    "recorded_at": datetime(2024, 1, 1, 9, index % 60).isoformat(),
+                }
+            )
+            history.append(
+                {
+                    "type": rng.choice(["checkup", "dental", "surgery", "lab"]),
+                    "description": "Routine visit with full examination",
+                    "date": given.isoformat(),
+                    "veterinarian": "Dr. Smith",
+                    "diagnosis": "Healthy",
+                    "treatment": "None required",
+                    "follow_up_needed": rng.random() < 0.2,
+                    "recorded_at": datetime(2024, 1, 1, 9, index % 60).isoformat(),
+                }
+            )
+        payloads.append(
+            {
+                "vaccination_records": vaccinations,
+                "medical_history": {
+                    "records": history,
+                    "weight_history": [
+                        {"weight_kg": 20 + i / 10, "date": "2024-01-01T09:00:00"}
+                        for i in range(records // 4)
+                    ],
+                },
+            }
+        )
+    return payloads
+
+
+def time_run(process: Callable[[Any], Any], values: List[Any], repeat: int) -> float:
+    """Process every value repeatedly and return the best elapsed time."""
+    best = float("inf")
+    # Collect garbage between runs rather than during them, as timeit does
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for value in values:
+                process(value)
+            best = min(best, time.perf_counter() - started)
+            gc.collect()
+    finally:
+        gc.enable()
+    return best
+
+
+def run_benchmark(pets: int, records: int, repeat: int) -> None:
+    """Process the same payloads both ways and report the timings."""
+    payloads = build_pet_payloads(pets, records)
+    values = [payload[column] for payload in payloads for column in payload]
+    documents = [json.dumps(value) for value in values]
+
+    dialect = sqlite.dialect()
+    column_type = JSONType()
+    bind = column_type.bind_processor(dialect)
+    result = column_type.result_processor(dialect, None)
+
+    for value, document in zip(values, documents):
+        if result(document) != legacy_process(json.loads(document)):
+            print("ERROR: normalized values differ from the original processing")
+            sys.exit(1)
+        if json.loads(bind(value)) != legacy_process(value):
+            print("ERROR: stored values differ from the original processing")
+            sys.exit(1)
+
+    timings = {
+        "read": (
+            time_run(lambda doc: legacy_process(json.loads(doc)), documents, repeat),
+            time_run(result, documents, repeat),
+        ),
+        "write": (
+            time_run(lambda value: json.dumps(legacy_process(value)), values, repeat),
+            time_run(bind, values, repeat),
+        ),
+        "normalize only": (
+            time_run(legacy_process, values, repeat),
+            time_run(column_type.normalize, values, repeat),
+        ),
+    }
+
+    codec = "orjson" if types.ORJSON_AVAILABLE else "json"
+    print(f"Pets: {pets}, records per column: {records}, codec: {codec}")
+    print(f"{'Path':<16}{'Original':>12}{'JSONType':>12}{'Speedup':>10}")
+    for name, (legacy_time, new_time) in timings.items():
+        print(
+            f"{name:<16}{legacy_time * 1000:>10.1f}ms{new_time * 1000:>10.1f}ms"
+            f"{legacy_time / new_time:>9.1f}x"
+        )
+
+
+def main() -> None:
+    """Parse command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pets", type=int, default=500, help="Pet rows to process")
+    parser.add_argument(
+        "--records", type=int, default=40, help="Records per JSON column"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions")
+    args = parser.parse_args()
+
+    run_benchmark(args.pets, args.records, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
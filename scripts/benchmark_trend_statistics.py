@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark for trend statistics over many metric series.
+
+This script generates synthetic metric series totalling about one million
+points and computes slopes, r², moving averages and z-scores for all of them,
+first with the pure-Python path and then with the batched NumPy path used by
+SecurityMetricsAnalyzer when NumPy is installed. It also groups one long
+series of timestamped points into daily periods with both paths.
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add the src directory to the path so we can import vet_core
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from vet_core.security import trend_statistics
+from vet_core.security.trend_statistics import (
+    aggregate_series,
+    compute_series_statistics,
+)
+
+
+def time_call(function, *args, **kwargs):
+    """Call a function and return its result and the elapsed seconds."""
+    started = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def run_benchmark(series_count: int, points: int, window: int) -> None:
+    """Compute statistics with both paths and report the timings."""
+    if not trend_statistics.NUMPY_AVAILABLE:
+        print("ERROR: NumPy is not installed; install it to compare both paths")
+        sys.exit(1)
+
+    rng = random.Random(42)
+    series = {
+        f"metric-{index}": [
+            index % 7 + 0.01 * position + rng.gauss(0, 1) for position in range(points)
+        ]
+        for index in range(series_count)
+    }
+
+    python, python_time = time_call(
+        compute_series_statistics, series, window, use_numpy=False
+    )
+    vectorized, numpy_time = time_call(
+        compute_series_statistics, series, window, use_numpy=True
+    )
+    for name, expected in python.items():
+        if abs(vectorized[name].slope - expected.slope) > 1e-9:
+            print(f"ERROR: slopes differ for {name}")
+            sys.exit(1)
+
+    start = datetime(2030, 1, 1)
+    total = series_count * points
+    timestamps = [start + timedelta(seconds=30 * i) for i in range(total)]
+    values = [value for metric in series.values() for value in metric]
+    _, python_group_time = time_call(
+        aggregate_series, timestamps, values, "daily", use_numpy=False
+    )
+    _, numpy_group_time = time_call(
+        aggregate_series, timestamps, values, "daily", use_numpy=True
+    )
+
+    print(f"Series: {series_count}, points per series: {points}, total: {total}")
+    print(f"{'':22}{'Python':>12}{'NumPy':>12}{'Speedup':>10}")
+    for label, slow, fast in (
+        ("Series statistics:", python_time, numpy_time),
+        ("Daily grouping:", python_group_time, numpy_group_time),
+    ):
+        print(
+            f"{label:22}{slow * 1000:10.0f}ms{fast * 1000:10.0f}ms{slow / fast:9.1f}x"
+        )
+
+
+def main() -> None:
+    """Parse command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--series", type=int, default=1000, help="Metric series")
+    parser.add_argument(
+        "--points", type=int, default=1000, help="Points in each metric series"
+    )
+    parser.add_argument("--window", type=int, default=7, help="Moving average window")
+    args = parser.parse_args()
+
+    run_benchmark(args.series, args.points, args.window)
+
+
+if __name__ == "__main__":
+    main()
@@ -51,7 +51,7 @@ __license__ = "MIT"
 __copyright__ = "Copyright 2025 Vet Clinic Platform Team"
 
 # Import implemented modules
-from . import database, exceptions, models, schemas, utils
+from . import database, exceptions, models, repositories, schemas, utils
 
 # Convenience imports for common usage patterns
 from .database import create_engine, get_session, get_transaction
@@ -69,6 +69,7 @@ __all__ = [
     "database",
     "exceptions",
     "models",
+    "repositories",
     "schemas",
     "utils",
     # Convenience imports
@@ -5,6 +5,8 @@ This module provides async SQLAlchemy engine configuration, session management,
 migration utilities, and database utilities for the veterinary clinic platform.
 """
 
+from .bulk import bulk_insert, bulk_upsert
+from .cache import CacheBackend, CacheStats, EntityCache, LRUCache
 from .connection import (
     DatabaseConfig,
     check_connection,
@@ -16,6 +18,14 @@ from .connection import (
     get_database_url,
     wait_for_database,
 )
+from .export import ExportFormat, export_rows, iter_export, stream_rows
+from .health import HealthMonitor, HealthSnapshot, PoolSaturation
+from .instrumentation import (
+    QueryInstrumentation,
+    QueryStatsSnapshot,
+    get_instrumentation,
+    instrument_engine,
+)
 from .migrations import (
     MigrationManager,
     create_initial_migration,
@@ -23,13 +33,50 @@ from .migrations import (
     run_migrations_async,
     validate_database_schema,
 )
+from .nplusone import (
+    NPlusOneAction,
+    NPlusOneDetector,
+    QueryScope,
+    RepeatedQuery,
+    detect_nplusone,
+)
+from .pagination import (
+    Page,
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+    paginate,
+)
+from .replicas import (
+    ReplicaRouter,
+    ReplicaState,
+    ReplicaStrategy,
+    clear_write,
+    record_write,
+)
+from .resilience import (
+    CircuitBreaker,
+    CircuitState,
+    ResilienceStats,
+    ResilientExecutor,
+    RetryPolicy,
+    deadline,
+    get_resilient_executor,
+    is_transient_error,
+    remaining_time,
+)
 from .session import (
     AsyncSessionLocal,
     SessionManager,
     cleanup_database,
     execute_with_retry,
+    get_cache_stats,
     get_engine,
+    get_health_snapshot,
     get_pool_status,
+    get_query_stats,
+    get_resilience_stats,
     get_session,
     get_session_manager,
     get_transaction,
@@ -37,6 +84,16 @@ from .session import (
     initialize_database,
     initialize_session_manager,
 )
+from .sharding import (
+    ConsistentHashDirectory,
+    ShardDirectory,
+    ShardRouter,
+    clinic_context,
+    get_current_clinic,
+    get_shard_router,
+    get_shard_session,
+    initialize_shard_router,
+)
 
 __all__ = [
     # Connection utilities
@@ -61,7 +118,71 @@ __all__ = [
     "initialize_database",
     "cleanup_database",
     "get_pool_status",
+    "get_query_stats",
+    "get_health_snapshot",
     "AsyncSessionLocal",
+    "get_resilience_stats",
+    "get_cache_stats",
+    # Entity cache
+    "EntityCache",
+    "CacheBackend",
+    "CacheStats",
+    "LRUCache",
+    # Read replica routing
+    "ReplicaRouter",
+    "ReplicaState",
+    "ReplicaStrategy",
+    "record_write",
+    "clear_write",
+    # Clinic sharding
+    "ShardRouter",
+    "ShardDirectory",
+    "ConsistentHashDirectory",
+    "clinic_context",
+    "get_current_clinic",
+    "initialize_shard_router",
+    "get_shard_router",
+    "get_shard_session",
+    # Resilient execution
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitState",
+    "ResilientExecutor",
+    "ResilienceStats",
+    "get_resilient_executor",
+    "is_transient_error",
+    "deadline",
+    "remaining_time",
+    # Health monitoring
+    "HealthMonitor",
+    "HealthSnapshot",
+    "PoolSaturation",
+    # Query instrumentation
+    "QueryInstrumentation",
+    "QueryStatsSnapshot",
+    "instrument_engine",
+    "get_instrumentation",
+    # N+1 query detection
+    "NPlusOneDetector",
+    "NPlusOneAction",
+    "QueryScope",
+    "RepeatedQuery",
+    "detect_nplusone",
+    # Bulk write utilities
+    "bulk_insert",
+    "bulk_upsert",
+    # Streaming export utilities
+    "ExportFormat",
+    "export_rows",
+    "iter_export",
+    "stream_rows",
+    # Pagination utilities
+    "Page",
+    "encode_cursor",
+    "decode_cursor",
+    "keyset_condition",
+    "clamp_page_size",
+    "paginate",
     # Migration utilities
     "MigrationManager",
     "run_migrations_async",
@@ -0,0 +1,272 @@
+"""
+Bulk insert and upsert utilities for the vet-core package.
+
+Adding tens of thousands of objects with ``session.add()`` pays for a model
+instance, attribute instrumentation and unit-of-work bookkeeping per row.
+These helpers instead write plain dictionaries with Core statements:
+
+- ``bulk_insert`` streams rows into the table with the PostgreSQL COPY
+  protocol when the session runs on asyncpg, and otherwise with batched
+  ``executemany`` inserts
+- ``bulk_upsert`` runs batched ``INSERT ... ON CONFLICT`` statements on
+  PostgreSQL and SQLite
+
+Rows are dictionaries keyed by column name. Missing columns get their
+Python-side defaults (such as a new UUID ``id``) or are left to the server
+default; no ORM objects are created and the session identity map is not
+touched.
+
+Example:
+    >>> async with get_transaction() as session:
+    ...     await bulk_insert(session, Pet, pet_rows)
+    ...     await bulk_upsert(session, User, user_rows, ["email"])
+"""
+
+import logging
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set
+
+from sqlalchemy import Table, func, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Columns an upsert never overwrites on conflict
+_INSERT_ONLY_COLUMNS = frozenset({"id", "created_at", "created_by"})
+
+
+def _batches(
+    rows: Iterable[Dict[str, Any]], batch_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """Split rows into lists of at most batch_size rows."""
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _python_default(column: Any) -> Any:
+    """Evaluate a column's Python-side scalar or callable default."""
+    default = column.default
+    if default.is_callable:
+        return default.arg(None)
+    return default.arg
+
+
+def _has_python_default(column: Any) -> bool:
+    """Check whether a column has a default computed in Python."""
+    default = column.default
+    return default is not None and (default.is_scalar or default.is_callable)
+
+
+def normalize_rows(
+    table: Table, rows: Sequence[Dict[str, Any]], fill_defaults: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Give every row of a batch the same set of columns.
+
+    ``executemany`` and COPY both need one column list for the whole batch.
+    Columns supplied by some rows but not others are filled in from their
+    Python-side default, or with None for nullable columns.
+
+    Args:
+        table: Table the rows are inserted into
+        rows: Row dictionaries keyed by column name
+        fill_defaults: Whether to add every column with a Python-side
+            default, as COPY does not apply them
+
+    Returns:
+        New row dictionaries sharing one set of keys
+
+    Raises:
+        ValueError: If a row names an unknown column, or a column that only
+            has a server default is missing from some rows
+    """
+    columns = table.columns
+    keys: Set[str] = set()
+    for row in rows:
+        keys.update(row)
+
+    unknown = keys - set(columns.keys())
+    if unknown:
+        raise ValueError(f"Unknown columns for table {table.name}: {sorted(unknown)}")
+
+    if fill_defaults:
+        keys.update(column.key for column in columns if _has_python_default(column))
+
+    normalized = []
+    for row in rows:
+        if len(row) == len(keys):
+            normalized.append(dict(row))
+            continue
+        filled = dict(row)
+        for key in keys.difference(row):
+            column = columns[key]
+            if _has_python_default(column):
+                filled[key] = _python_default(column)
+            elif column.nullable and column.server_default is None:
+                filled[key] = None
+            else:
+                raise ValueError(
+                    f"Column {table.name}.{key} must be given for all rows "
+                    f"or none of them"
+                )
+        normalized.append(filled)
+    return normalized
+
+
+async def _copy_records(
+    connection: AsyncConnection, table: Table, rows: List[Dict[str, Any]]
+) -> None:
+    """Write a batch with asyncpg's binary COPY protocol."""
+    keys = list(rows[0])
+    dialect = connection.dialect
+    processors = [
+        table.columns[key].type.dialect_impl(dialect).bind_processor(dialect)
+        for key in keys
+    ]
+    records = [
+        tuple(
+            processor(row[key]) if processor is not None else row[key]
+            for key, processor in zip(keys, processors)
+        )
+        for row in rows
+    ]
+
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    assert driver_connection is not None
+    await driver_connection.copy_records_to_table(
+        table.name, records=records, columns=keys, schema_name=table.schema
+    )
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    model: Any,
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    use_copy: bool = True,
+) -> int:
+    """
+    Insert many rows of a model without creating ORM objects.
+
+    On PostgreSQL with the asyncpg driver, each batch is written with the
+    COPY protocol; elsewhere, or with ``use_copy=False``, each batch is one
+    ``executemany`` insert. Rows are written in the session's transaction.
+
+    Args:
+        session: Async database session
+        model: Mapped model class, e.g. ``Pet``
+        rows: Row dictionaries keyed by column name; may be a generator
+        batch_size: Number of rows written per statement
+        use_copy: Whether COPY may be used when the driver supports it
+
+    Returns:
+        Number of rows inserted
+
+    Raises:
+        ValueError: If a row does not match the model's table
+    """
+    table: Table = model.__table__
+    # Pending ORM objects may be referenced by the rows' foreign keys
+    await session.flush()
+    connection = await session.connection()
+    copy = (
+        use_copy
+        and connection.dialect.name == "postgresql"
+        and connection.dialect.driver == "asyncpg"
+    )
+
+    count = 0
+    for batch in _batches(rows, batch_size):
+        normalized = normalize_rows(table, batch, fill_defaults=copy)
+        if copy:
+            await _copy_records(connection, table, normalized)
+        else:
+            await connection.execute(insert(table), normalized)
+        count += len(normalized)
+
+    logger.debug(f"Bulk inserted {count} rows into {table.name}")
+    return count
+
+
+async def bulk_upsert(
+    session: AsyncSession,
+    model: Any,
+    rows: Iterable[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Insert many rows of a model, updating rows that already exist.
+
+    Each batch is one ``INSERT ... ON CONFLICT (conflict_columns) DO UPDATE``
+    statement executed with ``executemany``. ``updated_at`` is refreshed on
+    updated rows.
+
+    Args:
+        session: Async database session
+        model: Mapped model class, e.g. ``User``
+        rows: Row dictionaries keyed by column name; may be a generator
+        conflict_columns: Columns of a unique constraint or index identifying
+            existing rows, e.g. ``["email"]``
+        update_columns: Columns overwritten on conflict; defaults to every
+            supplied column except the conflict columns, ``id`` and the
+            creation audit fields. An empty list leaves existing rows as they
+            are (``DO NOTHING``)
+        batch_size: Number of rows written per statement
+
+    Returns:
+        Number of rows processed
+
+    Raises:
+        ValueError: If a row does not match the model's table
+        NotImplementedError: If the database is not PostgreSQL or SQLite
+    """
+    table: Table = model.__table__
+    await session.flush()
+    connection = await session.connection()
+    dialect_name = connection.dialect.name
+    if dialect_name == "postgresql":
+        dialect_insert: Any = postgresql.insert
+    elif dialect_name == "sqlite":
+        dialect_insert = sqlite.insert
+    else:
+        raise NotImplementedError(f"bulk_upsert does not support {dialect_name}")
+
+    count = 0
+    for batch in _batches(rows, batch_size):
+        normalized = normalize_rows(table, batch)
+        stmt = dialect_insert(table)
+
+        if update_columns is None:
+            updates = [
+                key
+                for key in normalized[0]
+                if key not in conflict_columns and key not in _INSERT_ONLY_COLUMNS
+            ]
+        else:
+            updates = list(update_columns)
+
+        if updates:
+            set_ = {key: stmt.excluded[key] for key in updates}
+            if "updated_at" in table.columns and "updated_at" not in set_:
+                set_["updated_at"] = func.now()
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(conflict_columns), set_=set_
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+
+        await connection.execute(stmt, normalized)
+        count += len(normalized)
+
+    logger.debug(f"Bulk upserted {count} rows into {table.name}")
+    return count
@@ -0,0 +1,491 @@
+"""
+Second-level entity cache for the vet-core package.
+
+Clinics and veterinarians are read on nearly every scheduling request but
+change rarely. ``EntityCache`` keeps their committed column values by
+primary key so that a lookup can be answered without a query:
+
+- Read-through: ``get(session, model, id)`` returns the cached entity
+  attached to the session, or loads it and caches the row on a miss
+- Entries live in an in-process LRU bounded by ``max_entries`` and expire
+  after ``ttl`` seconds
+- An optional shared ``CacheBackend`` (e.g. Redis) is consulted on a local
+  miss, so several processes share the rows one of them loaded. Evictions
+  reach the backend but not the in-process caches of other processes,
+  which keep serving their copy of a changed row until it expires, so the
+  TTL also bounds how stale rows changed by another process may get
+- Rows written through any session are evicted when its transaction
+  commits: changed primary keys are collected on ``after_flush``, ORM bulk
+  UPDATE and DELETE statements evict the whole model, and the evictions are
+  applied on ``after_commit``
+
+Only column values are cached, never ORM instances, so cached entities can
+be attached to any session and mutable JSON values are never shared.
+Relationships are lazy-loaded as usual. Writes made with ``text()`` or by
+other applications are not seen; call ``invalidate()`` after them, and
+choose a TTL that bounds how stale such rows may get.
+
+Example:
+    >>> cache = session_manager.enable_entity_cache(ttl=600)
+    >>> async with session_manager.get_session() as session:
+    ...     clinic = await ClinicRepository(session).get_by_id(clinic_id)
+    >>> cache.stats().hit_rate
+"""
+
+import asyncio
+import copy
+import logging
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import (
+    ORMExecuteState,
+    Session,
+    class_mapper,
+    make_transient_to_detached,
+)
+from sqlalchemy.orm.attributes import set_committed_value
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_ENTRIES = 1024
+DEFAULT_CACHE_TTL = 300.0
+
+# Session.info key of the cache consulted by repositories
+ENTITY_CACHE_KEY = "entity_cache"
+
+# Session.info key of the (model, primary key) pairs written in the
+# transaction; a primary key of None stands for every row of the model
+_PENDING_KEY = "entity_cache_pending"
+
+EntityT = TypeVar("EntityT")
+Snapshot = Dict[str, Any]
+
+# Caches whose entries are evicted on commit
+_active_caches: "weakref.WeakSet[EntityCache]" = weakref.WeakSet()
+
+
+@dataclass
+class CacheStats:
+    """Counters of an entity cache."""
+
+    hits: int = 0
+    misses: int = 0
+    backend_hits: int = 0
+    stores: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    backend_errors: int = 0
+    size: int = 0
+    max_entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the counters to a dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "backend_hits": self.backend_hits,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "backend_errors": self.backend_errors,
+            "size": self.size,
+            "max_entries": self.max_entries,
+        }
+
+
+class CacheBackend(ABC):
+    """
+    Shared store behind the in-process cache.
+
+    Keys are strings of the form ``"<table>:<primary key>"``; values are
+    dictionaries of column values (UUIDs, datetimes, decimals, enums and
+    JSON structures), which a backend serializes as it sees fit, e.g.
+    with pickle.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Snapshot]:
+        """Get the values stored under a key, or None."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Snapshot, ttl: float) -> None:
+        """Store values under a key for ttl seconds."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Delete a key, if present."""
+
+    @abstractmethod
+    async def clear(self, prefix: str) -> None:
+        """Delete every key starting with prefix."""
+
+
+class LRUCache:
+    """In-process mapping with a size bound and per-entry expiry."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+        ttl: float = DEFAULT_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Number of entries above which the least recently
+                used one is evicted
+            ttl: Seconds an entry is kept, unless set with its own TTL
+            clock: Monotonic clock, replaceable in tests
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.evictions = 0
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get an unexpired entry and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store an entry, evicting the least recently used ones over the bound."""
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        """Delete an entry, returning whether it was present."""
+        return self._entries.pop(key, None) is not None
+
+    def clear(self, prefix: str = "") -> int:
+        """Delete the entries whose keys start with prefix."""
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+
+class EntityCache:
+    """Read-through cache of selected models by primary key."""
+
+    def __init__(
+        self,
+        models: Iterable[type],
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+        ttl: float = DEFAULT_CACHE_TTL,
+        backend: Optional[CacheBackend] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            models: Mapped classes to cache, e.g. ``(Clinic, Veterinarian)``
+            max_entries: Size bound of the in-process cache
+            ttl: Seconds an entry is kept, locally and in the backend
+            backend: Optional shared store consulted on local misses
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.models = frozenset(models)
+        self.ttl = ttl
+        self.backend = backend
+        self._local = LRUCache(max_entries, ttl, clock)
+        self._stats = CacheStats(max_entries=max_entries)
+        # Bumped on every eviction of a model, so a load that raced with a
+        # commit does not store the row it read before the commit
+        self._generations: Dict[type, int] = {model: 0 for model in self.models}
+        self._backend_tasks: Set["asyncio.Task[None]"] = set()
+
+    def enable(self) -> None:
+        """Start evicting rows written by any session on commit."""
+        _active_caches.add(self)
+
+    def disable(self) -> None:
+        """Stop evicting rows on commit and drop every entry."""
+        _active_caches.discard(self)
+        self._local.clear()
+
+    def caches(self, model: type) -> bool:
+        """Check if a model is cached."""
+        return model in self.models
+
+    async def get(
+        self, session: AsyncSession, model: Type[EntityT], entity_id: Any
+    ) -> Optional[EntityT]:
+        """
+        Get an entity by primary key, from the cache when possible.
+
+        An entity already in the session's identity map is returned as is.
+        A cached entity is attached to the session without a query; on a
+        miss the entity is loaded with all its columns and cached, unless
+        the session has written to it in its open transaction.
+
+        Args:
+            session: Session the entity is attached to
+            model: Mapped class of the entity
+            entity_id: Primary key value
+
+        Returns:
+            The entity, or None if no such row exists
+        """
+        if model not in self.models:
+            return await session.get(model, entity_id)
+
+        identity = class_mapper(model).identity_key_from_primary_key((entity_id,))
+        present = session.sync_session.identity_map.get(identity)
+        if present is not None:
+            return present
+
+        key = _cache_key(model, entity_id)
+        snapshot = await self._lookup(key)
+        if snapshot is not None:
+            self._stats.hits += 1
+            return await session.merge(_build(model, snapshot), load=False)
+
+        self._stats.misses += 1
+        generation = self._generations[model]
+        entity = await session.get(
+            model, entity_id, execution_options={"loading_profile": "full"}
+        )
+        if entity is None or _is_pending(session.sync_session, model, entity_id):
+            return entity
+        snapshot = _snapshot(entity)
+        if snapshot is not None and generation == self._generations[model]:
+            await self._store(key, snapshot)
+        return entity
+
+    def invalidate(self, model: type, entity_id: Any = None) -> None:
+        """
+        Evict an entity, or every entity of a model.
+
+        The entries are removed from this process and from the shared
+        backend; other processes' in-process copies expire after the TTL.
+
+        Args:
+            model: Mapped class of the entity
+            entity_id: Primary key value; None to evict the whole model
+        """
+        if model not in self.models:
+            return
+        self._generations[model] += 1
+        self._stats.invalidations += 1
+        if entity_id is None:
+            prefix = f"{_table_name(model)}:"
+            self._local.clear(prefix)
+            self._schedule_backend(lambda backend: backend.clear(prefix))
+        else:
+            key = _cache_key(model, entity_id)
+            self._local.delete(key)
+            self._schedule_backend(lambda backend: backend.delete(key))
+
+    def clear(self) -> None:
+        """Evict every entity of every cached model."""
+        for model in self.models:
+            self.invalidate(model)
+
+    async def wait_for_backend(self) -> None:
+        """Wait for evictions still being sent to the shared backend."""
+        while self._backend_tasks:
+            await asyncio.gather(*self._backend_tasks, return_exceptions=True)
+
+    def stats(self) -> CacheStats:
+        """
+        Get the cache counters.
+
+        Returns:
+            Copy of the counters with the current size
+        """
+        return CacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            backend_hits=self._stats.backend_hits,
+            stores=self._stats.stores,
+            evictions=self._local.evictions,
+            invalidations=self._stats.invalidations,
+            backend_errors=self._stats.backend_errors,
+            size=len(self._local),
+            max_entries=self._local.max_entries,
+        )
+
+    async def _lookup(self, key: str) -> Optional[Snapshot]:
+        """Look a key up locally, then in the backend."""
+        snapshot = self._local.get(key)
+        if snapshot is not None or self.backend is None:
+            return snapshot
+        try:
+            snapshot = await self.backend.get(key)
+        except Exception as e:
+            self._stats.backend_errors += 1
+            logger.warning(f"Entity cache backend get failed for '{key}': {e}")
+            return None
+        if snapshot is not None:
+            self._stats.backend_hits += 1
+            self._local.set(key, snapshot)
+        return snapshot
+
+    async def _store(self, key: str, snapshot: Snapshot) -> None:
+        """Store a row locally and in the backend."""
+        self._local.set(key, snapshot)
+        self._stats.stores += 1
+        if self.backend is None:
+            return
+        try:
+            await self.backend.set(key, snapshot, self.ttl)
+        except Exception as e:
+            self._stats.backend_errors += 1
+            logger.warning(f"Entity cache backend set failed for '{key}': {e}")
+
+    def _schedule_backend(self, operation: Callable[[CacheBackend], Any]) -> None:
+        """Send an eviction to the backend from a task on the running loop."""
+        backend = self.backend
+        if backend is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("Entity cache eviction not sent: no running event loop")
+            return
+        task = loop.create_task(self._run_backend(operation(backend)))
+        self._backend_tasks.add(task)
+        task.add_done_callback(self._backend_tasks.discard)
+
+    async def _run_backend(self, operation: Any) -> None:
+        """Await a backend eviction, logging failures."""
+        try:
+            await operation
+        except Exception as e:
+            self._stats.backend_errors += 1
+            logger.warning(f"Entity cache backend eviction failed: {e}")
+
+
+def _table_name(model: type) -> str:
+    """Name the table a model is stored in."""
+    return str(inspect(model).persist_selectable.name)
+
+
+def _cache_key(model: type, entity_id: Any) -> str:
+    """Build the cache key of a row."""
+    return f"{_table_name(model)}:{entity_id}"
+
+
+def _snapshot(entity: Any) -> Optional[Snapshot]:
+    """Copy the column values of a loaded entity; None if any is unloaded."""
+    state = inspect(entity)
+    if state.modified:
+        return None
+    values = {}
+    for attr in state.mapper.column_attrs:
+        if attr.key not in state.dict:
+            return None
+        values[attr.key] = state.dict[attr.key]
+    return copy.deepcopy(values)
+
+
+def _build(model: type, snapshot: Snapshot) -> Any:
+    """Build a detached entity from cached column values."""
+    entity: Any = class_mapper(model).class_manager.new_instance()
+    for key, value in snapshot.items():
+        set_committed_value(entity, key, copy.deepcopy(value))
+    make_transient_to_detached(entity)
+    return entity
+
+
+def _pending(session: Session) -> Set[Tuple[type, Any]]:
+    """Get the rows the session's transaction wrote to."""
+    pending: Set[Tuple[type, Any]] = session.info.setdefault(_PENDING_KEY, set())
+    return pending
+
+
+def _is_pending(session: Session, model: type, entity_id: Any) -> bool:
+    """Check if the session's transaction wrote to a row."""
+    pending: Set[Tuple[type, Any]] = session.info.get(_PENDING_KEY, set())
+    return (model, entity_id) in pending or (model, None) in pending
+
+
+def _cached_model(mapped_class: type) -> bool:
+    """Check if any enabled cache stores a model."""
+    return any(cache.caches(mapped_class) for cache in _active_caches)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed(session: Session, flush_context: Any) -> None:
+    """Remember the cached rows changed or deleted by a flush."""
+    if not _active_caches:
+        return
+    for entity in (*session.dirty, *session.deleted):
+        state = inspect(entity)
+        if state.identity is not None and _cached_model(state.class_):
+            identity = state.identity
+            _pending(session).add(
+                (state.class_, identity[0] if len(identity) == 1 else identity)
+            )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk(orm_execute_state: ORMExecuteState) -> None:
+    """Remember the cached models written by ORM UPDATE and DELETE statements."""
+    if not _active_caches or not (
+        orm_execute_state.is_update or orm_execute_state.is_delete
+    ):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and _cached_model(mapper.class_):
+        _pending(orm_execute_state.session).add((mapper.class_, None))
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_committed(session: Session) -> None:
+    """Evict the rows written by the committed transaction."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    for cache in list(_active_caches):
+        for model, entity_id in pending:
+            cache.invalidate(model, entity_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    """Forget the writes of a rolled back transaction."""
+    session.info.pop(_PENDING_KEY, None)
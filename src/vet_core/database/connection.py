@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 
 from ..exceptions import ConnectionException, DatabaseException
+from .instrumentation import DEFAULT_SLOW_QUERY_THRESHOLD_MS, instrument_engine
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +93,8 @@ def create_engine(
     echo_pool: bool = False,
     use_null_pool: bool = False,
     connect_args: Optional[dict] = None,
+    instrument_queries: bool = False,
+    slow_query_threshold_ms: Optional[float] = None,
 ) -> AsyncEngine:
     """
     Create an async SQLAlchemy engine with proper configuration.
@@ -108,6 +111,11 @@ def create_engine(
         echo_pool: Whether to echo pool events
         use_null_pool: Whether to use NullPool (useful for testing)
         connect_args: Additional connection arguments
+        instrument_queries: Whether to record per-statement latencies and
+            pool checkout waits (see ``vet_core.database.instrumentation``)
+        slow_query_threshold_ms: Log statements taking at least this many
+            milliseconds; implies instrument_queries. Defaults to 500 ms when
+            instrumentation is enabled
 
     Returns:
         Configured async SQLAlchemy engine
@@ -158,11 +166,21 @@ def create_engine(
     try:
         engine = create_async_engine(async_url, **engine_kwargs)
         logger.info(f"Created async database engine for {urlparse(async_url).hostname}")
-        return engine
     except Exception as e:
         logger.error(f"Failed to create database engine: {e}")
         raise
 
+    if instrument_queries or slow_query_threshold_ms is not None:
+        instrument_engine(
+            engine,
+            slow_query_threshold_ms=(
+                slow_query_threshold_ms
+                if slow_query_threshold_ms is not None
+                else DEFAULT_SLOW_QUERY_THRESHOLD_MS
+            ),
+        )
+    return engine
+
 
 async def check_connection(
     engine: AsyncEngine, max_retries: int = 3, retry_delay: float = 1.0
@@ -0,0 +1,307 @@
+"""
+Streaming export utilities for the vet-core package.
+
+Reporting jobs export whole tables, such as every appointment or every pet.
+Loading those result sets with ``session.execute()`` holds every row, and
+every ORM object built from it, in memory at once. These helpers instead:
+
+- Read rows through a server-side cursor with ``session.stream()`` and
+  ``yield_per``, so only one chunk of rows is held at a time
+- Select the model's table columns rather than whole entities, so no ORM
+  objects or identity map entries are created
+- Serialize each chunk to NDJSON or CSV text as soon as it arrives, and
+  write it to a file or any writer before fetching the next one
+
+Soft-deleted rows are left out unless ``include_deleted=True``.
+
+Example:
+    >>> async with get_session() as session:
+    ...     stmt = select(Appointment).where(Appointment.clinic_id == clinic_id)
+    ...     count = await export_rows(session, stmt, "appointments.ndjson")
+"""
+
+import csv
+import enum
+import inspect
+import io
+import json
+import logging
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from os import PathLike
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class ExportFormat(str, enum.Enum):
+    """Output formats supported by the export utilities."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+# File suffixes recognised when the format is taken from the destination
+_SUFFIX_FORMATS = {
+    ".ndjson": ExportFormat.NDJSON,
+    ".jsonl": ExportFormat.NDJSON,
+    ".csv": ExportFormat.CSV,
+}
+
+
+def _json_default(value: Any) -> Any:
+    """Convert values the json module cannot serialize."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(value: Any) -> Any:
+    """Convert a column value to a CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=_json_default, separators=(",", ":"))
+    return value
+
+
+def _export_select(stmt: Select[Any], include_deleted: bool) -> Select[Any]:
+    """Replace whole entities with their table columns and filter deletes."""
+    description = stmt.column_descriptions[0]
+    model = description.get("entity")
+    if model is None or not hasattr(model, "create_query_filter_active"):
+        raise ValueError("Export requires a select of a BaseModel subclass")
+
+    if len(stmt.column_descriptions) == 1 and description["expr"] is model:
+        stmt = stmt.with_only_columns(*model.__table__.columns)
+    if not include_deleted:
+        stmt = stmt.where(model.create_query_filter_active())
+    return stmt
+
+
+def resolve_format(
+    format: Union[ExportFormat, str, None], destination: Any = None
+) -> ExportFormat:
+    """
+    Determine the export format from an explicit value or a file name.
+
+    Args:
+        format: Requested format, or None to use the destination's suffix
+        destination: File path the export is written to, if any
+
+    Returns:
+        The export format
+
+    Raises:
+        ValueError: If the format is unknown or cannot be determined
+    """
+    if format is not None:
+        try:
+            return ExportFormat(format)
+        except ValueError:
+            raise ValueError(f"Unknown export format: {format}") from None
+
+    if isinstance(destination, (str, PathLike)):
+        suffix = Path(destination).suffix.lower()
+        if suffix in _SUFFIX_FORMATS:
+            return _SUFFIX_FORMATS[suffix]
+    raise ValueError("Export format must be given when it cannot be taken from a path")
+
+
+def _chunk_encoder(
+    export_format: ExportFormat, columns: Sequence[str]
+) -> Callable[[List[Dict[str, Any]]], str]:
+    """Build a function serializing chunks of rows, CSV header first."""
+    if export_format is ExportFormat.NDJSON:
+
+        def encode_ndjson(rows: List[Dict[str, Any]]) -> str:
+            return "".join(
+                json.dumps(row, default=_json_default, separators=(",", ":")) + "\n"
+                for row in rows
+            )
+
+        return encode_ndjson
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+
+    def encode_csv(rows: List[Dict[str, Any]]) -> str:
+        writer.writerows([_csv_value(value) for value in row.values()] for row in rows)
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    return encode_csv
+
+
+async def _stream_chunks(
+    session: AsyncSession, stmt: Select[Any], chunk_size: int
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Read a prepared export select in chunks from a server-side cursor."""
+    result = await session.stream(stmt.execution_options(yield_per=chunk_size))
+    try:
+        async for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
+    finally:
+        await result.close()
+
+
+async def stream_rows(
+    session: AsyncSession,
+    stmt: Select[Any],
+    include_deleted: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Stream the rows of a select in chunks through a server-side cursor.
+
+    A select of a whole model returns every table column; a select of
+    model columns returns those columns. Values are returned as loaded,
+    e.g. datetimes, UUIDs and enum members.
+
+    Args:
+        session: Async database session
+        stmt: Select of a model, or of columns from one model
+        include_deleted: Whether soft-deleted rows are returned
+        chunk_size: Number of rows fetched from the cursor at a time
+
+    Yields:
+        Lists of at most chunk_size row dictionaries keyed by column name
+
+    Raises:
+        ValueError: If the statement does not select a model
+    """
+    stmt = _export_select(stmt, include_deleted)
+    async for rows in _stream_chunks(session, stmt, chunk_size):
+        yield rows
+
+
+async def iter_export(
+    session: AsyncSession,
+    stmt: Select[Any],
+    format: Union[ExportFormat, str] = ExportFormat.NDJSON,
+    include_deleted: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[str]:
+    """
+    Stream the rows of a select as NDJSON or CSV text.
+
+    Each chunk of rows read from the cursor is serialized to one text
+    chunk, so the output can be written to a file or sent as a streaming
+    HTTP response without holding the whole export.
+
+    NDJSON has one JSON object per line. CSV starts with a header row of
+    column names, written even when there are no rows; JSON columns are
+    written as compact JSON and NULLs as empty cells.
+
+    Args:
+        session: Async database session
+        stmt: Select of a model, or of columns from one model
+        format: Output format
+        include_deleted: Whether soft-deleted rows are exported
+        chunk_size: Number of rows fetched and serialized at a time
+
+    Yields:
+        Text chunks
+
+    Raises:
+        ValueError: If the statement does not select a model or the format
+            is unknown
+    """
+    async for text, _ in _export_chunks(
+        session, stmt, resolve_format(format), include_deleted, chunk_size
+    ):
+        yield text
+
+
+async def _export_chunks(
+    session: AsyncSession,
+    stmt: Select[Any],
+    export_format: ExportFormat,
+    include_deleted: bool,
+    chunk_size: int,
+) -> AsyncIterator[Tuple[str, int]]:
+    """Serialize an export chunk by chunk, with the rows in each chunk."""
+    stmt = _export_select(stmt, include_deleted)
+    encode = _chunk_encoder(export_format, list(stmt.selected_columns.keys()))
+    if export_format is ExportFormat.CSV:
+        yield encode([]), 0
+    async for rows in _stream_chunks(session, stmt, chunk_size):
+        yield encode(rows), len(rows)
+
+
+async def export_rows(
+    session: AsyncSession,
+    stmt: Select[Any],
+    destination: Union[str, "PathLike[str]", Any],
+    format: Union[ExportFormat, str, None] = None,
+    include_deleted: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Export the rows of a select to a file or writer as NDJSON or CSV.
+
+    Args:
+        session: Async database session
+        stmt: Select of a model, or of columns from one model
+        destination: File path, or an object with a ``write(str)`` method;
+            an async ``write`` is awaited
+        format: Output format; taken from the file suffix (``.ndjson``,
+            ``.jsonl`` or ``.csv``) when not given
+        include_deleted: Whether soft-deleted rows are exported
+        chunk_size: Number of rows fetched and written at a time
+
+    Returns:
+        Number of rows exported
+
+    Raises:
+        ValueError: If the statement does not select a model or the format
+            cannot be determined
+    """
+    export_format = resolve_format(format, destination)
+
+    async def write_chunks(write: Callable[[str], Any]) -> int:
+        count = 0
+        async for text, rows in _export_chunks(
+            session, stmt, export_format, include_deleted, chunk_size
+        ):
+            written = write(text)
+            if inspect.isawaitable(written):
+                await written
+            count += rows
+        return count
+
+    if isinstance(destination, (str, PathLike)):
+        with open(destination, "w", encoding="utf-8", newline="") as file:
+            count = await write_chunks(file.write)
+    else:
+        count = await write_chunks(destination.write)
+
+    logger.debug(f"Exported {count} rows as {export_format.value}")
+    return count
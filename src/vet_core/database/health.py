@@ -0,0 +1,335 @@
+"""
+Background database health monitoring for the vet-core package.
+
+``SessionManager.health_check`` probes the database on the caller's request
+path, taking pool connections from real traffic whenever load balancer
+probes arrive. ``HealthMonitor`` instead probes on a schedule from one
+background task and publishes a cached ``HealthSnapshot``:
+
+- One connection and one ``SELECT 1`` per probe, bounded by a timeout
+- A rolling window of probe latencies and failures
+- Pool checkout samples, summarised as saturation now, on average, at its
+  peak and as a rising, falling or steady trend
+
+Readiness and liveness checks read the latest snapshot and perform no
+database I/O.
+
+Example:
+    >>> monitor = session_manager.start_health_monitor(interval=10.0)
+    >>> snapshot = session_manager.get_health_snapshot()
+    >>> snapshot.ready, snapshot.status, snapshot.latency_p95_ms
+    (True, 'healthy', 1.8)
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROBE_INTERVAL = 10.0
+DEFAULT_PROBE_TIMEOUT = 5.0
+DEFAULT_WINDOW_SIZE = 30
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_DEGRADED_LATENCY_MS = 250.0
+DEFAULT_SATURATION_THRESHOLD = 0.9
+
+# Change in mean saturation between the older and newer halves of the window
+# reported as a rising or falling trend
+_TREND_TOLERANCE = 0.05
+
+
+@dataclass
+class PoolSaturation:
+    """Connection pool usage over the monitoring window."""
+
+    size: int = 0
+    checked_out: int = 0
+    overflow: int = 0
+    current: float = 0.0
+    average: float = 0.0
+    peak: float = 0.0
+    trend: str = "steady"
+
+
+@dataclass
+class HealthSnapshot:
+    """Cached result of the background health probes."""
+
+    status: str = "unknown"
+    checked_at: Optional[float] = None
+    last_success_at: Optional[float] = None
+    consecutive_failures: int = 0
+    probes: int = 0
+    failure_rate: float = 0.0
+    latency_ms: Optional[float] = None
+    latency_p50_ms: float = 0.0
+    latency_p95_ms: float = 0.0
+    latency_max_ms: float = 0.0
+    last_error: Optional[str] = None
+    pool: PoolSaturation = field(default_factory=PoolSaturation)
+    stale_after: float = 3 * DEFAULT_PROBE_INTERVAL
+    monitor_running: bool = False
+
+    @property
+    def live(self) -> bool:
+        """Check if the monitor is running and its results are current."""
+        return self.monitor_running and not self.is_stale()
+
+    @property
+    def ready(self) -> bool:
+        """Check if the database answered recently enough to take traffic."""
+        if self.status not in ("healthy", "degraded"):
+            return False
+        if self.last_success_at is None:
+            return False
+        return time.time() - self.last_success_at <= self.stale_after
+
+    def is_stale(self, now: Optional[float] = None) -> bool:
+        """Check if the last probe is older than stale_after seconds."""
+        if self.checked_at is None:
+            return True
+        return (now if now is not None else time.time()) - self.checked_at > (
+            self.stale_after
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the snapshot to a dictionary, including ready and live."""
+        data = asdict(self)
+        data["ready"] = self.ready
+        data["live"] = self.live
+        return data
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a small list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _pool_usage(pool: Any) -> Tuple[int, int, int]:
+    """Read the size, checked-out and overflow counters of a pool."""
+
+    def counter(name: str) -> int:
+        value = getattr(pool, name, None)
+        try:
+            return int(value()) if callable(value) else 0
+        except (TypeError, ValueError):
+            return 0
+
+    return counter("size"), counter("checkedout"), max(0, counter("overflow"))
+
+
+class HealthMonitor:
+    """Probes the database on a schedule and caches the results."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        interval: float = DEFAULT_PROBE_INTERVAL,
+        timeout: float = DEFAULT_PROBE_TIMEOUT,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        degraded_latency_ms: float = DEFAULT_DEGRADED_LATENCY_MS,
+        saturation_threshold: float = DEFAULT_SATURATION_THRESHOLD,
+    ):
+        """
+        Initialize the monitor; call ``start()`` to begin probing.
+
+        Args:
+            engine: Engine whose database and pool are monitored
+            interval: Seconds between probes
+            timeout: Seconds before a probe counts as failed
+            window_size: Number of recent probes and pool samples kept
+            failure_threshold: Consecutive failed probes that make the
+                database unhealthy
+            degraded_latency_ms: p95 probe latency above which the database
+                is reported as degraded
+            saturation_threshold: Pool saturation (checked-out connections
+                per pool slot) above which the database is reported as
+                degraded
+        """
+        self.engine = engine
+        self.interval = interval
+        self.timeout = timeout
+        self.failure_threshold = max(1, failure_threshold)
+        self.degraded_latency_ms = degraded_latency_ms
+        self.saturation_threshold = saturation_threshold
+
+        # (latency in ms or None for a failure) per probe
+        self._probes: Deque[Optional[float]] = deque(maxlen=window_size)
+        self._saturation: Deque[float] = deque(maxlen=window_size)
+        self._consecutive_failures = 0
+        self._last_success_at: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._snapshot = HealthSnapshot(stale_after=3 * interval)
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the background task is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def snapshot(self) -> HealthSnapshot:
+        """Latest published health snapshot; reading it performs no I/O."""
+        return self._snapshot
+
+    def start(self) -> "HealthMonitor":
+        """
+        Start probing in a background task on the running event loop.
+
+        Returns:
+            This monitor
+        """
+        if not self.is_running:
+            self._stopping = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), name="vet-core-health-monitor"
+            )
+            self._publish()
+        return self
+
+    async def stop(self) -> None:
+        """
+        Stop the background task and wait for it to finish.
+
+        A probe in progress is allowed to complete, within the probe
+        timeout, rather than cancelled while it holds a connection.
+        """
+        task, self._task = self._task, None
+        if self._stopping is not None:
+            self._stopping.set()
+        if task is not None and not task.done():
+            try:
+                await asyncio.wait_for(task, timeout=self.timeout + 1.0)
+            except asyncio.TimeoutError:
+                logger.warning("Database health monitor did not stop in time")
+        self._publish()
+
+    async def probe_once(self) -> HealthSnapshot:
+        """
+        Run one probe now and publish the updated snapshot.
+
+        Returns:
+            The new snapshot
+        """
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._probe(), timeout=self.timeout)
+        except Exception as e:
+            self._probes.append(None)
+            self._consecutive_failures += 1
+            self._last_error = (
+                f"Probe timed out after {self.timeout}s"
+                if isinstance(e, asyncio.TimeoutError)
+                else f"{type(e).__name__}: {e}"
+            )
+            logger.warning(f"Database health probe failed: {self._last_error}")
+        else:
+            self._probes.append((time.perf_counter() - started) * 1000)
+            self._consecutive_failures = 0
+            self._last_success_at = time.time()
+        self.sample_pool()
+        return self._publish()
+
+    def sample_pool(self) -> None:
+        """Record the current pool saturation in the window."""
+        size, checked_out, _ = _pool_usage(self.engine.pool)
+        if size > 0:
+            self._saturation.append(checked_out / size)
+
+    async def _probe(self) -> None:
+        """Run SELECT 1 on one pooled connection."""
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    async def _run(self) -> None:
+        """Probe every interval until stopped."""
+        stopping = self._stopping
+        assert stopping is not None
+        while not stopping.is_set():
+            try:
+                await self.probe_once()
+            except Exception as e:  # pragma: no cover - keeps the loop alive
+                logger.error(f"Unexpected error in database health monitor: {e}")
+            try:
+                await asyncio.wait_for(stopping.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _status(self, latency_p95_ms: float, saturation: float) -> str:
+        """Classify the database from the window."""
+        if not self._probes:
+            return "unknown"
+        if (
+            self._consecutive_failures >= self.failure_threshold
+            or self._last_success_at is None
+        ):
+            return "unhealthy"
+        if (
+            None in self._probes
+            or latency_p95_ms > self.degraded_latency_ms
+            or saturation >= self.saturation_threshold
+        ):
+            return "degraded"
+        return "healthy"
+
+    def _pool_saturation(self) -> PoolSaturation:
+        """Summarise the pool samples in the window."""
+        size, checked_out, overflow = _pool_usage(self.engine.pool)
+        samples = list(self._saturation)
+        saturation = PoolSaturation(
+            size=size, checked_out=checked_out, overflow=overflow
+        )
+        if not samples:
+            return saturation
+
+        saturation.current = samples[-1]
+        saturation.average = sum(samples) / len(samples)
+        saturation.peak = max(samples)
+        half = len(samples) // 2
+        if half:
+            older = sum(samples[:half]) / half
+            newer = sum(samples[-half:]) / half
+            if newer - older > _TREND_TOLERANCE:
+                saturation.trend = "rising"
+            elif older - newer > _TREND_TOLERANCE:
+                saturation.trend = "falling"
+        return saturation
+
+    def _publish(self) -> HealthSnapshot:
+        """Build and cache a snapshot of the window."""
+        latencies = [latency for latency in self._probes if latency is not None]
+        failures = len(self._probes) - len(latencies)
+        pool = self._pool_saturation()
+        latency_p95_ms = _percentile(latencies, 0.95)
+
+        last_probe = self._probes[-1] if self._probes else None
+        self._snapshot = HealthSnapshot(
+            status=self._status(latency_p95_ms, pool.current),
+            checked_at=time.time() if self._probes else None,
+            last_success_at=self._last_success_at,
+            consecutive_failures=self._consecutive_failures,
+            probes=len(self._probes),
+            failure_rate=failures / len(self._probes) if self._probes else 0.0,
+            latency_ms=last_probe,
+            latency_p50_ms=_percentile(latencies, 0.50),
+            latency_p95_ms=latency_p95_ms,
+            latency_max_ms=max(latencies, default=0.0),
+            last_error=self._last_error,
+            pool=pool,
+            stale_after=3 * self.interval,
+            monitor_running=self.is_running,
+        )
+        return self._snapshot
@@ -0,0 +1,472 @@
+"""
+Query instrumentation for the vet-core package.
+
+Attaching ``QueryInstrumentation`` to an engine records, through SQLAlchemy
+engine events and in process:
+
+- Call counts, errors, rows and a latency histogram for each statement,
+  keyed by its normalized SQL (literals, placeholders and IN lists replaced)
+- Rows are the driver's ``rowcount``, so they count the rows affected by
+  INSERT, UPDATE and DELETE statements; rows returned by a SELECT are
+  fetched after the statement event and are only counted on drivers that
+  report them in ``rowcount``
+- How long each connection checkout waited for the pool
+- A warning log entry for every statement slower than a threshold, with
+  the statement normalized and the parameter values redacted
+
+Histograms use fixed logarithmic buckets, so memory use does not grow with
+the number of calls and p50/p95/p99 are accurate to within one bucket
+(about 19%).
+
+Example:
+    >>> engine = create_engine(url, instrument_queries=True,
+    ...                        slow_query_threshold_ms=200)
+    >>> snapshot = get_instrumentation(engine).snapshot()
+    >>> for stats in snapshot.statements[:5]:
+    ...     print(stats.p95_ms, stats.calls, stats.statement)
+"""
+
+import bisect
+import logging
+import re
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOW_QUERY_THRESHOLD_MS = 500.0
+DEFAULT_MAX_STATEMENTS = 1000
+
+# Statements beyond max_statements are aggregated under this key
+OTHER_STATEMENTS = "<other>"
+
+# Histogram bucket upper bounds in milliseconds: 0.01 ms to about 100 s,
+# four buckets per doubling
+_BUCKET_BOUNDS_MS: Tuple[float, ...] = tuple(0.01 * 2 ** (i / 4) for i in range(94))
+
+# Key of the statement start times in Connection.info
+_START_TIMES_KEY = "vet_core_query_start_times"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMERIC_LITERAL = re.compile(r"(?<![\w.$])-?\d+(?:\.\d+)?(?![\w.])")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"(\((?:\s*\?\s*,)*\s*\?\s*\))(?:\s*,\s*\1)+")
+_WHITESPACE = re.compile(r"\s+")
+
+# Instrumentation attached to each engine
+_instrumentations: "weakref.WeakKeyDictionary[Engine, QueryInstrumentation]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@lru_cache(maxsize=2048)
+def normalize_statement(statement: str) -> str:
+    """
+    Reduce a SQL statement to a key shared by all its executions.
+
+    String and numeric literals and driver placeholders become ``?``, IN
+    lists become ``IN (...)``, repeated multi-row VALUES groups are folded
+    into one and whitespace is collapsed.
+
+    Args:
+        statement: SQL text as sent to the driver
+
+    Returns:
+        Normalized statement text
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMERIC_LITERAL.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    return _VALUES_LIST.sub(r"\1", normalized)
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> Any:
+    """
+    Replace parameter values with their type names for logging.
+
+    Args:
+        parameters: Parameters passed to the driver
+        executemany: Whether parameters is a sequence of parameter sets
+
+    Returns:
+        Parameters of the same shape with every value redacted, or a summary
+        for executemany
+    """
+    if executemany and isinstance(parameters, (list, tuple)):
+        first = redact_parameters(parameters[0]) if parameters else None
+        return f"{len(parameters)} parameter sets like {first}"
+    if isinstance(parameters, dict):
+        return {key: f"<{type(value).__name__}>" for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return tuple(f"<{type(value).__name__}>" for value in parameters)
+    return parameters
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with percentile estimates."""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(_BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float) -> None:
+        """Add one observation in milliseconds."""
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile as the upper bound of its bucket.
+
+        Args:
+            fraction: Percentile as a fraction, e.g. 0.95
+
+        Returns:
+            Latency in milliseconds, never above the largest observation
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, round(fraction * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index == len(_BUCKET_BOUNDS_MS):
+                    return self.max_ms
+                return min(_BUCKET_BOUNDS_MS[index], self.max_ms)
+        return self.max_ms
+
+
+@dataclass
+class StatementStats:
+    """Recorded statistics for one normalized statement."""
+
+    statement: str
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    mean_ms: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+@dataclass
+class PoolWaitStats:
+    """Recorded statistics for connection pool checkouts."""
+
+    checkouts: int = 0
+    total_wait_ms: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+@dataclass
+class QueryStatsSnapshot:
+    """Point-in-time copy of the statistics recorded for an engine."""
+
+    since: datetime
+    statements: List[StatementStats] = field(default_factory=list)
+    pool: PoolWaitStats = field(default_factory=PoolWaitStats)
+    slow_queries: int = 0
+
+
+class _StatementRecord:
+    """Mutable counters for one normalized statement."""
+
+    __slots__ = ("histogram", "errors", "rows")
+
+    def __init__(self) -> None:
+        self.histogram = LatencyHistogram()
+        self.errors = 0
+        self.rows = 0
+
+
+class QueryInstrumentation:
+    """Records statement latencies and pool waits for one engine."""
+
+    def __init__(
+        self,
+        engine: Union[Engine, AsyncEngine],
+        slow_query_threshold_ms: Optional[float] = DEFAULT_SLOW_QUERY_THRESHOLD_MS,
+        max_statements: int = DEFAULT_MAX_STATEMENTS,
+    ):
+        """
+        Initialize instrumentation for an engine; call ``attach()`` to start.
+
+        Args:
+            engine: Engine to instrument; an AsyncEngine's sync engine is used
+            slow_query_threshold_ms: Statements taking at least this long are
+                logged as warnings, or None to disable the slow-query log
+            max_statements: Maximum number of distinct statements tracked;
+                further statements are aggregated under ``"<other>"``
+        """
+        self.engine: Engine = (
+            engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        )
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self.max_statements = max(1, max_statements)
+
+        self._lock = threading.Lock()
+        self._statements: Dict[str, _StatementRecord] = {}
+        self._pool_wait = LatencyHistogram()
+        self._slow_queries = 0
+        self._since = datetime.now(timezone.utc)
+        self._attached = False
+        self._wrapped_pools: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+    @property
+    def is_attached(self) -> bool:
+        """Check if the instrumentation is listening to its engine."""
+        return self._attached
+
+    def attach(self) -> "QueryInstrumentation":
+        """
+        Start recording statements and pool checkouts.
+
+        Returns:
+            This instrumentation
+        """
+        if self._attached:
+            return self
+        event.listen(self.engine, "before_cursor_execute", self._before_execute)
+        event.listen(self.engine, "after_cursor_execute", self._after_execute)
+        event.listen(self.engine, "handle_error", self._handle_error)
+        event.listen(self.engine, "engine_disposed", self._engine_disposed)
+        self._wrap_pool_connect(self.engine.pool)
+        self._attached = True
+        _instrumentations[self.engine] = self
+        return self
+
+    def detach(self) -> None:
+        """Stop recording; recorded statistics are kept."""
+        if not self._attached:
+            return
+        event.remove(self.engine, "before_cursor_execute", self._before_execute)
+        event.remove(self.engine, "after_cursor_execute", self._after_execute)
+        event.remove(self.engine, "handle_error", self._handle_error)
+        event.remove(self.engine, "engine_disposed", self._engine_disposed)
+        for pool in list(self._wrapped_pools):
+            pool.__dict__.pop("connect", None)
+        self._wrapped_pools = weakref.WeakSet()
+        self._attached = False
+        if _instrumentations.get(self.engine) is self:
+            del _instrumentations[self.engine]
+
+    def reset(self) -> None:
+        """Discard all recorded statistics."""
+        with self._lock:
+            self._statements = {}
+            self._pool_wait = LatencyHistogram()
+            self._slow_queries = 0
+            self._since = datetime.now(timezone.utc)
+
+    def snapshot(self) -> QueryStatsSnapshot:
+        """
+        Get a copy of the recorded statistics.
+
+        Returns:
+            Snapshot with statements ordered by total time, slowest first
+        """
+        with self._lock:
+            statements = [
+                StatementStats(
+                    statement=statement,
+                    calls=record.histogram.count,
+                    errors=record.errors,
+                    rows=record.rows,
+                    total_ms=record.histogram.total_ms,
+                    mean_ms=(
+                        record.histogram.total_ms / record.histogram.count
+                        if record.histogram.count
+                        else 0.0
+                    ),
+                    p50_ms=record.histogram.percentile(0.50),
+                    p95_ms=record.histogram.percentile(0.95),
+                    p99_ms=record.histogram.percentile(0.99),
+                    max_ms=record.histogram.max_ms,
+                )
+                for statement, record in self._statements.items()
+            ]
+            pool = PoolWaitStats(
+                checkouts=self._pool_wait.count,
+                total_wait_ms=self._pool_wait.total_ms,
+                p50_ms=self._pool_wait.percentile(0.50),
+                p95_ms=self._pool_wait.percentile(0.95),
+                p99_ms=self._pool_wait.percentile(0.99),
+                max_ms=self._pool_wait.max_ms,
+            )
+            snapshot = QueryStatsSnapshot(
+                since=self._since, pool=pool, slow_queries=self._slow_queries
+            )
+
+        statements.sort(key=lambda stats: stats.total_ms, reverse=True)
+        snapshot.statements = statements
+        return snapshot
+
+    def _record(self, statement: str) -> _StatementRecord:
+        """Get the counters for a statement; the lock must be held."""
+        key = normalize_statement(statement)
+        record = self._statements.get(key)
+        if record is None:
+            if len(self._statements) >= self.max_statements:
+                key = OTHER_STATEMENTS
+                record = self._statements.get(key)
+            if record is None:
+                record = self._statements[key] = _StatementRecord()
+        return record
+
+    def _before_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        """Remember when the statement was sent."""
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+    def _after_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        """Record a completed statement and log it if it was slow."""
+        start_times = conn.info.get(_START_TIMES_KEY)
+        if not start_times:
+            return
+        elapsed_ms = (time.perf_counter() - start_times.pop()) * 1000
+
+        # -1 when the driver does not know, as for most SELECTs
+        rows = getattr(cursor, "rowcount", -1)
+        if rows is None or rows < 0:
+            rows = 0
+
+        slow = (
+            self.slow_query_threshold_ms is not None
+            and elapsed_ms >= self.slow_query_threshold_ms
+        )
+        with self._lock:
+            record = self._record(statement)
+            record.histogram.record(elapsed_ms)
+            record.rows += rows
+            if slow:
+                self._slow_queries += 1
+
+        if slow:
+            logger.warning(
+                f"Slow query ({elapsed_ms:.1f} ms): "
+                f"{normalize_statement(statement)} "
+                f"parameters={redact_parameters(parameters, executemany)}"
+            )
+
+    def _handle_error(self, exception_context: Any) -> None:
+        """Count a failed statement."""
+        conn = exception_context.connection
+        statement = exception_context.statement
+        if conn is None or statement is None:
+            return
+        start_times = conn.info.get(_START_TIMES_KEY)
+        if start_times:
+            start_times.pop()
+        with self._lock:
+            self._record(statement).errors += 1
+
+    def _engine_disposed(self, engine: Engine) -> None:
+        """Instrument the pool that replaced the disposed one."""
+        self._wrap_pool_connect(engine.pool)
+
+    def _wrap_pool_connect(self, pool: Any) -> None:
+        """Time checkouts from a pool."""
+        if pool in self._wrapped_pools:
+            return
+        # Pools have no event before a checkout starts, so the instance's
+        # connect method is wrapped; detach() restores the class method
+        connect = type(pool).connect.__get__(pool)
+
+        def timed_connect() -> Any:
+            started = time.perf_counter()
+            try:
+                return connect()
+            finally:
+                waited_ms = (time.perf_counter() - started) * 1000
+                with self._lock:
+                    self._pool_wait.record(waited_ms)
+
+        pool.connect = timed_connect
+        self._wrapped_pools.add(pool)
+
+
+def instrument_engine(
+    engine: Union[Engine, AsyncEngine],
+    slow_query_threshold_ms: Optional[float] = DEFAULT_SLOW_QUERY_THRESHOLD_MS,
+    max_statements: int = DEFAULT_MAX_STATEMENTS,
+) -> QueryInstrumentation:
+    """
+    Attach query instrumentation to an engine.
+
+    An engine that is already instrumented keeps its instrumentation, whose
+    slow-query threshold is updated.
+
+    Args:
+        engine: Engine to instrument
+        slow_query_threshold_ms: Statements taking at least this long are
+            logged, or None to disable the slow-query log
+        max_statements: Maximum number of distinct statements tracked
+
+    Returns:
+        The engine's instrumentation
+    """
+    instrumentation = get_instrumentation(engine)
+    if instrumentation is not None:
+        instrumentation.slow_query_threshold_ms = slow_query_threshold_ms
+        return instrumentation
+    return QueryInstrumentation(
+        engine, slow_query_threshold_ms, max_statements
+    ).attach()
+
+
+def get_instrumentation(
+    engine: Union[Engine, AsyncEngine],
+) -> Optional[QueryInstrumentation]:
+    """
+    Get the instrumentation attached to an engine.
+
+    Args:
+        engine: Engine that may be instrumented
+
+    Returns:
+        The attached instrumentation, or None
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    return _instrumentations.get(sync_engine)
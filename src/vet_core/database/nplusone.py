@@ -0,0 +1,269 @@
+"""
+N+1 query detection for the vet-core package.
+
+Relationships such as ``Pet.owner``, ``Appointment.pet`` and
+``Clinic.veterinarians`` are lazy-loaded, so code that walks a list of rows
+and touches a relationship, or looks up a related row per item, issues one
+query per row. ``NPlusOneDetector`` watches the statements a session
+executes and reports a statement repeated with different parameters more
+than a threshold number of times within one scope, naming the relationship
+that triggered it when the statement is a lazy load.
+
+It is meant for tests and staging, not production: every statement is
+compiled once more to find its repetitions.
+
+Example:
+    >>> session_manager.enable_nplusone_detection(threshold=5, action="raise")
+    >>> async with session_manager.get_session() as session:
+    ...     appointments = (await session.scalars(select(Appointment))).all()
+    ...     for appointment in appointments:
+    ...         await session.refresh(appointment, ["pet"])  # Raises at 5
+"""
+
+import enum
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from ..exceptions import NPlusOneQueryException
+from .instrumentation import normalize_statement
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NPLUSONE_THRESHOLD = 5
+
+# Prefix of the keys of the active scopes in Session.info, one per detector
+_SCOPE_KEY = "nplusone_scope"
+
+
+class NPlusOneAction(str, enum.Enum):
+    """What the detector does when a statement repeats too often."""
+
+    WARN = "warn"
+    RAISE = "raise"
+
+
+@dataclass
+class RepeatedQuery:
+    """A statement executed repeatedly within one scope."""
+
+    statement: str
+    count: int
+    relationship: Optional[str] = None
+
+    def describe(self) -> str:
+        """Describe the repetition for log and error messages."""
+        origin = (
+            f"lazy load of {self.relationship}"
+            if self.relationship
+            else "repeated statement"
+        )
+        return (
+            f"Possible N+1 query: {origin} executed {self.count} times "
+            f"in one scope: {self.statement}"
+        )
+
+
+@dataclass
+class QueryScope:
+    """Statements counted for one session or request scope."""
+
+    total: int = 0
+    counts: Dict[str, int] = field(default_factory=dict)
+    relationships: Dict[str, str] = field(default_factory=dict)
+    detections: List[RepeatedQuery] = field(default_factory=list)
+
+    def repeated(self, minimum: int = 2) -> List[RepeatedQuery]:
+        """
+        List the statements executed at least minimum times.
+
+        Args:
+            minimum: Smallest count reported
+
+        Returns:
+            Repeated statements, most frequent first
+        """
+        repeated = [
+            RepeatedQuery(statement, count, self.relationships.get(statement))
+            for statement, count in self.counts.items()
+            if count >= minimum
+        ]
+        repeated.sort(key=lambda query: query.count, reverse=True)
+        return repeated
+
+
+class NPlusOneDetector:
+    """Counts the statements of sessions and reports N+1 patterns."""
+
+    def __init__(
+        self,
+        threshold: int = DEFAULT_NPLUSONE_THRESHOLD,
+        action: Union[NPlusOneAction, str] = NPlusOneAction.WARN,
+        ignore: Sequence[str] = (),
+    ):
+        """
+        Initialize the detector.
+
+        Args:
+            threshold: Number of executions of one statement within a scope
+                that is reported; must be at least 2
+            action: ``"warn"`` to log a warning, or ``"raise"`` to raise
+                NPlusOneQueryException from the offending execution
+            ignore: Substrings of statements, or relationship names such as
+                ``"Pet.owner"``, that are never reported
+        """
+        if threshold < 2:
+            raise ValueError("N+1 detection threshold must be at least 2")
+        self.threshold = threshold
+        self.action = NPlusOneAction(action)
+        self.ignore = tuple(ignore)
+        self._scope_key = (_SCOPE_KEY, id(self))
+
+    def attach(self, session: Union[Session, AsyncSession]) -> QueryScope:
+        """
+        Start counting the statements a session executes.
+
+        Args:
+            session: Session to watch; an AsyncSession's sync session is used
+
+        Returns:
+            The scope the session's statements are counted in
+        """
+        sync_session = _sync_session(session)
+        scope = sync_session.info.get(self._scope_key)
+        if scope is None:
+            scope = sync_session.info[self._scope_key] = QueryScope()
+        if not event.contains(sync_session, "do_orm_execute", self._on_execute):
+            event.listen(sync_session, "do_orm_execute", self._on_execute)
+        return scope
+
+    def detach(self, session: Union[Session, AsyncSession]) -> Optional[QueryScope]:
+        """
+        Stop counting the statements of a session.
+
+        Args:
+            session: Session being watched
+
+        Returns:
+            The session's final scope, or None if it was not watched
+        """
+        sync_session = _sync_session(session)
+        if event.contains(sync_session, "do_orm_execute", self._on_execute):
+            event.remove(sync_session, "do_orm_execute", self._on_execute)
+        scope: Optional[QueryScope] = sync_session.info.pop(self._scope_key, None)
+        return scope
+
+    def get_scope(self, session: Union[Session, AsyncSession]) -> Optional[QueryScope]:
+        """
+        Get the scope counting a session's statements.
+
+        Args:
+            session: Session that may be watched
+
+        Returns:
+            The active scope, or None if the session is not watched
+        """
+        scope: Optional[QueryScope] = _sync_session(session).info.get(self._scope_key)
+        return scope
+
+    @contextmanager
+    def scope(self, session: Union[Session, AsyncSession]) -> Iterator[QueryScope]:
+        """
+        Count statements in a fresh scope, e.g. for one request.
+
+        Statements executed by the session inside the block are counted
+        separately from those executed before or after it.
+
+        Args:
+            session: Session to watch
+
+        Yields:
+            The new scope
+        """
+        sync_session = _sync_session(session)
+        watched = event.contains(sync_session, "do_orm_execute", self._on_execute)
+        previous = sync_session.info.pop(self._scope_key, None)
+        scope = self.attach(sync_session)
+        try:
+            yield scope
+        finally:
+            if watched:
+                sync_session.info[self._scope_key] = previous or QueryScope()
+            else:
+                self.detach(sync_session)
+
+    def _on_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        """Count one statement and report it at the threshold."""
+        session = orm_execute_state.session
+        scope: Optional[QueryScope] = session.info.get(self._scope_key)
+        if scope is None:
+            return
+
+        bind = session.get_bind(**orm_execute_state.bind_arguments)
+        statement: Any = orm_execute_state.statement
+        key = normalize_statement(str(statement.compile(dialect=bind.dialect)))
+        scope.total += 1
+        count = scope.counts[key] = scope.counts.get(key, 0) + 1
+
+        if orm_execute_state.is_relationship_load:
+            path = orm_execute_state.loader_strategy_path
+            prop = getattr(path, "prop", None)
+            if prop is not None:
+                scope.relationships[key] = str(prop)
+
+        if count != self.threshold:
+            return
+        relationship = scope.relationships.get(key)
+        if any(pattern in key or pattern == relationship for pattern in self.ignore):
+            return
+
+        detection = RepeatedQuery(key, count, relationship)
+        scope.detections.append(detection)
+        if self.action is NPlusOneAction.RAISE:
+            raise NPlusOneQueryException(
+                detection.describe(),
+                statement=key,
+                count=count,
+                relationship=relationship,
+            )
+        logger.warning(detection.describe())
+
+
+def _sync_session(session: Union[Session, AsyncSession]) -> Session:
+    """Get the Session that executes an AsyncSession's statements."""
+    if isinstance(session, AsyncSession):
+        return session.sync_session
+    return session
+
+
+@contextmanager
+def detect_nplusone(
+    session: Union[Session, AsyncSession],
+    threshold: int = DEFAULT_NPLUSONE_THRESHOLD,
+    action: Union[NPlusOneAction, str] = NPlusOneAction.RAISE,
+    ignore: Sequence[str] = (),
+) -> Iterator[QueryScope]:
+    """
+    Check a block of code for N+1 queries on a session.
+
+    Args:
+        session: Session the block uses
+        threshold: Number of executions of one statement that is reported
+        action: ``"raise"`` (the default) or ``"warn"``
+        ignore: Statement substrings or relationship names not reported
+
+    Yields:
+        The scope counting the block's statements
+
+    Example:
+        >>> with detect_nplusone(session):
+        ...     await list_appointments_with_pets(session)
+    """
+    detector = NPlusOneDetector(threshold, action, ignore)
+    with detector.scope(session) as scope:
+        yield scope
@@ -0,0 +1,321 @@
+"""
+Keyset pagination utilities for the vet-core package.
+
+This module provides opaque cursor encoding and keyset (seek) predicates so
+that paginated queries filter on the last row of the previous page instead
+of using OFFSET, keeping the cost of deep pages the same as the first page.
+
+Example:
+    >>> stmt = select(Appointment).where(Appointment.clinic_id == clinic_id)
+    >>> page = await paginate(session, stmt, order_by=[Appointment.scheduled_at])
+    >>> next_page = await paginate(
+    ...     session, stmt, order_by=[Appointment.scheduled_at],
+    ...     after=page.next_cursor,
+    ... )
+"""
+
+import base64
+import binascii
+import enum
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Enum,
+    Numeric,
+    Select,
+    and_,
+    func,
+    literal,
+    or_,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import ColumnElement, UnaryExpression
+
+from ..exceptions import ValidationException
+from .types import ColumnLike
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+@dataclass
+class Page(Generic[T]):
+    """A page of results with an opaque cursor for the next page."""
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    limit: int = DEFAULT_PAGE_SIZE
+
+    @property
+    def has_more(self) -> bool:
+        """Check if another page is available."""
+        return self.next_cursor is not None
+
+    def __len__(self) -> int:
+        """Return the number of items in the page."""
+        return len(self.items)
+
+
+def _cursor_value(value: Any) -> Any:
+    """Convert a sort key value into a JSON-serializable cursor value."""
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the sort key of the last row on a page into an opaque cursor.
+
+    Args:
+        values: Sort key values of the last row, e.g. ``(name, id)``
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([_cursor_value(value) for value in values])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, expected_length: Optional[int] = None) -> List[Any]:
+    """
+    Decode an opaque cursor back into its sort key values.
+
+    Args:
+        cursor: Cursor string produced by encode_cursor
+        expected_length: Number of sort key values the query expects
+
+    Returns:
+        List of sort key values in their JSON representation
+
+    Raises:
+        ValidationException: If the cursor is malformed
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValidationException(
+            "Invalid pagination cursor", field="cursor", value=cursor
+        ) from e
+
+    if not isinstance(values, list) or (
+        expected_length is not None and len(values) != expected_length
+    ):
+        raise ValidationException(
+            "Invalid pagination cursor", field="cursor", value=cursor
+        )
+
+    return values
+
+
+def keyset_condition(
+    columns: Sequence[ColumnLike],
+    values: Sequence[Any],
+    descending: Sequence[bool],
+) -> ColumnElement[bool]:
+    """
+    Build the seek predicate selecting rows after a cursor position.
+
+    When every key sorts in the same direction a row-value comparison such as
+    ``(name, id) > (:name, :id)`` is used, which both PostgreSQL and SQLite can
+    serve directly from a composite index. Mixed directions are expanded into
+    the equivalent ``OR`` of prefix equalities.
+
+    Args:
+        columns: Sort key expressions in ORDER BY order
+        values: Sort key values of the last row of the previous page
+        descending: Whether each sort key is ordered descending
+
+    Returns:
+        Boolean SQL expression usable in a WHERE clause
+    """
+    if len(set(descending)) == 1:
+        if descending[0]:
+            return tuple_(*columns) < tuple_(*values)
+        return tuple_(*columns) > tuple_(*values)
+
+    branches = []
+    for index, (column, value) in enumerate(zip(columns, values)):
+        prefix = [columns[i] == values[i] for i in range(index)]
+        comparison = column < value if descending[index] else column > value
+        branches.append(and_(*prefix, comparison))
+    return or_(*branches)
+
+
+def clamp_page_size(limit: int) -> int:
+    """Clamp a requested page size to the allowed range."""
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def _sort_key(expression: Any) -> Tuple[Any, bool]:
+    """Split an ORDER BY expression into its column and direction."""
+    descending = False
+    if isinstance(expression, UnaryExpression) and expression.modifier in (
+        operators.desc_op,
+        operators.asc_op,
+    ):
+        descending = expression.modifier is operators.desc_op
+        expression = expression.element
+    if hasattr(expression, "__clause_element__"):
+        expression = expression.__clause_element__()
+    return expression, descending
+
+
+def _parse_cursor_value(column: Any, value: Any) -> Any:
+    """Convert a decoded cursor value back to the column's Python type."""
+    if value is None:
+        return None
+    column_type = column.type
+    if isinstance(column_type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column_type, Date):
+        return date.fromisoformat(value)
+    if isinstance(column_type, Enum) and column_type.enum_class is not None:
+        return column_type.enum_class(value)
+    if isinstance(column_type, Numeric) and column_type.asdecimal:
+        return Decimal(value)
+    return value
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select[Any],
+    order_by: Sequence[Any],
+    after: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    include_deleted: bool = False,
+) -> Page[Any]:
+    """
+    Run one page of a select using keyset pagination.
+
+    The first entity the statement selects supplies the soft-delete filter
+    and the primary key, which is appended to ``order_by`` as a tie-breaker
+    so that every row has a unique ``(sort_key, id)`` position. The page
+    continues after the position encoded in ``after``, so the database seeks
+    straight to it instead of skipping ``OFFSET`` rows.
+
+    With an equality filter on the leading columns of a composite index, the
+    sort keys should be the remaining index columns, e.g.
+    ``Appointment.clinic_id == clinic_id`` ordered by
+    ``Appointment.scheduled_at`` uses ``idx_appointments_clinic_scheduled``.
+    The first sort key is also bounded on its own so that such an index can
+    serve the seek as a range scan.
+
+    Args:
+        session: Async database session
+        stmt: Select of a model, or of columns from one model; any ORDER BY
+            and LIMIT it carries are replaced
+        order_by: Sort key columns of that model, optionally wrapped in
+            ``.desc()`` or ``.asc()``
+        after: Cursor returned with the previous page
+        limit: Maximum number of rows per page
+        include_deleted: Whether soft-deleted rows are returned
+
+    Returns:
+        Page of model instances when the statement selects a whole model,
+        otherwise of result rows
+
+    Raises:
+        ValueError: If the statement does not select a model
+        ValidationException: If the cursor is malformed
+    """
+    description = stmt.column_descriptions[0]
+    model = description.get("entity")
+    if model is None or not hasattr(model, "create_query_filter_active"):
+        raise ValueError("paginate() requires a select of a BaseModel subclass")
+    whole_entity = len(stmt.column_descriptions) == 1 and description["expr"] is model
+
+    keys = [_sort_key(expression) for expression in order_by]
+    if not keys or keys[-1][0].key != "id":
+        keys.append((model.id.__clause_element__(), keys[-1][1] if keys else False))
+    columns = [column for column, _ in keys]
+    descending = [desc for _, desc in keys]
+
+    # SQLite keeps timestamps as text, and server defaults omit the
+    # fractional seconds that bound datetimes carry, so compare the parsed
+    # values rather than the text
+    bind = session.bind
+    parse_timestamps = bind is not None and bind.dialect.name == "sqlite"
+
+    def comparable(column: Any, value: Any) -> Any:
+        if parse_timestamps and isinstance(column.type, DateTime):
+            return func.julianday(value)
+        return value
+
+    sort_exprs = [comparable(column, column) for column in columns]
+
+    limit = clamp_page_size(limit)
+    if not whole_entity:
+        selected = {column.key for column in stmt.selected_columns}
+        missing = [column for column in columns if column.key not in selected]
+        if missing:
+            stmt = stmt.add_columns(*missing)
+    if not include_deleted:
+        stmt = stmt.where(model.create_query_filter_active())
+
+    if after is not None:
+        raw_values = decode_cursor(after, expected_length=len(columns))
+        try:
+            # The last key is always the UUID primary key
+            parsed = [
+                _parse_cursor_value(column, value)
+                for column, value in zip(columns[:-1], raw_values[:-1])
+            ] + [uuid.UUID(raw_values[-1])]
+            values = [
+                comparable(column, literal(value, column.type))
+                for column, value in zip(columns, parsed)
+            ]
+        except (TypeError, ValueError, InvalidOperation) as e:
+            raise ValidationException(
+                "Invalid pagination cursor", field="cursor", value=after
+            ) from e
+        stmt = stmt.where(keyset_condition(sort_exprs, values, descending))
+        if len(columns) > 1:
+            # Redundant range on the first key lets a composite index bound
+            # the scan; the row-value comparison above decides ties
+            stmt = stmt.where(
+                sort_exprs[0] <= values[0]
+                if descending[0]
+                else sort_exprs[0] >= values[0]
+            )
+
+    stmt = (
+        stmt.order_by(None)
+        .order_by(
+            *(
+                expr.desc() if desc else expr.asc()
+                for expr, desc in zip(sort_exprs, descending)
+            )
+        )
+        .limit(limit + 1)
+    )
+
+    result = await session.execute(stmt)
+    rows: List[Any] = list(result.scalars()) if whole_entity else list(result)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        if whole_entity:
+            cursor_values = [getattr(last, column.key) for column in columns]
+        else:
+            cursor_values = [last._mapping[column.key] for column in columns]
+        next_cursor = encode_cursor(cursor_values)
+
+    return Page(items=rows, next_cursor=next_cursor, limit=limit)
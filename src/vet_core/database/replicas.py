@@ -0,0 +1,354 @@
+"""
+Read-replica routing for the vet-core package.
+
+``ReplicaRouter`` picks the engine for read-only sessions, so appointment
+listings and searches can be served by replicas while writes stay on the
+primary:
+
+- Replicas are chosen round-robin or by fewest open sessions
+- A replica is skipped while it is unhealthy: after a connection error or
+  a failed ``check_replicas()`` probe it is ejected for ``cooldown``
+  seconds, and a replica found lagging the primary by more than
+  ``max_lag_seconds`` is ejected until a later check passes
+- Read-your-writes: after a session commits writes, read-only sessions in
+  the same request (the same asyncio task context) use the primary for
+  ``sticky_seconds``, and then only replicas whose last measured lag is
+  shorter than the time since the commit
+- With no usable replica, reads fall back to the primary
+
+Example:
+    >>> manager = SessionManager(primary, replicas=[replica_a, replica_b])
+    >>> async with manager.get_session(readonly=True) as session:
+    ...     appointments = (await session.scalars(select(Appointment))).all()
+"""
+
+import asyncio
+import enum
+import itertools
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STICKY_SECONDS = 5.0
+DEFAULT_REPLICA_COOLDOWN = 30.0
+DEFAULT_CHECK_INTERVAL = 10.0
+
+# Replication delay on a PostgreSQL standby; zero once it has replayed all
+# WAL received, and zero on a server that is not a standby
+_POSTGRESQL_LAG_QUERY = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE("
+    "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+# Session.info key set once a session has written in its transaction
+_HAS_WRITES = "replica_router_has_writes"
+
+# time.monotonic() of the current request's last committed write
+_last_write_at: ContextVar[Optional[float]] = ContextVar(
+    "vet_core_last_write_at", default=None
+)
+
+
+class ReplicaStrategy(str, enum.Enum):
+    """How a replica is chosen among the usable ones."""
+
+    ROUND_ROBIN = "round_robin"
+    LEAST_CONNECTIONS = "least_connections"
+
+
+@dataclass
+class ReplicaState:
+    """Health and load of one replica."""
+
+    engine: AsyncEngine
+    name: str
+    healthy: bool = True
+    lag_seconds: Optional[float] = None
+    active_sessions: int = 0
+    sessions: int = 0
+    failures: int = 0
+    last_error: Optional[str] = None
+    last_checked_at: Optional[float] = None
+    ejected_until: float = 0.0
+    lagging: bool = False
+
+    def is_usable(self, now: float) -> bool:
+        """Check if the replica may serve reads."""
+        if self.lagging:
+            # Only a passing check brings a lagging replica back
+            return False
+        return self.healthy or now >= self.ejected_until
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the state to a dictionary, without the engine."""
+        return {
+            "name": self.name,
+            "healthy": self.healthy,
+            "lagging": self.lagging,
+            "lag_seconds": self.lag_seconds,
+            "active_sessions": self.active_sessions,
+            "sessions": self.sessions,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "last_checked_at": self.last_checked_at,
+        }
+
+
+def record_write() -> None:
+    """Note that the current request committed a write to the primary."""
+    _last_write_at.set(time.monotonic())
+
+
+def clear_write() -> None:
+    """Let the current request read from replicas again right away."""
+    _last_write_at.set(None)
+
+
+def track_writes(session: AsyncSession) -> None:
+    """
+    Record a write for read-your-writes when a session commits one.
+
+    Flushes and ORM insert, update and delete statements count as writes;
+    after writing with ``text()``, call ``record_write()`` explicitly.
+
+    Args:
+        session: Session bound to the primary
+    """
+    sync_session = session.sync_session
+    event.listen(sync_session, "after_flush", _on_flush)
+    event.listen(sync_session, "do_orm_execute", _on_execute)
+    event.listen(sync_session, "after_commit", _on_commit)
+
+
+def _on_flush(session: Session, flush_context: Any) -> None:
+    """Flag the session's transaction as writing."""
+    session.info[_HAS_WRITES] = True
+
+
+def _on_execute(orm_execute_state: ORMExecuteState) -> None:
+    """Flag the session's transaction as writing on DML statements."""
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[_HAS_WRITES] = True
+
+
+def _on_commit(session: Session) -> None:
+    """Record the commit of a writing transaction."""
+    if session.info.pop(_HAS_WRITES, False):
+        record_write()
+
+
+class ReplicaRouter:
+    """Chooses the engine for each read-only session."""
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine],
+        strategy: Union[ReplicaStrategy, str] = ReplicaStrategy.ROUND_ROBIN,
+        max_lag_seconds: Optional[float] = None,
+        sticky_seconds: float = DEFAULT_STICKY_SECONDS,
+        cooldown: float = DEFAULT_REPLICA_COOLDOWN,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            primary: Engine of the primary database, used for fallback
+            replicas: Engines of the read replicas
+            strategy: ``"round_robin"`` or ``"least_connections"``
+            max_lag_seconds: Replication lag above which ``check_replicas``
+                ejects a replica until a later check passes; None to ignore
+                lag
+            sticky_seconds: Minimum time reads stay on the primary after
+                the request committed a write
+            cooldown: Seconds a replica that failed stays ejected before
+                it is tried again
+        """
+        self.primary = primary
+        self.strategy = ReplicaStrategy(strategy)
+        self.max_lag_seconds = max_lag_seconds
+        self.sticky_seconds = sticky_seconds
+        self.cooldown = cooldown
+        self.replicas = [
+            ReplicaState(engine=engine, name=_engine_name(engine, index))
+            for index, engine in enumerate(replicas)
+        ]
+        self.primary_fallbacks = 0
+        self._round_robin = itertools.count()
+        self._check_task: Optional["asyncio.Task[None]"] = None
+
+    def choose(self) -> Optional[ReplicaState]:
+        """
+        Choose the replica for a read-only session.
+
+        Returns:
+            The chosen replica, or None to read from the primary
+        """
+        if not self.replicas:
+            return None
+
+        now = time.monotonic()
+        last_write = _last_write_at.get()
+        since_write = None if last_write is None else now - last_write
+        if since_write is not None and since_write < self.sticky_seconds:
+            return None
+
+        candidates = [
+            replica
+            for replica in self.replicas
+            if replica.is_usable(now)
+            and (
+                since_write is None
+                # A replica whose lag was never measured may not have the write
+                or (
+                    replica.lag_seconds is not None
+                    and replica.lag_seconds <= since_write
+                )
+            )
+        ]
+        if not candidates:
+            self.primary_fallbacks += 1
+            return None
+
+        if self.strategy is ReplicaStrategy.LEAST_CONNECTIONS:
+            return min(candidates, key=lambda replica: replica.active_sessions)
+        return candidates[next(self._round_robin) % len(candidates)]
+
+    def mark_failed(self, replica: ReplicaState, error: BaseException) -> None:
+        """
+        Eject a replica after an error, for the cooldown period.
+
+        Args:
+            replica: Replica that failed
+            error: Error it raised
+        """
+        replica.healthy = False
+        replica.failures += 1
+        replica.last_error = f"{type(error).__name__}: {error}"
+        replica.ejected_until = time.monotonic() + self.cooldown
+        logger.warning(
+            f"Read replica '{replica.name}' ejected for {self.cooldown}s: "
+            f"{replica.last_error}"
+        )
+
+    async def check_replicas(self) -> List[ReplicaState]:
+        """
+        Probe every replica for connectivity and replication lag.
+
+        Returns:
+            The updated replica states
+        """
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+        return self.replicas
+
+    def start_health_checks(
+        self, interval: float = DEFAULT_CHECK_INTERVAL
+    ) -> "asyncio.Task[None]":
+        """
+        Check the replicas from a background task on the running event loop.
+
+        Args:
+            interval: Seconds between checks
+
+        Returns:
+            The background task
+        """
+        if self._check_task is None or self._check_task.done():
+            self._check_task = asyncio.get_running_loop().create_task(
+                self._run_checks(interval), name="vet-core-replica-checks"
+            )
+        return self._check_task
+
+    async def stop_health_checks(self) -> None:
+        """Stop the background checks, if running."""
+        task, self._check_task = self._check_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Describe the replicas and routing counters.
+
+        Returns:
+            Dictionary with the strategy, primary fallbacks and replicas
+        """
+        return {
+            "strategy": self.strategy.value,
+            "primary_fallbacks": self.primary_fallbacks,
+            "replicas": [replica.to_dict() for replica in self.replicas],
+        }
+
+    async def _check(self, replica: ReplicaState) -> None:
+        """Probe one replica and update its state."""
+        try:
+            async with replica.engine.connect() as conn:
+                if conn.dialect.name == "postgresql":
+                    lag = float(
+                        (await conn.execute(_POSTGRESQL_LAG_QUERY)).scalar() or 0
+                    )
+                else:
+                    await conn.execute(text("SELECT 1"))
+                    lag = 0.0
+        except Exception as e:
+            self.mark_failed(replica, e)
+            return
+        finally:
+            replica.last_checked_at = time.time()
+
+        replica.lag_seconds = lag
+        if self.max_lag_seconds is not None and lag > self.max_lag_seconds:
+            if not replica.lagging:
+                logger.warning(
+                    f"Read replica '{replica.name}' ejected until its "
+                    f"replication lag is under {self.max_lag_seconds}s"
+                )
+            replica.healthy = False
+            replica.lagging = True
+            replica.failures += 1
+            replica.last_error = (
+                f"replication lag {lag:.1f}s over {self.max_lag_seconds}s"
+            )
+            return
+        if not replica.healthy:
+            logger.info(f"Read replica '{replica.name}' is healthy again")
+        replica.healthy = True
+        replica.lagging = False
+        replica.last_error = None
+
+    async def _run_checks(self, interval: float) -> None:
+        """Check the replicas every interval until cancelled."""
+        while True:
+            await self.check_replicas()
+            await asyncio.sleep(interval)
+
+
+def _engine_name(engine: AsyncEngine, index: int) -> str:
+    """Name a replica by its host and database, without credentials."""
+    url = getattr(engine, "url", None)
+    host = getattr(url, "host", None)
+    database = getattr(url, "database", None)
+    if isinstance(host, str) and host:
+        return f"{host}/{database}" if isinstance(database, str) else host
+    if isinstance(database, str) and database:
+        return database
+    return f"replica-{index}"
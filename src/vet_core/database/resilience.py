@@ -0,0 +1,485 @@
+"""
+Resilient execution of database operations for the vet-core package.
+
+Retrying transient failures with plain exponential backoff makes every
+worker retry in lockstep during a failover, hitting the primary together
+as soon as it returns. ``ResilientExecutor`` retries with:
+
+- Full-jitter backoff: each delay is drawn uniformly between zero and the
+  exponential delay, capped at ``max_delay``
+- A circuit breaker shared by all callers of an engine, which rejects
+  calls for ``reset_timeout`` seconds after ``failure_threshold``
+  consecutive transient failures and then lets one trial call through
+- Request deadlines: ``deadline(seconds)`` sets a budget in a context
+  variable, so nested calls and tasks created inside it share it, and
+  attempts and backoff sleeps never run past it
+
+Errors are classified with ``DatabaseException.is_retryable``; transient
+SQLAlchemy and driver errors are classified as ``ConnectionException``.
+
+Example:
+    >>> with deadline(2.0):
+    ...     pets = await session_manager.execute_with_retry(list_pets)
+    >>> session_manager.get_resilience_stats().circuit_state
+    'closed'
+"""
+
+import asyncio
+import enum
+import logging
+import random
+import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterator, Optional, TypeVar, Union
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError, DisconnectionError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..exceptions import (
+    CircuitOpenException,
+    ConnectionException,
+    DatabaseException,
+    DeadlineExceededException,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+DEFAULT_MAX_DELAY = 30.0
+
+# Absolute time.monotonic() at which the current request must finish
+_deadline: ContextVar[Optional[float]] = ContextVar("vet_core_deadline", default=None)
+
+_executors: "weakref.WeakKeyDictionary[Engine, ResilientExecutor]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class CircuitState(str, enum.Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Limit the time the enclosed database operations may take.
+
+    Nested deadlines never extend an enclosing one.
+
+    Args:
+        seconds: Budget for the block
+
+    Yields:
+        The absolute ``time.monotonic()`` deadline in effect
+
+    Example:
+        >>> with deadline(1.5):
+        ...     await session_manager.execute_with_retry(book_appointment)
+    """
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+    token = _deadline.set(expires_at)
+    try:
+        yield expires_at
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Get the seconds left before the current deadline.
+
+    Returns:
+        Seconds left (zero or less once expired), or None without a deadline
+    """
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+def classify_error(error: BaseException) -> Optional[DatabaseException]:
+    """
+    Describe an error as a DatabaseException for retry decisions.
+
+    Args:
+        error: Error raised by a database operation
+
+    Returns:
+        The error itself if it is a DatabaseException, a ConnectionException
+        for transient SQLAlchemy or driver errors, or None for other errors
+    """
+    if isinstance(error, DatabaseException):
+        return error
+    if isinstance(error, (DisconnectionError, OperationalError)) or (
+        isinstance(error, DBAPIError) and error.connection_invalidated
+    ):
+        return ConnectionException(str(error), original_error=error)
+    if isinstance(error, (asyncio.TimeoutError, ConnectionError)):
+        return ConnectionException(
+            str(error) or type(error).__name__, original_error=error
+        )
+    return None
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Check if an error is worth retrying.
+
+    Args:
+        error: Error raised by a database operation
+
+    Returns:
+        True if the classified error reports itself as retryable
+    """
+    classified = classify_error(error)
+    return classified is not None and classified.is_retryable()
+
+
+@dataclass
+class RetryPolicy:
+    """How often and how long to wait between attempts."""
+
+    max_retries: int = 3
+    base_delay: float = 1.0
+    max_delay: float = DEFAULT_MAX_DELAY
+    exponential: bool = True
+    jitter: bool = True
+
+    def compute_delay(self, attempt: int) -> float:
+        """
+        Get the delay before the retry following an attempt.
+
+        Args:
+            attempt: Zero-based number of the failed attempt
+
+        Returns:
+            Delay in seconds; with jitter, drawn from zero to the capped
+            exponential delay
+        """
+        delay = self.base_delay * (2**attempt if self.exponential else 1)
+        delay = min(delay, self.max_delay)
+        if self.jitter:
+            return random.uniform(0.0, delay)
+        return delay
+
+
+class CircuitBreaker:
+    """Stops calls to a failing database until it has had time to recover."""
+
+    def __init__(
+        self,
+        name: str = "database",
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a closed circuit breaker.
+
+        Args:
+            name: Name used in logs and errors
+            failure_threshold: Consecutive transient failures that open it
+            reset_timeout: Seconds it stays open before allowing trial calls
+            half_open_max_calls: Trial calls allowed at once while half-open
+            clock: Monotonic time source, replaceable in tests
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open breaker past its timeout is half-open."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_calls = 0
+            logger.info(f"Circuit breaker '{self.name}' half-open, allowing trials")
+        return self._state
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Transient failures since the last success."""
+        return self._consecutive_failures
+
+    def before_call(self) -> None:
+        """
+        Admit a call or reject it.
+
+        Raises:
+            CircuitOpenException: If the breaker is open, or half-open with
+                its trial calls in progress
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+        if (
+            state is CircuitState.HALF_OPEN
+            and self._trial_calls < self.half_open_max_calls
+        ):
+            self._trial_calls += 1
+            return
+
+        self.rejected += 1
+        retry_after = max(0.0, self._opened_at + self.reset_timeout - self._clock())
+        raise CircuitOpenException(
+            f"Database circuit breaker '{self.name}' is open",
+            circuit=self.name,
+            retry_after=retry_after,
+        )
+
+    def record_success(self) -> None:
+        """Record a successful call, closing a half-open breaker."""
+        if self._state is not CircuitState.CLOSED:
+            logger.info(f"Circuit breaker '{self.name}' closed after a trial call")
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._trial_calls = 0
+
+    def record_failure(self) -> None:
+        """Record a transient failure, opening the breaker at the threshold."""
+        self._consecutive_failures += 1
+        state = self.state
+        if state is CircuitState.HALF_OPEN or (
+            state is CircuitState.CLOSED
+            and self._consecutive_failures >= self.failure_threshold
+        ):
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock()
+            self.trips += 1
+            logger.warning(
+                f"Circuit breaker '{self.name}' opened after "
+                f"{self._consecutive_failures} consecutive failures"
+            )
+
+    def release(self) -> None:
+        """Free the trial slot of a half-open call that was cancelled."""
+        if self._state is CircuitState.HALF_OPEN and self._trial_calls > 0:
+            self._trial_calls -= 1
+
+    def reset(self) -> None:
+        """Close the breaker and clear its failure count."""
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._trial_calls = 0
+
+
+@dataclass
+class ResilienceStats:
+    """Counters of a ResilientExecutor and its circuit breaker."""
+
+    calls: int = 0
+    successes: int = 0
+    failures: int = 0
+    retries: int = 0
+    deadline_exceeded: int = 0
+    circuit_state: str = CircuitState.CLOSED.value
+    circuit_trips: int = 0
+    circuit_rejections: int = 0
+    consecutive_failures: int = 0
+
+
+class ResilientExecutor:
+    """Runs operations with jittered retries, a circuit breaker and deadlines."""
+
+    def __init__(self, breaker: Optional[CircuitBreaker] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            breaker: Circuit breaker shared by the callers of one database,
+                or None to retry without one
+        """
+        self.breaker = breaker
+        self._stats = ResilienceStats()
+
+    async def run(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        policy: Optional[RetryPolicy] = None,
+        operation_name: Optional[str] = None,
+        log: Optional[logging.Logger] = None,
+    ) -> T:
+        """
+        Run an operation, retrying transient failures.
+
+        Args:
+            operation: Zero-argument coroutine function to run per attempt
+            policy: Retry policy; defaults to ``RetryPolicy()``
+            operation_name: Name used in logs and errors
+            log: Logger for retry messages; defaults to this module's
+
+        Returns:
+            Result of the operation
+
+        Raises:
+            CircuitOpenException: If the circuit breaker rejects an attempt
+            DeadlineExceededException: If the current deadline expires
+            Exception: The operation's last error if it is not retryable or
+                all retries fail
+        """
+        policy = policy or RetryPolicy()
+        name = operation_name or str(getattr(operation, "__name__", operation))
+        log = log or logger
+        self._stats.calls += 1
+        attempt = 0
+
+        while True:
+            budget = remaining_time()
+            if budget is not None and budget <= 0:
+                raise self._deadline_exceeded(name, attempt)
+            if self.breaker is not None:
+                self.breaker.before_call()
+
+            try:
+                if budget is None:
+                    result = await operation()
+                else:
+                    result = await asyncio.wait_for(operation(), timeout=budget)
+            except asyncio.CancelledError:
+                if self.breaker is not None:
+                    self.breaker.release()
+                raise
+            except Exception as e:
+                budget = remaining_time()
+                if budget is not None and budget <= 0:
+                    self._record_failure()
+                    raise self._deadline_exceeded(name, attempt + 1, e) from e
+
+                if not is_transient_error(e):
+                    # The database answered; the error is the operation's own
+                    self._record_success()
+                    self._stats.failures += 1
+                    log.error(
+                        f"Non-retryable error in database operation '{name}': {e}"
+                    )
+                    raise
+
+                self._record_failure()
+                if attempt >= policy.max_retries:
+                    self._stats.failures += 1
+                    log.error(
+                        f"Database operation '{name}' failed after "
+                        f"{attempt + 1} attempts: {e}"
+                    )
+                    raise
+
+                delay = policy.compute_delay(attempt)
+                if budget is not None and delay >= budget:
+                    raise self._deadline_exceeded(name, attempt + 1, e) from e
+                log.warning(
+                    f"Database operation '{name}' failed "
+                    f"(attempt {attempt + 1}/{policy.max_retries + 1}), "
+                    f"retrying in {delay:.3f}s: {e}"
+                )
+                self._stats.retries += 1
+                attempt += 1
+                await asyncio.sleep(delay)
+            else:
+                self._stats.successes += 1
+                self._record_success()
+                return result
+
+    def stats(self) -> ResilienceStats:
+        """
+        Get a copy of the executor's counters.
+
+        Returns:
+            Counters, including the circuit breaker state and trips
+        """
+        stats = ResilienceStats(**vars(self._stats))
+        if self.breaker is not None:
+            stats.circuit_state = self.breaker.state.value
+            stats.circuit_trips = self.breaker.trips
+            stats.circuit_rejections = self.breaker.rejected
+            stats.consecutive_failures = self.breaker.consecutive_failures
+        return stats
+
+    def reset_stats(self) -> None:
+        """Clear the counters, keeping the circuit breaker state."""
+        self._stats = ResilienceStats()
+        if self.breaker is not None:
+            self.breaker.trips = 0
+            self.breaker.rejected = 0
+
+    def _record_success(self) -> None:
+        """Report a call the database answered to the circuit breaker."""
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def _record_failure(self) -> None:
+        """Count a transient failure against the circuit breaker."""
+        if self.breaker is not None:
+            self.breaker.record_failure()
+
+    def _deadline_exceeded(
+        self, name: str, attempts: int, error: Optional[Exception] = None
+    ) -> DeadlineExceededException:
+        """Build the error for an operation that ran out of time."""
+        self._stats.deadline_exceeded += 1
+        self._stats.failures += 1
+        return DeadlineExceededException(
+            f"Database operation '{name}' exceeded its deadline "
+            f"after {attempts} attempts",
+            operation=name,
+            attempts=attempts,
+            original_error=error,
+        )
+
+
+def get_resilient_executor(
+    engine: Union[Engine, AsyncEngine],
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+    reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+) -> ResilientExecutor:
+    """
+    Get the executor, and circuit breaker, shared by all callers of an engine.
+
+    The breaker settings only apply when the executor is first created.
+
+    Args:
+        engine: Engine the operations use
+        failure_threshold: Consecutive transient failures that open the
+            breaker
+        reset_timeout: Seconds the breaker stays open
+
+    Returns:
+        The engine's executor
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    executor = _executors.get(sync_engine)
+    if executor is None:
+        url = getattr(sync_engine, "url", None)
+        host = getattr(url, "host", None)
+        breaker = CircuitBreaker(
+            name=host if isinstance(host, str) and host else "database",
+            failure_threshold=failure_threshold,
+            reset_timeout=reset_timeout,
+        )
+        executor = _executors[sync_engine] = ResilientExecutor(breaker)
+    return executor
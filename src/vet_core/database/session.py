@@ -9,14 +9,44 @@ import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Optional
-
-from sqlalchemy import MetaData, text
-from sqlalchemy.exc import DisconnectionError, OperationalError, SQLAlchemyError
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+)
+
+from sqlalchemy import MetaData, Select, text
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import Pool
 
 from ..exceptions import DatabaseException, TransactionException
+from . import bulk, export
+from .cache import (
+    DEFAULT_CACHE_ENTRIES,
+    DEFAULT_CACHE_TTL,
+    ENTITY_CACHE_KEY,
+    CacheBackend,
+    CacheStats,
+    EntityCache,
+)
+from .health import DEFAULT_PROBE_INTERVAL, HealthMonitor, HealthSnapshot
+from .instrumentation import QueryStatsSnapshot, get_instrumentation
+from .nplusone import DEFAULT_NPLUSONE_THRESHOLD, NPlusOneDetector
+from .replicas import DEFAULT_STICKY_SECONDS, ReplicaRouter, track_writes
+from .resilience import (
+    DEFAULT_MAX_DELAY,
+    ResilienceStats,
+    RetryPolicy,
+    get_resilient_executor,
+    is_transient_error,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,16 +55,45 @@ class SessionManager:
     """Manages database sessions and provides transaction utilities."""
 
     def __init__(
-        self, engine: AsyncEngine, session_config: Optional[Dict[str, Any]] = None
+        self,
+        engine: AsyncEngine,
+        session_config: Optional[Dict[str, Any]] = None,
+        replicas: Optional[Sequence[AsyncEngine]] = None,
+        replica_strategy: str = "round_robin",
+        max_replica_lag: Optional[float] = None,
+        sticky_seconds: float = DEFAULT_STICKY_SECONDS,
     ):
         """
         Initialize session manager with database engine.
 
         Args:
-            engine: SQLAlchemy async engine
+            engine: SQLAlchemy async engine of the primary database
             session_config: Optional session configuration overrides
+            replicas: Optional engines of read replicas, used by
+                ``get_session(readonly=True)``
+            replica_strategy: ``"round_robin"`` or ``"least_connections"``
+            max_replica_lag: Replication lag in seconds above which a
+                replica is not used; None to ignore lag. Lag is measured by
+                the replica checks started with ``start_health_monitor()``
+                or run with ``check_replicas()``
+            sticky_seconds: Minimum time reads stay on the primary after
+                the request committed a write
         """
         self.engine = engine
+        self.replica_router: Optional[ReplicaRouter] = None
+        if replicas:
+            self.replica_router = ReplicaRouter(
+                engine,
+                replicas,
+                strategy=replica_strategy,
+                max_lag_seconds=max_replica_lag,
+                sticky_seconds=sticky_seconds,
+            )
+        self.nplusone_detector: Optional[NPlusOneDetector] = None
+        self.entity_cache: Optional[EntityCache] = None
+        self.health_monitor: Optional[HealthMonitor] = None
+        # Serializes forced checks so they share one monitor probe
+        self._forced_probe_lock = asyncio.Lock()
         self._is_initialized = False
         self._health_check_interval = 30.0  # seconds
         self._last_health_check = 0.0
@@ -57,21 +116,131 @@ class SessionManager:
             expire_on_commit=default_config.get("expire_on_commit", False),
         )
 
-    async def create_session(self) -> AsyncSession:
+    async def create_session(self, bind: Optional[AsyncEngine] = None) -> AsyncSession:
         """
         Create a new database session.
 
+        Sessions are watched for N+1 queries when detection is enabled, and
+        carry the entity cache in ``session.info`` when it is enabled.
+
+        Args:
+            bind: Engine to use instead of the primary, e.g. a replica
+
         Returns:
             New async database session
         """
-        session = self.session_factory()
+        if bind is None:
+            session = self.session_factory()
+            if self.replica_router is not None:
+                track_writes(session)
+        else:
+            session = self.session_factory(bind=bind)
+        if self.nplusone_detector is not None:
+            self.nplusone_detector.attach(session)
+        if self.entity_cache is not None:
+            session.info[ENTITY_CACHE_KEY] = self.entity_cache
         return session
 
+    def enable_nplusone_detection(
+        self,
+        threshold: int = DEFAULT_NPLUSONE_THRESHOLD,
+        action: str = "warn",
+        ignore: Sequence[str] = (),
+    ) -> NPlusOneDetector:
+        """
+        Watch every session created from now on for N+1 queries.
+
+        A statement executed threshold times in one session with different
+        parameters, typically a lazy-loaded relationship walked in a loop, is
+        logged or raised as NPlusOneQueryException. Intended for tests and
+        staging. Use ``NPlusOneDetector.scope(session)`` to count a request
+        separately within a longer-lived session.
+
+        Args:
+            threshold: Number of executions of one statement that is reported
+            action: ``"warn"`` or ``"raise"``
+            ignore: Statement substrings or relationship names, such as
+                ``"Pet.owner"``, that are never reported
+
+        Returns:
+            The detector attached to new sessions
+        """
+        self.nplusone_detector = NPlusOneDetector(threshold, action, ignore)
+        return self.nplusone_detector
+
+    def disable_nplusone_detection(self) -> None:
+        """Stop watching sessions created from now on for N+1 queries."""
+        self.nplusone_detector = None
+
+    def enable_entity_cache(
+        self,
+        models: Optional[Sequence[type]] = None,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+        ttl: float = DEFAULT_CACHE_TTL,
+        backend: Optional[CacheBackend] = None,
+    ) -> EntityCache:
+        """
+        Cache slowly-changing entities by primary key for new sessions.
+
+        Repositories of the cached models answer ``get_by_id`` from the
+        cache. Rows written through any session are evicted when its
+        transaction commits.
+
+        Args:
+            models: Mapped classes to cache; defaults to Clinic and
+                Veterinarian
+            max_entries: Size bound of the in-process cache
+            ttl: Seconds an entry is kept
+            backend: Optional shared store consulted on local misses;
+                other processes' in-process copies of a changed row are
+                only dropped when they expire
+
+        Returns:
+            The cache used by new sessions
+        """
+        if models is None:
+            from ..models import Clinic, Veterinarian
+
+            models = (Clinic, Veterinarian)
+        if self.entity_cache is not None:
+            self.entity_cache.disable()
+        self.entity_cache = EntityCache(models, max_entries, ttl, backend)
+        self.entity_cache.enable()
+        return self.entity_cache
+
+    def disable_entity_cache(self) -> None:
+        """Stop caching entities for new sessions and drop the cache."""
+        if self.entity_cache is not None:
+            self.entity_cache.disable()
+            self.entity_cache = None
+
+    def get_cache_stats(self) -> Optional[CacheStats]:
+        """
+        Get the entity cache counters.
+
+        Returns:
+            Cache counters, or None if the cache is not enabled
+        """
+        if self.entity_cache is None:
+            return None
+        return self.entity_cache.stats()
+
     @asynccontextmanager
-    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
+    async def get_session(
+        self, loading_profile: Optional[str] = None, readonly: bool = False
+    ) -> AsyncGenerator[AsyncSession, None]:
         """
         Context manager for database sessions with automatic cleanup.
 
+        Args:
+            loading_profile: Column loading profile ("summary", "scheduling"
+                or "full") applied to every model selected in the session,
+                unless a statement sets its own ``loading_profile`` execution
+                option. See ``BaseModel.loading_options``.
+            readonly: Serve the session from a read replica when replicas
+                are configured, one is healthy, and the request has not
+                just committed a write; otherwise the primary is used
+
         Yields:
             Database session
 
@@ -79,22 +248,47 @@ class SessionManager:
             async with session_manager.get_session() as session:
                 # Use session for database operations
                 result = await session.execute(select(User))
+
+            async with session_manager.get_session("summary") as session:
+                # Large JSON columns are deferred
+                pets = (await session.scalars(select(Pet))).all()
         """
-        session = await self.create_session()
+        router = self.replica_router
+        replica = router.choose() if readonly and router is not None else None
+
+        if replica is None:
+            session = await self.create_session()
+        else:
+            session = await self.create_session(replica.engine)
+            session.info["replica"] = replica.name
+            replica.active_sessions += 1
+            replica.sessions += 1
+        if loading_profile is not None:
+            session.info["loading_profile"] = loading_profile
         try:
             yield session
         except Exception as e:
             await session.rollback()
             logger.error(f"Session error, rolling back: {e}")
+            if router is not None and replica is not None and is_transient_error(e):
+                router.mark_failed(replica, e)
             raise
         finally:
             await session.close()
+            if replica is not None:
+                replica.active_sessions -= 1
 
     @asynccontextmanager
-    async def get_transaction(self) -> AsyncGenerator[AsyncSession, None]:
+    async def get_transaction(
+        self, loading_profile: Optional[str] = None
+    ) -> AsyncGenerator[AsyncSession, None]:
         """
         Context manager for database transactions with automatic commit/rollback.
 
+        Args:
+            loading_profile: Column loading profile applied to every model
+                selected in the transaction (see ``get_session``)
+
         Yields:
             Database session within a transaction
 
@@ -105,7 +299,7 @@ class SessionManager:
                 session.add(user)
                 # Transaction is automatically committed on success
         """
-        async with self.get_session() as session:
+        async with self.get_session(loading_profile) as session:
             async with session.begin():
                 try:
                     yield session
@@ -160,12 +354,30 @@ class SessionManager:
         """
         Comprehensive health check for database sessions and connections.
 
+        While a health monitor is running, the monitor's cached snapshot is
+        returned without database I/O. ``force`` then reports the latest
+        probe, running one only if none ran within the monitor's interval,
+        so forced checks on the request path cannot flood the database.
+
         Args:
             force: Force health check even if recently performed
 
         Returns:
             Dictionary with health check results
         """
+        monitor = self.health_monitor
+        if monitor is not None and monitor.is_running:
+            if not force:
+                return self._monitor_health(monitor.snapshot, probed=False)
+            async with self._forced_probe_lock:
+                snapshot = monitor.snapshot
+                if (
+                    snapshot.checked_at is None
+                    or time.time() - snapshot.checked_at >= monitor.interval
+                ):
+                    snapshot = await monitor.probe_once()
+            return self._monitor_health(snapshot, probed=True)
+
         current_time = time.time()
 
         # Skip if recently checked (unless forced)
@@ -247,6 +459,131 @@ class SessionManager:
 
         return health_status
 
+    def _monitor_health(self, snapshot: HealthSnapshot, probed: bool) -> Dict[str, Any]:
+        """Convert a monitor snapshot to the health_check result format."""
+        if probed:
+            # A forced check reports the latest probe, as before
+            passed = snapshot.consecutive_failures == 0
+            status = "healthy" if passed else "unhealthy"
+        else:
+            passed = snapshot.status in ("healthy", "degraded")
+            status = snapshot.status
+
+        basic_query: Dict[str, Any] = {"status": "pass" if passed else "fail"}
+        if passed and snapshot.latency_ms is not None:
+            basic_query["response_time"] = round(snapshot.latency_ms, 2)
+        elif not passed and snapshot.last_error:
+            basic_query["error"] = snapshot.last_error
+
+        pool = snapshot.pool
+        return {
+            "status": status,
+            "timestamp": snapshot.checked_at,
+            "checks": {"basic_query": basic_query},
+            "pool_info": {
+                "size": pool.size,
+                "checked_out": pool.checked_out,
+                "overflow": pool.overflow,
+                "saturation": round(pool.current, 3),
+                "saturation_trend": pool.trend,
+            },
+            "monitor": snapshot.to_dict(),
+        }
+
+    def start_health_monitor(
+        self, interval: float = DEFAULT_PROBE_INTERVAL, **options: Any
+    ) -> HealthMonitor:
+        """
+        Probe the database from a background task instead of per call.
+
+        Must be called from a running event loop. Afterwards health_check,
+        get_health_snapshot, readiness and liveness read the monitor's
+        cached snapshot, so load balancer probes do not take connections
+        from the pool. Read replicas, if any, are checked for connectivity
+        and replication lag at the same interval.
+
+        Args:
+            interval: Seconds between probes
+            **options: Other HealthMonitor options, such as timeout,
+                window_size, failure_threshold or degraded_latency_ms
+
+        Returns:
+            The running monitor
+        """
+        if self.health_monitor is None or not self.health_monitor.is_running:
+            self.health_monitor = HealthMonitor(self.engine, interval, **options)
+            self.health_monitor.start()
+            logger.info(f"Database health monitor started, probing every {interval}s")
+        if self.replica_router is not None:
+            self.replica_router.start_health_checks(interval)
+        return self.health_monitor
+
+    async def stop_health_monitor(self) -> None:
+        """Stop the background health monitor and replica checks, if running."""
+        if self.replica_router is not None:
+            await self.replica_router.stop_health_checks()
+        monitor, self.health_monitor = self.health_monitor, None
+        if monitor is not None:
+            await monitor.stop()
+            logger.info("Database health monitor stopped")
+
+    def get_health_snapshot(self) -> Optional[HealthSnapshot]:
+        """
+        Get the health monitor's latest snapshot without database I/O.
+
+        Returns:
+            Latest snapshot, or None if no monitor was started
+        """
+        if self.health_monitor is None:
+            return None
+        return self.health_monitor.snapshot
+
+    def readiness(self) -> Dict[str, Any]:
+        """
+        Readiness check for service endpoints, read from the cached snapshot.
+
+        Ready means the database answered a probe recently and is not
+        unhealthy. Performs no database I/O.
+
+        Returns:
+            Dictionary with ``ready``, ``status`` and the snapshot details
+        """
+        snapshot = self.get_health_snapshot()
+        if snapshot is None:
+            return {
+                "ready": False,
+                "status": "unknown",
+                "reason": "monitor_not_started",
+            }
+        return {
+            "ready": snapshot.ready,
+            "status": snapshot.status,
+            "last_success_at": snapshot.last_success_at,
+            "consecutive_failures": snapshot.consecutive_failures,
+            "latency_p95_ms": round(snapshot.latency_p95_ms, 2),
+            "pool_saturation": round(snapshot.pool.current, 3),
+            "pool_saturation_trend": snapshot.pool.trend,
+        }
+
+    def liveness(self) -> Dict[str, Any]:
+        """
+        Liveness check for service endpoints, read from the cached snapshot.
+
+        Live means the monitor task is running and has probed recently,
+        whatever the probe result. Performs no database I/O.
+
+        Returns:
+            Dictionary with ``live`` and the time of the last probe
+        """
+        snapshot = self.get_health_snapshot()
+        if snapshot is None:
+            return {"live": False, "reason": "monitor_not_started"}
+        return {
+            "live": snapshot.live,
+            "monitor_running": snapshot.monitor_running,
+            "checked_at": snapshot.checked_at,
+        }
+
     async def initialize_database(self, metadata: Optional[MetaData] = None) -> bool:
         """
         Initialize database schema and perform setup operations.
@@ -317,10 +654,15 @@ class SessionManager:
             return False
 
     async def close_all_sessions(self) -> None:
-        """Close all active sessions and dispose of the engine."""
+        """Close all active sessions and dispose of the engines."""
+        await self.stop_health_monitor()
         try:
             # Dispose of the engine (closes all connections)
             await self.engine.dispose()
+            if self.replica_router is not None:
+                await self.replica_router.stop_health_checks()
+                for replica in self.replica_router.replicas:
+                    await replica.engine.dispose()
             logger.info("All database sessions and connections closed")
         except Exception as e:
             logger.error(f"Error closing database sessions: {e}")
@@ -331,71 +673,174 @@ class SessionManager:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         exponential_backoff: bool = True,
+        jitter: bool = True,
+        max_delay: float = DEFAULT_MAX_DELAY,
     ) -> Any:
         """
         Execute a database operation with retry logic for transient failures.
 
+        Each attempt runs in its own transaction. Retries wait a random delay
+        of up to the exponential backoff delay (full jitter), so callers
+        failing together do not retry together. Attempts go through the
+        engine's shared circuit breaker and stop at the deadline set with
+        ``vet_core.database.deadline()``.
+
         Args:
             operation: Async function that takes a session and returns a result
             max_retries: Maximum number of retry attempts
             retry_delay: Initial delay between retries in seconds
             exponential_backoff: Whether to use exponential backoff
+            jitter: Whether to randomize delays between zero and the backoff
+            max_delay: Upper bound of a single delay in seconds
 
         Returns:
             Result of the operation
 
         Raises:
+            CircuitOpenException: If the engine's circuit breaker is open
+            DeadlineExceededException: If the current deadline expires
             DatabaseException: If operation fails after all retries
         """
-        last_exception = None
+        operation_name = (
+            operation.__name__ if hasattr(operation, "__name__") else str(operation)
+        )
+        policy = RetryPolicy(
+            max_retries=max_retries,
+            base_delay=retry_delay,
+            max_delay=max_delay,
+            exponential=exponential_backoff,
+            jitter=jitter,
+        )
 
-        for attempt in range(max_retries + 1):
-            try:
-                async with self.get_transaction() as session:
-                    return await operation(session)
-
-            except (DisconnectionError, OperationalError) as e:
-                last_exception = e
-                if attempt < max_retries:
-                    delay = retry_delay * (2**attempt if exponential_backoff else 1)
-                    logger.warning(
-                        f"Database operation failed (attempt {attempt + 1}/{max_retries + 1}), "
-                        f"retrying in {delay}s: {e}"
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    logger.error(
-                        f"Database operation failed after {max_retries + 1} attempts: {e}"
-                    )
+        async def attempt() -> Any:
+            async with self.get_transaction() as session:
+                return await operation(session)
 
-            except Exception as e:
-                # Don't retry for non-transient errors
-                logger.error(f"Non-retryable database operation error: {e}")
+        try:
+            return await get_resilient_executor(self.engine).run(
+                attempt, policy, operation_name, logger
+            )
+        except DatabaseException:
+            raise
+        except Exception as e:
+            if is_transient_error(e):
+                # All retries failed
                 raise DatabaseException(
-                    "Database operation failed",
-                    details={
-                        "operation": (
-                            operation.__name__
-                            if hasattr(operation, "__name__")
-                            else str(operation)
-                        )
-                    },
+                    f"Database operation failed after {max_retries + 1} attempts",
+                    details={"operation": operation_name, "max_retries": max_retries},
                     original_error=e,
                 )
+            raise DatabaseException(
+                "Database operation failed",
+                details={"operation": operation_name},
+                original_error=e,
+            )
 
-        # If we get here, all retries failed
-        raise DatabaseException(
-            f"Database operation failed after {max_retries + 1} attempts",
-            details={
-                "operation": (
-                    operation.__name__
-                    if hasattr(operation, "__name__")
-                    else str(operation)
-                ),
-                "max_retries": max_retries,
-            },
-            original_error=last_exception,
-        )
+    def get_resilience_stats(self) -> ResilienceStats:
+        """
+        Get the retry and circuit breaker counters of the engine.
+
+        Returns:
+            Calls, retries, failures, deadline expiries, and the circuit
+            breaker's state, trips and rejections
+        """
+        return get_resilient_executor(self.engine).stats()
+
+    async def bulk_insert(
+        self,
+        model: Any,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int = bulk.DEFAULT_BATCH_SIZE,
+        use_copy: bool = True,
+    ) -> int:
+        """
+        Insert many rows of a model in one transaction.
+
+        Uses the COPY protocol on PostgreSQL with asyncpg and batched
+        ``executemany`` inserts elsewhere. See ``vet_core.database.bulk``.
+
+        Args:
+            model: Mapped model class, e.g. ``Pet``
+            rows: Row dictionaries keyed by column name; may be a generator
+            batch_size: Number of rows written per statement
+            use_copy: Whether COPY may be used when the driver supports it
+
+        Returns:
+            Number of rows inserted
+
+        Example:
+            count = await session_manager.bulk_insert(
+                Pet, ({"owner_id": owner_id, "name": name, ...} for name in names)
+            )
+        """
+        async with self.get_transaction() as session:
+            return await bulk.bulk_insert(session, model, rows, batch_size, use_copy)
+
+    async def bulk_upsert(
+        self,
+        model: Any,
+        rows: Iterable[Dict[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Optional[Sequence[str]] = None,
+        batch_size: int = bulk.DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """
+        Insert many rows of a model in one transaction, updating existing rows.
+
+        Uses batched ``INSERT ... ON CONFLICT`` statements on PostgreSQL and
+        SQLite. See ``vet_core.database.bulk``.
+
+        Args:
+            model: Mapped model class, e.g. ``User``
+            rows: Row dictionaries keyed by column name; may be a generator
+            conflict_columns: Columns identifying existing rows
+            update_columns: Columns overwritten on conflict; defaults to every
+                supplied column except the conflict columns and ``id``
+            batch_size: Number of rows written per statement
+
+        Returns:
+            Number of rows processed
+        """
+        async with self.get_transaction() as session:
+            return await bulk.bulk_upsert(
+                session, model, rows, conflict_columns, update_columns, batch_size
+            )
+
+    async def export_rows(
+        self,
+        stmt: Select[Any],
+        destination: Any,
+        format: Optional[str] = None,
+        include_deleted: bool = False,
+        chunk_size: int = export.DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Export the rows of a select to a file or writer as NDJSON or CSV.
+
+        Rows are read through a server-side cursor in chunks of chunk_size
+        and written as they arrive, so memory use does not grow with the
+        number of rows. See ``vet_core.database.export``.
+
+        Args:
+            stmt: Select of a model, or of columns from one model
+            destination: File path, or an object with a ``write(str)`` method
+            format: ``"ndjson"`` or ``"csv"``; taken from the file suffix
+                when not given
+            include_deleted: Whether soft-deleted rows are exported
+            chunk_size: Number of rows fetched and written at a time
+
+        Returns:
+            Number of rows exported
+
+        Example:
+            count = await session_manager.export_rows(
+                select(Appointment), "/exports/appointments.csv"
+            )
+        """
+        async with self.get_session() as session:
+            return await export.export_rows(
+                session, stmt, destination, format, include_deleted, chunk_size
+            )
 
     @property
     def is_initialized(self) -> bool:
@@ -432,25 +877,109 @@ class SessionManager:
                 }
             )
 
+        instrumentation = get_instrumentation(self.engine)
+        if instrumentation is not None:
+            wait = instrumentation.snapshot().pool
+            status.update(
+                {
+                    "checkouts": str(wait.checkouts),
+                    "checkout_wait_p95_ms": f"{wait.p95_ms:.2f}",
+                    "checkout_wait_max_ms": f"{wait.max_ms:.2f}",
+                }
+            )
+
+        if self.entity_cache is not None:
+            cache = self.entity_cache.stats()
+            status.update(
+                {
+                    "entity_cache_hits": str(cache.hits),
+                    "entity_cache_misses": str(cache.misses),
+                    "entity_cache_hit_rate": f"{cache.hit_rate:.2f}",
+                    "entity_cache_size": str(cache.size),
+                    "entity_cache_evictions": str(cache.evictions),
+                }
+            )
+
         return status
 
+    async def check_replicas(self) -> List[Dict[str, Any]]:
+        """
+        Probe the read replicas for connectivity and replication lag.
+
+        Replicas that fail stop receiving reads until a later check passes
+        or their cooldown ends, and replicas lagging by more than
+        ``max_replica_lag`` until a later check passes. The replicas are
+        checked in the background while the health monitor is running.
+
+        Returns:
+            State of each replica; empty without replicas
+        """
+        if self.replica_router is None:
+            return []
+        replicas = await self.replica_router.check_replicas()
+        return [replica.to_dict() for replica in replicas]
+
+    def get_replica_status(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the routing strategy, primary fallbacks and replica states.
+
+        Returns:
+            Replica status, or None without replicas
+        """
+        if self.replica_router is None:
+            return None
+        return self.replica_router.status()
+
+    def get_query_stats(self) -> Optional[QueryStatsSnapshot]:
+        """
+        Get the statement statistics recorded for the engine.
+
+        Statistics are only recorded when the engine was created with
+        ``instrument_queries=True`` or instrumented with
+        ``instrument_engine``.
+
+        Returns:
+            Snapshot with per-statement calls, rows and latency percentiles
+            and pool checkout waits, or None if the engine is not
+            instrumented
+
+        Example:
+            stats = session_manager.get_query_stats()
+            for statement in stats.statements[:10]:
+                print(statement.total_ms, statement.p95_ms, statement.statement)
+        """
+        instrumentation = get_instrumentation(self.engine)
+        if instrumentation is None:
+            return None
+        return instrumentation.snapshot()
+
 
 # Global session manager instance (will be initialized by application)
 _session_manager: Optional[SessionManager] = None
 
 
-def initialize_session_manager(engine: AsyncEngine) -> SessionManager:
+def initialize_session_manager(
+    engine: AsyncEngine,
+    replicas: Optional[Sequence[AsyncEngine]] = None,
+    **replica_options: Any,
+) -> SessionManager:
     """
     Initialize the global session manager.
 
     Args:
-        engine: SQLAlchemy async engine
+        engine: SQLAlchemy async engine of the primary database
+        replicas: Optional engines of read replicas
+        **replica_options: replica_strategy, max_replica_lag or
+            sticky_seconds (see ``SessionManager``)
 
     Returns:
         Initialized session manager
     """
     global _session_manager
-    _session_manager = SessionManager(engine)
+    if replicas:
+        _session_manager = SessionManager(engine, replicas=replicas, **replica_options)
+    else:
+        _session_manager = SessionManager(engine)
     logger.info("Session manager initialized")
     return _session_manager
 
@@ -487,10 +1016,19 @@ def get_engine() -> AsyncEngine:
 
 
 @asynccontextmanager
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
+async def get_session(
+    loading_profile: Optional[str] = None,
+    readonly: bool = False,
+) -> AsyncGenerator[AsyncSession, None]:
     """
     Get a database session.
 
+    Args:
+        loading_profile: Column loading profile applied to every model
+            selected in the session ("summary", "scheduling" or "full")
+        readonly: Serve the session from a read replica when the session
+            manager was initialized with replicas
+
     Yields:
         Database session
 
@@ -498,15 +1036,21 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         RuntimeError: If session manager is not initialized
     """
     manager = get_session_manager()
-    async with manager.get_session() as session:
+    async with manager.get_session(loading_profile, readonly=readonly) as session:
         yield session
 
 
 @asynccontextmanager
-async def get_transaction() -> AsyncGenerator[AsyncSession, None]:
+async def get_transaction(
+    loading_profile: Optional[str] = None,
+) -> AsyncGenerator[AsyncSession, None]:
     """
     Get a database transaction.
 
+    Args:
+        loading_profile: Column loading profile applied to every model
+            selected in the transaction ("summary", "scheduling" or "full")
+
     Yields:
         Database session within a transaction
 
@@ -514,7 +1058,7 @@ async def get_transaction() -> AsyncGenerator[AsyncSession, None]:
         RuntimeError: If session manager is not initialized
     """
     manager = get_session_manager()
-    async with manager.get_transaction() as session:
+    async with manager.get_transaction(loading_profile) as session:
         yield session
 
 
@@ -614,5 +1158,61 @@ async def get_pool_status() -> Dict[str, Any]:
     return await manager.get_pool_status()
 
 
+def get_query_stats() -> Optional[QueryStatsSnapshot]:
+    """
+    Get the statement statistics recorded for the database engine.
+
+    Returns:
+        Statistics snapshot, or None if the engine is not instrumented
+
+    Raises:
+        RuntimeError: If session manager is not initialized
+    """
+    manager = get_session_manager()
+    return manager.get_query_stats()
+
+
+def get_resilience_stats() -> ResilienceStats:
+    """
+    Get the retry and circuit breaker counters of the database engine.
+
+    Returns:
+        Resilience counters of the engine
+
+    Raises:
+        RuntimeError: If session manager is not initialized
+    """
+    manager = get_session_manager()
+    return manager.get_resilience_stats()
+
+
+def get_cache_stats() -> Optional[CacheStats]:
+    """
+    Get the entity cache counters.
+
+    Returns:
+        Cache counters, or None if the cache is not enabled
+
+    Raises:
+        RuntimeError: If session manager is not initialized
+    """
+    manager = get_session_manager()
+    return manager.get_cache_stats()
+
+
+def get_health_snapshot() -> Optional[HealthSnapshot]:
+    """
+    Get the database health monitor's latest snapshot without database I/O.
+
+    Returns:
+        Latest snapshot, or None if no monitor was started
+
+    Raises:
+        RuntimeError: If session manager is not initialized
+    """
+    manager = get_session_manager()
+    return manager.get_health_snapshot()
+
+
 # Create session factory type for type hints
 AsyncSessionLocal = async_sessionmaker[AsyncSession]
@@ -0,0 +1,505 @@
+"""
+Clinic-keyed database sharding for the vet-core package.
+
+Appointments, pets and veterinarians all belong to a clinic, so a region
+can be split across several databases by clinic. ``ShardRouter`` keeps one
+``SessionManager`` per shard and routes each session to the shard that
+holds a clinic:
+
+- A pluggable ``ShardDirectory`` maps clinic IDs to shard names; the
+  default ``ConsistentHashDirectory`` places clinics on a hash ring with
+  virtual nodes, so adding a shard moves only about 1/N of the clinics,
+  and accepts pinned clinics that have been moved explicitly
+- ``clinic_context(clinic_id)`` sets the clinic for the current request
+  in a context variable, so ``get_session()`` needs no argument
+- ``scatter_gather()`` runs an operation on every shard in parallel with
+  ``asyncio.gather`` for cross-clinic reports, and ``fetch_all()`` merges
+  the rows of a select, optionally in sorted order and up to a limit
+
+Example:
+    >>> router = initialize_shard_router({"eu-1": engine_1, "eu-2": engine_2})
+    >>> with clinic_context(clinic_id):
+    ...     async with router.get_session() as session:
+    ...         pets = (await session.scalars(select(Pet))).all()
+    >>> recent = await router.fetch_all(
+    ...     select(Appointment).order_by(Appointment.scheduled_at.desc()),
+    ...     key=lambda appointment: appointment.scheduled_at,
+    ...     reverse=True,
+    ...     limit=50,
+    ... )
+"""
+
+import asyncio
+import bisect
+import hashlib
+import heapq
+import logging
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from ..exceptions import DatabaseException, ShardRoutingException
+from .session import SessionManager
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_VIRTUAL_NODES = 128
+
+# Clinic the current request works for
+_clinic_id: ContextVar[Optional[Any]] = ContextVar("vet_core_clinic_id", default=None)
+
+
+@contextmanager
+def clinic_context(clinic_id: Any) -> Iterator[Any]:
+    """
+    Route the enclosed sessions to the shard of a clinic.
+
+    Args:
+        clinic_id: Clinic the request works for
+
+    Yields:
+        The clinic ID
+    """
+    token = _clinic_id.set(clinic_id)
+    try:
+        yield clinic_id
+    finally:
+        _clinic_id.reset(token)
+
+
+def get_current_clinic() -> Optional[Any]:
+    """
+    Get the clinic set with ``clinic_context``.
+
+    Returns:
+        Current clinic ID, or None outside a clinic context
+    """
+    return _clinic_id.get()
+
+
+class ShardDirectory(ABC):
+    """Abstract base class for mapping clinics to shards."""
+
+    @abstractmethod
+    def shard_for(self, clinic_id: Any) -> str:
+        """
+        Get the shard holding a clinic.
+
+        Args:
+            clinic_id: Clinic ID
+
+        Returns:
+            Shard name
+        """
+        pass
+
+    @abstractmethod
+    def shard_names(self) -> List[str]:
+        """
+        List the shards in the directory.
+
+        Returns:
+            Shard names
+        """
+        pass
+
+
+class ConsistentHashDirectory(ShardDirectory):
+    """Places clinics on a consistent hash ring of shards."""
+
+    def __init__(
+        self,
+        shards: Sequence[str],
+        virtual_nodes: int = DEFAULT_VIRTUAL_NODES,
+        pinned: Optional[Mapping[Any, str]] = None,
+    ):
+        """
+        Initialize the directory.
+
+        Args:
+            shards: Shard names
+            virtual_nodes: Points per shard on the ring; more points spread
+                clinics more evenly
+            pinned: Clinics placed on a given shard regardless of the ring,
+                e.g. while moving a large clinic
+        """
+        self.virtual_nodes = max(1, virtual_nodes)
+        self._shards: List[str] = []
+        self._ring: List[Tuple[int, str]] = []
+        self._pinned: Dict[str, str] = {}
+        for shard in shards:
+            self.add_shard(shard)
+        for clinic_id, shard in (pinned or {}).items():
+            self.pin(clinic_id, shard)
+
+    def shard_for(self, clinic_id: Any) -> str:
+        """Get the shard holding a clinic."""
+        key = str(clinic_id)
+        pinned = self._pinned.get(key)
+        if pinned is not None:
+            return pinned
+        if not self._ring:
+            raise ShardRoutingException("No shards configured", clinic_id=clinic_id)
+        index = bisect.bisect(self._ring, (_hash(key),)) % len(self._ring)
+        return self._ring[index][1]
+
+    def shard_names(self) -> List[str]:
+        """List the shards in the directory."""
+        return list(self._shards)
+
+    def add_shard(self, shard: str) -> None:
+        """
+        Add a shard to the ring.
+
+        Args:
+            shard: Shard name
+        """
+        if shard in self._shards:
+            return
+        self._shards.append(shard)
+        for point in range(self.virtual_nodes):
+            bisect.insort(self._ring, (_hash(f"{shard}#{point}"), shard))
+
+    def remove_shard(self, shard: str) -> None:
+        """
+        Remove a shard; its clinics move to the next shards on the ring.
+
+        Args:
+            shard: Shard name
+        """
+        if shard in self._shards:
+            self._shards.remove(shard)
+            self._ring = [node for node in self._ring if node[1] != shard]
+
+    def pin(self, clinic_id: Any, shard: str) -> None:
+        """
+        Place a clinic on a shard regardless of the ring.
+
+        Args:
+            clinic_id: Clinic ID
+            shard: Shard name
+
+        Raises:
+            ShardRoutingException: If the shard is not in the directory
+        """
+        if shard not in self._shards:
+            raise ShardRoutingException(
+                f"Unknown shard '{shard}'", clinic_id=clinic_id, shard=shard
+            )
+        self._pinned[str(clinic_id)] = shard
+
+    def unpin(self, clinic_id: Any) -> None:
+        """
+        Place a pinned clinic by the ring again.
+
+        Args:
+            clinic_id: Clinic ID
+        """
+        self._pinned.pop(str(clinic_id), None)
+
+
+def _hash(key: str) -> int:
+    """Stable 64-bit hash of a key, the same in every process."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class ShardRouter:
+    """Routes sessions to clinic shards and runs cross-shard queries."""
+
+    def __init__(
+        self,
+        shards: Mapping[str, Union[AsyncEngine, SessionManager]],
+        directory: Optional[ShardDirectory] = None,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            shards: Engine, or SessionManager (e.g. one with replicas), of
+                each shard by name
+            directory: Clinic to shard mapping; defaults to a
+                ConsistentHashDirectory of the shard names
+
+        Raises:
+            ShardRoutingException: If the directory names unknown shards
+        """
+        if not shards:
+            raise ShardRoutingException("At least one shard is required")
+        self.managers: Dict[str, SessionManager] = {
+            name: shard if isinstance(shard, SessionManager) else SessionManager(shard)
+            for name, shard in shards.items()
+        }
+        self.directory = directory or ConsistentHashDirectory(list(self.managers))
+        unknown = set(self.directory.shard_names()) - set(self.managers)
+        if unknown:
+            raise ShardRoutingException(
+                f"Shard directory names unknown shards: {sorted(unknown)}"
+            )
+
+    def shard_for(self, clinic_id: Optional[Any] = None) -> str:
+        """
+        Get the shard of a clinic, or of the current clinic context.
+
+        Args:
+            clinic_id: Clinic ID; defaults to ``get_current_clinic()``
+
+        Returns:
+            Shard name
+
+        Raises:
+            ShardRoutingException: Without a clinic, or if the directory
+                returns an unknown shard
+        """
+        if clinic_id is None:
+            clinic_id = get_current_clinic()
+        if clinic_id is None:
+            raise ShardRoutingException(
+                "No clinic given and no clinic context is active"
+            )
+        shard = self.directory.shard_for(clinic_id)
+        if shard not in self.managers:
+            raise ShardRoutingException(
+                f"Clinic mapped to unknown shard '{shard}'",
+                clinic_id=clinic_id,
+                shard=shard,
+            )
+        return shard
+
+    def manager_for(self, clinic_id: Optional[Any] = None) -> SessionManager:
+        """
+        Get the session manager of a clinic's shard.
+
+        Args:
+            clinic_id: Clinic ID; defaults to the current clinic context
+
+        Returns:
+            Session manager of the shard
+        """
+        return self.managers[self.shard_for(clinic_id)]
+
+    @asynccontextmanager
+    async def get_session(
+        self,
+        clinic_id: Optional[Any] = None,
+        loading_profile: Optional[str] = None,
+        readonly: bool = False,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Context manager for a session on a clinic's shard.
+
+        Args:
+            clinic_id: Clinic ID; defaults to the current clinic context
+            loading_profile: Column loading profile (see
+                ``SessionManager.get_session``)
+            readonly: Use a replica of the shard if it has any
+
+        Yields:
+            Database session on the clinic's shard
+        """
+        shard = self.shard_for(clinic_id)
+        async with self.managers[shard].get_session(
+            loading_profile, readonly=readonly
+        ) as session:
+            session.info["shard"] = shard
+            yield session
+
+    @asynccontextmanager
+    async def get_transaction(
+        self, clinic_id: Optional[Any] = None, loading_profile: Optional[str] = None
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Context manager for a transaction on a clinic's shard.
+
+        Args:
+            clinic_id: Clinic ID; defaults to the current clinic context
+            loading_profile: Column loading profile
+
+        Yields:
+            Database session within a transaction on the clinic's shard
+        """
+        shard = self.shard_for(clinic_id)
+        async with self.managers[shard].get_transaction(loading_profile) as session:
+            session.info["shard"] = shard
+            yield session
+
+    async def scatter_gather(
+        self,
+        operation: Callable[[AsyncSession], Awaitable[T]],
+        shards: Optional[Sequence[str]] = None,
+        readonly: bool = True,
+    ) -> Dict[str, T]:
+        """
+        Run an operation on every shard in parallel.
+
+        Args:
+            operation: Async function that takes a session and returns a result
+            shards: Shards to query; defaults to all
+            readonly: Use replicas of the shards if they have any
+
+        Returns:
+            Result of each shard by shard name
+
+        Raises:
+            DatabaseException: If the operation fails on any shard
+        """
+        names = list(shards) if shards is not None else list(self.managers)
+
+        async def run(name: str) -> T:
+            async with self.managers[name].get_session(readonly=readonly) as session:
+                session.info["shard"] = name
+                return await operation(session)
+
+        results = await asyncio.gather(
+            *(run(name) for name in names), return_exceptions=True
+        )
+        failed = {
+            name: result
+            for name, result in zip(names, results)
+            if isinstance(result, BaseException)
+        }
+        if failed:
+            first = next(iter(failed.values()))
+            if not isinstance(first, Exception):
+                raise first
+            logger.error(f"Scatter-gather failed on shards {sorted(failed)}: {first}")
+            raise DatabaseException(
+                f"Scatter-gather query failed on {len(failed)} of {len(names)} shards",
+                details={
+                    "failed_shards": {
+                        name: str(error) for name, error in failed.items()
+                    }
+                },
+                original_error=first,
+            )
+        return {name: cast(T, result) for name, result in zip(names, results)}
+
+    async def fetch_all(
+        self,
+        stmt: Select[Any],
+        key: Optional[Callable[[Any], Any]] = None,
+        reverse: bool = False,
+        limit: Optional[int] = None,
+        shards: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        """
+        Run a select on every shard and merge the rows.
+
+        When key is given, each shard's rows must already be sorted by it
+        (give the statement the matching ``order_by``); the rows are merged
+        in order without sorting them again.
+
+        Args:
+            stmt: Select statement; single-entity or single-column selects
+                return objects or values, others return rows
+            key: Sort key of a row, for an ordered merge
+            reverse: Whether the rows are sorted in descending order
+            limit: Maximum number of rows; also applied on every shard
+            shards: Shards to query; defaults to all
+
+        Returns:
+            Merged rows
+        """
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        single = len(stmt.column_descriptions) == 1
+
+        async def fetch(session: AsyncSession) -> List[Any]:
+            result = await session.execute(stmt)
+            return list(result.scalars().all() if single else result.all())
+
+        per_shard = await self.scatter_gather(fetch, shards)
+        if key is None:
+            merged: List[Any] = [row for rows in per_shard.values() for row in rows]
+        else:
+            merged = list(heapq.merge(*per_shard.values(), key=key, reverse=reverse))
+        return merged if limit is None else merged[:limit]
+
+    async def close_all_sessions(self) -> None:
+        """Close the sessions and dispose of the engines of every shard."""
+        for manager in self.managers.values():
+            await manager.close_all_sessions()
+
+
+# Global shard router instance (initialized by the application)
+_shard_router: Optional[ShardRouter] = None
+
+
+def initialize_shard_router(
+    shards: Mapping[str, Union[AsyncEngine, SessionManager]],
+    directory: Optional[ShardDirectory] = None,
+) -> ShardRouter:
+    """
+    Initialize the global shard router.
+
+    Args:
+        shards: Engine or SessionManager of each shard by name
+        directory: Clinic to shard mapping; defaults to consistent hashing
+
+    Returns:
+        Initialized shard router
+    """
+    global _shard_router
+    _shard_router = ShardRouter(shards, directory)
+    logger.info(
+        f"Shard router initialized with shards {sorted(_shard_router.managers)}"
+    )
+    return _shard_router
+
+
+def get_shard_router() -> ShardRouter:
+    """
+    Get the global shard router.
+
+    Returns:
+        Shard router
+
+    Raises:
+        RuntimeError: If the shard router is not initialized
+    """
+    if _shard_router is None:
+        raise RuntimeError(
+            "Shard router not initialized. Call initialize_shard_router() first."
+        )
+    return _shard_router
+
+
+@asynccontextmanager
+async def get_shard_session(
+    clinic_id: Optional[Any] = None, readonly: bool = False
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get a session on a clinic's shard from the global shard router.
+
+    Args:
+        clinic_id: Clinic ID; defaults to the current clinic context
+        readonly: Use a replica of the shard if it has any
+
+    Yields:
+        Database session on the clinic's shard
+
+    Raises:
+        RuntimeError: If the shard router is not initialized
+    """
+    async with get_shard_router().get_session(clinic_id, readonly=readonly) as session:
+        yield session
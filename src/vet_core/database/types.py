@@ -2,16 +2,108 @@
 Database-agnostic column types for vet-core.
 
 This module provides column types that work across different database backends,
-particularly for handling JSON data in both PostgreSQL and SQLite.
+particularly for handling JSON data in both PostgreSQL and SQLite, along with
+helpers for querying JSON array columns on either backend.
 """
 
-from typing import Any
+import json
+import numbers
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
-from sqlalchemy import JSON, TypeDecorator
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import JSON, TypeDecorator, and_, func, literal, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB, array
 from sqlalchemy.engine import Dialect
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement, Null
 from sqlalchemy.sql.type_api import TypeEngine
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+# orjson is available for encoding and decoding JSON columns on SQLite
+ORJSON_AVAILABLE = orjson is not None
+
+# Hand types the json module rejects (or encodes differently) back to it
+_ORJSON_DUMPS_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson is not None
+    else 0
+)
+
+# A SQL expression or a mapped attribute such as ``Clinic.specialties``
+ColumnLike = Union[ColumnElement[Any], InstrumentedAttribute[Any]]
+
+# Keys of JSON records that hold calendar dates, stored without a time part
+DEFAULT_DATE_FIELDS: FrozenSet[str] = frozenset(
+    {"date", "next_due_date", "date_discovered", "date_recorded"}
+)
+
+# Keys holding lists of nested records, such as medical_history["records"]
+DEFAULT_NESTED_FIELDS: FrozenSet[str] = frozenset({"records"})
+
+
+def json_dumps(value: Any) -> str:
+    """
+    Serialize a value to a JSON string, using orjson when it is installed.
+
+    Values orjson cannot encode, such as integers wider than 64 bits, fall
+    back to the standard library encoder, as do datetimes, dataclasses,
+    subclasses of built-in types and dictionaries with non-string keys, so
+    they are encoded (or rejected with a TypeError) as by the json module.
+    Otherwise orjson differs only in writing NaN and infinite floats as null
+    rather than NaN and Infinity, and in encoding enums and UUIDs by value
+    where the json module raises a TypeError.
+
+    Args:
+        value: JSON-compatible value to serialize
+
+    Returns:
+        JSON document as a string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=_ORJSON_DUMPS_OPTIONS).decode()
+        except TypeError:
+            pass
+    return json.dumps(value)
+
+
+def json_loads(value: Any) -> Any:
+    """
+    Deserialize a JSON document, using orjson when it is installed.
+
+    Documents orjson rejects, such as ones containing NaN, fall back to the
+    standard library decoder.
+
+    Args:
+        value: JSON document as a string or bytes
+
+    Returns:
+        Deserialized value
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(value)
+
 
 class JSONType(TypeDecorator):
     """
@@ -19,12 +111,46 @@ class JSONType(TypeDecorator):
 
     Uses JSONB for PostgreSQL and JSON for other databases (like SQLite).
     This ensures compatibility across different database backends while
-    maintaining optimal performance for each.
+    maintaining optimal performance for each. On SQLite, values are encoded
+    and decoded with orjson when it is installed; see json_dumps() for how
+    that differs from the standard JSON processing.
+
+    Date fields in JSON records (and in lists of nested records, such as
+    medical_history["records"]) are normalized to plain ISO dates on the way
+    in and out. Normalization is a single pass that copies only the
+    containers it changes, so already-normalized values are returned as is.
     """
 
     impl = JSON
     cache_ok = True
 
+    def __init__(
+        self,
+        date_fields: Optional[Iterable[str]] = None,
+        nested_fields: Optional[Iterable[str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialize the column type.
+
+        Args:
+            date_fields: Record keys holding dates; defaults to
+                DEFAULT_DATE_FIELDS
+            nested_fields: Record keys holding lists of nested records;
+                defaults to DEFAULT_NESTED_FIELDS
+        """
+        super().__init__(**kwargs)
+        # Resolved once per column rather than on every bind or result value
+        self.date_fields = (
+            DEFAULT_DATE_FIELDS if date_fields is None else frozenset(date_fields)
+        )
+        self.nested_fields = (
+            DEFAULT_NESTED_FIELDS if nested_fields is None else frozenset(nested_fields)
+        )
+        # Tuples are faster than sets to iterate in the per-record loops
+        self._date_fields = tuple(sorted(self.date_fields))
+        self._nested_fields = tuple(sorted(self.nested_fields))
+
     def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
         """Load the appropriate JSON type based on the database dialect."""
         if dialect.name == "postgresql":
@@ -32,158 +158,181 @@ class JSONType(TypeDecorator):
         else:
             return dialect.type_descriptor(JSON())
 
-    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
-        """Process value when storing to database."""
-        if value is None:
-            return None
+    def bind_processor(self, dialect: Dialect) -> Optional[Callable[[Any], Any]]:
+        """Build the bind processor, fusing normalization and encoding on SQLite."""
+        if not self._uses_fast_codec(dialect, "_json_serializer"):
+            return super().bind_processor(dialect)
 
-        # Ensure date fields are stored as date strings, not datetime strings
-        if isinstance(value, list):
-            formatted_list = []
-            for item in value:
-                if isinstance(item, dict):
-                    formatted_item = item.copy()
-
-                    # Format date fields to ensure they're stored as date strings
-                    for field_name in [
-                        "date",
-                        "next_due_date",
-                        "date_discovered",
-                        "date_recorded",
-                    ]:
-                        if field_name in formatted_item and formatted_item[field_name]:
-                            date_value = formatted_item[field_name]
-                            if isinstance(date_value, str) and "T" in date_value:
-                                # Extract just the date part if it contains time
-                                formatted_item[field_name] = date_value.split("T")[0]
-
-                    formatted_list.append(formatted_item)
-                else:
-                    formatted_list.append(item)
-            return formatted_list
-        elif isinstance(value, dict):
-            # Handle single dictionary objects
-            formatted_dict = value.copy()
-
-            # Format date fields to ensure they're stored as date strings
-            for field_name in [
-                "date",
-                "next_due_date",
-                "date_discovered",
-                "date_recorded",
-            ]:
-                if field_name in formatted_dict and formatted_dict[field_name]:
-                    date_value = formatted_dict[field_name]
-                    if isinstance(date_value, str) and "T" in date_value:
-                        # Extract just the date part if it contains time
-                        formatted_dict[field_name] = date_value.split("T")[0]
-
-            # Handle nested records in medical_history
-            if "records" in formatted_dict and isinstance(
-                formatted_dict["records"], list
-            ):
-                formatted_records = []
-                for record in formatted_dict["records"]:
-                    if isinstance(record, dict):
-                        formatted_record = record.copy()
-                        for field_name in [
-                            "date",
-                            "next_due_date",
-                            "date_discovered",
-                            "date_recorded",
-                        ]:
-                            if (
-                                field_name in formatted_record
-                                and formatted_record[field_name]
-                            ):
-                                date_value = formatted_record[field_name]
-                                if isinstance(date_value, str) and "T" in date_value:
-                                    formatted_record[field_name] = date_value.split(
-                                        "T"
-                                    )[0]
-                        formatted_records.append(formatted_record)
-                    else:
-                        formatted_records.append(record)
-                formatted_dict["records"] = formatted_records
-
-            return formatted_dict
+        json_null = JSON.NULL
+        none_as_null = cast(JSON, self.impl_instance).none_as_null
+        normalize = self.normalize
 
-        return value
+        def process(value: Any) -> Any:
+            if value is json_null:
+                value = None
+            elif isinstance(value, Null) or (value is None and none_as_null):
+                return None
+            return json_dumps(normalize(value))
+
+        return process
+
+    def result_processor(
+        self, dialect: Dialect, coltype: Any
+    ) -> Optional[Callable[[Any], Any]]:
+        """Build the result processor, fusing decoding and normalization on SQLite."""
+        if not self._uses_fast_codec(dialect, "_json_deserializer"):
+            return super().result_processor(dialect, coltype)
+
+        normalize = self.normalize
+
+        def process(value: Any) -> Any:
+            if value is None:
+                return None
+            # JSON functions such as json_extract() can return plain numbers
+            if isinstance(value, numbers.Number):
+                return value
+            return normalize(json_loads(value))
+
+        return process
+
+    @staticmethod
+    def _uses_fast_codec(dialect: Dialect, engine_codec: str) -> bool:
+        """Check whether to use orjson rather than the impl's JSON processing."""
+        return (
+            dialect.name == "sqlite"
+            and ORJSON_AVAILABLE
+            # A codec configured on the engine always takes precedence
+            and getattr(dialect, engine_codec, None) is None
+        )
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        """Process value when storing to database."""
+        return self.normalize(value)
 
     def process_result_value(self, value: Any, dialect: Dialect) -> Any:
         """Process value when loading from database."""
-        if value is None:
-            return None
+        return self.normalize(value)
 
-        # Handle date formatting in vaccination records and other JSON data
-        if isinstance(value, list):
-            formatted_list = []
-            for item in value:
-                if isinstance(item, dict):
-                    formatted_item = item.copy()
-
-                    # Format date fields that might have been converted to datetime strings
-                    for field_name in [
-                        "date",
-                        "next_due_date",
-                        "date_discovered",
-                        "date_recorded",
-                    ]:
-                        if field_name in formatted_item and formatted_item[field_name]:
-                            date_value = formatted_item[field_name]
-                            if isinstance(date_value, str) and "T" in date_value:
-                                # Extract just the date part if it contains time
-                                formatted_item[field_name] = date_value.split("T")[0]
-
-                    formatted_list.append(formatted_item)
-                else:
-                    formatted_list.append(item)
-            return formatted_list
-        elif isinstance(value, dict):
-            # Handle single dictionary objects (like medical_history)
-            formatted_dict = value.copy()
-
-            # Format date fields that might have been converted to datetime strings
-            for field_name in [
-                "date",
-                "next_due_date",
-                "date_discovered",
-                "date_recorded",
-            ]:
-                if field_name in formatted_dict and formatted_dict[field_name]:
-                    date_value = formatted_dict[field_name]
-                    if isinstance(date_value, str) and "T" in date_value:
-                        # Extract just the date part if it contains time
-                        formatted_dict[field_name] = date_value.split("T")[0]
-
-            # Handle nested records in medical_history
-            if "records" in formatted_dict and isinstance(
-                formatted_dict["records"], list
-            ):
-                formatted_records = []
-                for record in formatted_dict["records"]:
-                    if isinstance(record, dict):
-                        formatted_record = record.copy()
-                        for field_name in [
-                            "date",
-                            "next_due_date",
-                            "date_discovered",
-                            "date_recorded",
-                        ]:
-                            if (
-                                field_name in formatted_record
-                                and formatted_record[field_name]
-                            ):
-                                date_value = formatted_record[field_name]
-                                if isinstance(date_value, str) and "T" in date_value:
-                                    formatted_record[field_name] = date_value.split(
-                                        "T"
-                                    )[0]
-                        formatted_records.append(formatted_record)
-                    else:
-                        formatted_records.append(record)
-                formatted_dict["records"] = formatted_records
-
-            return formatted_dict
+    def normalize(self, value: Any) -> Any:
+        """
+        Strip the time part from date fields in a JSON value.
+
+        Args:
+            value: JSON value, typically a list of records or a single record
 
+        Returns:
+            The value itself if nothing changed, otherwise a copy in which
+            only the changed records and their enclosing lists are new objects
+        """
+        if isinstance(value, list):
+            return _normalize_list(value, self._date_fields, self._nested_fields)
+        if isinstance(value, dict):
+            return _normalize_record(value, self._date_fields, self._nested_fields)
         return value
+
+
+def _normalize_list(
+    items: List[Any], date_fields: Tuple[str, ...], nested_fields: Tuple[str, ...]
+) -> List[Any]:
+    """Normalize the records in a list, copying it only if one changes."""
+    normalized = None
+    for index, item in enumerate(items):
+        if isinstance(item, dict):
+            new_item = _normalize_record(item, date_fields, nested_fields)
+            if new_item is not item:
+                if normalized is None:
+                    normalized = list(items)
+                normalized[index] = new_item
+    return items if normalized is None else normalized
+
+
+def _normalize_record(
+    record: Dict[str, Any],
+    date_fields: Tuple[str, ...],
+    nested_fields: Tuple[str, ...],
+) -> Dict[str, Any]:
+    """Normalize one record, copying it only if one of its fields changes."""
+    normalized = None
+    for field_name in date_fields:
+        if field_name in record:
+            date_value = record[field_name]
+            if isinstance(date_value, str) and "T" in date_value:
+                if normalized is None:
+                    normalized = dict(record)
+                # Extract just the date part if it contains time
+                normalized[field_name] = date_value.partition("T")[0]
+
+    for field_name in nested_fields:
+        if field_name in record:
+            nested = record[field_name]
+            if isinstance(nested, list):
+                new_nested = _normalize_list(nested, date_fields, nested_fields)
+                if new_nested is not nested:
+                    if normalized is None:
+                        normalized = dict(record)
+                    normalized[field_name] = new_nested
+
+    return record if normalized is None else normalized
+
+
+def json_contains_all(
+    column: ColumnLike, values: Sequence[Any], dialect_name: str
+) -> ColumnElement[bool]:
+    """
+    Build a predicate matching JSON arrays that contain all of the given values.
+
+    On PostgreSQL this compiles to JSONB containment (``column @> '[...]'``),
+    which is served by the GIN indexes declared on JSON columns. Other
+    databases fall back to one ``json_each`` lookup per value.
+
+    Args:
+        column: JSON array column to test
+        values: Values that must all be present in the array
+        dialect_name: Name of the database dialect the query will run on
+
+    Returns:
+        Boolean SQL expression usable in a WHERE clause
+    """
+    if dialect_name == "postgresql":
+        return type_coerce(column, JSONB).contains(list(values))
+
+    conditions = [_json_each_exists(column, [value]) for value in values]
+    return and_(*conditions)
+
+
+def json_contains_any(
+    column: ColumnLike, values: Sequence[str], dialect_name: str
+) -> ColumnElement[bool]:
+    """
+    Build a predicate matching JSON arrays that contain any of the given strings.
+
+    On PostgreSQL this compiles to the JSONB ``?|`` operator, which is served
+    by the GIN indexes declared on JSON columns. Other databases fall back to
+    a single ``json_each`` lookup.
+
+    Args:
+        column: JSON array column to test
+        values: Strings of which at least one must be present in the array
+        dialect_name: Name of the database dialect the query will run on
+
+    Returns:
+        Boolean SQL expression usable in a WHERE clause
+    """
+    if dialect_name == "postgresql":
+        has_any: ColumnElement[bool] = type_coerce(column, JSONB).has_any(
+            array(list(values))
+        )
+        return has_any
+
+    return _json_each_exists(column, values)
+
+
+def _json_each_exists(column: ColumnLike, values: Sequence[Any]) -> ColumnElement[bool]:
+    """Build an EXISTS over ``json_each(column)`` matching any of the values."""
+    elements = func.json_each(column).table_valued("value")
+    return (
+        select(literal(1))
+        .select_from(elements)
+        .where(elements.c.value.in_(list(values)))
+        .exists()
+    )
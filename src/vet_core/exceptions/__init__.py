@@ -7,13 +7,17 @@ used throughout the veterinary clinic platform.
 
 from .core_exceptions import (  # Utility functions
     BusinessRuleException,
+    CircuitOpenException,
     ConfigurationException,
     ConnectionException,
     DatabaseConfigException,
     DatabaseException,
+    DeadlineExceededException,
     EnvironmentException,
     MigrationException,
+    NPlusOneQueryException,
     SchemaValidationException,
+    ShardRoutingException,
     TransactionException,
     ValidationException,
     VetCoreException,
@@ -30,6 +34,10 @@ __all__ = [
     "ConnectionException",
     "TransactionException",
     "MigrationException",
+    "NPlusOneQueryException",
+    "CircuitOpenException",
+    "DeadlineExceededException",
+    "ShardRoutingException",
     "ValidationException",
     "SchemaValidationException",
     "BusinessRuleException",
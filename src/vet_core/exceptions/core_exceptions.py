@@ -5,7 +5,6 @@ This module defines the exception hierarchy and custom exceptions
 used throughout the veterinary clinic platform.
 """
 
-import asyncio
 import logging
 import time
 import traceback
@@ -405,6 +404,138 @@ class MigrationException(DatabaseException):
         )
 
 
+class NPlusOneQueryException(DatabaseException):
+    """Exception raised when one statement is repeated once per row (N+1)."""
+
+    def __init__(
+        self,
+        message: str = "Possible N+1 query detected",
+        statement: Optional[str] = None,
+        count: Optional[int] = None,
+        relationship: Optional[str] = None,
+    ):
+        """
+        Initialize N+1 query exception.
+
+        Args:
+            message: Error message
+            statement: Normalized SQL of the repeated statement
+            count: Number of times the statement was executed
+            relationship: Lazy-loaded relationship that issued the statement,
+                e.g. "Appointment.pet"
+        """
+        details: Dict[str, Any] = {}
+        if statement:
+            details["statement"] = statement
+        if count is not None:
+            details["count"] = count
+        if relationship:
+            details["relationship"] = relationship
+
+        super().__init__(
+            message=message,
+            error_code="DATABASE_N_PLUS_ONE_QUERY",
+            details=details,
+            max_retries=0,
+        )
+
+
+class CircuitOpenException(DatabaseException):
+    """Exception raised when a circuit breaker rejects a database call."""
+
+    def __init__(
+        self,
+        message: str = "Database circuit breaker is open",
+        circuit: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ):
+        """
+        Initialize circuit open exception.
+
+        Args:
+            message: Error message
+            circuit: Name of the circuit breaker that rejected the call
+            retry_after: Seconds until the breaker lets a trial call through
+        """
+        details: Dict[str, Any] = {}
+        if circuit:
+            details["circuit"] = circuit
+        if retry_after is not None:
+            details["retry_after"] = round(retry_after, 3)
+
+        super().__init__(
+            message=message,
+            error_code="DATABASE_CIRCUIT_OPEN",
+            details=details,
+            max_retries=0,
+        )
+
+
+class DeadlineExceededException(DatabaseException):
+    """Exception raised when a request's deadline expires before a call ends."""
+
+    def __init__(
+        self,
+        message: str = "Database operation deadline exceeded",
+        operation: Optional[str] = None,
+        attempts: Optional[int] = None,
+        original_error: Optional[Exception] = None,
+    ):
+        """
+        Initialize deadline exceeded exception.
+
+        Args:
+            message: Error message
+            operation: Name of the operation that ran out of time
+            attempts: Number of attempts made before the deadline
+            original_error: Last error of the operation, if any
+        """
+        details: Dict[str, Any] = {}
+        if operation:
+            details["operation"] = operation
+        if attempts is not None:
+            details["attempts"] = attempts
+
+        super().__init__(
+            message=message,
+            error_code="DATABASE_DEADLINE_EXCEEDED",
+            details=details,
+            original_error=original_error,
+            max_retries=0,
+        )
+
+
+class ShardRoutingException(DatabaseException):
+    """Exception raised when a session cannot be routed to a database shard."""
+
+    def __init__(
+        self,
+        message: str = "Unable to route to a database shard",
+        clinic_id: Optional[Any] = None,
+        shard: Optional[str] = None,
+    ):
+        """
+        Initialize shard routing exception.
+
+        Args:
+            message: Error message
+            clinic_id: Clinic the session was routed for, if any
+            shard: Shard name involved, if any
+        """
+        details: Dict[str, Any] = {}
+        if clinic_id is not None:
+            details["clinic_id"] = str(clinic_id)
+        if shard:
+            details["shard"] = shard
+
+        super().__init__(
+            message=message,
+            error_code="DATABASE_SHARD_ROUTING_ERROR",
+            details=details,
+            max_retries=0,
+        )
+
+
 class ValidationException(VetCoreException):
     """Base exception for data validation errors."""
 
@@ -687,15 +818,27 @@ def handle_database_retry(
     max_retries: int = 3,
     base_delay: float = 1.0,
     logger: Optional[logging.Logger] = None,
+    max_delay: float = 30.0,
+    jitter: bool = True,
+    circuit_breaker: Optional[Any] = None,
 ) -> Any:
     """
     Decorate database operations with retry logic.
 
+    Retries DatabaseExceptions that report themselves as retryable, and
+    transient SQLAlchemy connection errors, after a random delay of up to
+    the exponential backoff delay (full jitter), and stops at the deadline
+    set with ``vet_core.database.deadline()``.
+
     Args:
         operation_name: Name of the operation for logging
         max_retries: Maximum number of retry attempts
         base_delay: Base delay for exponential backoff
         logger: Logger instance to use
+        max_delay: Upper bound of a single delay in seconds
+        jitter: Whether to randomize delays between zero and the backoff
+        circuit_breaker: Optional ``vet_core.database.CircuitBreaker``
+            shared with other callers of the same database
 
     Returns:
         Decorator function
@@ -703,49 +846,24 @@ def handle_database_retry(
 
     def decorator(func: Any) -> Any:
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Imported here as vet_core.database depends on this module
+            from ..database.resilience import ResilientExecutor, RetryPolicy
+
             if logger is None:
                 operation_logger = logging.getLogger(__name__)
             else:
                 operation_logger = logger
 
-            last_exception = None
-
-            for attempt in range(max_retries + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except DatabaseException as e:
-                    last_exception = e
-
-                    if not e.is_retryable() or attempt == max_retries:
-                        operation_logger.error(
-                            f"Database operation '{operation_name}' failed after {attempt + 1} attempts",
-                            extra={"exception_data": e.to_dict()},
-                        )
-                        raise
-
-                    # Calculate delay and wait
-                    delay = base_delay * (2**attempt)
-                    operation_logger.warning(
-                        f"Database operation '{operation_name}' failed (attempt {attempt + 1}/{max_retries + 1}), "
-                        f"retrying in {delay}s",
-                        extra={"exception_data": e.to_dict()},
-                    )
-
-                    await asyncio.sleep(delay)
-
-                    # Create new exception with incremented retry count
-                    last_exception = e.increment_retry()
-                except Exception as e:
-                    # Non-database exceptions are not retryable
-                    operation_logger.error(
-                        f"Non-retryable error in database operation '{operation_name}'",
-                        extra={"error": str(e)},
-                    )
-                    raise
-
-            # This should never be reached, but just in case
-            if last_exception:
-                raise last_exception
+            policy = RetryPolicy(
+                max_retries=max_retries,
+                base_delay=base_delay,
+                max_delay=max_delay,
+                jitter=jitter,
+            )
+            executor = ResilientExecutor(circuit_breaker)
+            return await executor.run(
+                lambda: func(*args, **kwargs), policy, operation_name, operation_logger
+            )
 
         return wrapper
 
@@ -35,19 +35,46 @@ Example:
 
 import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional, TypeVar, cast
-
-from sqlalchemy import Boolean, DateTime, String, text
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from sqlalchemy import Boolean, DateTime, Select, String, event, text
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.engine import Dialect
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    ORMExecuteState,
+    Session,
+    defer,
+    mapped_column,
+)
+from sqlalchemy.orm.interfaces import ORMOption
 from sqlalchemy.sql import func
 from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.types import CHAR, TypeDecorator, TypeEngine
 
+from .serialization import get_serializer, register_serializer, to_dicts
+
 # Type variable for model classes
 T = TypeVar("T", bound="BaseModel")
 
+# Named column loading profiles, from lightest to complete
+LOADING_PROFILES = ("summary", "scheduling", "full")
+
+# Execution option and session.info key selecting a loading profile
+LOADING_PROFILE_OPTION = "loading_profile"
+
 
 class GUID(TypeDecorator):
     """
@@ -191,6 +218,10 @@ class BaseModel(Base):
 
     __abstract__ = True
 
+    # Columns deferred under each loading profile; profiles a model does not
+    # list load every column
+    __loading_profiles__: ClassVar[Dict[str, Tuple[str, ...]]] = {}
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize BaseModel with proper default values."""
         # Set default values if not provided
@@ -263,7 +294,8 @@ class BaseModel(Base):
         """
         Convert model instance to dictionary representation.
 
-        Converts all column values to JSON-serializable types:
+        Uses the serializer compiled for the model class when its mapper was
+        configured, which converts all column values to JSON-serializable types:
         - datetime objects to ISO format strings
         - UUID objects to string representation
         - Other types remain unchanged
@@ -289,16 +321,33 @@ class BaseModel(Base):
         if exclude_deleted and self.is_deleted:
             return {}
 
-        result = {}
-        for column in self.__table__.columns:
-            value = getattr(self, column.name)
-            if isinstance(value, datetime):
-                result[column.name] = value.isoformat()
-            elif isinstance(value, uuid.UUID):
-                result[column.name] = str(value)
-            else:
-                result[column.name] = value
-        return result
+        return get_serializer(type(self))(self)
+
+    @classmethod
+    def to_dicts(
+        cls, rows: Iterable["BaseModel"], exclude_deleted: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert a list of model instances to dictionary representations.
+
+        Each row is converted with its class's compiled serializer, so a page
+        of rows costs one function call per row. Values are converted as in
+        to_dict.
+
+        Args:
+            rows: Model instances to convert
+            exclude_deleted: If True, soft-deleted rows are left out of the
+                           result instead of being returned as empty dicts.
+
+        Returns:
+            List of dictionaries, one per included row, in order.
+
+        Example:
+            >>> pets = (await session.execute(select(Pet))).scalars().all()
+            >>> data = Pet.to_dicts(pets)
+            >>> print(data[0]['name'])  # "Buddy"
+        """
+        return to_dicts(rows, exclude_deleted=exclude_deleted)
 
     def soft_delete(self, deleted_by: Optional[uuid.UUID] = None) -> None:
         """
@@ -434,6 +483,43 @@ class BaseModel(Base):
         """
         return cls.is_deleted.is_(True)
 
+    @classmethod
+    def loading_options(cls, profile: str) -> List[ORMOption]:
+        """
+        Get the loader options applying a named loading profile.
+
+        Profiles defer the large JSON and text columns a query does not need:
+        "summary" keeps what lists and search results show, "scheduling"
+        additionally keeps the schedules used to book appointments, and
+        "full" loads every column. Deferred columns are loaded on first
+        access; in async sessions, load them explicitly with
+        ``await session.refresh(instance, [names])``.
+
+        Args:
+            profile: One of "summary", "scheduling" or "full"
+
+        Returns:
+            Options to pass to ``select(...).options()``
+
+        Raises:
+            ValueError: If the profile name is unknown
+
+        Example:
+            >>> stmt = select(Pet).options(*Pet.loading_options("summary"))
+            >>> # Or for every query in a session:
+            >>> async with get_session(loading_profile="summary") as session:
+            ...     pets = (await session.scalars(select(Pet))).all()
+        """
+        if profile not in LOADING_PROFILES:
+            raise ValueError(
+                f"Unknown loading profile '{profile}'. "
+                f"Must be one of: {list(LOADING_PROFILES)}"
+            )
+        return [
+            defer(getattr(cls, name))
+            for name in cls.__loading_profiles__.get(profile, ())
+        ]
+
     def update_fields(self, **kwargs: Any) -> None:
         """
         Update multiple fields on the model instance in a single operation.
@@ -471,3 +557,60 @@ class BaseModel(Base):
                 raise AttributeError(
                     f"'{self.__class__.__name__}' has no attribute '{field}'"
                 )
+
+
+@event.listens_for(BaseModel, "mapper_configured", propagate=True)
+def _compile_model_serializer(mapper: Any, model_class: type) -> None:
+    """Compile the to_dict serializer once each model's mapper is configured."""
+    register_serializer(model_class)
+
+
+@event.listens_for(BaseModel, "mapper_configured", propagate=True)
+def _check_loading_profiles(mapper: Any, model_class: Type[BaseModel]) -> None:
+    """Check that loading profiles only name columns of their model."""
+    columns = set(mapper.column_attrs.keys())
+    for profile, names in model_class.__loading_profiles__.items():
+        if profile not in LOADING_PROFILES:
+            raise ValueError(
+                f"{model_class.__name__} defines unknown loading profile '{profile}'"
+            )
+        unknown = set(names) - columns
+        if unknown:
+            raise ValueError(
+                f"{model_class.__name__} loading profile '{profile}' names "
+                f"unknown columns: {sorted(unknown)}"
+            )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _apply_loading_profile(state: ORMExecuteState) -> None:
+    """
+    Apply the loading profile selected for a query or its session.
+
+    The profile comes from the ``loading_profile`` execution option of the
+    statement, falling back to ``session.info["loading_profile"]`` as set by
+    ``get_session(loading_profile=...)``. It applies to every model selected
+    as a whole entity in a top-level ORM select.
+    """
+    if not state.is_select or state.is_column_load or state.is_relationship_load:
+        return
+
+    profile = state.execution_options.get(
+        LOADING_PROFILE_OPTION, state.session.info.get(LOADING_PROFILE_OPTION)
+    )
+    if profile is None or profile == "full":
+        return
+
+    statement = cast(Select[Any], state.statement)
+    options: List[ORMOption] = []
+    for description in statement.column_descriptions:
+        entity = description.get("entity")
+        if (
+            isinstance(entity, type)
+            and issubclass(entity, BaseModel)
+            and description["expr"] is entity
+        ):
+            options.extend(entity.loading_options(profile))
+
+    if options:
+        state.statement = statement.options(*options)
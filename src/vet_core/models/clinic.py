@@ -57,6 +57,28 @@ class Clinic(BaseModel):
 
     __tablename__ = "clinics"
 
+    # Search results keep services and specialties; booking needs the hours
+    __loading_profiles__ = {
+        "summary": (
+            "operating_hours",
+            "description",
+            "facility_features",
+            "equipment_available",
+            "insurance_accepted",
+            "payment_methods",
+            "after_hours_instructions",
+            "photos",
+        ),
+        "scheduling": (
+            "description",
+            "facility_features",
+            "equipment_available",
+            "insurance_accepted",
+            "payment_methods",
+            "photos",
+        ),
+    }
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize Clinic with default values."""
         # Set default values if not provided
@@ -87,6 +87,26 @@ class Pet(BaseModel):
 
     __tablename__ = "pets"
 
+    # Medical documents are only needed on the pet's detail pages
+    __loading_profiles__ = {
+        "summary": (
+            "additional_photos",
+            "medical_history",
+            "vaccination_records",
+            "medication_history",
+            "allergy_information",
+            "emergency_contact",
+            "special_needs",
+            "behavioral_notes",
+        ),
+        "scheduling": (
+            "additional_photos",
+            "medical_history",
+            "vaccination_records",
+            "medication_history",
+        ),
+    }
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize Pet with default values."""
         # Set default values if not provided
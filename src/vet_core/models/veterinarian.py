@@ -72,6 +72,24 @@ class Veterinarian(BaseModel):
 
     __tablename__ = "veterinarians"
 
+    # Search results keep specializations and languages; booking needs the
+    # weekly availability
+    __loading_profiles__ = {
+        "summary": (
+            "additional_certifications",
+            "availability",
+            "bio",
+            "professional_interests",
+            "professional_memberships",
+        ),
+        "scheduling": (
+            "additional_certifications",
+            "bio",
+            "professional_interests",
+            "professional_memberships",
+        ),
+    }
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize Veterinarian with default values."""
         # Set default values if not provided
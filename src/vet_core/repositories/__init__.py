@@ -0,0 +1,32 @@
+"""
+Async repositories for the vet core package.
+
+This module contains repository classes that compile search filters and
+other common access patterns into efficient SQLAlchemy queries.
+"""
+
+from .availability import get_clinic_availability
+from .base import BaseRepository
+from .clinic import ClinicRepository
+from .projection import Projection
+from .user_lookup import (
+    UserLookupCache,
+    UserLookupStats,
+    UserSnapshot,
+    get_user_lookup_cache,
+    initialize_user_lookup_cache,
+)
+from .veterinarian import VeterinarianRepository
+
+__all__ = [
+    "BaseRepository",
+    "ClinicRepository",
+    "Projection",
+    "UserLookupCache",
+    "UserLookupStats",
+    "UserSnapshot",
+    "VeterinarianRepository",
+    "get_clinic_availability",
+    "get_user_lookup_cache",
+    "initialize_user_lookup_cache",
+]
@@ -0,0 +1,141 @@
+"""
+Clinic availability queries for the vet-core package.
+
+This module builds the booking calendar for every veterinarian in a clinic
+with a fixed number of queries: one for the clinic roster and schedules, and
+one for all booked appointments in the window, served by
+idx_appointments_clinic_scheduled. The appointments are grouped per
+veterinarian and handed to the sweep-line AppointmentSlotEngine.
+"""
+
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.appointment import Appointment, AppointmentStatus
+from ..models.clinic import Clinic
+from ..models.veterinarian import Veterinarian, VeterinarianStatus
+from ..schemas.appointment import ClinicSlotAvailability
+from ..utils.datetime_utils import (
+    AppointmentSlotEngine,
+    Interval,
+    intersect_business_hours,
+    parse_clinic_operating_hours,
+    parse_veterinarian_availability,
+)
+
+# Appointments that start this long before the window may still overlap it.
+# Bounding the lookback keeps the scheduled_at predicate a plain index range.
+APPOINTMENT_LOOKBACK = timedelta(hours=24)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Attach UTC to naive datetimes returned by backends without time zones."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+async def get_clinic_availability(
+    session: AsyncSession,
+    request: ClinicSlotAvailability,
+    buffer_time: timedelta = timedelta(minutes=15),
+) -> Dict[uuid.UUID, Dict[date, List[datetime]]]:
+    """
+    Get available appointment slots for every veterinarian in a clinic.
+
+    Each veterinarian's ``availability`` is intersected with the clinic's
+    operating hours when the clinic has any. Veterinarians without an
+    availability schedule have no slots, matching
+    ``Veterinarian.is_available_on_day``. Slots are generated in the clinic's
+    time zone.
+
+    Args:
+        session: Database session
+        request: Clinic, optional veterinarians, window and slot duration
+        buffer_time: Buffer time between appointments
+
+    Returns:
+        Dictionary mapping each active veterinarian's ID to a dictionary of
+        date to available slot start times
+
+    Example:
+        >>> request = ClinicSlotAvailability(
+        ...     clinic_id=clinic.id, start_date=start, end_date=start + timedelta(days=14)
+        ... )
+        >>> calendar = await get_clinic_availability(session, request)
+        >>> calendar[veterinarian.id][start.date()]
+    """
+    roster_stmt = (
+        select(
+            Veterinarian.id,
+            Veterinarian.availability,
+            Clinic.operating_hours,
+            Clinic.timezone,
+        )
+        .join(Clinic, Veterinarian.clinic_id == Clinic.id)
+        .where(
+            Veterinarian.clinic_id == request.clinic_id,
+            Veterinarian.create_query_filter_active(),
+            Veterinarian.status == VeterinarianStatus.ACTIVE,
+        )
+    )
+    if request.veterinarian_ids:
+        roster_stmt = roster_stmt.where(Veterinarian.id.in_(request.veterinarian_ids))
+
+    roster = (await session.execute(roster_stmt)).all()
+    if not roster:
+        return {}
+
+    appointments_stmt = (
+        select(
+            Appointment.veterinarian_id,
+            Appointment.scheduled_at,
+            Appointment.duration_minutes,
+        )
+        .where(
+            Appointment.clinic_id == request.clinic_id,
+            Appointment.scheduled_at >= request.start_date - APPOINTMENT_LOOKBACK,
+            Appointment.scheduled_at < request.end_date,
+            Appointment.status != AppointmentStatus.CANCELLED,
+            Appointment.create_query_filter_active(),
+        )
+        .order_by(Appointment.scheduled_at)
+    )
+
+    booked: Dict[uuid.UUID, List[Interval]] = defaultdict(list)
+    for veterinarian_id, scheduled_at, duration_minutes in await session.execute(
+        appointments_stmt
+    ):
+        start = _as_utc(scheduled_at)
+        booked[veterinarian_id].append(
+            (start, start + timedelta(minutes=duration_minutes))
+        )
+
+    _, _, operating_hours, clinic_timezone = roster[0]
+    clinic_timezone = clinic_timezone or "UTC"
+    clinic_hours = parse_clinic_operating_hours(operating_hours)
+    tzinfo = ZoneInfo(clinic_timezone)
+    window_start = request.start_date.astimezone(tzinfo)
+    window_end = request.end_date.astimezone(tzinfo)
+    duration = timedelta(minutes=request.duration_minutes)
+
+    calendar: Dict[uuid.UUID, Dict[date, List[datetime]]] = {}
+    for veterinarian_id, availability, _, _ in roster:
+        business_hours = parse_veterinarian_availability(availability)
+        if clinic_hours:
+            business_hours = intersect_business_hours(clinic_hours, business_hours)
+
+        engine = AppointmentSlotEngine(
+            business_hours,
+            booked.get(veterinarian_id),
+            appointment_duration=duration,
+            buffer_time=buffer_time,
+            timezone=clinic_timezone,
+        )
+        calendar[veterinarian_id] = engine.get_slots_for_range(window_start, window_end)
+
+    return calendar
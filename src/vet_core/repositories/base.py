@@ -0,0 +1,121 @@
+"""
+Base repository class for the vet-core package.
+
+This module provides the foundational repository class that compiles
+model-specific queries against an async session, hiding dialect differences
+between PostgreSQL and SQLite from callers.
+"""
+
+import uuid
+from typing import Generic, Optional, Type, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database.cache import ENTITY_CACHE_KEY, EntityCache
+from ..database.pagination import DEFAULT_PAGE_SIZE, Page, paginate
+from ..models.base import BaseModel
+from .projection import Projection, SchemaT
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class BaseRepository(Generic[ModelT]):
+    """
+    Base class for async repositories bound to a single model.
+
+    Subclasses set ``model`` and build their queries with SQLAlchemy Core
+    ``select`` statements so that each operation runs as one round trip.
+    """
+
+    model: Type[ModelT]
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize the repository with a database session.
+
+        Args:
+            session: Async database session used for all queries
+        """
+        self.session = session
+
+    @property
+    def dialect_name(self) -> str:
+        """Get the name of the database dialect the session is bound to."""
+        bind = self.session.bind
+        if bind is None:
+            return "postgresql"
+        return bind.dialect.name
+
+    async def get_by_id(
+        self, entity_id: uuid.UUID, include_deleted: bool = False
+    ) -> Optional[ModelT]:
+        """
+        Get a single entity by primary key.
+
+        When the session carries an entity cache for the model (see
+        ``SessionManager.enable_entity_cache``), the entity is read through
+        the cache.
+
+        Args:
+            entity_id: Primary key of the entity
+            include_deleted: Whether soft-deleted entities are returned
+
+        Returns:
+            The entity, or None if not found
+        """
+        cache: Optional[EntityCache] = self.session.info.get(ENTITY_CACHE_KEY)
+        if cache is not None and cache.caches(self.model):
+            entity = await cache.get(self.session, self.model, entity_id)
+            if entity is not None and entity.is_deleted and not include_deleted:
+                return None
+            return entity
+
+        stmt = select(self.model).where(self.model.id == entity_id)
+        if not include_deleted:
+            stmt = stmt.where(self.model.create_query_filter_active())
+
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def list_as(
+        self,
+        schema: Type[SchemaT],
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        include_deleted: bool = False,
+    ) -> Page[SchemaT]:
+        """
+        List entities as response schema objects, newest first.
+
+        Only the columns the schema needs are selected, and the response
+        objects are built directly from the result rows, so no ORM objects
+        are loaded into the session.
+
+        Args:
+            schema: List response schema, e.g. ``PetListResponse``
+            limit: Maximum number of entities per page
+            after: Cursor returned with the previous page
+            include_deleted: Whether soft-deleted entities are returned
+
+        Returns:
+            Page of response objects ordered by creation time
+
+        Raises:
+            ConfigurationException: If the schema does not match the model
+            ValidationException: If the cursor is malformed
+        """
+        projection = Projection.for_schema(self.model, schema)
+        page = await paginate(
+            self.session,
+            projection.select(),
+            order_by=[self.model.created_at.desc()],
+            after=after,
+            limit=limit,
+            include_deleted=include_deleted,
+        )
+        return Page(
+            items=projection.from_rows(page.items),
+            next_cursor=page.next_cursor,
+            limit=page.limit,
+        )
@@ -0,0 +1,265 @@
+"""
+Clinic repository for the vet-core package.
+
+This module compiles ClinicSearchFilters into a single SQLAlchemy select,
+using a latitude/longitude bounding box ahead of the Haversine distance check,
+JSONB containment on the GIN-indexed service and specialty columns, and
+keyset pagination over the results.
+"""
+
+import math
+from typing import Any, List, Optional, Tuple, Unpack
+
+from sqlalchemy import Float, Select, cast, func, or_, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from ..database.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+)
+from ..database.types import ColumnLike, json_contains_all
+from ..models.clinic import Clinic, ClinicStatus
+from ..schemas.clinic import ClinicSearchFilters
+from .base import BaseRepository
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def bounding_box(
+    latitude: float, longitude: float, radius_km: float
+) -> Tuple[float, float, Optional[Tuple[float, float]]]:
+    """
+    Calculate the latitude/longitude box enclosing a search circle.
+
+    Args:
+        latitude: Latitude of the search centre
+        longitude: Longitude of the search centre
+        radius_km: Search radius in kilometers
+
+    Returns:
+        Tuple of (min_latitude, max_latitude, longitude_range). The longitude
+        range is None when the circle covers a pole, and its minimum is greater
+        than its maximum when the circle crosses the antimeridian.
+    """
+    angular_radius = radius_km / EARTH_RADIUS_KM
+    lat_delta = math.degrees(angular_radius)
+    min_lat = latitude - lat_delta
+    max_lat = latitude + lat_delta
+
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), min(max_lat, 90.0), None
+
+    lon_delta = math.degrees(
+        math.asin(math.sin(angular_radius) / math.cos(math.radians(latitude)))
+    )
+    min_lon = longitude - lon_delta
+    max_lon = longitude + lon_delta
+    if min_lon < -180:
+        min_lon += 360
+    if max_lon > 180:
+        max_lon -= 360
+
+    return min_lat, max_lat, (min_lon, max_lon)
+
+
+def haversine_distance_km(latitude: float, longitude: float) -> ColumnElement[float]:
+    """
+    Build a SQL expression for the distance from a point to each clinic.
+
+    Uses the same Haversine formula as ``Clinic.calculate_distance_to``.
+
+    Args:
+        latitude: Latitude of the reference point
+        longitude: Longitude of the reference point
+
+    Returns:
+        SQL expression evaluating to the distance in kilometers
+    """
+    lat1 = math.radians(latitude)
+    lon1 = math.radians(longitude)
+    lat2 = func.radians(Clinic.latitude)
+    lon2 = func.radians(Clinic.longitude)
+
+    a = func.power(func.sin((lat2 - lat1) / 2), 2) + math.cos(lat1) * func.cos(
+        lat2
+    ) * func.power(func.sin((lon2 - lon1) / 2), 2)
+    return cast(2 * EARTH_RADIUS_KM * func.asin(func.sqrt(a)), Float)
+
+
+class ClinicRepository(BaseRepository[Clinic]):
+    """
+    Repository for clinic queries.
+
+    Example:
+        >>> async with get_session() as session:
+        ...     repository = ClinicRepository(session)
+        ...     page = await repository.search(
+        ...         ClinicSearchFilters(latitude=40.7, longitude=-74.0, radius_km=10)
+        ...     )
+        ...     next_page = await repository.search(filters, after=page.next_cursor)
+    """
+
+    model = Clinic
+
+    def build_search_query(
+        self,
+        filters: ClinicSearchFilters,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        active_only: bool = True,
+    ) -> Select[Any]:
+        """
+        Compile search filters into a single select statement.
+
+        Location searches select ``(Clinic, distance_km)`` ordered by distance;
+        other searches select ``(Clinic,)`` ordered by name. Both break ties on
+        the primary key so that cursors are stable. One extra row beyond
+        ``limit`` is fetched to detect whether another page exists.
+
+        Args:
+            filters: Validated clinic search filters
+            limit: Maximum number of clinics per page
+            after: Cursor returned with the previous page
+            active_only: Whether to restrict results to active clinics
+
+        Returns:
+            Select statement for the requested page
+
+        Raises:
+            ValidationException: If the cursor is malformed
+        """
+        conditions: List[ColumnElement[bool]] = [Clinic.create_query_filter_active()]
+
+        if active_only:
+            conditions.append(Clinic.status == ClinicStatus.ACTIVE)
+
+        if filters.city is not None:
+            conditions.append(Clinic.city == filters.city)
+        if filters.state is not None:
+            conditions.append(Clinic.state == filters.state)
+        if filters.country is not None:
+            conditions.append(Clinic.country == filters.country)
+        if filters.type is not None:
+            conditions.append(Clinic.type == filters.type)
+        if filters.accepts_new_patients is not None:
+            conditions.append(
+                Clinic.accepts_new_patients.is_(filters.accepts_new_patients)
+            )
+        if filters.accepts_emergencies is not None:
+            conditions.append(
+                Clinic.accepts_emergencies.is_(filters.accepts_emergencies)
+            )
+        if filters.accepts_walk_ins is not None:
+            conditions.append(Clinic.accepts_walk_ins.is_(filters.accepts_walk_ins))
+
+        if filters.services_offered:
+            conditions.append(
+                json_contains_all(
+                    Clinic.services_offered,
+                    filters.services_offered,
+                    self.dialect_name,
+                )
+            )
+        if filters.specialties:
+            conditions.append(
+                json_contains_all(
+                    Clinic.specialties, filters.specialties, self.dialect_name
+                )
+            )
+
+        stmt: Select[Unpack[Tuple[Any, ...]]]
+        sort_keys: List[ColumnLike]
+        if (
+            filters.latitude is not None
+            and filters.longitude is not None
+            and filters.radius_km is not None
+        ):
+            conditions.extend(
+                self._bounding_box_conditions(
+                    filters.latitude, filters.longitude, filters.radius_km
+                )
+            )
+            distance = haversine_distance_km(filters.latitude, filters.longitude)
+            conditions.append(distance <= filters.radius_km)
+            stmt = select(Clinic, distance.label("distance_km"))
+            sort_keys = [distance, Clinic.id]
+        else:
+            stmt = select(Clinic)
+            sort_keys = [Clinic.name, Clinic.id]
+
+        if after is not None:
+            cursor_values = decode_cursor(after, expected_length=len(sort_keys))
+            conditions.append(
+                keyset_condition(sort_keys, cursor_values, [False] * len(sort_keys))
+            )
+
+        return (
+            stmt.where(*conditions)
+            .order_by(*sort_keys)
+            .limit(clamp_page_size(limit) + 1)
+        )
+
+    async def search(
+        self,
+        filters: ClinicSearchFilters,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        active_only: bool = True,
+    ) -> Page[Clinic]:
+        """
+        Search clinics matching the given filters.
+
+        Args:
+            filters: Validated clinic search filters
+            limit: Maximum number of clinics per page
+            after: Cursor returned with the previous page
+            active_only: Whether to restrict results to active clinics
+
+        Returns:
+            Page of clinics, nearest first for location searches
+
+        Raises:
+            ValidationException: If the cursor is malformed
+        """
+        limit = clamp_page_size(limit)
+        stmt = self.build_search_query(filters, limit, after, active_only)
+        rows = (await self.session.execute(stmt)).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            if len(last) > 1:
+                next_cursor = encode_cursor([last.distance_km, last.Clinic.id])
+            else:
+                next_cursor = encode_cursor([last.Clinic.name, last.Clinic.id])
+
+        return Page(
+            items=[row.Clinic for row in rows], next_cursor=next_cursor, limit=limit
+        )
+
+    @staticmethod
+    def _bounding_box_conditions(
+        latitude: float, longitude: float, radius_km: float
+    ) -> List[ColumnElement[bool]]:
+        """Build index-friendly coordinate range predicates for a radius search."""
+        min_lat, max_lat, lon_range = bounding_box(latitude, longitude, radius_km)
+        conditions: List[ColumnElement[bool]] = [
+            Clinic.latitude.between(min_lat, max_lat),
+            Clinic.longitude.is_not(None),
+        ]
+
+        if lon_range is not None:
+            min_lon, max_lon = lon_range
+            if min_lon <= max_lon:
+                conditions.append(Clinic.longitude.between(min_lon, max_lon))
+            else:
+                conditions.append(
+                    or_(Clinic.longitude >= min_lon, Clinic.longitude <= max_lon)
+                )
+
+        return conditions
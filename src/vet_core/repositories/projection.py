@@ -0,0 +1,121 @@
+"""
+Column projections from list response schemas.
+
+List response schemas such as PetListResponse only need a handful of columns,
+yet validating them from ORM objects loads every column of the row, including
+large JSON documents like ``Pet.medical_history``, and registers each object
+in the session identity map. A Projection instead derives the column list from
+the schema fields, selects just those columns with a Core ``select`` and
+validates the response objects straight from the result rows.
+
+Example:
+    >>> projection = Projection.for_schema(Pet, PetListResponse)
+    >>> stmt = projection.select().where(Pet.owner_id == owner_id)
+    >>> pets = projection.from_rows((await session.execute(stmt)).all())
+"""
+
+from typing import Any, Dict, Generic, List, Sequence, Tuple, Type, TypeVar
+
+from pydantic import BaseModel as SchemaModel
+from pydantic import TypeAdapter
+from sqlalchemy import Select, inspect, select
+from sqlalchemy.orm import InstrumentedAttribute
+
+from ..exceptions import ConfigurationException
+from ..models.base import BaseModel
+
+SchemaT = TypeVar("SchemaT", bound=SchemaModel)
+
+# Compiled projections by (model class, schema class)
+_projections: Dict[Tuple[type, type], "Projection[Any]"] = {}
+
+
+class Projection(Generic[SchemaT]):
+    """
+    Selects the columns a response schema needs and builds it from rows.
+
+    Every schema field is matched to the model column attribute of the same
+    name and labelled with the field name, so result rows expose exactly the
+    attributes the schema reads with ``from_attributes``. Fields without a
+    matching column are left to their schema defaults; a required field
+    without one is a configuration error.
+
+    Use ``Projection.for_schema`` rather than the constructor so that the
+    column list and the validator are compiled once per model and schema.
+    """
+
+    def __init__(self, model: Type[BaseModel], schema: Type[SchemaT]):
+        """
+        Compile the projection of a model onto a response schema.
+
+        Args:
+            model: Mapped model class to select from
+            schema: Pydantic response schema built from each row
+
+        Raises:
+            ConfigurationException: If a required schema field has no
+                matching column on the model
+        """
+        self.model = model
+        self.schema = schema
+
+        column_keys = set(inspect(model).column_attrs.keys())
+        self.columns: List[InstrumentedAttribute[Any]] = []
+        for name, field in schema.model_fields.items():
+            if name in column_keys:
+                self.columns.append(getattr(model, name))
+            elif field.is_required():
+                raise ConfigurationException(
+                    f"{schema.__name__}.{name} has no matching column on "
+                    f"{model.__name__}",
+                    config_key=name,
+                )
+
+        self._adapter = TypeAdapter(List[schema])  # type: ignore[valid-type]
+
+    @classmethod
+    def for_schema(
+        cls, model: Type[BaseModel], schema: Type[SchemaT]
+    ) -> "Projection[SchemaT]":
+        """
+        Get the compiled projection of a model onto a response schema.
+
+        Args:
+            model: Mapped model class to select from
+            schema: Pydantic response schema built from each row
+
+        Returns:
+            Projection shared by all callers using the same model and schema
+        """
+        key = (model, schema)
+        projection = _projections.get(key)
+        if projection is None:
+            projection = _projections[key] = cls(model, schema)
+        return projection
+
+    @property
+    def column_names(self) -> List[str]:
+        """Get the names of the selected columns."""
+        return [column.key for column in self.columns]
+
+    def select(self) -> Select[Any]:
+        """
+        Build a select of the projected columns.
+
+        Returns:
+            Core select statement; add filters, ordering and limits as needed
+        """
+        return select(*self.columns)
+
+    def from_rows(self, rows: Sequence[Any]) -> List[SchemaT]:
+        """
+        Validate response objects from result rows.
+
+        Args:
+            rows: Rows returned by a statement built with ``select``, or any
+                objects exposing the schema fields as attributes
+
+        Returns:
+            One response object per row, in row order
+        """
+        return self._adapter.validate_python(rows, from_attributes=True)
@@ -0,0 +1,457 @@
+"""
+User lookup cache for the vet-core package.
+
+Authentication resolves the signed-in user by email on every request.
+``UserLookupCache`` answers those lookups, by email or by ID, from compact
+immutable ``UserSnapshot`` objects holding what access checks need (role,
+status and verification flags) instead of ORM instances:
+
+- Emails are normalized (trimmed, lower case) as ``UserCreate`` stores them
+- Unknown emails are cached as misses for ``negative_ttl`` seconds
+- Concurrent lookups of a key that is not cached wait for a single query
+- A user is evicted as soon as one of its columns is changed in memory,
+  e.g. by ``update_profile()``, ``activate()`` or ``suspend()``, and again
+  when a transaction that wrote the row, or inserted a user with a cached
+  unknown email, commits; ORM bulk UPDATE and DELETE statements on users
+  clear the cache
+
+Example:
+    >>> cache = initialize_user_lookup_cache(ttl=60)
+    >>> async with get_session() as session:
+    ...     user = await cache.get_by_email(session, request_email)
+    >>> if user is None or not user.can_access_role(UserRole.VET_TECH):
+    ...     raise PermissionError
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+import weakref
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from ..database.cache import LRUCache
+from ..models.user import User, UserRole, UserStatus
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOOKUP_ENTRIES = 10000
+DEFAULT_LOOKUP_TTL = 60.0
+DEFAULT_NEGATIVE_TTL = 30.0
+
+# Session.info key of the cache keys written in the transaction; _ALL_USERS
+# stands for every user
+_PENDING_KEY = "user_lookup_pending"
+_ALL_USERS = "*"
+
+# Cached in place of a snapshot for emails without a user
+_UNKNOWN = object()
+
+# Result of a running query whose caller was cancelled, or whose row must
+# not be shared; its waiters query again themselves
+_RETRY = object()
+
+_ROLE_LEVELS = {
+    UserRole.PET_OWNER: 1,
+    UserRole.VET_TECH: 2,
+    UserRole.VETERINARIAN: 3,
+    UserRole.CLINIC_ADMIN: 4,
+    UserRole.PLATFORM_ADMIN: 5,
+}
+
+# Caches whose entries are evicted on writes
+_active_caches: "weakref.WeakSet[UserLookupCache]" = weakref.WeakSet()
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """Immutable access-control view of a user."""
+
+    id: uuid.UUID
+    email: str
+    clerk_user_id: str
+    role: UserRole
+    status: UserStatus
+    email_verified: bool
+    phone_verified: bool
+
+    @property
+    def is_active(self) -> bool:
+        """Check if the user account is active."""
+        return self.status == UserStatus.ACTIVE
+
+    @property
+    def is_verified(self) -> bool:
+        """Check if the user's email is verified."""
+        return self.email_verified
+
+    def can_access_role(self, required_role: UserRole) -> bool:
+        """
+        Check if the user may access a resource protected by a role.
+
+        Mirrors ``User.can_access_role``.
+
+        Args:
+            required_role: The minimum role required for access
+
+        Returns:
+            True if the user is active and has sufficient permissions
+        """
+        if not self.is_active:
+            return False
+        return _ROLE_LEVELS.get(self.role, 0) >= _ROLE_LEVELS.get(required_role, 0)
+
+
+@dataclass
+class UserLookupStats:
+    """Counters of a user lookup cache."""
+
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    stores: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered without a query."""
+        lookups = self.hits + self.negative_hits + self.misses + self.coalesced
+        answered = self.hits + self.negative_hits + self.coalesced
+        return answered / lookups if lookups else 0.0
+
+
+def normalize_email(email: str) -> str:
+    """Normalize an email address the way user schemas store it."""
+    return email.strip().lower()
+
+
+def _id_key(user_id: Any) -> str:
+    """Build the cache key of a user ID."""
+    return f"id:{user_id}"
+
+
+def _email_key(email: str) -> str:
+    """Build the cache key of an email address."""
+    return f"email:{normalize_email(email)}"
+
+
+class UserLookupCache:
+    """Cache of user snapshots by ID and by email."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_LOOKUP_ENTRIES,
+        ttl: float = DEFAULT_LOOKUP_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache and start evicting users written by any session.
+
+        Args:
+            max_entries: Size bound of the cache; a user takes up to two
+                entries, one per key
+            ttl: Seconds a snapshot is kept
+            negative_ttl: Seconds an unknown email is kept
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.negative_ttl = negative_ttl
+        self._entries = LRUCache(max_entries, ttl, clock)
+        self._stats = UserLookupStats()
+        # Snapshot, None or _RETRY of each running query
+        self._inflight: Dict[str, "asyncio.Future[object]"] = {}
+        # Bumped on every eviction, so a query that raced with a write does
+        # not store the row it read before the write
+        self._generation = 0
+        _active_caches.add(self)
+
+    def close(self) -> None:
+        """Stop evicting users on writes and drop every entry."""
+        _active_caches.discard(self)
+        self._entries.clear()
+
+    async def get_by_id(
+        self, session: AsyncSession, user_id: uuid.UUID
+    ) -> Optional[UserSnapshot]:
+        """
+        Look up an active user by ID.
+
+        Args:
+            session: Session used on a cache miss
+            user_id: Primary key of the user
+
+        Returns:
+            Snapshot of the user, or None if no active user has the ID
+        """
+        return await self._lookup(
+            session, _id_key(user_id), lambda: _fetch(session, User.id == user_id)
+        )
+
+    async def get_by_email(
+        self, session: AsyncSession, email: str
+    ) -> Optional[UserSnapshot]:
+        """
+        Look up an active user by email address.
+
+        Args:
+            session: Session used on a cache miss
+            email: Email address, in any case
+
+        Returns:
+            Snapshot of the user, or None if no active user has the email
+        """
+        email = normalize_email(email)
+        return await self._lookup(
+            session, _email_key(email), lambda: _fetch(session, User.email == email)
+        )
+
+    def invalidate(
+        self, user_id: Optional[Any] = None, email: Optional[str] = None
+    ) -> None:
+        """
+        Evict a user by ID and email.
+
+        Args:
+            user_id: Primary key of the user
+            email: Email address of the user, cached or unknown
+        """
+        keys = set()
+        if user_id is not None:
+            keys.add(_id_key(user_id))
+            cached = self._entries.get(_id_key(user_id))
+            if isinstance(cached, UserSnapshot):
+                keys.add(_email_key(cached.email))
+        if email:
+            keys.add(_email_key(email))
+        self._evict(keys)
+
+    def clear(self) -> None:
+        """Evict every user."""
+        self._evict({_ALL_USERS})
+
+    def stats(self) -> UserLookupStats:
+        """
+        Get the cache counters.
+
+        Returns:
+            Copy of the counters with the current size
+        """
+        return UserLookupStats(
+            hits=self._stats.hits,
+            negative_hits=self._stats.negative_hits,
+            misses=self._stats.misses,
+            coalesced=self._stats.coalesced,
+            stores=self._stats.stores,
+            evictions=self._entries.evictions,
+            invalidations=self._stats.invalidations,
+            size=len(self._entries),
+        )
+
+    async def _lookup(
+        self,
+        session: AsyncSession,
+        key: str,
+        fetch: Callable[[], Awaitable[Optional[UserSnapshot]]],
+    ) -> Optional[UserSnapshot]:
+        """Answer a lookup from the cache, a running query, or a new query."""
+        cached = self._entries.get(key)
+        if cached is _UNKNOWN:
+            self._stats.negative_hits += 1
+            return None
+        if cached is not None:
+            self._stats.hits += 1
+            return cached  # type: ignore[no-any-return]
+
+        running = self._inflight.get(key)
+        if running is not None:
+            self._stats.coalesced += 1
+            result = await asyncio.shield(running)
+            if result is _RETRY:
+                return await self._lookup(session, key, fetch)
+            return result  # type: ignore[return-value]
+
+        self._stats.misses += 1
+        future: "asyncio.Future[object]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            snapshot = await fetch()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                # Only the caller was cancelled, not the lookups waiting on it
+                future.set_result(_RETRY)
+            else:
+                future.set_exception(e)
+                future.exception()  # Waiters re-raise it; no one else must
+            raise
+        finally:
+            del self._inflight[key]
+
+        if generation == self._generation and not _wrote_users(session):
+            self._store(key, snapshot)
+            future.set_result(snapshot)
+        else:
+            # The row may predate a write, or come from a transaction that
+            # can still roll back; waiters query again with their own session
+            future.set_result(_RETRY)
+        return snapshot
+
+    def _evict(self, keys: Iterable[str]) -> None:
+        """Delete cache keys; _ALL_USERS deletes every entry."""
+        self._generation += 1
+        self._stats.invalidations += 1
+        for key in keys:
+            if key == _ALL_USERS:
+                self._entries.clear()
+            else:
+                self._entries.delete(key)
+
+    def _store(self, key: str, snapshot: Optional[UserSnapshot]) -> None:
+        """Cache a snapshot under both its keys, or an unknown email."""
+        self._stats.stores += 1
+        if snapshot is None:
+            if key.startswith("email:"):
+                self._entries.set(key, _UNKNOWN, self.negative_ttl)
+            return
+        self._entries.set(_id_key(snapshot.id), snapshot)
+        self._entries.set(_email_key(snapshot.email), snapshot)
+
+
+async def _fetch(session: AsyncSession, condition: Any) -> Optional[UserSnapshot]:
+    """Select the snapshot columns of an active user."""
+    stmt = select(
+        User.id,
+        User.email,
+        User.clerk_user_id,
+        User.role,
+        User.status,
+        User.email_verified,
+        User.phone_verified,
+    ).where(condition, User.create_query_filter_active())
+    row = (await session.execute(stmt)).first()
+    return None if row is None else UserSnapshot(**row._mapping)
+
+
+def _wrote_users(session: AsyncSession) -> bool:
+    """Check if the session's open transaction wrote to users."""
+    return bool(session.sync_session.info.get(_PENDING_KEY))
+
+
+def _evict_everywhere(keys: Set[str]) -> None:
+    """Delete cache keys from every cache."""
+    for cache in list(_active_caches):
+        cache._evict(keys)
+
+
+def _on_user_set(target: User, value: Any, oldvalue: Any, initiator: Any) -> None:
+    """Evict a stored user as soon as one of its columns changes."""
+    if not _active_caches:
+        return
+    state = inspect(target)
+    if state.identity is None:
+        return
+    keys = {_id_key(state.identity[0])}
+    emails = [target.email, oldvalue] if initiator.key == "email" else [target.email]
+    keys.update(_email_key(email) for email in emails if isinstance(email, str))
+    _evict_everywhere(keys)
+
+
+for _column in inspect(User).column_attrs:
+    event.listen(getattr(User, _column.key), "set", _on_user_set)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed(session: Session, flush_context: Any) -> None:
+    """Remember the users inserted, changed or deleted by a flush."""
+    if not _active_caches:
+        return
+    for entity in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(entity, User):
+            continue
+        pending: Set[str] = session.info.setdefault(_PENDING_KEY, set())
+        history = inspect(entity).attrs.email.history
+        for email in (entity.email, *history.deleted):
+            if isinstance(email, str):
+                pending.add(_email_key(email))
+        if entity.id is not None:
+            pending.add(_id_key(entity.id))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk(orm_execute_state: ORMExecuteState) -> None:
+    """Remember ORM UPDATE and DELETE statements on users."""
+    if not _active_caches or not (
+        orm_execute_state.is_update or orm_execute_state.is_delete
+    ):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ is User:
+        orm_execute_state.session.info.setdefault(_PENDING_KEY, set()).add(_ALL_USERS)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_committed(session: Session) -> None:
+    """Evict the users written by the committed transaction."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    _evict_everywhere(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    """Forget the writes of a rolled back transaction."""
+    session.info.pop(_PENDING_KEY, None)
+
+
+_user_lookup_cache: Optional[UserLookupCache] = None
+
+
+def initialize_user_lookup_cache(
+    max_entries: int = DEFAULT_LOOKUP_ENTRIES,
+    ttl: float = DEFAULT_LOOKUP_TTL,
+    negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+) -> UserLookupCache:
+    """
+    Initialize the global user lookup cache.
+
+    Args:
+        max_entries: Size bound of the cache
+        ttl: Seconds a snapshot is kept
+        negative_ttl: Seconds an unknown email is kept
+
+    Returns:
+        The global cache
+    """
+    global _user_lookup_cache
+    if _user_lookup_cache is not None:
+        _user_lookup_cache.close()
+    _user_lookup_cache = UserLookupCache(max_entries, ttl, negative_ttl)
+    logger.info("User lookup cache initialized")
+    return _user_lookup_cache
+
+
+def get_user_lookup_cache() -> UserLookupCache:
+    """
+    Get the global user lookup cache.
+
+    Returns:
+        The global cache
+
+    Raises:
+        RuntimeError: If the cache is not initialized
+    """
+    if _user_lookup_cache is None:
+        raise RuntimeError(
+            "User lookup cache not initialized. "
+            "Call initialize_user_lookup_cache() first."
+        )
+    return _user_lookup_cache
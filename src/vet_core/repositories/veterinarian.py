@@ -0,0 +1,218 @@
+"""
+Veterinarian repository for the vet-core package.
+
+This module compiles VeterinarianSearchFilters into JSONB containment and
+overlap predicates served by the GIN indexes on the veterinarians table, and
+returns results ranked by rating with keyset pagination.
+"""
+
+from decimal import Decimal, InvalidOperation
+from typing import Any, AsyncIterator, List, Optional
+
+from sqlalchemy import Select, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from ..database.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+)
+from ..database.types import json_contains_all, json_contains_any
+from ..exceptions import ValidationException
+from ..models.veterinarian import Veterinarian, VeterinarianStatus
+from ..schemas.veterinarian import VeterinarianSearchFilters
+from .base import BaseRepository
+
+# Matches idx_veterinarians_rating_reviews, scanned backwards, with the
+# primary key as a tie-breaker so that cursors are stable
+_SORT_KEYS = (Veterinarian.rating, Veterinarian.total_reviews, Veterinarian.id)
+
+
+class VeterinarianRepository(BaseRepository[Veterinarian]):
+    """
+    Repository for veterinarian queries.
+
+    Example:
+        >>> async with get_session() as session:
+        ...     repository = VeterinarianRepository(session)
+        ...     filters = VeterinarianSearchFilters(species_expertise=["feline"])
+        ...     async for veterinarian in repository.iter_search(filters):
+        ...         print(veterinarian.display_name)
+    """
+
+    model = Veterinarian
+
+    def build_search_query(
+        self,
+        filters: VeterinarianSearchFilters,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        active_only: bool = True,
+    ) -> Select[Any]:
+        """
+        Compile search filters into a single select statement.
+
+        Specializations, services and species expertise must all be present
+        (JSONB ``@>``); a veterinarian matches the language filter when they
+        speak any of the requested languages (JSONB ``?|``). Results are ranked
+        by rating, then number of reviews. One extra row beyond ``limit`` is
+        fetched to detect whether another page exists.
+
+        Args:
+            filters: Validated veterinarian search filters
+            limit: Maximum number of veterinarians per page
+            after: Cursor returned with the previous page
+            active_only: Whether to restrict results to active veterinarians
+
+        Returns:
+            Select statement for the requested page
+
+        Raises:
+            ValidationException: If the cursor is malformed
+        """
+        dialect_name = self.dialect_name
+        conditions: List[ColumnElement[bool]] = [
+            Veterinarian.create_query_filter_active()
+        ]
+
+        if active_only:
+            conditions.append(Veterinarian.status == VeterinarianStatus.ACTIVE)
+
+        if filters.clinic_id is not None:
+            conditions.append(Veterinarian.clinic_id == filters.clinic_id)
+        if filters.is_accepting_new_patients is not None:
+            conditions.append(
+                Veterinarian.is_accepting_new_patients.is_(
+                    filters.is_accepting_new_patients
+                )
+            )
+        if filters.min_rating is not None:
+            conditions.append(Veterinarian.rating >= Decimal(str(filters.min_rating)))
+        if filters.min_experience_years is not None:
+            conditions.append(
+                Veterinarian.years_of_experience >= filters.min_experience_years
+            )
+        if filters.employment_type is not None:
+            conditions.append(Veterinarian.employment_type == filters.employment_type)
+
+        if filters.specializations:
+            conditions.append(
+                json_contains_all(
+                    Veterinarian.specializations, filters.specializations, dialect_name
+                )
+            )
+        if filters.services_provided:
+            conditions.append(
+                json_contains_all(
+                    Veterinarian.services_provided,
+                    filters.services_provided,
+                    dialect_name,
+                )
+            )
+        if filters.species_expertise:
+            conditions.append(
+                json_contains_all(
+                    Veterinarian.species_expertise,
+                    filters.species_expertise,
+                    dialect_name,
+                )
+            )
+        if filters.languages_spoken:
+            conditions.append(
+                json_contains_any(
+                    Veterinarian.languages_spoken,
+                    filters.languages_spoken,
+                    dialect_name,
+                )
+            )
+
+        if after is not None:
+            rating, total_reviews, veterinarian_id = decode_cursor(
+                after, expected_length=len(_SORT_KEYS)
+            )
+            try:
+                rating = Decimal(rating)
+            except (InvalidOperation, TypeError, ValueError) as e:
+                raise ValidationException(
+                    "Invalid pagination cursor", field="cursor", value=after
+                ) from e
+            conditions.append(
+                keyset_condition(
+                    _SORT_KEYS,
+                    [rating, total_reviews, veterinarian_id],
+                    [True] * len(_SORT_KEYS),
+                )
+            )
+
+        return (
+            select(Veterinarian)
+            .where(*conditions)
+            .order_by(*(key.desc() for key in _SORT_KEYS))
+            .limit(clamp_page_size(limit) + 1)
+        )
+
+    async def search(
+        self,
+        filters: VeterinarianSearchFilters,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        active_only: bool = True,
+    ) -> Page[Veterinarian]:
+        """
+        Search veterinarians matching the given filters, best rated first.
+
+        Args:
+            filters: Validated veterinarian search filters
+            limit: Maximum number of veterinarians per page
+            after: Cursor returned with the previous page
+            active_only: Whether to restrict results to active veterinarians
+
+        Returns:
+            Page of veterinarians
+
+        Raises:
+            ValidationException: If the cursor is malformed
+        """
+        limit = clamp_page_size(limit)
+        stmt = self.build_search_query(filters, limit, after, active_only)
+        veterinarians = list((await self.session.execute(stmt)).scalars())
+
+        next_cursor = None
+        if len(veterinarians) > limit:
+            veterinarians = veterinarians[:limit]
+            last = veterinarians[-1]
+            next_cursor = encode_cursor([last.rating, last.total_reviews, last.id])
+
+        return Page(items=veterinarians, next_cursor=next_cursor, limit=limit)
+
+    async def iter_search(
+        self,
+        filters: VeterinarianSearchFilters,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        active_only: bool = True,
+    ) -> AsyncIterator[Veterinarian]:
+        """
+        Stream every veterinarian matching the filters, best rated first.
+
+        Results are fetched one keyset page at a time, so memory use is bounded
+        by the page size rather than by the number of matching veterinarians.
+
+        Args:
+            filters: Validated veterinarian search filters
+            page_size: Number of veterinarians fetched per query
+            active_only: Whether to restrict results to active veterinarians
+
+        Yields:
+            Matching veterinarians in rank order
+        """
+        cursor: Optional[str] = None
+        while True:
+            page = await self.search(filters, page_size, cursor, active_only)
+            for veterinarian in page.items:
+                yield veterinarian
+            if not page.has_more:
+                return
+            cursor = page.next_cursor
@@ -14,6 +14,7 @@ from .appointment import (
     AppointmentSlotAvailability,
     AppointmentStatusUpdate,
     AppointmentUpdate,
+    ClinicSlotAvailability,
 )
 from .clinic import (
     ClinicCreate,
@@ -90,6 +91,7 @@ __all__ = [
     "AppointmentReschedule",
     "AppointmentCompletion",
     "AppointmentSlotAvailability",
+    "ClinicSlotAvailability",
     # Clinic schemas
     "ClinicCreate",
     "ClinicUpdate",
@@ -6,9 +6,9 @@ including create, update, and response schemas with datetime validation and time
 """
 
 import re
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
@@ -551,3 +551,46 @@ class AppointmentSlotAvailability(BaseModel):
             raise ValueError("Date range cannot exceed 90 days")
 
         return self
+
+
+class ClinicSlotAvailability(BaseModel):
+    """Schema for checking appointment slot availability across a clinic."""
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    clinic_id: UUID = Field(..., description="Clinic ID to check availability for")
+    veterinarian_ids: Optional[List[UUID]] = Field(
+        None, description="Restrict the check to these veterinarians"
+    )
+    start_date: datetime = Field(..., description="Start of availability check period")
+    end_date: datetime = Field(..., description="End of availability check period")
+    duration_minutes: int = Field(
+        30, description="Required appointment duration", gt=0, le=480
+    )
+    service_type: Optional[ServiceType] = Field(
+        None, description="Type of service (for specialized availability)"
+    )
+
+    @field_validator("start_date", "end_date")
+    @classmethod
+    def validate_dates(cls, v: datetime) -> datetime:
+        """Validate dates are timezone-aware and not in the past."""
+        if v.tzinfo is None:
+            raise ValueError("Dates must be timezone-aware")
+
+        now = datetime.now(timezone.utc)
+        if v < now:
+            raise ValueError("Dates cannot be in the past")
+
+        return v
+
+    @model_validator(mode="after")
+    def validate_date_range(self) -> "ClinicSlotAvailability":
+        """Validate date range."""
+        if self.end_date <= self.start_date:
+            raise ValueError("End date must be after start date")
+
+        if self.end_date - self.start_date > timedelta(days=90):
+            raise ValueError("Date range cannot exceed 90 days")
+
+        return self
@@ -13,7 +13,9 @@ from .assessor import RiskAssessor
 from .audit_trail import (
     AuditEvent,
     AuditEventType,
+    AuditWriterStats,
     ComplianceMetrics,
+    QueueOverflowPolicy,
     SecurityAuditTrail,
 )
 from .compliance import (
@@ -82,6 +84,8 @@ __all__ = [
     "AuditEvent",
     "AuditEventType",
     "ComplianceMetrics",
+    "AuditWriterStats",
+    "QueueOverflowPolicy",
     "SecurityComplianceManager",
     "ComplianceFramework",
     "PolicyRule",
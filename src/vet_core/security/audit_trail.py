@@ -12,15 +12,20 @@ Requirements addressed:
 - 4.4: Evidence of proactive security management practices
 """
 
+import atexit
 import json
 import logging
+import queue
 import sqlite3
+import threading
+import time
 import uuid
-from dataclasses import asdict, dataclass, field
+import weakref
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .assessor import RiskAssessment
 from .models import (
@@ -30,6 +35,41 @@ from .models import (
     VulnerabilitySeverity,
 )
 
+# Pragmas applied to every audit database connection. WAL lets readers proceed
+# while a batch is being written, and NORMAL synchronous mode is durable
+# across application crashes in WAL mode while avoiding an fsync per commit.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+
+_INSERT_AUDIT_EVENT_SQL = """
+    INSERT INTO audit_events (
+        event_id, event_type, timestamp, vulnerability_id, package_name,
+        severity, action_taken, outcome, user_id, system_component,
+        details, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Queue item telling the background writer to stop once earlier events are written
+_STOP_WRITER = object()
+
+# Audit trails with unflushed events, flushed when the interpreter exits
+_open_audit_trails: "weakref.WeakSet[SecurityAuditTrail]" = weakref.WeakSet()
+
+
+def _close_open_audit_trails() -> None:
+    """Flush and close every audit trail that is still open at exit."""
+    for audit_trail in list(_open_audit_trails):
+        try:
+            audit_trail.close()
+        except Exception:
+            pass
+
+
+atexit.register(_close_open_audit_trails)
+
 
 class AuditEventType(Enum):
     """Types of audit events that can be logged."""
@@ -91,6 +131,40 @@ class AuditEvent:
         return cls(**data)
 
 
+class QueueOverflowPolicy(Enum):
+    """What the background writer does when its queue is full."""
+
+    BLOCK = "block"  # Slow the caller down until there is room
+    DROP = "drop"  # Drop the new event immediately
+
+
+@dataclass
+class AuditWriterStats:
+    """Counters for the background audit event writer."""
+
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0
+    failed: int = 0
+    batches: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    last_flush_latency_ms: float = 0.0
+    max_flush_latency_ms: float = 0.0
+    total_flush_latency_ms: float = 0.0
+
+    @property
+    def average_flush_latency_ms(self) -> float:
+        """Average time taken to write a batch to both sinks."""
+        return self.total_flush_latency_ms / self.batches if self.batches else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert writer statistics to dictionary representation."""
+        data = asdict(self)
+        data["average_flush_latency_ms"] = self.average_flush_latency_ms
+        return data
+
+
 @dataclass
 class ComplianceMetrics:
     """Represents compliance metrics for security management."""
@@ -126,19 +200,57 @@ class SecurityAuditTrail:
     purposes.
     """
 
+    # Buffered events kept while the database cannot be written
+    MAX_PENDING_EVENTS = 100000
+
     def __init__(
         self,
         audit_db_path: Optional[Path] = None,
         log_file_path: Optional[Path] = None,
         retention_days: int = 365,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        background_writer: bool = False,
+        max_queue_size: int = 10000,
+        overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+        enqueue_timeout: Optional[float] = None,
     ) -> None:
         """
         Initialize the security audit trail system.
 
+        Events are buffered in memory and written to the database in batches
+        when ``batch_size`` events are pending, when the oldest pending event
+        is ``flush_interval`` seconds old, before any read of the audit
+        database, and on ``flush()``, ``close()`` or interpreter exit. A
+        flusher thread runs while events are buffered and writes them once
+        they are due, even if no further events are logged, so at most
+        ``flush_interval`` seconds of events are lost if the process is
+        killed. Events that fail to be written stay buffered and are retried
+        every ``flush_interval`` seconds; ``log_event`` does not raise for
+        them, but ``flush()`` does.
+
+        With ``background_writer`` enabled, ``log_event`` only places the event
+        on a bounded queue and returns; a dedicated thread drains the queue in
+        batches of up to ``batch_size`` events to both the database and the
+        log file. When the queue is full, ``overflow_policy`` decides whether
+        the caller waits for room or the event is dropped straight away. By
+        default the caller waits as long as it takes, so no event is lost;
+        set ``enqueue_timeout`` to drop events that cannot be queued in time
+        instead. Dropped events are counted in ``get_writer_stats()``.
+
         Args:
             audit_db_path: Path to SQLite database for audit events
             log_file_path: Path to log file for audit events
             retention_days: Number of days to retain audit events
+            batch_size: Number of buffered events that triggers a write
+            flush_interval: Maximum age in seconds of a buffered event before
+                it is written
+            background_writer: Whether to write events on a background thread
+            max_queue_size: Maximum number of events waiting for the writer
+            overflow_policy: How to handle events logged while the queue is full
+            enqueue_timeout: Seconds to wait for queue space with the BLOCK
+                policy before dropping the event; None, the default, waits
+                indefinitely
         """
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
@@ -153,14 +265,39 @@ class SecurityAuditTrail:
         self.log_file_path = log_file_path
 
         self.retention_days = retention_days
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        # One long-lived connection per thread, plus the shared write buffer
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.RLock()
+        self._pending_events: List[Tuple[Any, ...]] = []
+        self._oldest_pending: Optional[float] = None
+        self._retry_at = 0.0
+        self._flush_due = threading.Condition(self._lock)
+        self._flusher_thread: Optional[threading.Thread] = None
 
         # Track initialization status
         self._database_initialized = False
         self._file_logging_initialized = False
 
+        # Background writer state
+        self.overflow_policy = overflow_policy
+        self.enqueue_timeout = enqueue_timeout
+        self._writer_stats = AuditWriterStats()
+        self._stats_lock = threading.Lock()
+        self._queue: Optional["queue.Queue[Any]"] = None
+        self._writer_thread: Optional[threading.Thread] = None
+
         # Try to initialize database and file logging
         self._initialize_components()
 
+        if background_writer and (
+            self._database_initialized or self._file_logging_initialized
+        ):
+            self._start_writer(max_queue_size)
+
     def _initialize_components(self) -> None:
         """Initialize database and file logging components with error handling."""
         # Initialize database
@@ -193,7 +330,7 @@ class SecurityAuditTrail:
             # Create directory if it doesn't exist
             self.audit_db_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with sqlite3.connect(self.audit_db_path) as conn:
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
 
                 # Create audit events table
@@ -261,8 +398,6 @@ class SecurityAuditTrail:
                 """
                 )
 
-                conn.commit()
-
         except (OSError, PermissionError) as e:
             # Handle file system errors gracefully
             self.logger.error(
@@ -325,9 +460,19 @@ class SecurityAuditTrail:
         """
         Log an audit event to both database and file.
 
+        With the background writer enabled the event is queued and written
+        asynchronously; otherwise it is written on the calling thread.
+
         Args:
             event: The audit event to log
         """
+        if self._writer_thread is not None:
+            self._enqueue(event)
+        else:
+            self._write_event(event)
+
+    def _write_event(self, event: AuditEvent) -> None:
+        """Write an audit event to the database buffer and the log file."""
         logged_successfully = False
 
         try:
@@ -360,36 +505,288 @@ class SecurityAuditTrail:
             self.logger.error(f"Failed to log audit event {event.event_id}: {e}")
             raise
 
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get this thread's audit database connection, opening it if needed."""
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.audit_db_path, timeout=30.0, check_same_thread=False
+            )
+            for pragma in _SQLITE_PRAGMAS:
+                conn.execute(pragma)
+            self._local.connection = conn
+            with self._lock:
+                self._connections.append(conn)
+                _open_audit_trails.add(self)
+        return conn
+
     def _log_to_database(self, event: AuditEvent) -> None:
-        """Log audit event to SQLite database."""
-        with sqlite3.connect(self.audit_db_path) as conn:
-            cursor = conn.cursor()
+        """Buffer an audit event, writing the buffer when it is due."""
+        row = (
+            event.event_id,
+            event.event_type.value,
+            event.timestamp.isoformat(),
+            event.vulnerability_id,
+            event.package_name,
+            event.severity.value if event.severity else None,
+            event.action_taken,
+            event.outcome,
+            event.user_id,
+            event.system_component,
+            json.dumps(event.details),
+            json.dumps(event.metadata),
+        )
 
-            cursor.execute(
-                """
-                INSERT INTO audit_events (
-                    event_id, event_type, timestamp, vulnerability_id, package_name,
-                    severity, action_taken, outcome, user_id, system_component,
-                    details, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    event.event_id,
-                    event.event_type.value,
-                    event.timestamp.isoformat(),
-                    event.vulnerability_id,
-                    event.package_name,
-                    event.severity.value if event.severity else None,
-                    event.action_taken,
-                    event.outcome,
-                    event.user_id,
-                    event.system_component,
-                    json.dumps(event.details),
-                    json.dumps(event.metadata),
-                ),
+        with self._lock:
+            now = time.monotonic()
+            if self._oldest_pending is None:
+                self._oldest_pending = now
+            self._pending_events.append(row)
+
+            if now >= self._retry_at and (
+                len(self._pending_events) >= self.batch_size
+                or now - self._oldest_pending >= self.flush_interval
+            ):
+                try:
+                    self._write_pending()
+                except Exception:
+                    # The events stay buffered; back off before trying again
+                    self._retry_at = now + self.flush_interval
+
+            if self._pending_events and self._flusher_thread is None:
+                self._flusher_thread = threading.Thread(
+                    target=self._flush_loop, name="security-audit-flusher", daemon=True
+                )
+                self._flusher_thread.start()
+
+    def _flush_loop(self) -> None:
+        """Write buffered events once they are due, until the buffer is empty."""
+        with self._flush_due:
+            try:
+                while self._pending_events and self._oldest_pending is not None:
+                    now = time.monotonic()
+                    due = max(
+                        self._oldest_pending + self.flush_interval, self._retry_at
+                    )
+                    if now < due:
+                        self._flush_due.wait(due - now)
+                        continue
+                    try:
+                        self._write_pending()
+                    except Exception:
+                        self._retry_at = now + self.flush_interval
+            finally:
+                self._flusher_thread = None
+                # The thread ends here, so its connection is not reused
+                conn = getattr(self._local, "connection", None)
+                if conn is not None:
+                    del self._local.connection
+                    if conn in self._connections:
+                        self._connections.remove(conn)
+                    conn.close()
+
+    def flush(self, timeout: Optional[float] = None) -> int:
+        """
+        Write all queued and buffered audit events to the database.
+
+        With the background writer enabled this first waits until the writer
+        has processed the events queued before the call; events queued by
+        other threads in the meantime are not waited for.
+
+        Args:
+            timeout: Maximum seconds to wait for the background writer, or
+                None to wait until it reaches the events queued before the call
+
+        Returns:
+            Number of buffered events written by this call
+        """
+        writer_thread = self._writer_thread
+        if (
+            self._queue is not None
+            and writer_thread is not None
+            and writer_thread is not threading.current_thread()
+        ):
+            reached = threading.Event()
+            try:
+                self._queue.put(reached, timeout=timeout)
+            except queue.Full:
+                pass
+            else:
+                reached.wait(timeout)
+            if not reached.is_set():
+                self.logger.warning(
+                    f"Audit writer did not reach queued events within {timeout}s"
+                )
+        return self._write_pending()
+
+    def _write_pending(self) -> int:
+        """
+        Write buffered audit events to the database in one transaction.
+
+        The buffer is only cleared once the transaction has committed. If the
+        write fails, for example because the database is locked or the disk
+        is full, the events stay buffered for the next write and the error is
+        re-raised. Beyond ``MAX_PENDING_EVENTS`` the oldest events are
+        dropped and logged, so a database that stays unwritable cannot
+        exhaust memory.
+
+        Returns:
+            Number of events written
+        """
+        with self._lock:
+            rows = self._pending_events
+            if not rows:
+                return 0
+
+            try:
+                with self._get_connection() as conn:
+                    conn.executemany(_INSERT_AUDIT_EVENT_SQL, rows)
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to write {len(rows)} audit events, "
+                    f"keeping them buffered: {e}"
+                )
+                overflow = len(rows) - self.MAX_PENDING_EVENTS
+                if overflow > 0:
+                    del rows[:overflow]
+                    self.logger.error(
+                        f"Audit event buffer full, dropped {overflow} oldest events"
+                    )
+                raise
+
+            self._pending_events = []
+            self._oldest_pending = None
+            self._retry_at = 0.0
+            return len(rows)
+
+    def _start_writer(self, max_queue_size: int) -> None:
+        """Start the background thread that writes queued events."""
+        self._queue = queue.Queue(maxsize=max(1, max_queue_size))
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="security-audit-writer", daemon=True
+        )
+        self._writer_thread.start()
+        _open_audit_trails.add(self)
+
+    def _enqueue(self, event: AuditEvent) -> None:
+        """Queue an event for the background writer, applying backpressure."""
+        assert self._queue is not None
+        try:
+            if self.overflow_policy is QueueOverflowPolicy.BLOCK:
+                self._queue.put(event, timeout=self.enqueue_timeout)
+            else:
+                self._queue.put_nowait(event)
+        except queue.Full:
+            with self._stats_lock:
+                self._writer_stats.dropped += 1
+            self.logger.warning(
+                f"Audit event queue full, dropped event: {event.event_id}"
             )
+            return
+
+        depth = self._queue.qsize()
+        with self._stats_lock:
+            self._writer_stats.enqueued += 1
+            if depth > self._writer_stats.max_queue_depth:
+                self._writer_stats.max_queue_depth = depth
+
+    def _writer_loop(self) -> None:
+        """Drain the event queue in batches until asked to stop."""
+        assert self._queue is not None
+        event_queue = self._queue
+
+        while True:
+            batch = [event_queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(event_queue.get_nowait())
+                except queue.Empty:
+                    break
 
-            conn.commit()
+            events = [item for item in batch if isinstance(item, AuditEvent)]
+            started = time.perf_counter()
+            failed = 0
+            try:
+                for event in events:
+                    try:
+                        self._write_event(event)
+                    except Exception:
+                        failed += 1
+
+                try:
+                    self._write_pending()
+                except Exception:
+                    pass  # Logged, and kept buffered for the next batch
+            finally:
+                latency_ms = (time.perf_counter() - started) * 1000
+                with self._stats_lock:
+                    stats = self._writer_stats
+                    stats.written += len(events) - min(failed, len(events))
+                    stats.failed += failed
+                    stats.batches += 1
+                    stats.last_flush_latency_ms = latency_ms
+                    stats.total_flush_latency_ms += latency_ms
+                    stats.max_flush_latency_ms = max(
+                        stats.max_flush_latency_ms, latency_ms
+                    )
+                for item in batch:
+                    if isinstance(item, threading.Event):
+                        item.set()  # Wakes flush() once its events are written
+                    event_queue.task_done()
+
+            if any(item is _STOP_WRITER for item in batch):
+                return
+
+    def get_writer_stats(self) -> AuditWriterStats:
+        """
+        Get a snapshot of the background writer counters.
+
+        Returns:
+            Writer statistics, including the current queue depth
+        """
+        with self._stats_lock:
+            stats = replace(self._writer_stats)
+        stats.queue_depth = self._queue.qsize() if self._queue is not None else 0
+        return stats
+
+    def close(self) -> None:
+        """
+        Flush queued and buffered events and close every database connection.
+
+        Stops the background writer, if any, after it has written every event
+        queued before the call.
+        """
+        writer_thread = self._writer_thread
+        if writer_thread is not None and self._queue is not None:
+            self._writer_thread = None
+            self._queue.put(_STOP_WRITER)
+            writer_thread.join()
+
+        with self._lock:
+            try:
+                self.flush()
+            finally:
+                self._flush_due.notify_all()  # Ends the flusher thread
+                for conn in self._connections:
+                    conn.close()
+                self._connections = []
+                self._local = threading.local()
+                _open_audit_trails.discard(self)
+
+    def __enter__(self) -> "SecurityAuditTrail":
+        """Enter a context that closes the audit trail on exit."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Flush buffered events and close the audit trail."""
+        self.close()
+
+    def __del__(self) -> None:
+        """Write any buffered events before the audit trail is discarded."""
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def _log_to_file(self, event: AuditEvent) -> None:
         """Log audit event to file."""
@@ -662,7 +1059,8 @@ class SecurityAuditTrail:
             return []
 
         try:
-            with sqlite3.connect(self.audit_db_path) as conn:
+            self.flush()
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
 
                 # Build query with filters
@@ -875,7 +1273,7 @@ class SecurityAuditTrail:
             return
 
         try:
-            with sqlite3.connect(self.audit_db_path) as conn:
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute(
@@ -941,7 +1339,7 @@ class SecurityAuditTrail:
         metrics_rows = []
         if self._database_initialized:
             try:
-                with sqlite3.connect(self.audit_db_path) as conn:
+                with self._get_connection() as conn:
                     cursor = conn.cursor()
                     cursor.execute(
                         """
@@ -1119,7 +1517,8 @@ class SecurityAuditTrail:
         cutoff_date = datetime.now() - timedelta(days=self.retention_days)
 
         try:
-            with sqlite3.connect(self.audit_db_path) as conn:
+            self.flush()
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
 
                 # Count events to be deleted
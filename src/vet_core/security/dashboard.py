@@ -55,7 +55,9 @@ class VulnerabilityDashboard:
         # Initialize components
         self.scanner = VulnerabilityScanner()
         self.risk_assessor = RiskAssessor()
-        self.audit_trail = SecurityAuditTrail(audit_db_path=audit_db_path)
+        self.audit_trail = SecurityAuditTrail(
+            audit_db_path=audit_db_path, background_writer=True
+        )
         self.compliance_manager = SecurityComplianceManager(self.audit_trail)
         self.reporter = SecurityReporter()
         self.status_tracker = VulnerabilityStatusTracker(self.audit_trail)
@@ -633,6 +635,7 @@ class VulnerabilityDashboard:
     def _load_vulnerability_status(self) -> Dict[str, str]:
         """Load vulnerability status from database."""
         try:
+            self.audit_trail.flush()
             with sqlite3.connect(self.audit_trail.audit_db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute(
@@ -14,7 +14,9 @@ import json
 import logging
 import sqlite3
 import statistics
+import threading
 from collections import Counter, defaultdict
+from contextlib import closing
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -27,6 +29,61 @@ from .status_tracker import (
     VulnerabilityStatus,
     VulnerabilityStatusTracker,
 )
+from .trend_statistics import (
+    SeriesStatistics,
+    aggregate_series,
+    compute_series_statistics,
+)
+
+# Rollup granularities, with the ISO timestamp prefix that identifies a bucket
+# and the suffix that turns it into the bucket start ("YYYY-MM-DDTHH:00:00")
+_ROLLUP_BUCKETS = {"hourly": (13, ":00:00"), "daily": (10, "T00:00:00")}
+
+_UPSERT_EVENT_ROLLUPS_SQL = """
+    INSERT INTO event_rollups (granularity, event_type, bucket, event_count)
+    SELECT ?, event_type, substr(timestamp, 1, ?) || ?, COUNT(*)
+    FROM audit.audit_events
+    WHERE rowid > ? AND rowid <= ?
+    GROUP BY 2, 3
+    ON CONFLICT (granularity, event_type, bucket)
+    DO UPDATE SET event_count = event_count + excluded.event_count
+"""
+
+_UPSERT_MILESTONES_SQL = """
+    INSERT INTO vulnerability_milestones (
+        vulnerability_id, detected_at, assessed_at, resolved_at
+    )
+    SELECT vulnerability_id,
+           MAX(CASE WHEN event_type = ? THEN timestamp END),
+           MAX(CASE WHEN event_type = ? THEN timestamp END),
+           MAX(CASE WHEN event_type = ? THEN timestamp END)
+    FROM audit.audit_events
+    WHERE rowid > ? AND rowid <= ? AND vulnerability_id IS NOT NULL
+    GROUP BY vulnerability_id
+    ON CONFLICT (vulnerability_id) DO UPDATE SET
+        detected_at = COALESCE(
+            MAX(excluded.detected_at, detected_at), excluded.detected_at, detected_at
+        ),
+        assessed_at = COALESCE(
+            MAX(excluded.assessed_at, assessed_at), excluded.assessed_at, assessed_at
+        ),
+        resolved_at = COALESCE(
+            MAX(excluded.resolved_at, resolved_at), excluded.resolved_at, resolved_at
+        )
+"""
+
+
+def _floor_to(value: datetime, step: timedelta) -> datetime:
+    """Round a datetime down to a whole hour or day."""
+    if step >= timedelta(days=1):
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil_to(value: datetime, step: timedelta) -> datetime:
+    """Round a datetime up to a whole hour or day."""
+    floor = _floor_to(value, step)
+    return floor if floor == value else floor + step
 
 
 @dataclass
@@ -62,6 +119,9 @@ class TrendAnalysis:
     max_value: Optional[float] = None
     variance: Optional[float] = None
     growth_rate: Optional[float] = None  # percentage change
+    r_squared: Optional[float] = None  # Fit of the linear trend
+    moving_average: List[float] = field(default_factory=list)
+    anomalies: List[MetricPoint] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert trend analysis to dictionary representation."""
@@ -90,6 +150,7 @@ class TrendAnalysis:
                 self.max_value,
                 self.variance,
                 self.growth_rate,
+                self.r_squared,
             ]
         ):
             result["statistics"] = {}
@@ -103,6 +164,13 @@ class TrendAnalysis:
                 result["statistics"]["variance"] = self.variance
             if self.growth_rate is not None:
                 result["statistics"]["growth_rate"] = self.growth_rate
+            if self.r_squared is not None:
+                result["statistics"]["r_squared"] = self.r_squared
+
+        if self.moving_average:
+            result["moving_average"] = self.moving_average
+        if self.anomalies:
+            result["anomalies"] = [point.to_dict() for point in self.anomalies]
 
         return result
 
@@ -268,6 +336,9 @@ class SecurityMetricsAnalyzer:
             metrics_db_path = Path.cwd() / "security-metrics.db"
         self.metrics_db_path = metrics_db_path
 
+        # Serializes rollup refreshes from this analyzer
+        self._rollup_lock = threading.Lock()
+
         # Initialize database
         self._init_metrics_database()
 
@@ -310,6 +381,41 @@ class SecurityMetricsAnalyzer:
                 """
                 )
 
+                # Create rollup tables, maintained incrementally from the
+                # audit trail by refresh_rollups()
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS event_rollups (
+                        granularity TEXT NOT NULL,  -- hourly or daily
+                        bucket TEXT NOT NULL,  -- bucket start
+                        event_type TEXT NOT NULL,
+                        event_count INTEGER NOT NULL,
+                        PRIMARY KEY (granularity, event_type, bucket)
+                    )
+                """
+                )
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS vulnerability_milestones (
+                        vulnerability_id TEXT PRIMARY KEY,
+                        detected_at TEXT,
+                        assessed_at TEXT,
+                        resolved_at TEXT
+                    )
+                """
+                )
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS rollup_watermarks (
+                        name TEXT PRIMARY KEY,
+                        source TEXT NOT NULL,
+                        last_rowid INTEGER NOT NULL,
+                        last_event_id TEXT,
+                        refreshed_at TEXT NOT NULL
+                    )
+                """
+                )
+
                 # Create indexes
                 cursor.execute(
                     "CREATE INDEX IF NOT EXISTS idx_snapshots_date ON metrics_snapshots(snapshot_date)"
@@ -327,6 +433,265 @@ class SecurityMetricsAnalyzer:
             self.logger.error(f"Failed to initialize metrics database: {e}")
             raise
 
+    def refresh_rollups(self) -> Optional[int]:
+        """
+        Roll audit events logged since the last refresh into the rollup tables.
+
+        Hourly and daily event counts per event type, and the latest detection,
+        assessment and resolution time of each vulnerability, are updated from
+        the audit events after the stored watermark (the rowid and ID of the
+        last processed audit event) in a single transaction. If the audit trail
+        now uses another database the rollups are rebuilt from scratch.
+
+        Counts are kept after old audit events are cleaned up. SQLite reuses
+        the rowids of deleted rows at the end of the table, so when the last
+        processed event itself has been cleaned up, every remaining event is
+        treated as new; cleanup removes events oldest first, so those before
+        it are gone as well.
+
+        Returns:
+            Number of audit events processed, or None when the audit trail has
+            no database to roll up or the refresh failed
+        """
+        audit_db_path = self._rollup_source()
+        if audit_db_path is None:
+            return None
+
+        source = str(audit_db_path.resolve())
+        processed: int
+        try:
+            self.audit_trail.flush()
+            with (
+                self._rollup_lock,
+                closing(self._connect_rollups(audit_db_path)) as conn,
+            ):
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    watermark = conn.execute(
+                        "SELECT source, last_rowid, last_event_id "
+                        "FROM rollup_watermarks WHERE name = ?",
+                        ("audit_events",),
+                    ).fetchone()
+                    high, high_event_id = conn.execute(
+                        "SELECT rowid, event_id FROM audit.audit_events "
+                        "ORDER BY rowid DESC LIMIT 1"
+                    ).fetchone() or (0, None)
+
+                    last_rowid = 0
+                    if watermark and watermark[0] != source:
+                        # Different audit database: start over
+                        conn.execute("DELETE FROM event_rollups")
+                        conn.execute("DELETE FROM vulnerability_milestones")
+                    elif watermark and watermark[1]:
+                        last_event = conn.execute(
+                            "SELECT event_id FROM audit.audit_events WHERE rowid = ?",
+                            (watermark[1],),
+                        ).fetchone()
+                        # Otherwise the last processed event was cleaned up and
+                        # its rowid may have been reused by a new event
+                        if last_event is not None and last_event[0] == watermark[2]:
+                            last_rowid = watermark[1]
+
+                    (processed,) = conn.execute(
+                        "SELECT COUNT(*) FROM audit.audit_events "
+                        "WHERE rowid > ? AND rowid <= ?",
+                        (last_rowid, high),
+                    ).fetchone()
+
+                    if processed:
+                        for granularity, (length, suffix) in _ROLLUP_BUCKETS.items():
+                            conn.execute(
+                                _UPSERT_EVENT_ROLLUPS_SQL,
+                                (granularity, length, suffix, last_rowid, high),
+                            )
+                        conn.execute(
+                            _UPSERT_MILESTONES_SQL,
+                            (
+                                AuditEventType.VULNERABILITY_DETECTED.value,
+                                AuditEventType.RISK_ASSESSMENT_PERFORMED.value,
+                                AuditEventType.VULNERABILITY_RESOLVED.value,
+                                last_rowid,
+                                high,
+                            ),
+                        )
+
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO rollup_watermarks (
+                            name, source, last_rowid, last_event_id, refreshed_at
+                        ) VALUES (?, ?, ?, ?, ?)
+                    """,
+                        (
+                            "audit_events",
+                            source,
+                            high,
+                            high_event_id,
+                            datetime.now().isoformat(),
+                        ),
+                    )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+
+        except Exception as e:
+            self.logger.error(f"Failed to refresh metrics rollups: {e}")
+            return None
+
+        if processed:
+            self.logger.debug(f"Rolled up {processed} audit events")
+        return processed
+
+    def _rollup_source(self) -> Optional[Path]:
+        """Get the audit database to roll up, if the audit trail has one."""
+        audit_db_path = getattr(self.audit_trail, "audit_db_path", None)
+        if not isinstance(audit_db_path, Path):
+            return None
+        if getattr(self.audit_trail, "_database_initialized", False) is not True:
+            return None
+        return audit_db_path
+
+    def _connect_rollups(self, audit_db_path: Path) -> sqlite3.Connection:
+        """Open the metrics database with the audit database attached."""
+        conn = sqlite3.connect(self.metrics_db_path, timeout=30.0)
+        conn.execute("ATTACH DATABASE ? AS audit", (str(audit_db_path),))
+        return conn
+
+    def _count_events(self, start_date: datetime, end_date: datetime) -> Counter[str]:
+        """
+        Count audit events by type between two dates, inclusive.
+
+        Whole days are read from the daily rollups, whole hours from the
+        hourly rollups, and only the partial hours at either end of the range
+        are counted from raw audit events. Call refresh_rollups() first.
+
+        Args:
+            start_date: Start of the range
+            end_date: End of the range
+
+        Returns:
+            Counter of event type value to number of events
+        """
+        first_hour = _ceil_to(start_date, timedelta(hours=1))
+        last_hour = _floor_to(end_date, timedelta(hours=1))
+
+        raw_ranges = [(start_date, end_date)]
+        rollup_ranges: List[Tuple[str, datetime, datetime]] = []
+        if first_hour < last_hour:
+            raw_ranges = [(start_date, first_hour), (last_hour, end_date)]
+            first_day = _ceil_to(first_hour, timedelta(days=1))
+            last_day = _floor_to(last_hour, timedelta(days=1))
+            if first_day < last_day:
+                rollup_ranges = [
+                    ("hourly", first_hour, first_day),
+                    ("daily", first_day, last_day),
+                    ("hourly", last_day, last_hour),
+                ]
+            else:
+                rollup_ranges = [("hourly", first_hour, last_hour)]
+
+        counts: Counter[str] = Counter()
+        with closing(self._connect_rollups(self.audit_trail.audit_db_path)) as conn:
+            for granularity, range_start, range_end in rollup_ranges:
+                counts.update(
+                    dict(
+                        conn.execute(
+                            """
+                            SELECT event_type, SUM(event_count)
+                            FROM event_rollups
+                            WHERE granularity = ? AND bucket >= ? AND bucket < ?
+                            GROUP BY event_type
+                        """,
+                            (
+                                granularity,
+                                range_start.isoformat(),
+                                range_end.isoformat(),
+                            ),
+                        ).fetchall()
+                    )
+                )
+
+            # The raw ranges are the partial hours; the last one is inclusive
+            for index, (range_start, range_end) in enumerate(raw_ranges):
+                upper = "<=" if index == len(raw_ranges) - 1 else "<"
+                counts.update(
+                    dict(
+                        conn.execute(
+                            f"""
+                            SELECT event_type, COUNT(*)
+                            FROM audit.audit_events
+                            WHERE timestamp >= ? AND timestamp {upper} ?
+                            GROUP BY event_type
+                        """,
+                            (range_start.isoformat(), range_end.isoformat()),
+                        ).fetchall()
+                    )
+                )
+
+        return counts
+
+    def _get_event_trend_data(
+        self,
+        event_type: AuditEventType,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: str,
+    ) -> List[MetricPoint]:
+        """
+        Get event counts per period for an event type from the rollups.
+
+        Hourly and daily points come straight from the matching rollup,
+        weekly and monthly points are summed from the daily rollup by SQLite.
+        Periods without events are omitted.
+
+        Args:
+            event_type: Audit event type to count
+            start_date: Start of the range
+            end_date: End of the range
+            granularity: Time granularity ("hourly", "daily", "weekly", "monthly")
+
+        Returns:
+            List of MetricPoint objects, one per period, oldest first
+        """
+        period_sql = {
+            "weekly": "date(bucket, '-6 days', 'weekday 1') || 'T00:00:00'",
+            "monthly": "strftime('%Y-%m-01T00:00:00', bucket)",
+        }.get(granularity, "bucket")
+        rollup = "hourly" if granularity == "hourly" else "daily"
+        bucket_length = timedelta(hours=1) if rollup == "hourly" else timedelta(days=1)
+
+        try:
+            with closing(sqlite3.connect(self.metrics_db_path)) as conn:
+                rows = conn.execute(
+                    f"""
+                    SELECT {period_sql} AS period, SUM(event_count)
+                    FROM event_rollups
+                    WHERE granularity = ? AND event_type = ?
+                      AND bucket >= ? AND bucket <= ?
+                    GROUP BY period
+                    ORDER BY period ASC
+                """,
+                    (
+                        rollup,
+                        event_type.value,
+                        _floor_to(start_date, bucket_length).isoformat(),
+                        end_date.isoformat(),
+                    ),
+                ).fetchall()
+
+        except Exception as e:
+            self.logger.error(f"Failed to get rollups for {event_type.value}: {e}")
+            return []
+
+        return [
+            MetricPoint(
+                timestamp=datetime.fromisoformat(period),
+                value=float(count),
+                metadata={"granularity": granularity, "source": "rollup"},
+            )
+            for period, count in rows
+        ]
+
     def calculate_current_metrics(
         self, period_days: int = 30, include_trends: bool = True
     ) -> SecurityMetrics:
@@ -347,26 +712,32 @@ class SecurityMetricsAnalyzer:
             f"Calculating security metrics for period: {start_date} to {end_date}"
         )
 
-        # Get audit events for the period
-        events = self.audit_trail.get_audit_events(
-            start_date=start_date, end_date=end_date
-        )
-
         # Get current tracking records
         tracking_records = self.status_tracker.get_all_tracking_records()
 
-        # Calculate vulnerability metrics
+        # Calculate vulnerability metrics (from tracking records only)
         vulnerability_metrics = self._calculate_vulnerability_metrics(
-            events, tracking_records
+            [], tracking_records
         )
 
-        # Calculate time-based metrics
-        time_metrics = self._calculate_time_based_metrics(events, tracking_records)
-
-        # Calculate performance metrics
-        performance_metrics = self._calculate_performance_metrics(
-            events, tracking_records, period_days
-        )
+        if self.refresh_rollups() is not None:
+            # Event-based metrics from the rollups, up to date after the refresh
+            event_counts = self._count_events(start_date, end_date)
+            time_metrics = self._calculate_time_based_metrics_from_rollups(
+                start_date, end_date
+            )
+            performance_metrics = self._performance_metrics_from_counts(
+                event_counts, tracking_records, period_days
+            )
+        else:
+            # Get audit events for the period
+            events = self.audit_trail.get_audit_events(
+                start_date=start_date, end_date=end_date
+            )
+            time_metrics = self._calculate_time_based_metrics(events, tracking_records)
+            performance_metrics = self._calculate_performance_metrics(
+                events, tracking_records, period_days
+            )
 
         # Calculate compliance metrics
         compliance_metrics = self._calculate_compliance_metrics(tracking_records)
@@ -519,6 +890,62 @@ class SecurityMetricsAnalyzer:
                     (resolved_time - detected_time).total_seconds() / 3600
                 )
 
+        return self._summarize_time_intervals(
+            detection_times, assessment_times, resolution_times, verification_times
+        )
+
+    def _calculate_time_based_metrics_from_rollups(
+        self, start_date: datetime, end_date: datetime
+    ) -> Dict[str, Optional[float]]:
+        """
+        Calculate time-based metrics from the vulnerability milestones rollup.
+
+        A vulnerability counts when its latest detection falls in the period,
+        and an interval counts when the later milestone does too, matching
+        _calculate_time_based_metrics over the period's audit events.
+        """
+        start, end = start_date.isoformat(), end_date.isoformat()
+        with closing(sqlite3.connect(self.metrics_db_path)) as conn:
+            rows = conn.execute(
+                """
+                SELECT detected_at, assessed_at, resolved_at
+                FROM vulnerability_milestones
+                WHERE detected_at >= ? AND detected_at <= ?
+            """,
+                (start, end),
+            ).fetchall()
+
+        assessment_times = []
+        resolution_times = []
+        for detected_at, assessed_at, resolved_at in rows:
+            detected_time = datetime.fromisoformat(detected_at)
+            if assessed_at and start <= assessed_at <= end:
+                assessment_times.append(
+                    (
+                        datetime.fromisoformat(assessed_at) - detected_time
+                    ).total_seconds()
+                    / 3600
+                )
+            if resolved_at and start <= resolved_at <= end:
+                resolution_times.append(
+                    (
+                        datetime.fromisoformat(resolved_at) - detected_time
+                    ).total_seconds()
+                    / 3600
+                )
+
+        return self._summarize_time_intervals(
+            [], assessment_times, resolution_times, []
+        )
+
+    def _summarize_time_intervals(
+        self,
+        detection_times: List[float],
+        assessment_times: List[float],
+        resolution_times: List[float],
+        verification_times: List[float],
+    ) -> Dict[str, Optional[float]]:
+        """Summarize lifecycle intervals, in hours, into time-based metrics."""
         # Calculate means
         return {
             "detection": None,  # Would need external data source
@@ -553,24 +980,31 @@ class SecurityMetricsAnalyzer:
         # Handle Mock objects in tests
         if hasattr(events, "_mock_name") or not hasattr(events, "__iter__"):
             events = []
+
+        event_counts = Counter(e.event_type.value for e in events)
+        return self._performance_metrics_from_counts(
+            event_counts, tracking_records, period_days
+        )
+
+    def _performance_metrics_from_counts(
+        self,
+        event_counts: Counter[str],
+        tracking_records: List[Any],
+        period_days: int,
+    ) -> Dict[str, float]:
+        """Calculate performance metrics from event counts by event type."""
         if hasattr(tracking_records, "_mock_name") or not hasattr(
             tracking_records, "__iter__"
         ):
             tracking_records = []
 
         # Count scans
-        scan_events = [
-            e for e in events if e.event_type == AuditEventType.SCAN_COMPLETED
-        ]
-        scan_frequency = len(scan_events) / period_days if period_days > 0 else 0.0
+        scan_count = event_counts[AuditEventType.SCAN_COMPLETED.value]
+        scan_frequency = scan_count / period_days if period_days > 0 else 0.0
 
         # Calculate detection rate
-        vulnerability_events = [
-            e for e in events if e.event_type == AuditEventType.VULNERABILITY_DETECTED
-        ]
-        detection_rate = (
-            len(vulnerability_events) / len(scan_events) if scan_events else 0.0
-        )
+        detection_count = event_counts[AuditEventType.VULNERABILITY_DETECTED.value]
+        detection_rate = detection_count / scan_count if scan_count else 0.0
 
         # Calculate resolution rate
         resolved_count = sum(
@@ -634,22 +1068,30 @@ class SecurityMetricsAnalyzer:
         )
 
         # Get policy violations from recent events
-        thirty_days_ago = datetime.now() - timedelta(days=30)
-        recent_events = self.audit_trail.get_audit_events(start_date=thirty_days_ago)
-
-        # Handle Mock objects in tests
-        if hasattr(recent_events, "_mock_name") or not hasattr(
-            recent_events, "__iter__"
-        ):
-            recent_events = []
-
-        policy_violations = len(
-            [
-                e
-                for e in recent_events
-                if e.event_type == AuditEventType.POLICY_VIOLATION
+        now = datetime.now()
+        thirty_days_ago = now - timedelta(days=30)
+        if self.refresh_rollups() is not None:
+            policy_violations = self._count_events(thirty_days_ago, now)[
+                AuditEventType.POLICY_VIOLATION.value
             ]
-        )
+        else:
+            recent_events = self.audit_trail.get_audit_events(
+                start_date=thirty_days_ago
+            )
+
+            # Handle Mock objects in tests
+            if hasattr(recent_events, "_mock_name") or not hasattr(
+                recent_events, "__iter__"
+            ):
+                recent_events = []
+
+            policy_violations = len(
+                [
+                    e
+                    for e in recent_events
+                    if e.event_type == AuditEventType.POLICY_VIOLATION
+                ]
+            )
 
         # Calculate risk score based on severity and status
         risk_score = 0.0
@@ -744,10 +1186,15 @@ class SecurityMetricsAnalyzer:
         """
         Analyze trends for specific metrics.
 
+        Metric names that are audit event types (such as "scan_completed")
+        are analyzed as event counts per period, read from the rollup tables
+        after rolling up the events logged since the last refresh.
+
         Args:
             metric_names: List of metric names to analyze
             period_days: Number of days to analyze
-            granularity: Time granularity ("daily", "weekly", "monthly")
+            granularity: Time granularity ("daily", "weekly", "monthly", and
+                "hourly" for event metrics)
 
         Returns:
             List of TrendAnalysis objects
@@ -755,37 +1202,56 @@ class SecurityMetricsAnalyzer:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=period_days)
 
-        trend_analyses = []
+        event_types = {event_type.value: event_type for event_type in AuditEventType}
+        rollups_ready = any(name in event_types for name in metric_names) and (
+            self.refresh_rollups() is not None
+        )
+
+        series: Dict[str, List[MetricPoint]] = {}
 
         for metric_name in metric_names:
-            # Get trend data for the metric
-            trend_data = self._get_trend_data(metric_name, start_date, end_date)
+            if rollups_ready and metric_name in event_types:
+                # Event counts come pre-aggregated from the rollups
+                aggregated_data = self._get_event_trend_data(
+                    event_types[metric_name], start_date, end_date, granularity
+                )
+            else:
+                # Get trend data for the metric
+                trend_data = self._get_trend_data(metric_name, start_date, end_date)
 
-            if not trend_data:
-                self.logger.warning(f"No trend data found for metric: {metric_name}")
-                continue
+                if not trend_data:
+                    self.logger.warning(
+                        f"No trend data found for metric: {metric_name}"
+                    )
+                    continue
 
-            # Aggregate data by granularity
-            aggregated_data = self._aggregate_trend_data(trend_data, granularity)
+                # Aggregate data by granularity
+                aggregated_data = self._aggregate_trend_data(trend_data, granularity)
 
             # Calculate trend statistics
-            values = [point.value for point in aggregated_data]
+            if len(aggregated_data) >= 2:
+                series[metric_name] = aggregated_data
+
+        # Statistics for every metric in one batched pass
+        series_statistics = compute_series_statistics(
+            {
+                metric_name: [point.value for point in points]
+                for metric_name, points in series.items()
+            }
+        )
 
-            if len(values) < 2:
-                continue
+        trend_analyses = []
+
+        for metric_name, aggregated_data in series.items():
+            values = [point.value for point in aggregated_data]
+            stats = series_statistics[metric_name]
 
             # Calculate trend direction and strength
             trend_direction, change_pct, confidence = self._calculate_trend_direction(
-                values
+                values, stats
             )
             trend_strength = confidence  # Use confidence as trend strength
 
-            # Calculate statistics
-            avg_value = statistics.mean(values)
-            min_value = min(values)
-            max_value = max(values)
-            variance = statistics.variance(values) if len(values) > 1 else 0.0
-
             # Calculate growth rate
             growth_rate = (
                 ((values[-1] - values[0]) / values[0] * 100) if values[0] != 0 else 0.0
@@ -797,11 +1263,14 @@ class SecurityMetricsAnalyzer:
                 data_points=aggregated_data,
                 trend_direction=trend_direction,
                 trend_strength=trend_strength,
-                average_value=avg_value,
-                min_value=min_value,
-                max_value=max_value,
-                variance=variance,
+                average_value=stats.mean,
+                min_value=stats.minimum,
+                max_value=stats.maximum,
+                variance=stats.variance,
                 growth_rate=growth_rate,
+                r_squared=stats.r_squared,
+                moving_average=stats.moving_average,
+                anomalies=[aggregated_data[index] for index in stats.anomalies()],
             )
 
             trend_analyses.append(trend_analysis)
@@ -922,61 +1391,40 @@ class SecurityMetricsAnalyzer:
         if not trend_data:
             return []
 
-        # Group data points by time period
-        grouped_data = defaultdict(list)
-
-        for point in trend_data:
-            if granularity == "daily":
-                key = point.timestamp.date()
-            elif granularity == "weekly":
-                # Get Monday of the week
-                key = point.timestamp.date() - timedelta(days=point.timestamp.weekday())
-            elif granularity == "monthly":
-                key = point.timestamp.replace(day=1).date()
-            else:
-                key = point.timestamp.date()  # Default to daily
-
-            grouped_data[key].append(point)
-
-        # Aggregate each group
-        aggregated_data = []
-        for date_key, points in sorted(grouped_data.items()):
-            avg_value = statistics.mean([p.value for p in points])
-
-            # Use the latest timestamp in the group
-            latest_timestamp = max([p.timestamp for p in points])
-
-            aggregated_point = MetricPoint(
+        # Each period is averaged and stamped with its latest timestamp
+        return [
+            MetricPoint(
                 timestamp=latest_timestamp,
                 value=avg_value,
-                metadata={"aggregated_from": len(points), "granularity": granularity},
+                metadata={"aggregated_from": count, "granularity": granularity},
             )
-            aggregated_data.append(aggregated_point)
-
-        return aggregated_data
+            for latest_timestamp, avg_value, count in aggregate_series(
+                [point.timestamp for point in trend_data],
+                [point.value for point in trend_data],
+                granularity,
+            )
+        ]
 
     def _calculate_trend_direction(
-        self, values: List[float]
+        self, values: List[float], stats: Optional[SeriesStatistics] = None
     ) -> Tuple[str, float, float]:
-        """Calculate trend direction, change percentage, and confidence."""
-        if len(values) < 2:
-            return "stable", 0.0, 0.0
-
-        # Simple linear regression to determine trend
-        n = len(values)
-        x_values = list(range(n))
-
-        # Calculate slope
-        x_mean = statistics.mean(x_values)
-        y_mean = statistics.mean(values)
+        """
+        Calculate trend direction, change percentage, and confidence.
 
-        numerator = sum((x - x_mean) * (y - y_mean) for x, y in zip(x_values, values))
-        denominator = sum((x - x_mean) ** 2 for x in x_values)
+        Args:
+            values: Metric values, oldest first
+            stats: Statistics already computed for the values, if any
 
-        if denominator == 0:
+        Returns:
+            Tuple of direction, change percentage and confidence
+        """
+        if len(values) < 2:
             return "stable", 0.0, 0.0
 
-        slope = numerator / denominator
+        # Simple linear regression to determine trend
+        if stats is None:
+            stats = compute_series_statistics({"values": values})["values"]
+        slope = stats.slope
 
         # Calculate change percentage
         if values[0] != 0:
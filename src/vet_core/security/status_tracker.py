@@ -14,6 +14,7 @@ import json
 import logging
 import sqlite3
 import uuid
+from contextlib import closing
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -222,6 +223,24 @@ class VulnerabilityStatusTracker:
         ProgressStage.CLOSURE: 100.0,
     }
 
+    # Remediation stage reached at each status
+    STATUS_STAGE_MAP = {
+        VulnerabilityStatus.NEW: ProgressStage.DISCOVERY,
+        VulnerabilityStatus.DETECTED: ProgressStage.DISCOVERY,
+        VulnerabilityStatus.ASSESSED: ProgressStage.ASSESSMENT,
+        VulnerabilityStatus.ASSIGNED: ProgressStage.PLANNING,
+        VulnerabilityStatus.IN_PROGRESS: ProgressStage.IMPLEMENTATION,
+        VulnerabilityStatus.TESTING: ProgressStage.TESTING,
+        VulnerabilityStatus.RESOLVED: ProgressStage.DEPLOYMENT,
+        VulnerabilityStatus.VERIFIED: ProgressStage.VERIFICATION,
+        VulnerabilityStatus.CLOSED: ProgressStage.CLOSURE,
+        VulnerabilityStatus.IGNORED: ProgressStage.CLOSURE,
+        VulnerabilityStatus.DEFERRED: ProgressStage.ASSESSMENT,
+    }
+
+    # Statuses that can no longer become overdue
+    FINAL_STATUSES = (VulnerabilityStatus.CLOSED, VulnerabilityStatus.IGNORED)
+
     # SLA timelines by severity (in hours)
     SLA_TIMELINES = {
         VulnerabilitySeverity.CRITICAL: 24,
@@ -304,7 +323,8 @@ class VulnerabilityStatusTracker:
                         estimated_effort_hours REAL,
                         actual_effort_hours REAL,
                         tags TEXT,  -- JSON array
-                        metadata TEXT  -- JSON object
+                        metadata TEXT,  -- JSON object
+                        sla_deadline TEXT  -- target resolution date
                     )
                 """
                 )
@@ -360,6 +380,36 @@ class VulnerabilityStatusTracker:
                     "CREATE INDEX IF NOT EXISTS idx_status_changes_time ON status_changes(changed_at)"
                 )
 
+                # Databases created before sla_deadline was stored on the
+                # record get the column, filled from the saved progress metrics
+                columns = {
+                    row[1]
+                    for row in cursor.execute("PRAGMA table_info(tracking_records)")
+                }
+                if "sla_deadline" not in columns:
+                    cursor.execute(
+                        "ALTER TABLE tracking_records ADD COLUMN sla_deadline TEXT"
+                    )
+                    cursor.execute(
+                        """
+                        UPDATE tracking_records
+                        SET sla_deadline = (
+                            SELECT sla_deadline FROM progress_metrics
+                            WHERE progress_metrics.vulnerability_id
+                                = tracking_records.vulnerability_id
+                        )
+                    """
+                    )
+
+                # Covering indexes for the aggregate progress summary and the
+                # overdue range scan
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_tracking_status_severity ON tracking_records(current_status, severity)"
+                )
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_tracking_sla_deadline ON tracking_records(sla_deadline, current_status)"
+                )
+
                 conn.commit()
 
         except Exception as e:
@@ -569,52 +619,40 @@ class VulnerabilityStatusTracker:
         Returns:
             List of matching tracking records
         """
-        try:
-            with sqlite3.connect(self.tracking_db_path) as conn:
-                cursor = conn.cursor()
+        conditions = ["1=1"]
+        params: List[Any] = []
 
-                query = "SELECT vulnerability_id FROM tracking_records WHERE 1=1"
-                params = []
+        if status_filter:
+            conditions.append("current_status = ?")
+            params.append(status_filter.value)
 
-                if status_filter:
-                    query += " AND current_status = ?"
-                    params.append(status_filter.value)
+        if severity_filter:
+            conditions.append("severity = ?")
+            params.append(severity_filter.value)
 
-                if severity_filter:
-                    query += " AND severity = ?"
-                    params.append(severity_filter.value)
-
-                if assigned_to_filter:
-                    query += " AND assigned_to = ?"
-                    params.append(assigned_to_filter)
-
-                query += " ORDER BY updated_at DESC"
-
-                cursor.execute(query, params)
-                vulnerability_ids = [row[0] for row in cursor.fetchall()]
-
-                # Load full records
-                records = []
-                for vuln_id in vulnerability_ids:
-                    record = self.get_tracking_record(vuln_id)
-                    if record:
-                        records.append(record)
-
-                return records
+        if assigned_to_filter:
+            conditions.append("assigned_to = ?")
+            params.append(assigned_to_filter)
 
+        try:
+            records = self._load_tracking_records(" AND ".join(conditions), params)
         except Exception as e:
             self.logger.error(f"Failed to get tracking records: {e}")
             return []
 
+        return self._prefer_cached(records)
+
     def get_progress_summary(self) -> Dict[str, Any]:
         """
         Get overall progress summary.
 
+        The counts and averages are aggregated by SQLite over the
+        (current_status, severity) and sla_deadline indexes, so no tracking
+        records are loaded into memory.
+
         Returns:
             Dictionary with progress summary statistics
         """
-        all_records = self.get_all_tracking_records()
-
         # Status distribution
         status_counts = {}
         for status in VulnerabilityStatus:
@@ -625,35 +663,56 @@ class VulnerabilityStatusTracker:
         for severity in VulnerabilitySeverity:
             severity_counts[severity.value] = 0
 
-        # Progress metrics
-        total_progress = 0.0
-        overdue_count = 0
-        completed_count = 0
+        progress_sql = self._progress_percentage_sql()
+        open_condition, final_statuses = self._open_status_condition()
 
-        for record in all_records:
-            status_counts[record.current_status.value] += 1
-            severity_counts[record.severity.value] += 1
+        try:
+            with closing(sqlite3.connect(self.tracking_db_path)) as conn:
+                grouped_rows = conn.execute(
+                    """
+                    SELECT current_status, severity, COUNT(*)
+                    FROM tracking_records
+                    GROUP BY current_status, severity
+                """
+                ).fetchall()
 
-            if record.progress_metrics:
-                total_progress += record.progress_metrics.progress_percentage
-                if record.progress_metrics.is_overdue:
-                    overdue_count += 1
-                if record.progress_metrics.progress_percentage >= 100.0:
-                    completed_count += 1
+                total, average_progress, completed_count = conn.execute(
+                    f"""
+                    SELECT COUNT(*),
+                           COALESCE(AVG({progress_sql}), 0.0),
+                           COALESCE(SUM({progress_sql} >= 100.0), 0)
+                    FROM tracking_records
+                """
+                ).fetchone()
 
-        average_progress = total_progress / len(all_records) if all_records else 0.0
+                (overdue_count,) = conn.execute(
+                    f"""
+                    SELECT COUNT(*)
+                    FROM tracking_records
+                    WHERE sla_deadline < ? AND {open_condition}
+                """,
+                    [datetime.now().isoformat(), *final_statuses],
+                ).fetchone()
+        except Exception as e:
+            self.logger.error(f"Failed to get progress summary: {e}")
+            grouped_rows = []
+            total, average_progress, completed_count, overdue_count = 0, 0.0, 0, 0
+
+        for status_value, severity_value, count in grouped_rows:
+            status_counts[status_value] = status_counts.get(status_value, 0) + count
+            severity_counts[severity_value] = (
+                severity_counts.get(severity_value, 0) + count
+            )
 
         return {
-            "total_vulnerabilities": len(all_records),
+            "total_vulnerabilities": total,
             "status_distribution": status_counts,
             "severity_distribution": severity_counts,
             "progress_metrics": {
                 "average_progress_percentage": average_progress,
                 "completed_count": completed_count,
                 "overdue_count": overdue_count,
-                "completion_rate": (
-                    (completed_count / len(all_records) * 100) if all_records else 0.0
-                ),
+                "completion_rate": (completed_count / total * 100) if total else 0.0,
             },
             "generated_at": datetime.now().isoformat(),
         }
@@ -662,28 +721,55 @@ class VulnerabilityStatusTracker:
         """
         Get vulnerabilities that are overdue based on SLA.
 
+        Only the overdue records are loaded, found with a range scan on the
+        sla_deadline index.
+
         Returns:
-            List of overdue vulnerability tracking records
+            List of overdue vulnerability tracking records, most overdue first
         """
-        all_records = self.get_all_tracking_records()
-        overdue_records = []
-
-        for record in all_records:
-            if record.progress_metrics and record.progress_metrics.is_overdue:
-                overdue_records.append(record)
-
-        # Sort by how overdue they are (most overdue first)
-        overdue_records.sort(
-            key=lambda r: (
-                r.progress_metrics.sla_deadline
-                if r.progress_metrics and r.progress_metrics.sla_deadline
-                else datetime.now()
-            ),
-            reverse=False,
-        )
+        open_condition, final_statuses = self._open_status_condition()
+        try:
+            overdue_records = self._load_tracking_records(
+                f"sla_deadline < ? AND {open_condition}",
+                [datetime.now().isoformat(), *final_statuses],
+                order_by="sla_deadline ASC",
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to get overdue vulnerabilities: {e}")
+            return []
+
+        overdue_records = self._prefer_cached(overdue_records)
+
+        # Cached metrics may predate the deadline passing
+        for record in overdue_records:
+            record.progress_metrics = self._calculate_progress_metrics(record)
 
         return overdue_records
 
+    def _open_status_condition(self) -> Tuple[str, List[str]]:
+        """Build a SQL condition excluding records in a final status."""
+        final_statuses = [status.value for status in self.FINAL_STATUSES]
+        placeholders = ", ".join("?" * len(final_statuses))
+        return f"current_status NOT IN ({placeholders})", final_statuses
+
+    def _progress_percentage_sql(self) -> str:
+        """Build a SQL expression for the progress percentage of a record."""
+        default = self.STAGE_PROGRESS_MAP[ProgressStage.DISCOVERY]
+        cases = " ".join(
+            f"WHEN '{status.value}' THEN {self.STAGE_PROGRESS_MAP.get(stage, 0.0)}"
+            for status, stage in self.STATUS_STAGE_MAP.items()
+        )
+        return f"(CASE current_status {cases} ELSE {default} END)"
+
+    def _prefer_cached(
+        self, records: List[VulnerabilityTrackingRecord]
+    ) -> List[VulnerabilityTrackingRecord]:
+        """Swap loaded records for cached instances so in-memory updates are kept."""
+        return [
+            self.tracking_cache.setdefault(record.vulnerability_id, record)
+            for record in records
+        ]
+
     def _is_valid_status_transition(
         self, current_status: VulnerabilityStatus, new_status: VulnerabilityStatus
     ) -> bool:
@@ -691,6 +777,11 @@ class VulnerabilityStatusTracker:
         allowed_transitions = self.STATUS_PROGRESSION.get(current_status, [])
         return new_status in allowed_transitions or new_status == current_status
 
+    def _sla_deadline(self, record: VulnerabilityTrackingRecord) -> datetime:
+        """Get the date a vulnerability should be resolved by under its SLA."""
+        sla_hours = self.SLA_TIMELINES.get(record.severity, 720)  # Default to 1 month
+        return record.created_at + timedelta(hours=sla_hours)
+
     def _calculate_progress_metrics(
         self, record: VulnerabilityTrackingRecord
     ) -> ProgressMetrics:
@@ -698,21 +789,9 @@ class VulnerabilityStatusTracker:
         now = datetime.now()
 
         # Determine current stage based on status
-        stage_map = {
-            VulnerabilityStatus.NEW: ProgressStage.DISCOVERY,
-            VulnerabilityStatus.DETECTED: ProgressStage.DISCOVERY,
-            VulnerabilityStatus.ASSESSED: ProgressStage.ASSESSMENT,
-            VulnerabilityStatus.ASSIGNED: ProgressStage.PLANNING,
-            VulnerabilityStatus.IN_PROGRESS: ProgressStage.IMPLEMENTATION,
-            VulnerabilityStatus.TESTING: ProgressStage.TESTING,
-            VulnerabilityStatus.RESOLVED: ProgressStage.DEPLOYMENT,
-            VulnerabilityStatus.VERIFIED: ProgressStage.VERIFICATION,
-            VulnerabilityStatus.CLOSED: ProgressStage.CLOSURE,
-            VulnerabilityStatus.IGNORED: ProgressStage.CLOSURE,
-            VulnerabilityStatus.DEFERRED: ProgressStage.ASSESSMENT,
-        }
-
-        current_stage = stage_map.get(record.current_status, ProgressStage.DISCOVERY)
+        current_stage = self.STATUS_STAGE_MAP.get(
+            record.current_status, ProgressStage.DISCOVERY
+        )
         progress_percentage = self.STAGE_PROGRESS_MAP.get(current_stage, 0.0)
 
         # Calculate time metrics
@@ -728,12 +807,10 @@ class VulnerabilityStatusTracker:
                     break
 
         # Calculate SLA deadline
-        sla_hours = self.SLA_TIMELINES.get(record.severity, 720)  # Default to 1 month
-        sla_deadline = record.created_at + timedelta(hours=sla_hours)
-        is_overdue = now > sla_deadline and record.current_status not in [
-            VulnerabilityStatus.CLOSED,
-            VulnerabilityStatus.IGNORED,
-        ]
+        sla_deadline = self._sla_deadline(record)
+        is_overdue = (
+            now > sla_deadline and record.current_status not in self.FINAL_STATUSES
+        )
 
         # Estimate completion time (simplified heuristic)
         estimated_completion_time = None
@@ -818,8 +895,9 @@ class VulnerabilityStatusTracker:
                     INSERT OR REPLACE INTO tracking_records (
                         vulnerability_id, package_name, severity, current_status,
                         created_at, updated_at, assigned_to, priority_score,
-                        estimated_effort_hours, actual_effort_hours, tags, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        estimated_effort_hours, actual_effort_hours, tags, metadata,
+                        sla_deadline
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                     (
                         record.vulnerability_id,
@@ -834,6 +912,7 @@ class VulnerabilityStatusTracker:
                         record.actual_effort_hours,
                         json.dumps(record.tags),
                         json.dumps({}),  # metadata placeholder
+                        self._sla_deadline(record).isoformat(),
                     ),
                 )
 
@@ -913,87 +992,115 @@ class VulnerabilityStatusTracker:
     ) -> Optional[VulnerabilityTrackingRecord]:
         """Load tracking record from database."""
         try:
-            with sqlite3.connect(self.tracking_db_path) as conn:
-                cursor = conn.cursor()
+            records = self._load_tracking_records(
+                "vulnerability_id = ?", [vulnerability_id]
+            )
+            return records[0] if records else None
 
-                # Load main record
-                cursor.execute(
-                    """
-                    SELECT vulnerability_id, package_name, severity, current_status,
-                           created_at, updated_at, assigned_to, priority_score,
-                           estimated_effort_hours, actual_effort_hours, tags
-                    FROM tracking_records
-                    WHERE vulnerability_id = ?
-                """,
-                    (vulnerability_id,),
-                )
+        except Exception as e:
+            self.logger.error(f"Failed to load tracking record {vulnerability_id}: {e}")
+            return None
 
-                row = cursor.fetchone()
-                if not row:
-                    return None
-
-                # Create record
-                record = VulnerabilityTrackingRecord(
-                    vulnerability_id=row[0],
-                    package_name=row[1],
-                    severity=VulnerabilitySeverity(row[2]),
-                    current_status=VulnerabilityStatus(row[3]),
-                    created_at=datetime.fromisoformat(row[4]),
-                    updated_at=datetime.fromisoformat(row[5]),
-                    assigned_to=row[6],
-                    priority_score=row[7] or 0.0,
-                    estimated_effort_hours=row[8],
-                    actual_effort_hours=row[9],
-                    tags=json.loads(row[10]) if row[10] else [],
-                )
+    def _load_tracking_records(
+        self,
+        where_clause: str = "1=1",
+        params: Optional[List[Any]] = None,
+        order_by: str = "updated_at DESC",
+    ) -> List[VulnerabilityTrackingRecord]:
+        """
+        Load tracking records matching a filter with their history and metrics.
 
-                # Load status history
-                cursor.execute(
-                    """
-                    SELECT change_id, old_status, new_status, changed_by,
-                           changed_at, reason, notes, metadata
-                    FROM status_changes
-                    WHERE vulnerability_id = ?
-                    ORDER BY changed_at ASC
-                """,
-                    (vulnerability_id,),
-                )
+        The records, their status changes and their progress metrics rows are
+        fetched with three set-based queries over one connection and assembled
+        in memory, so the cost does not grow with one round trip per record.
 
-                for change_row in cursor.fetchall():
-                    change = StatusChange(
-                        change_id=change_row[0],
-                        vulnerability_id=vulnerability_id,
-                        old_status=(
-                            VulnerabilityStatus(change_row[1])
-                            if change_row[1]
-                            else None
-                        ),
-                        new_status=VulnerabilityStatus(change_row[2]),
-                        changed_by=change_row[3],
-                        changed_at=datetime.fromisoformat(change_row[4]),
-                        reason=change_row[5] or "",
-                        notes=change_row[6] or "",
-                        metadata=json.loads(change_row[7]) if change_row[7] else {},
-                    )
-                    record.status_history.append(change)
+        Args:
+            where_clause: SQL condition on tracking_records columns
+            params: Parameters for the placeholders in where_clause
+            order_by: SQL ordering of the returned records
 
-                # Load progress metrics
-                cursor.execute(
-                    """
-                    SELECT current_stage, progress_percentage, estimated_completion_time,
-                           sla_deadline, completion_confidence
+        Returns:
+            Matching tracking records in the requested order
+        """
+        params = list(params or [])
+        matching_ids = (
+            f"SELECT vulnerability_id FROM tracking_records WHERE {where_clause}"
+        )
+
+        with closing(sqlite3.connect(self.tracking_db_path)) as conn:
+            record_rows = conn.execute(
+                f"""
+                SELECT vulnerability_id, package_name, severity, current_status,
+                       created_at, updated_at, assigned_to, priority_score,
+                       estimated_effort_hours, actual_effort_hours, tags
+                FROM tracking_records
+                WHERE {where_clause}
+                ORDER BY {order_by}
+            """,
+                params,
+            ).fetchall()
+            if not record_rows:
+                return []
+
+            change_rows = conn.execute(
+                f"""
+                SELECT vulnerability_id, change_id, old_status, new_status,
+                       changed_by, changed_at, reason, notes, metadata
+                FROM status_changes
+                WHERE vulnerability_id IN ({matching_ids})
+                ORDER BY vulnerability_id, changed_at ASC
+            """,
+                params,
+            ).fetchall()
+
+            ids_with_metrics = {
+                row[0]
+                for row in conn.execute(
+                    f"""
+                    SELECT vulnerability_id
                     FROM progress_metrics
-                    WHERE vulnerability_id = ?
+                    WHERE vulnerability_id IN ({matching_ids})
                 """,
-                    (vulnerability_id,),
+                    params,
                 )
+            }
+
+        history: Dict[str, List[StatusChange]] = {}
+        for change_row in change_rows:
+            history.setdefault(change_row[0], []).append(
+                StatusChange(
+                    change_id=change_row[1],
+                    vulnerability_id=change_row[0],
+                    old_status=(
+                        VulnerabilityStatus(change_row[2]) if change_row[2] else None
+                    ),
+                    new_status=VulnerabilityStatus(change_row[3]),
+                    changed_by=change_row[4],
+                    changed_at=datetime.fromisoformat(change_row[5]),
+                    reason=change_row[6] or "",
+                    notes=change_row[7] or "",
+                    metadata=json.loads(change_row[8]) if change_row[8] else {},
+                )
+            )
 
-                metrics_row = cursor.fetchone()
-                if metrics_row:
-                    record.progress_metrics = self._calculate_progress_metrics(record)
-
-                return record
+        records = []
+        for row in record_rows:
+            record = VulnerabilityTrackingRecord(
+                vulnerability_id=row[0],
+                package_name=row[1],
+                severity=VulnerabilitySeverity(row[2]),
+                current_status=VulnerabilityStatus(row[3]),
+                created_at=datetime.fromisoformat(row[4]),
+                updated_at=datetime.fromisoformat(row[5]),
+                assigned_to=row[6],
+                priority_score=row[7] or 0.0,
+                estimated_effort_hours=row[8],
+                actual_effort_hours=row[9],
+                tags=json.loads(row[10]) if row[10] else [],
+                status_history=history.get(row[0], []),
+            )
+            if record.vulnerability_id in ids_with_metrics:
+                record.progress_metrics = self._calculate_progress_metrics(record)
+            records.append(record)
 
-        except Exception as e:
-            self.logger.error(f"Failed to load tracking record {vulnerability_id}: {e}")
-            return None
+        return records
@@ -0,0 +1,326 @@
+"""
+Batched statistics for security metric trend series.
+
+This module computes the descriptive statistics used by trend analysis
+(mean, sample variance, least-squares slope and r², trailing moving averages
+and z-scores) for many metric series at once, and groups timestamped points
+into daily, weekly or monthly periods.
+
+When NumPy is installed, every series is loaded into one zero-padded 2D array
+and all statistics are computed in a single vectorized pass. Without NumPy the
+same results are produced by pure-Python loops.
+"""
+
+import math
+import operator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None  # type: ignore[assignment]
+
+# NumPy is available for the vectorized path
+NUMPY_AVAILABLE = np is not None
+
+# Below this many points the pure-Python path is faster than building arrays
+NUMPY_MIN_POINTS = 256
+
+GRANULARITIES = ("daily", "weekly", "monthly")
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass
+class SeriesStatistics:
+    """Statistics for one metric series, with points at x = 0, 1, 2, ..."""
+
+    count: int
+    mean: float
+    minimum: float
+    maximum: float
+    variance: float  # Sample variance, 0.0 with fewer than two points
+    slope: float
+    intercept: float
+    r_squared: float
+    moving_average: List[float] = field(default_factory=list)
+    z_scores: List[float] = field(default_factory=list)
+
+    def anomalies(self, threshold: float = 3.0) -> List[int]:
+        """Get the indexes of points whose z-score exceeds the threshold."""
+        return [
+            index for index, score in enumerate(self.z_scores) if abs(score) > threshold
+        ]
+
+
+def _use_numpy(use_numpy: Optional[bool], points: int) -> bool:
+    """Decide whether to take the NumPy path."""
+    if use_numpy is None:
+        return NUMPY_AVAILABLE and points >= NUMPY_MIN_POINTS
+    if use_numpy and not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required for use_numpy=True")
+    return use_numpy
+
+
+def compute_series_statistics(
+    series: Mapping[str, Sequence[float]],
+    window: int = 7,
+    use_numpy: Optional[bool] = None,
+) -> Dict[str, SeriesStatistics]:
+    """
+    Compute statistics for every metric series in one pass.
+
+    Args:
+        series: Mapping of metric name to its values, oldest first
+        window: Number of trailing points in each moving average
+        use_numpy: Force (True) or disable (False) the NumPy path; by default
+            NumPy is used when it is installed and there are enough points
+
+    Returns:
+        Dictionary mapping each metric name to its SeriesStatistics
+
+    Raises:
+        ValueError: If the window is not positive
+        ImportError: If use_numpy is True and NumPy is not installed
+
+    Example:
+        >>> stats = compute_series_statistics({"scans": [1.0, 2.0, 4.0]})
+        >>> stats["scans"].slope
+        1.5
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1")
+
+    points = sum(len(values) for values in series.values())
+    if _use_numpy(use_numpy, points):
+        return _numpy_series_statistics(series, window)
+    return {
+        name: _python_series_statistics(values, window)
+        for name, values in series.items()
+    }
+
+
+def _empty_statistics() -> SeriesStatistics:
+    """Statistics of a series without points."""
+    return SeriesStatistics(
+        count=0,
+        mean=0.0,
+        minimum=0.0,
+        maximum=0.0,
+        variance=0.0,
+        slope=0.0,
+        intercept=0.0,
+        r_squared=0.0,
+    )
+
+
+def _python_series_statistics(values: Sequence[float], window: int) -> SeriesStatistics:
+    """Compute the statistics of one series with pure-Python loops."""
+    n = len(values)
+    if n == 0:
+        return _empty_statistics()
+
+    mean = math.fsum(values) / n
+    x_mean = (n - 1) / 2
+    deviations = [value - mean for value in values]
+    sxx = (n - 1) * n * (n + 1) / 12  # Sum of (x - x_mean)^2 for x = 0..n-1
+    sxy = math.fsum((x - x_mean) * dev for x, dev in enumerate(deviations))
+    syy = math.fsum(dev * dev for dev in deviations)
+
+    slope = sxy / sxx if sxx > 0 else 0.0
+    r_squared = sxy * sxy / (sxx * syy) if sxx > 0 and syy > 0 else 0.0
+    std = math.sqrt(syy / n)
+
+    moving_average = []
+    running = 0.0
+    for index, value in enumerate(values):
+        running += value
+        if index >= window:
+            running -= values[index - window]
+        moving_average.append(running / min(index + 1, window))
+
+    return SeriesStatistics(
+        count=n,
+        mean=mean,
+        minimum=min(values),
+        maximum=max(values),
+        variance=syy / (n - 1) if n > 1 else 0.0,
+        slope=slope,
+        intercept=mean - slope * x_mean,
+        r_squared=r_squared,
+        moving_average=moving_average,
+        z_scores=[dev / std if std > 0 else 0.0 for dev in deviations],
+    )
+
+
+def _numpy_series_statistics(
+    series: Mapping[str, Sequence[float]], window: int
+) -> Dict[str, SeriesStatistics]:
+    """Compute the statistics of every series in one vectorized pass."""
+    names = list(series)
+    if not names:
+        return {}
+
+    lengths = np.fromiter((len(series[name]) for name in names), dtype=np.int64)
+    width = int(lengths.max())
+    values = np.zeros((len(names), width))
+    for row, name in enumerate(names):
+        values[row, : lengths[row]] = series[name]
+
+    mask = np.arange(width) < lengths[:, None]
+    n = lengths.astype(float)
+    safe_n = np.maximum(n, 1.0)
+    x = np.arange(width, dtype=float)
+    x_mean = (n - 1) / 2
+
+    mean = values.sum(axis=1) / safe_n
+    deviations = np.where(mask, values - mean[:, None], 0.0)
+    x_deviations = np.where(mask, x - x_mean[:, None], 0.0)
+    sxx = (n - 1) * n * (n + 1) / 12
+    sxy = (x_deviations * deviations).sum(axis=1)
+    syy = (deviations * deviations).sum(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(sxx > 0, sxy / sxx, 0.0)
+        r_squared = np.where((sxx > 0) & (syy > 0), sxy * sxy / (sxx * syy), 0.0)
+        variance = np.where(n > 1, syy / (n - 1), 0.0)
+        std = np.sqrt(syy / safe_n)
+        z_scores = np.where(std[:, None] > 0, deviations / std[:, None], 0.0)
+
+    # Trailing moving average from prefix sums, shorter at the start
+    prefix = np.zeros((len(names), width + 1))
+    np.cumsum(values, axis=1, out=prefix[:, 1:])
+    ends = np.arange(1, width + 1)
+    starts = np.maximum(ends - window, 0)
+    moving_average = (prefix[:, ends] - prefix[:, starts]) / (ends - starts)
+
+    minimum = np.where(mask, values, np.inf).min(axis=1)
+    maximum = np.where(mask, values, -np.inf).max(axis=1)
+    intercept = mean - slope * x_mean
+
+    results = {}
+    for row, name in enumerate(names):
+        length = int(lengths[row])
+        if length == 0:
+            results[name] = _empty_statistics()
+            continue
+        results[name] = SeriesStatistics(
+            count=length,
+            mean=float(mean[row]),
+            minimum=float(minimum[row]),
+            maximum=float(maximum[row]),
+            variance=float(variance[row]),
+            slope=float(slope[row]),
+            intercept=float(intercept[row]),
+            r_squared=float(r_squared[row]),
+            moving_average=moving_average[row, :length].tolist(),
+            z_scores=z_scores[row, :length].tolist(),
+        )
+    return results
+
+
+def _period_start(timestamp: datetime, granularity: str) -> datetime:
+    """Get the start of the day, week or month containing a timestamp."""
+    day = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "weekly":
+        return day - timedelta(days=day.weekday())
+    if granularity == "monthly":
+        return day.replace(day=1)
+    return day
+
+
+def aggregate_series(
+    timestamps: Sequence[datetime],
+    values: Sequence[float],
+    granularity: str = "daily",
+    use_numpy: Optional[bool] = None,
+) -> List[Tuple[datetime, float, int]]:
+    """
+    Group timestamped values into periods and average each period.
+
+    Unknown granularities group by day.
+
+    Args:
+        timestamps: Timestamp of each value
+        values: Values to aggregate
+        granularity: Time granularity ("daily", "weekly", "monthly")
+        use_numpy: Force (True) or disable (False) the NumPy path; by default
+            NumPy is used when it is installed and there are enough points
+
+    Returns:
+        List of (latest timestamp, mean value, number of points) tuples, one
+        per period, oldest period first
+
+    Raises:
+        ImportError: If use_numpy is True and NumPy is not installed
+    """
+    if not timestamps:
+        return []
+    if granularity not in GRANULARITIES:
+        granularity = "daily"
+
+    # Aware timestamps cannot be compared with the naive epoch
+    naive = all(timestamp.tzinfo is None for timestamp in timestamps)
+    if naive and _use_numpy(use_numpy, len(timestamps)):
+        return _numpy_aggregate_series(timestamps, values, granularity)
+
+    groups: Dict[datetime, List[float]] = {}
+    latest: Dict[datetime, datetime] = {}
+    for timestamp, value in zip(timestamps, values):
+        key = _period_start(timestamp, granularity)
+        groups.setdefault(key, []).append(value)
+        if key not in latest or timestamp > latest[key]:
+            latest[key] = timestamp
+
+    return [
+        (latest[key], math.fsum(group) / len(group), len(group))
+        for key, group in sorted(groups.items())
+    ]
+
+
+def _numpy_aggregate_series(
+    timestamps: Sequence[datetime], values: Sequence[float], granularity: str
+) -> List[Tuple[datetime, float, int]]:
+    """Group and average values by period with NumPy."""
+    # Day numbers are much cheaper to extract than full datetime64 values
+    days = np.fromiter(
+        map(datetime.toordinal, timestamps), dtype=np.int64, count=len(timestamps)
+    )
+    if granularity == "weekly":
+        # Ordinal day 1 (0001-01-01) was a Monday
+        keys = days - (days - 1) % 7
+    elif granularity == "monthly":
+        keys = (days - _EPOCH_ORDINAL).astype("datetime64[D]").astype("datetime64[M]")
+    else:
+        keys = days
+
+    _, inverse = np.unique(keys, return_inverse=True)
+    counts = np.bincount(inverse)
+    sums = np.bincount(inverse, weights=np.asarray(values, dtype=float))
+
+    # Order points by period, then by time, so each period ends with its
+    # latest point; points read in time order need no sort by time
+    in_time_order = all(map(operator.le, timestamps, islice(timestamps, 1, None)))
+    if in_time_order:
+        order = np.argsort(inverse, kind="stable")
+    else:
+        moments = np.fromiter(
+            ((timestamp - _EPOCH) // _MICROSECOND for timestamp in timestamps),
+            dtype=np.int64,
+            count=len(timestamps),
+        )
+        order = np.lexsort((moments, inverse))
+    latest = order[np.cumsum(counts) - 1]
+
+    return list(
+        zip(
+            [timestamps[index] for index in latest.tolist()],
+            (sums / counts).tolist(),
+            counts.tolist(),
+        )
+    )
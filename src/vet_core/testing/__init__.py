@@ -0,0 +1,6 @@
+"""
+Testing helpers for services built on vet-core.
+
+The pytest plugin in ``vet_core.testing.pytest_plugin`` is registered
+automatically when vet-core is installed alongside pytest.
+"""
@@ -0,0 +1,37 @@
+"""
+Pytest plugin for services built on vet-core.
+
+Registered through the ``pytest11`` entry point, so installing vet-core
+makes its fixtures available to every test suite:
+
+- ``nplusone_guard``: fails the test if it issues N+1 queries on the
+  ``async_session`` fixture, which the test suite must provide
+
+Example:
+    >>> async def test_list_appointments(async_session, nplusone_guard):
+    ...     await list_appointments_with_pets(async_session)
+"""
+
+from typing import Iterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from vet_core.database.nplusone import QueryScope, detect_nplusone
+
+
+@pytest.fixture
+def nplusone_guard(async_session: AsyncSession) -> Iterator[QueryScope]:
+    """
+    Fail the test if it issues N+1 queries on async_session.
+
+    A statement repeated with different parameters
+    ``DEFAULT_NPLUSONE_THRESHOLD`` times, such as a lazy-loaded relationship
+    walked in a loop, raises NPlusOneQueryException where it happens;
+    detections swallowed by the code under test still fail the test at
+    teardown.
+    """
+    with detect_nplusone(async_session, action="raise") as scope:
+        yield scope
+    if scope.detections:
+        pytest.fail("\n".join(detection.describe() for detection in scope.detections))
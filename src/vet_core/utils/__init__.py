@@ -18,6 +18,7 @@ from .config import (
     is_feature_enabled,
 )
 from .datetime_utils import (
+    AppointmentSlotEngine,
     BusinessHours,
     DayOfWeek,
     calculate_pet_age,
@@ -25,12 +26,16 @@ from .datetime_utils import (
     format_pet_age,
     from_utc,
     get_available_appointment_slots,
+    get_available_slots_for_range,
     get_current_local,
     get_current_utc,
     get_next_business_day,
     get_pet_age_category,
+    intersect_business_hours,
     is_appointment_time_valid,
     is_business_hours,
+    parse_clinic_operating_hours,
+    parse_veterinarian_availability,
     round_to_nearest_slot,
     to_utc,
 )
@@ -64,6 +69,11 @@ __all__ = [
     "is_business_hours",
     "get_next_business_day",
     "get_available_appointment_slots",
+    "get_available_slots_for_range",
+    "AppointmentSlotEngine",
+    "parse_clinic_operating_hours",
+    "parse_veterinarian_availability",
+    "intersect_business_hours",
     "calculate_pet_age",
     "format_pet_age",
     "get_pet_age_category",
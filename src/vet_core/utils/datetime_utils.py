@@ -5,10 +5,12 @@ This module provides timezone-aware datetime handling, business hours calculatio
 appointment scheduling helpers, and age calculation utilities for pets.
 """
 
+import bisect
 import calendar
+import heapq
 from datetime import date, datetime, time, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from zoneinfo import ZoneInfo
 
 
@@ -28,7 +30,12 @@ class BusinessHours:
     """Represents business hours for a clinic."""
 
     def __init__(
-        self, day: DayOfWeek, open_time: time, close_time: time, is_closed: bool = False
+        self,
+        day: DayOfWeek,
+        open_time: time,
+        close_time: time,
+        is_closed: bool = False,
+        breaks: Optional[List[Tuple[time, time]]] = None,
     ):
         """
         Initialize business hours for a specific day.
@@ -38,11 +45,13 @@ class BusinessHours:
             open_time: Opening time
             close_time: Closing time
             is_closed: Whether the business is closed on this day
+            breaks: Optional list of (start, end) break periods, e.g. lunch
         """
         self.day = day
         self.open_time = open_time
         self.close_time = close_time
         self.is_closed = is_closed
+        self.breaks = sorted(breaks) if breaks else []
 
     def is_open_at(self, check_time: time) -> bool:
         """Check if the clinic is open at a specific time."""
@@ -135,6 +144,331 @@ def get_next_business_day(
     return None
 
 
+_DAY_NAMES = {day.name.lower(): day for day in DayOfWeek}
+
+# A (start, end) busy period such as an appointment or a break
+Interval = Tuple[datetime, datetime]
+
+
+def _parse_time(value: str) -> time:
+    """Parse an HH:MM (or HH:MM:SS) string into a time object."""
+    parts = [int(part) for part in value.split(":")]
+    hour, minute, second = (parts + [0, 0])[:3]
+    return time(hour, minute, second)
+
+
+def _parse_break_periods(raw_breaks: Optional[List[Any]]) -> List[Tuple[time, time]]:
+    """
+    Parse break periods stored in clinic or veterinarian schedule JSON.
+
+    Both the ``{"start", "end"}`` form written by the models and the
+    ``{"start_time", "end_time"}`` form produced by the schemas are accepted.
+    """
+    periods = []
+    for raw_break in raw_breaks or []:
+        if not isinstance(raw_break, dict):
+            continue
+        start = raw_break.get("start") or raw_break.get("start_time")
+        end = raw_break.get("end") or raw_break.get("end_time")
+        if start and end:
+            periods.append((_parse_time(start), _parse_time(end)))
+    return periods
+
+
+def _parse_schedule(
+    schedule: Optional[Dict[str, Any]],
+    flag_key: str,
+    start_key: str,
+    end_key: str,
+    breaks_key: str,
+) -> Dict[DayOfWeek, BusinessHours]:
+    """Convert a weekly schedule JSON mapping into BusinessHours objects."""
+    business_hours: Dict[DayOfWeek, BusinessHours] = {}
+    if not schedule:
+        return business_hours
+
+    for day_name, day_schedule in schedule.items():
+        day = _DAY_NAMES.get(str(day_name).lower())
+        if day is None or not isinstance(day_schedule, dict):
+            continue
+
+        start = day_schedule.get(start_key)
+        end = day_schedule.get(end_key)
+        if not day_schedule.get(flag_key, False) or not start or not end:
+            business_hours[day] = BusinessHours(day, time.min, time.min, is_closed=True)
+            continue
+
+        raw_breaks = day_schedule.get(breaks_key)
+        if isinstance(raw_breaks, dict):
+            raw_breaks = [raw_breaks]
+
+        business_hours[day] = BusinessHours(
+            day,
+            _parse_time(start),
+            _parse_time(end),
+            breaks=_parse_break_periods(raw_breaks),
+        )
+
+    return business_hours
+
+
+def parse_clinic_operating_hours(
+    operating_hours: Optional[Dict[str, Any]],
+) -> Dict[DayOfWeek, BusinessHours]:
+    """
+    Convert ``Clinic.operating_hours`` JSON into BusinessHours objects.
+
+    Args:
+        operating_hours: Mapping of day name to ``is_open``, ``open_time``,
+            ``close_time`` and optional ``lunch_break``
+
+    Returns:
+        Dictionary mapping days to BusinessHours, including the lunch break
+    """
+    return _parse_schedule(
+        operating_hours, "is_open", "open_time", "close_time", "lunch_break"
+    )
+
+
+def parse_veterinarian_availability(
+    availability: Optional[Dict[str, Any]],
+) -> Dict[DayOfWeek, BusinessHours]:
+    """
+    Convert ``Veterinarian.availability`` JSON into BusinessHours objects.
+
+    Args:
+        availability: Mapping of day name to ``is_available``, ``start_time``,
+            ``end_time`` and optional ``breaks``
+
+    Returns:
+        Dictionary mapping days to BusinessHours, including all breaks
+    """
+    return _parse_schedule(
+        availability, "is_available", "start_time", "end_time", "breaks"
+    )
+
+
+def intersect_business_hours(
+    first: Dict[DayOfWeek, BusinessHours],
+    second: Dict[DayOfWeek, BusinessHours],
+) -> Dict[DayOfWeek, BusinessHours]:
+    """
+    Intersect two weekly schedules, e.g. clinic hours and a veterinarian's.
+
+    A day is open only if it is open in both schedules; the resulting window
+    is the overlap of both windows and the breaks of both are kept.
+
+    Args:
+        first: First weekly schedule
+        second: Second weekly schedule
+
+    Returns:
+        Dictionary mapping days to the intersected BusinessHours
+    """
+    business_hours: Dict[DayOfWeek, BusinessHours] = {}
+    for day, first_hours in first.items():
+        second_hours = second.get(day)
+        if second_hours is None:
+            continue
+
+        open_time = max(first_hours.open_time, second_hours.open_time)
+        close_time = min(first_hours.close_time, second_hours.close_time)
+        is_closed = (
+            first_hours.is_closed or second_hours.is_closed or close_time <= open_time
+        )
+        business_hours[day] = BusinessHours(
+            day,
+            open_time,
+            close_time,
+            is_closed=is_closed,
+            breaks=first_hours.breaks + second_hours.breaks,
+        )
+
+    return business_hours
+
+
+def _coalesce_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """
+    Merge sorted, possibly overlapping intervals into disjoint ones.
+
+    Touching intervals are merged as well; this does not change which slots
+    conflict because overlap checks are strict on both ends.
+    """
+    merged: List[Interval] = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class AppointmentSlotEngine:
+    """
+    Sweep-line appointment slot availability engine.
+
+    Existing appointments are sorted and merged into disjoint busy intervals
+    once, when the engine is built. Each day is then answered with a binary
+    search for the first relevant busy interval followed by a single forward
+    pass over candidate slots, so a date range costs roughly
+    O((slots + appointments) log n) instead of O(slots x appointments).
+
+    Example:
+        >>> hours = parse_clinic_operating_hours(clinic.operating_hours)
+        >>> engine = AppointmentSlotEngine(hours, booked, timezone=clinic.timezone)
+        >>> slots_by_day = engine.get_slots_for_range(start, end)
+    """
+
+    def __init__(
+        self,
+        business_hours: Dict[DayOfWeek, BusinessHours],
+        existing_appointments: Optional[Iterable[Interval]] = None,
+        appointment_duration: timedelta = timedelta(minutes=30),
+        buffer_time: timedelta = timedelta(minutes=15),
+        timezone: str = "UTC",
+    ):
+        """
+        Initialize the engine and index the existing appointments.
+
+        Args:
+            business_hours: Dictionary mapping days to BusinessHours
+            existing_appointments: Iterable of (start, end) tuples for existing
+                appointments, in any order
+            appointment_duration: Duration of each appointment
+            buffer_time: Buffer time between appointments
+            timezone: Timezone for the appointments
+        """
+        if appointment_duration <= timedelta(0):
+            raise ValueError("Appointment duration must be positive")
+
+        self.business_hours = business_hours
+        self.appointment_duration = appointment_duration
+        self.buffer_time = buffer_time
+        self.timezone = timezone
+        self._tzinfo = ZoneInfo(timezone)
+
+        busy = _coalesce_intervals(sorted(existing_appointments or []))
+        self._busy = busy
+        # Merged intervals are disjoint, so ends are sorted as well as starts
+        self._busy_starts = [start for start, _ in busy]
+        self._busy_ends = [end for _, end in busy]
+
+    def _busy_intervals_for_day(
+        self,
+        date_to_check: date,
+        hours: BusinessHours,
+        day_start: datetime,
+        day_end: datetime,
+    ) -> List[Interval]:
+        """Get the disjoint busy intervals overlapping a day's opening window."""
+        first = bisect.bisect_right(self._busy_ends, day_start)
+        last = bisect.bisect_left(self._busy_starts, day_end, lo=first)
+        appointments = self._busy[first:last]
+
+        if not hours.breaks:
+            return appointments
+
+        breaks = [
+            (
+                datetime.combine(date_to_check, break_start, self._tzinfo),
+                datetime.combine(date_to_check, break_end, self._tzinfo),
+            )
+            for break_start, break_end in hours.breaks
+        ]
+        return _coalesce_intervals(heapq.merge(appointments, breaks))
+
+    def get_slots(
+        self,
+        date_to_check: date,
+        window_start: Optional[datetime] = None,
+        window_end: Optional[datetime] = None,
+    ) -> List[datetime]:
+        """
+        Get available appointment slots for a single date.
+
+        Args:
+            date_to_check: The date to check for availability
+            window_start: Optional earliest allowed slot start
+            window_end: Optional latest allowed slot end
+
+        Returns:
+            List of available appointment start times
+        """
+        day_of_week = DayOfWeek(date_to_check.weekday())
+        hours = self.business_hours.get(day_of_week)
+        if hours is None or hours.is_closed:
+            return []
+
+        day_start = datetime.combine(date_to_check, hours.open_time, self._tzinfo)
+        day_end = datetime.combine(date_to_check, hours.close_time, self._tzinfo)
+        busy = self._busy_intervals_for_day(date_to_check, hours, day_start, day_end)
+
+        available_slots = []
+        duration = self.appointment_duration
+        slot_step = duration + self.buffer_time
+        busy_count = len(busy)
+        index = 0
+        current_slot = day_start
+
+        while current_slot + duration <= day_end:
+            slot_end = current_slot + duration
+
+            # Busy intervals ending before this slot cannot affect later slots
+            while index < busy_count and busy[index][1] <= current_slot:
+                index += 1
+
+            if (
+                (index == busy_count or busy[index][0] >= slot_end)
+                and (window_start is None or current_slot >= window_start)
+                and (window_end is None or slot_end <= window_end)
+            ):
+                available_slots.append(current_slot)
+
+            current_slot += slot_step
+
+        return available_slots
+
+    def get_slots_for_range(
+        self,
+        start: Union[date, datetime],
+        end: Union[date, datetime],
+    ) -> Dict[date, List[datetime]]:
+        """
+        Get available appointment slots for every date in a range.
+
+        Dates are inclusive on both ends. When datetimes are given (as in
+        ``AppointmentSlotAvailability``), slots outside the window are dropped.
+
+        Args:
+            start: First date, or start of the availability window
+            end: Last date, or end of the availability window
+
+        Returns:
+            Dictionary mapping each date in the range to its available slots
+
+        Raises:
+            ValueError: If the range ends before it starts
+        """
+        window_start = start if isinstance(start, datetime) else None
+        window_end = end if isinstance(end, datetime) else None
+        start_date = start.date() if isinstance(start, datetime) else start
+        end_date = end.date() if isinstance(end, datetime) else end
+
+        if end_date < start_date:
+            raise ValueError("End date must not be before start date")
+
+        slots_by_date: Dict[date, List[datetime]] = {}
+        current_date = start_date
+        while current_date <= end_date:
+            slots_by_date[current_date] = self.get_slots(
+                current_date, window_start, window_end
+            )
+            current_date += timedelta(days=1)
+
+        return slots_by_date
+
+
 def get_available_appointment_slots(
     date_to_check: date,
     business_hours: Dict[DayOfWeek, BusinessHours],
@@ -157,42 +491,51 @@ def get_available_appointment_slots(
     Returns:
         List of available appointment start times
     """
-    day_of_week = DayOfWeek(date_to_check.weekday())
-
-    if day_of_week not in business_hours or business_hours[day_of_week].is_closed:
-        return []
-
-    hours = business_hours[day_of_week]
-
-    # Create datetime objects for the business hours
-    start_datetime = datetime.combine(
-        date_to_check, hours.open_time, ZoneInfo(timezone)
+    engine = AppointmentSlotEngine(
+        business_hours,
+        existing_appointments,
+        appointment_duration=appointment_duration,
+        buffer_time=buffer_time,
+        timezone=timezone,
     )
-    end_datetime = datetime.combine(date_to_check, hours.close_time, ZoneInfo(timezone))
-
-    # Generate all possible slots
-    available_slots = []
-    current_slot = start_datetime
-    slot_duration = appointment_duration + buffer_time
+    return engine.get_slots(date_to_check)
 
-    while current_slot + appointment_duration <= end_datetime:
-        slot_end = current_slot + appointment_duration
 
-        # Check if this slot conflicts with existing appointments
-        is_available = True
-        if existing_appointments:
-            for existing_start, existing_end in existing_appointments:
-                # Check for overlap
-                if current_slot < existing_end and slot_end > existing_start:
-                    is_available = False
-                    break
+def get_available_slots_for_range(
+    start: Union[date, datetime],
+    end: Union[date, datetime],
+    business_hours: Dict[DayOfWeek, BusinessHours],
+    appointment_duration: timedelta = timedelta(minutes=30),
+    buffer_time: timedelta = timedelta(minutes=15),
+    existing_appointments: Optional[List[Tuple[datetime, datetime]]] = None,
+    timezone: str = "UTC",
+) -> Dict[date, List[datetime]]:
+    """
+    Get available appointment slots for every date in a range.
 
-        if is_available:
-            available_slots.append(current_slot)
+    The existing appointments are indexed once for the whole range, which is
+    much cheaper than calling get_available_appointment_slots for each day.
 
-        current_slot += slot_duration
+    Args:
+        start: First date, or start of the availability window
+        end: Last date (inclusive), or end of the availability window
+        business_hours: Dictionary mapping days to BusinessHours
+        appointment_duration: Duration of each appointment
+        buffer_time: Buffer time between appointments
+        existing_appointments: List of (start, end) tuples for existing appointments
+        timezone: Timezone for the appointments
 
-    return available_slots
+    Returns:
+        Dictionary mapping each date to its available appointment start times
+    """
+    engine = AppointmentSlotEngine(
+        business_hours,
+        existing_appointments,
+        appointment_duration=appointment_duration,
+        buffer_time=buffer_time,
+        timezone=timezone,
+    )
+    return engine.get_slots_for_range(start, end)
 
 
 def calculate_pet_age(
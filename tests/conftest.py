@@ -46,6 +46,10 @@ from vet_core.models import (
 )
 from vet_core.models.base import Base
 
+# Fixtures of the vet-core pytest plugin, also used when running from a
+# checkout where the plugin's entry point is not installed
+from vet_core.testing.pytest_plugin import nplusone_guard  # noqa: F401
+
 # Test database configuration
 TEST_DATABASE_URL = os.getenv(
     "TEST_DATABASE_URL",
@@ -14,6 +14,7 @@ import os
 import platform
 import sqlite3
 import tempfile
+import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -26,6 +27,7 @@ from vet_core.security.audit_trail import (
     AuditEvent,
     AuditEventType,
     ComplianceMetrics,
+    QueueOverflowPolicy,
     SecurityAuditTrail,
 )
 from vet_core.security.models import (
@@ -116,8 +118,7 @@ class TestSecurityAuditTrail:
         # Explicit cleanup to ensure database connections are closed
         try:
             # Close any open database connections
-            if hasattr(trail, "_db_connection"):
-                trail._db_connection.close()
+            trail.close()
 
             # Force garbage collection
             gc.collect()
@@ -185,8 +186,9 @@ class TestSecurityAuditTrail:
             details={"test": "data"},
         )
 
-        # Log the event
+        # Log the event and write the buffer
         audit_trail.log_event(event)
+        audit_trail.flush()
 
         # Verify event was stored in database
         with sqlite3.connect(audit_trail.audit_db_path) as conn:
@@ -525,6 +527,244 @@ class TestSecurityAuditTrail:
         with pytest.raises(Exception):
             invalid_audit_trail._init_database()
 
+    def test_events_are_buffered_until_flush(self, temp_db_path, temp_log_path):
+        """Test events are written in batches rather than one by one."""
+
+        def stored_count():
+            with sqlite3.connect(temp_db_path) as conn:
+                return conn.execute("SELECT COUNT(*) FROM audit_events").fetchone()[0]
+
+        with SecurityAuditTrail(
+            audit_db_path=temp_db_path,
+            log_file_path=temp_log_path,
+            batch_size=5,
+            flush_interval=60,
+        ) as audit_trail:
+            for i in range(7):
+                audit_trail.log_event(AuditEvent(vulnerability_id=f"VULN-{i}"))
+
+            # The first batch of five is written, the remaining two are pending
+            assert stored_count() == 5
+            assert audit_trail.flush() == 2
+            assert stored_count() == 7
+
+            audit_trail.log_event(AuditEvent(vulnerability_id="VULN-7"))
+            assert len(audit_trail.get_audit_events()) == 8
+
+            audit_trail.log_event(AuditEvent(vulnerability_id="VULN-8"))
+
+        # Closing the audit trail writes the remaining event
+        assert stored_count() == 9
+
+    def test_failed_write_keeps_events(self, temp_db_path, temp_log_path):
+        """Test that events stay buffered when the database cannot be written."""
+        with SecurityAuditTrail(
+            audit_db_path=temp_db_path,
+            log_file_path=temp_log_path,
+            batch_size=2,
+            flush_interval=60,
+        ) as audit_trail:
+            with patch.object(
+                audit_trail,
+                "_get_connection",
+                side_effect=sqlite3.OperationalError("database is locked"),
+            ):
+                # Reaching the batch size does not raise in log_event
+                for i in range(3):
+                    audit_trail.log_event(AuditEvent(vulnerability_id=f"VULN-{i}"))
+                with pytest.raises(sqlite3.OperationalError):
+                    audit_trail.flush()
+
+            assert len(audit_trail._pending_events) == 3
+            assert audit_trail.flush() == 3
+            assert len(audit_trail.get_audit_events()) == 3
+
+    def test_flush_interval_bounds_buffering(self, temp_db_path, temp_log_path):
+        """Test that an old pending event causes the buffer to be written."""
+        audit_trail = SecurityAuditTrail(
+            audit_db_path=temp_db_path,
+            log_file_path=temp_log_path,
+            batch_size=100,
+            flush_interval=0,
+        )
+
+        audit_trail.log_event(AuditEvent(vulnerability_id="VULN-1"))
+
+        assert audit_trail._pending_events == []
+        audit_trail.close()
+
+    def test_idle_buffer_is_written_after_flush_interval(
+        self, temp_db_path, temp_log_path
+    ):
+        """Test buffered events are written without further events being logged."""
+        audit_trail = SecurityAuditTrail(
+            audit_db_path=temp_db_path,
+            log_file_path=temp_log_path,
+            batch_size=100,
+            flush_interval=0.1,
+        )
+
+        audit_trail.log_event(AuditEvent(vulnerability_id="VULN-1"))
+        flusher = audit_trail._flusher_thread
+        assert flusher is not None
+        flusher.join(timeout=5)
+
+        assert not flusher.is_alive()
+        assert audit_trail._pending_events == []
+        with sqlite3.connect(temp_db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM audit_events").fetchone()[0] == 1
+        audit_trail.close()
+
+    def test_connection_uses_wal_mode(self, audit_trail):
+        """Test the persistent connection is reused and in WAL mode."""
+        conn = audit_trail._get_connection()
+
+        assert audit_trail._get_connection() is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_background_writer(self, temp_db_path, temp_log_path):
+        """Test queued events are written by the background writer."""
+        with SecurityAuditTrail(
+            audit_db_path=temp_db_path,
+            log_file_path=temp_log_path,
+            background_writer=True,
+            batch_size=10,
+        ) as audit_trail:
+            for i in range(25):
+                audit_trail.log_event(AuditEvent(vulnerability_id=f"VULN-{i}"))
+
+            events = audit_trail.get_audit_events()
+            stats = audit_trail.get_writer_stats()
+
+        assert len(events) == 25
+        assert stats.enqueued == 25
+        assert stats.written == 25
+        assert stats.dropped == 0
+        assert stats.queue_depth == 0
+        assert stats.batches >= 3
+        assert stats.max_flush_latency_ms >= stats.average_flush_latency_ms > 0
+        assert "EVENT_ID=" in temp_log_path.read_text()
+
+    def test_flush_waits_only_for_earlier_events(self, temp_db_path, temp_log_path):
+        """Test flush returns while another thread keeps queueing events."""
+        import threading
+
+        audit_trail = SecurityAuditTrail(
+            audit_db_path=temp_db_path,
+            log_file_path=temp_log_path,
+            background_writer=True,
+            batch_size=10,
+        )
+        stop = threading.Event()
+
+        def produce():
+            while not stop.is_set():
+                audit_trail.log_event(AuditEvent(vulnerability_id="VULN-BG"))
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        try:
+            for i in range(5):
+                audit_trail.log_event(AuditEvent(vulnerability_id=f"VULN-{i}"))
+            audit_trail.flush()
+            stored = {
+                event.vulnerability_id for event in audit_trail.get_audit_events()
+            }
+        finally:
+            stop.set()
+            producer.join()
+            audit_trail.close()
+
+        assert {f"VULN-{i}" for i in range(5)} <= stored
+
+    def test_flush_timeout(self, temp_db_path, temp_log_path):
+        """Test flush gives up waiting for a stalled writer after the timeout."""
+        audit_trail = SecurityAuditTrail(
+            audit_db_path=temp_db_path,
+            log_file_path=temp_log_path,
+            background_writer=True,
+        )
+
+        # Holding the write lock stalls the writer
+        with audit_trail._lock:
+            audit_trail.log_event(AuditEvent(vulnerability_id="VULN-1"))
+            started = time.perf_counter()
+            audit_trail.flush(timeout=0.05)
+            elapsed = time.perf_counter() - started
+
+        stored = len(audit_trail.get_audit_events())
+        audit_trail.close()
+        assert 0.05 <= elapsed < 1
+        assert stored == 1
+
+    @pytest.mark.parametrize(
+        "policy", [QueueOverflowPolicy.DROP, QueueOverflowPolicy.BLOCK]
+    )
+    def test_background_writer_backpressure(self, temp_db_path, temp_log_path, policy):
+        """Test events are dropped and counted when the queue stays full."""
+        audit_trail = SecurityAuditTrail(
+            audit_db_path=temp_db_path,
+            log_file_path=temp_log_path,
+            background_writer=True,
+            batch_size=1,
+            max_queue_size=2,
+            overflow_policy=policy,
+            enqueue_timeout=0.05,
+        )
+
+        # Holding the write lock stalls the writer so the queue fills up
+        with audit_trail._lock:
+            started = time.perf_counter()
+            for i in range(10):
+                audit_trail.log_event(AuditEvent(vulnerability_id=f"VULN-{i}"))
+            elapsed = time.perf_counter() - started
+
+        audit_trail.flush()
+        stats = audit_trail.get_writer_stats()
+        stored = len(audit_trail.get_audit_events())
+        audit_trail.close()
+
+        assert stats.dropped >= 7
+        assert stats.enqueued + stats.dropped == 10
+        assert stored == stats.enqueued
+        if policy is QueueOverflowPolicy.BLOCK:
+            assert elapsed >= 0.05 * stats.dropped
+        else:
+            assert elapsed < 0.05
+
+    def test_background_writer_blocks_by_default(self, temp_db_path, temp_log_path):
+        """Test a full queue slows callers down without dropping events."""
+        audit_trail = SecurityAuditTrail(
+            audit_db_path=temp_db_path,
+            log_file_path=temp_log_path,
+            background_writer=True,
+            batch_size=1,
+            max_queue_size=1,
+        )
+
+        locked = threading.Event()
+
+        def stall_writer():
+            with audit_trail._lock:
+                locked.set()
+                time.sleep(1.2)
+
+        # Holding the write lock stalls the writer for longer than the queue
+        # can absorb, and longer than a one-second enqueue timeout would wait
+        staller = threading.Thread(target=stall_writer)
+        staller.start()
+        locked.wait()
+        for i in range(5):
+            audit_trail.log_event(AuditEvent(vulnerability_id=f"VULN-{i}"))
+        staller.join()
+
+        audit_trail.flush()
+        stats = audit_trail.get_writer_stats()
+        stored = len(audit_trail.get_audit_events())
+        audit_trail.close()
+
+        assert (stats.enqueued, stats.dropped, stored) == (5, 0, 5)
+
     def test_concurrent_access(self, audit_trail):
         """Test concurrent access to audit trail (basic test)."""
         import threading
@@ -0,0 +1,180 @@
+"""
+Tests for bulk insert and upsert utilities.
+
+This module tests writing model rows with bulk_insert and bulk_upsert on
+SQLite, row normalization and the SessionManager wrappers.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+
+from vet_core.database import bulk_insert, bulk_upsert
+from vet_core.database.bulk import normalize_rows
+from vet_core.models import Pet, PetSpecies, PetStatus, User, UserRole
+
+
+def _user_rows(count: int, tag: str = "bulk"):
+    """Build user rows with unique identifiers."""
+    run = uuid.uuid4().hex[:8]
+    return [
+        {
+            "clerk_user_id": f"{tag}_{run}_{i}",
+            "email": f"{tag}_{run}_{i}@example.com",
+            "first_name": "Bulk",
+            "last_name": f"User {i}",
+        }
+        for i in range(count)
+    ]
+
+
+class TestNormalizeRows:
+    """Test cases for normalize_rows."""
+
+    def test_mixed_columns_are_filled(self):
+        """Test that columns missing from some rows get defaults or None."""
+        rows = normalize_rows(
+            Pet.__table__,
+            [
+                {"owner_id": uuid.uuid4(), "name": "A", "species": PetSpecies.DOG},
+                {
+                    "owner_id": uuid.uuid4(),
+                    "name": "B",
+                    "species": PetSpecies.CAT,
+                    "breed": "Siamese",
+                    "status": PetStatus.INACTIVE,
+                },
+            ],
+        )
+
+        assert rows[0]["breed"] is None
+        assert rows[0]["status"] == PetStatus.ACTIVE
+        assert set(rows[0]) == set(rows[1])
+
+    def test_fill_defaults_adds_python_defaults(self):
+        """Test that COPY batches get every Python-side default."""
+        (row,) = normalize_rows(
+            Pet.__table__,
+            [{"owner_id": uuid.uuid4(), "name": "A", "species": PetSpecies.DOG}],
+            fill_defaults=True,
+        )
+
+        assert isinstance(row["id"], uuid.UUID)
+        assert row["is_deleted"] is False
+        assert "created_at" not in row
+
+    def test_unknown_column(self):
+        """Test that rows naming unknown columns are rejected."""
+        with pytest.raises(ValueError, match="Unknown columns"):
+            normalize_rows(Pet.__table__, [{"nickname": "Rex"}])
+
+    def test_server_default_column_given_for_some_rows(self):
+        """Test that server-default columns must be given for all rows."""
+        with pytest.raises(ValueError, match="created_at"):
+            normalize_rows(
+                Pet.__table__,
+                [{"name": "A"}, {"name": "B", "created_at": "2024-01-01"}],
+            )
+
+
+class TestBulkInsert:
+    """Test cases for bulk_insert."""
+
+    async def test_insert_rows(self, async_session):
+        """Test that rows are inserted with defaults applied."""
+        rows = _user_rows(25)
+
+        count = await bulk_insert(async_session, User, rows, batch_size=10)
+
+        assert count == 25
+        emails = [row["email"] for row in rows]
+        users = (
+            await async_session.scalars(select(User).where(User.email.in_(emails)))
+        ).all()
+        assert len(users) == 25
+        assert all(user.role == UserRole.PET_OWNER for user in users)
+        assert all(user.created_at is not None for user in users)
+        assert len({user.id for user in users}) == 25
+
+    async def test_insert_from_generator(self, async_session, user_factory):
+        """Test that rows may reference objects pending in the session."""
+        owner = user_factory.build()
+        async_session.add(owner)
+
+        count = await bulk_insert(
+            async_session,
+            Pet,
+            (
+                {"owner_id": owner.id, "name": f"Pet {i}", "species": PetSpecies.DOG}
+                for i in range(7)
+            ),
+            batch_size=3,
+        )
+
+        assert count == 7
+        total = await async_session.scalar(
+            select(func.count()).select_from(Pet).where(Pet.owner_id == owner.id)
+        )
+        assert total == 7
+
+    async def test_insert_nothing(self, async_session):
+        """Test that an empty input writes nothing."""
+        assert await bulk_insert(async_session, User, []) == 0
+
+
+class TestBulkUpsert:
+    """Test cases for bulk_upsert."""
+
+    async def test_upsert_updates_existing_rows(self, async_session):
+        """Test that conflicting rows are updated and new rows inserted."""
+        rows = _user_rows(3)
+        await bulk_insert(async_session, User, rows)
+
+        rows[0]["first_name"] = "Changed"
+        new_rows = _user_rows(2)
+        count = await bulk_upsert(async_session, User, rows + new_rows, ["email"])
+
+        assert count == 5
+        emails = [row["email"] for row in rows + new_rows]
+        result = await async_session.execute(
+            select(User.email, User.first_name).where(User.email.in_(emails))
+        )
+        names = dict(result.all())
+        assert len(names) == 5
+        assert names[rows[0]["email"]] == "Changed"
+
+    async def test_upsert_do_nothing(self, async_session):
+        """Test that an empty update list keeps existing rows."""
+        rows = _user_rows(2)
+        await bulk_insert(async_session, User, rows)
+
+        rows[0]["first_name"] = "Ignored"
+        await bulk_upsert(async_session, User, rows, ["email"], update_columns=[])
+
+        first_name = await async_session.scalar(
+            select(User.first_name).where(User.email == rows[0]["email"])
+        )
+        assert first_name == "Bulk"
+
+
+class TestSessionManagerBulk:
+    """Test cases for the SessionManager bulk wrappers."""
+
+    async def test_bulk_insert_and_upsert(self, test_session_manager):
+        """Test that the wrappers commit their own transaction."""
+        rows = _user_rows(4, tag="manager")
+
+        assert await test_session_manager.bulk_insert(User, rows) == 4
+        rows[1]["last_name"] = "Updated"
+        assert await test_session_manager.bulk_upsert(User, rows, ["email"]) == 4
+
+        async with test_session_manager.get_transaction() as session:
+            users = (
+                await session.scalars(
+                    select(User).where(User.email.in_([row["email"] for row in rows]))
+                )
+            ).all()
+            assert {user.last_name for user in users} >= {"Updated"}
+            for user in users:
+                await session.delete(user)
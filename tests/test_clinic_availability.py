@@ -0,0 +1,252 @@
+"""
+Tests for clinic-wide appointment availability.
+
+This module tests building the per-veterinarian slot calendar for a clinic
+from the clinic roster, schedules and booked appointments.
+"""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from vet_core.models import Appointment, Clinic, User, UserRole, Veterinarian
+from vet_core.models.appointment import AppointmentStatus, ServiceType
+from vet_core.models.veterinarian import VeterinarianStatus
+from vet_core.repositories import get_clinic_availability
+from vet_core.schemas.appointment import ClinicSlotAvailability
+
+MONDAY = date(2030, 1, 7)
+WINDOW_START = datetime(2030, 1, 7, tzinfo=timezone.utc)
+
+
+def _at(hour: int, minute: int = 0, day: date = MONDAY) -> datetime:
+    """Build a UTC datetime on the given day."""
+    return datetime(day.year, day.month, day.day, hour, minute, tzinfo=timezone.utc)
+
+
+async def _veterinarian(session, clinic, license_number: str, **kwargs):
+    """Create a veterinarian, and the user it belongs to, at a clinic."""
+    user = User(
+        clerk_user_id=f"user_{license_number}",
+        email=f"{license_number.lower()}@example.com",
+        first_name="Test",
+        last_name="Vet",
+        role=UserRole.VETERINARIAN,
+    )
+    session.add(user)
+    await session.flush()
+
+    veterinarian = Veterinarian(
+        user_id=user.id,
+        clinic_id=clinic.id,
+        license_number=license_number,
+        license_state="IL",
+        **kwargs,
+    )
+    session.add(veterinarian)
+    return veterinarian
+
+
+def _appointment(veterinarian, scheduled_at, duration_minutes=30, **kwargs):
+    """Build an appointment for a veterinarian at their clinic."""
+    return Appointment(
+        pet_id=uuid.uuid4(),
+        veterinarian_id=veterinarian.id,
+        clinic_id=veterinarian.clinic_id,
+        scheduled_at=scheduled_at,
+        duration_minutes=duration_minutes,
+        service_type=ServiceType.WELLNESS_EXAM,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+async def clinic(async_session):
+    """Create a clinic open on Mondays with a lunch break."""
+    clinic = Clinic(
+        name="Main Street Vet",
+        phone_number="555-123-4567",
+        address_line1="1 Main Street",
+        city="Springfield",
+        state="IL",
+        postal_code="62701",
+        timezone="UTC",
+        operating_hours={
+            "monday": {
+                "is_open": True,
+                "open_time": "08:00",
+                "close_time": "17:00",
+                "lunch_break": {"start": "11:30", "end": "12:00"},
+            }
+        },
+    )
+    async_session.add(clinic)
+    await async_session.flush()
+    return clinic
+
+
+@pytest.fixture
+async def staff(async_session, clinic):
+    """Create two working veterinarians, one without a schedule and one inactive."""
+    morning = await _veterinarian(
+        async_session,
+        clinic,
+        "VET0001",
+        availability={
+            "monday": {"is_available": True, "start_time": "09:00", "end_time": "12:00"}
+        },
+    )
+    late = await _veterinarian(
+        async_session,
+        clinic,
+        "VET0002",
+        availability={
+            "monday": {
+                "is_available": True,
+                "start_time": "16:00",
+                "end_time": "18:00",
+            }
+        },
+    )
+    unscheduled = await _veterinarian(async_session, clinic, "VET0003")
+    await _veterinarian(
+        async_session,
+        clinic,
+        "VET0004",
+        availability=morning.availability,
+        status=VeterinarianStatus.INACTIVE,
+    )
+    await async_session.flush()
+    return morning, late, unscheduled
+
+
+def _request(clinic, days: int = 1, **kwargs) -> ClinicSlotAvailability:
+    """Build an availability request starting on MONDAY."""
+    return ClinicSlotAvailability(
+        clinic_id=clinic.id,
+        start_date=WINDOW_START,
+        end_date=WINDOW_START + timedelta(days=days),
+        **kwargs,
+    )
+
+
+class TestClinicAvailability:
+    """Test cases for get_clinic_availability."""
+
+    async def test_calendar_per_active_veterinarian(self, async_session, clinic, staff):
+        """Test schedules are intersected with clinic hours for each vet."""
+        morning, late, unscheduled = staff
+
+        calendar = await get_clinic_availability(
+            async_session, _request(clinic), buffer_time=timedelta(0)
+        )
+
+        assert set(calendar) == {morning.id, late.id, unscheduled.id}
+        assert calendar[morning.id][MONDAY] == [
+            _at(9),
+            _at(9, 30),
+            _at(10),
+            _at(10, 30),
+            _at(11),
+        ]
+        assert calendar[late.id][MONDAY] == [_at(16), _at(16, 30)]
+        assert calendar[unscheduled.id][MONDAY] == []
+
+    async def test_booked_appointments_remove_slots(self, async_session, clinic, staff):
+        """Test booked and overnight appointments block slots, cancelled do not."""
+        morning, late, _ = staff
+        cancelled = _appointment(morning, _at(10))
+        cancelled.status = AppointmentStatus.CANCELLED
+        async_session.add_all(
+            [
+                _appointment(morning, _at(9, 30)),
+                cancelled,
+                _appointment(late, _at(20, day=MONDAY - timedelta(days=1)), 1215),
+            ]
+        )
+        await async_session.flush()
+
+        calendar = await get_clinic_availability(
+            async_session, _request(clinic), buffer_time=timedelta(0)
+        )
+
+        assert calendar[morning.id][MONDAY] == [
+            _at(9),
+            _at(10),
+            _at(10, 30),
+            _at(11),
+        ]
+        assert calendar[late.id][MONDAY] == [_at(16, 30)]
+
+    async def test_restrict_to_veterinarians(self, async_session, clinic, staff):
+        """Test limiting the calendar to selected veterinarians."""
+        morning, _, _ = staff
+
+        calendar = await get_clinic_availability(
+            async_session, _request(clinic, days=14, veterinarian_ids=[morning.id])
+        )
+
+        assert list(calendar) == [morning.id]
+        assert len(calendar[morning.id]) == 15
+        assert calendar[morning.id][MONDAY + timedelta(days=7)]
+        assert calendar[morning.id][MONDAY + timedelta(days=1)] == []
+
+    async def test_unknown_clinic(self, async_session):
+        """Test that a clinic without veterinarians has an empty calendar."""
+        request = ClinicSlotAvailability(
+            clinic_id=uuid.uuid4(),
+            start_date=WINDOW_START,
+            end_date=WINDOW_START + timedelta(days=1),
+        )
+
+        assert await get_clinic_availability(async_session, request) == {}
+
+    async def test_fixed_number_of_queries(self, async_session, clinic, staff):
+        """Test the calendar costs two queries however many vets there are."""
+        for index in range(5, 25):
+            await _veterinarian(
+                async_session,
+                clinic,
+                f"VET{index:04d}",
+                availability=staff[0].availability,
+            )
+        await async_session.flush()
+
+        statements = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        sync_engine = async_session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", _count)
+        try:
+            calendar = await get_clinic_availability(
+                async_session, _request(clinic, days=14)
+            )
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _count)
+
+        assert len(calendar) == 23
+        assert len(statements) == 2
+
+
+class TestClinicSlotAvailability:
+    """Test cases for the ClinicSlotAvailability schema."""
+
+    def test_rejects_naive_and_oversized_ranges(self):
+        """Test the window must be timezone-aware and at most 90 days."""
+        with pytest.raises(ValueError):
+            ClinicSlotAvailability(
+                clinic_id=uuid.uuid4(),
+                start_date=datetime(2030, 1, 7),
+                end_date=datetime(2030, 1, 8),
+            )
+
+        with pytest.raises(ValueError):
+            ClinicSlotAvailability(
+                clinic_id=uuid.uuid4(),
+                start_date=WINDOW_START,
+                end_date=WINDOW_START + timedelta(days=91),
+            )
@@ -0,0 +1,190 @@
+"""
+Tests for the Clinic repository.
+
+This module tests compiling ClinicSearchFilters into SQL, bounding box
+calculation and keyset pagination of clinic search results.
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from vet_core.exceptions import ValidationException
+from vet_core.models import Clinic, ClinicStatus, ClinicType
+from vet_core.repositories import ClinicRepository
+from vet_core.repositories.clinic import bounding_box
+from vet_core.schemas.clinic import ClinicSearchFilters
+
+
+def _clinic(name: str, **kwargs) -> Clinic:
+    """Build a clinic with the required fields filled in."""
+    defaults = {
+        "name": name,
+        "phone_number": "555-123-4567",
+        "address_line1": "1 Main Street",
+        "city": "Springfield",
+        "state": "IL",
+        "postal_code": "62701",
+    }
+    defaults.update(kwargs)
+    return Clinic(**defaults)
+
+
+@pytest.fixture
+async def clinics(async_session):
+    """Create a set of clinics around Springfield."""
+    clinics = [
+        _clinic(
+            "Alpha Vet",
+            latitude=39.80,
+            longitude=-89.65,
+            services_offered=["checkup", "surgery"],
+            specialties=["cardiology"],
+        ),
+        _clinic(
+            "Beta Vet",
+            latitude=39.85,
+            longitude=-89.60,
+            services_offered=["checkup"],
+            type=ClinicType.EMERGENCY,
+            accepts_emergencies=True,
+        ),
+        _clinic(
+            "Gamma Vet",
+            latitude=41.88,
+            longitude=-87.63,
+            city="Chicago",
+            services_offered=["checkup", "surgery", "dental"],
+        ),
+        _clinic("Closed Vet", status=ClinicStatus.PERMANENTLY_CLOSED),
+    ]
+    deleted = _clinic("Deleted Vet")
+    deleted.soft_delete()
+    clinics.append(deleted)
+
+    async_session.add_all(clinics)
+    await async_session.flush()
+    return clinics
+
+
+class TestBoundingBox:
+    """Test cases for the search bounding box."""
+
+    def test_bounding_box_contains_circle(self):
+        """Test the box spans the radius in both directions."""
+        min_lat, max_lat, lon_range = bounding_box(40.0, -74.0, 10)
+
+        assert min_lat < 40.0 < max_lat
+        assert max_lat - min_lat == pytest.approx(0.18, abs=0.01)
+        assert lon_range is not None
+        assert lon_range[0] < -74.0 < lon_range[1]
+
+    def test_bounding_box_antimeridian(self):
+        """Test the longitude range wraps across the antimeridian."""
+        _, _, lon_range = bounding_box(0.0, 179.95, 50)
+
+        assert lon_range is not None
+        assert lon_range[0] > lon_range[1]
+
+    def test_bounding_box_near_pole(self):
+        """Test that no longitude range is used near the poles."""
+        _, max_lat, lon_range = bounding_box(89.9, 0.0, 50)
+
+        assert max_lat == 90.0
+        assert lon_range is None
+
+
+class TestClinicRepository:
+    """Test cases for ClinicRepository.search."""
+
+    async def test_search_excludes_inactive_and_deleted(self, async_session, clinics):
+        """Test the default search skips closed and soft-deleted clinics."""
+        page = await ClinicRepository(async_session).search(ClinicSearchFilters())
+
+        names = [clinic.name for clinic in page.items]
+        assert names == ["Alpha Vet", "Beta Vet", "Gamma Vet"]
+        assert page.has_more is False
+
+    async def test_search_by_scalar_filters(self, async_session, clinics):
+        """Test city, type and boolean filters."""
+        repository = ClinicRepository(async_session)
+
+        page = await repository.search(ClinicSearchFilters(city="Chicago"))
+        assert [clinic.name for clinic in page.items] == ["Gamma Vet"]
+
+        page = await repository.search(
+            ClinicSearchFilters(type=ClinicType.EMERGENCY, accepts_emergencies=True)
+        )
+        assert [clinic.name for clinic in page.items] == ["Beta Vet"]
+
+    async def test_search_by_services_and_specialties(self, async_session, clinics):
+        """Test that every requested service must be offered."""
+        repository = ClinicRepository(async_session)
+
+        page = await repository.search(
+            ClinicSearchFilters(services_offered=["checkup", "surgery"])
+        )
+        assert [clinic.name for clinic in page.items] == ["Alpha Vet", "Gamma Vet"]
+
+        page = await repository.search(ClinicSearchFilters(specialties=["cardiology"]))
+        assert [clinic.name for clinic in page.items] == ["Alpha Vet"]
+
+    async def test_search_by_radius_orders_by_distance(self, async_session, clinics):
+        """Test radius search returns the nearest clinics first."""
+        page = await ClinicRepository(async_session).search(
+            ClinicSearchFilters(latitude=39.86, longitude=-89.61, radius_km=25)
+        )
+
+        assert [clinic.name for clinic in page.items] == ["Beta Vet", "Alpha Vet"]
+        for clinic in page.items:
+            assert clinic.is_within_radius(39.86, -89.61, 25)
+
+    async def test_keyset_pagination(self, async_session, clinics):
+        """Test walking through results one page at a time."""
+        repository = ClinicRepository(async_session)
+        filters = ClinicSearchFilters()
+
+        first = await repository.search(filters, limit=2)
+        assert [clinic.name for clinic in first.items] == ["Alpha Vet", "Beta Vet"]
+        assert first.has_more is True
+
+        second = await repository.search(filters, limit=2, after=first.next_cursor)
+        assert [clinic.name for clinic in second.items] == ["Gamma Vet"]
+        assert second.has_more is False
+
+    async def test_keyset_pagination_by_distance(self, async_session, clinics):
+        """Test that distance-ordered pages continue from the cursor."""
+        repository = ClinicRepository(async_session)
+        filters = ClinicSearchFilters(latitude=39.86, longitude=-89.61, radius_km=25)
+
+        first = await repository.search(filters, limit=1)
+        second = await repository.search(filters, limit=1, after=first.next_cursor)
+
+        assert [clinic.name for clinic in first.items] == ["Beta Vet"]
+        assert [clinic.name for clinic in second.items] == ["Alpha Vet"]
+
+    async def test_invalid_cursor(self, async_session):
+        """Test that a malformed cursor raises a validation error."""
+        with pytest.raises(ValidationException):
+            await ClinicRepository(async_session).search(
+                ClinicSearchFilters(), after="not-a-cursor"
+            )
+
+    def test_postgresql_query_uses_jsonb_containment(self):
+        """Test the PostgreSQL query uses @> and the coordinate bounding box."""
+
+        class _PostgresRepository(ClinicRepository):
+            dialect_name = "postgresql"
+
+        stmt = _PostgresRepository(None).build_search_query(
+            ClinicSearchFilters(
+                services_offered=["surgery"],
+                latitude=39.8,
+                longitude=-89.6,
+                radius_km=10,
+            )
+        )
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "clinics.services_offered @>" in sql
+        assert "clinics.latitude BETWEEN" in sql
+        assert "ORDER BY" in sql
@@ -0,0 +1,199 @@
+"""Tests for the database-agnostic JSON column type."""
+
+import json
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import JSON, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from vet_core.database import types
+from vet_core.database.types import JSONType, json_dumps, json_loads
+from vet_core.models import Pet
+
+orjson_required = pytest.mark.skipif(
+    not types.ORJSON_AVAILABLE, reason="orjson is not installed"
+)
+
+
+@pytest.fixture
+def medical_history():
+    """Create a medical history with a mix of dates and datetimes."""
+    return {
+        "records": [
+            {"type": "checkup", "date": "2023-01-15T10:30:00", "notes": "Healthy"},
+            {"type": "surgery", "date": "2023-03-02", "notes": "Neutered"},
+            "legacy free-text entry",
+        ],
+        "weight_history": [{"weight_kg": 25.5, "date": "2023-01-15T10:30:00"}],
+        "allergies": [{"allergen": "pollen", "date_discovered": "2022-05-01"}],
+    }
+
+
+class TestJSONTypeNormalization:
+    """Test cases for JSONType date normalization."""
+
+    def test_strips_time_from_date_fields(self, medical_history):
+        """Test date fields in records and nested records are normalized."""
+        column_type = JSONType()
+        vaccinations = [
+            {
+                "vaccine_type": "Rabies",
+                "date": "2023-01-15T10:30:00",
+                "next_due_date": "2024-01-15T00:00:00+00:00",
+                "recorded_at": "2023-01-15T10:31:00",
+            },
+            "not a record",
+        ]
+
+        normalized = column_type.normalize(vaccinations)
+        assert normalized[0]["date"] == "2023-01-15"
+        assert normalized[0]["next_due_date"] == "2024-01-15"
+        assert normalized[0]["recorded_at"] == "2023-01-15T10:31:00"
+        assert normalized[1] == "not a record"
+
+        history = column_type.normalize(medical_history)
+        assert [record["date"] for record in history["records"][:2]] == [
+            "2023-01-15",
+            "2023-03-02",
+        ]
+        # Only lists of nested records under "records" are normalized
+        assert history["weight_history"][0]["date"] == "2023-01-15T10:30:00"
+
+    def test_copies_only_changed_containers(self, medical_history):
+        """Test unchanged values are returned as is and inputs are not mutated."""
+        column_type = JSONType()
+        original = json.loads(json.dumps(medical_history))
+
+        history = column_type.normalize(medical_history)
+
+        assert medical_history == original
+        assert history is not medical_history
+        assert history["records"] is not medical_history["records"]
+        assert history["records"][1] is medical_history["records"][1]
+        assert history["weight_history"] is medical_history["weight_history"]
+        assert history["allergies"] is medical_history["allergies"]
+
+        # A second pass finds nothing to change
+        assert column_type.normalize(history) is history
+
+    def test_custom_fields(self):
+        """Test the normalized fields can be configured per column."""
+        column_type = JSONType(date_fields=["visit_on"], nested_fields=["visits"])
+        value = {
+            "date": "2023-01-15T10:30:00",
+            "visits": [{"visit_on": "2023-02-01T09:00:00"}],
+        }
+
+        normalized = column_type.normalize(value)
+        assert normalized["date"] == "2023-01-15T10:30:00"
+        assert normalized["visits"][0]["visit_on"] == "2023-02-01"
+
+        # The field sets are part of the cache key, so columns do not share
+        # compiled processing with a differently configured column
+        assert column_type._static_cache_key != JSONType()._static_cache_key
+
+    def test_scalars_and_none(self):
+        """Test non-container values pass through unchanged."""
+        column_type = JSONType()
+        dialect = postgresql.dialect()
+
+        assert column_type.process_bind_param(None, dialect) is None
+        assert column_type.process_result_value("2023-01-15T10:30:00", dialect) == (
+            "2023-01-15T10:30:00"
+        )
+        assert column_type.process_result_value(42, dialect) == 42
+
+
+class TestJSONTypeCodec:
+    """Test cases for the JSON codec used on SQLite."""
+
+    @orjson_required
+    def test_sqlite_processors_round_trip(self, medical_history):
+        """Test the fused SQLite processors encode, decode and normalize."""
+        dialect = sqlite.dialect()
+        column_type = JSONType()
+        bind = column_type.bind_processor(dialect)
+        result = column_type.result_processor(dialect, None)
+
+        stored = bind(medical_history)
+        assert json.loads(stored)["records"][0]["date"] == "2023-01-15"
+
+        loaded = result(json.dumps([{"date": "2023-01-15T10:30:00"}]))
+        assert loaded == [{"date": "2023-01-15"}]
+
+        assert bind(None) == "null"
+        assert bind(JSON.NULL) == "null"
+        assert result(None) is None
+        assert result(7) == 7
+
+    @orjson_required
+    def test_engine_serializer_takes_precedence(self):
+        """Test a serializer configured on the engine is still used."""
+        dialect = sqlite.dialect(json_serializer=lambda value: "custom")
+        bind = JSONType().bind_processor(dialect)
+
+        assert bind({"date": "2023-01-15T10:30:00"}) == "custom"
+
+    def test_codec_matches_standard_library(self):
+        """Test the codec helpers agree with the json module."""
+        value = {"name": "Rex", 1: [1.5, None, True], "wide": 2**70, "emoji": "🐶"}
+
+        assert json_loads(json_dumps(value)) == json.loads(json.dumps(value))
+        assert json_loads(b'{"a": NaN}')["a"] != 0
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {date(2023, 1, 15): 1},
+            {"seen": datetime(2023, 1, 15, 10, 30)},
+            {1: "first", 2.5: "second"},
+        ],
+    )
+    def test_codec_falls_back_like_standard_library(self, value):
+        """Test values the codecs handle differently go to the json module."""
+        try:
+            expected = json.dumps(value)
+        except TypeError:
+            with pytest.raises(TypeError):
+                json_dumps(value)
+        else:
+            assert json_dumps(value) == expected
+
+    def test_without_orjson(self, monkeypatch):
+        """Test the standard JSON processing is used without orjson."""
+        monkeypatch.setattr(types, "ORJSON_AVAILABLE", False)
+        monkeypatch.setattr(types, "orjson", None)
+        bind = JSONType().bind_processor(sqlite.dialect())
+
+        assert json.loads(bind([{"date": "2023-01-15T10:30:00"}])) == [
+            {"date": "2023-01-15"}
+        ]
+        assert json_dumps({"a": 1}) == '{"a": 1}'
+
+
+class TestJSONTypePersistence:
+    """Test cases for JSONType columns stored in the database."""
+
+    async def test_pet_json_round_trip(self, async_session, pet_factory):
+        """Test pet JSON columns are normalized when saved and loaded."""
+        pet = await pet_factory.create(
+            async_session,
+            vaccination_records=[
+                {"vaccine_type": "Rabies", "date": "2023-01-15T10:30:00"}
+            ],
+            medical_history={
+                "records": [{"type": "checkup", "date": "2023-02-01T08:00:00"}]
+            },
+        )
+        row = (
+            await async_session.execute(
+                select(Pet.vaccination_records, Pet.medical_history).where(
+                    Pet.id == pet.id
+                )
+            )
+        ).one()
+
+        assert row.vaccination_records[0]["date"] == "2023-01-15"
+        assert row.medical_history["records"][0]["date"] == "2023-02-01"
+        assert date.fromisoformat(row.vaccination_records[0]["date"])
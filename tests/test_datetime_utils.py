@@ -0,0 +1,232 @@
+"""
+Tests for datetime utilities.
+
+This module tests business hours parsing and the sweep-line appointment
+slot availability engine.
+"""
+
+import random
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from vet_core.utils.datetime_utils import (
+    AppointmentSlotEngine,
+    BusinessHours,
+    DayOfWeek,
+    get_available_appointment_slots,
+    get_available_slots_for_range,
+    intersect_business_hours,
+    parse_clinic_operating_hours,
+    parse_veterinarian_availability,
+)
+
+UTC = ZoneInfo("UTC")
+MONDAY = date(2030, 1, 7)
+
+
+def _weekday_hours(open_hour: int = 9, close_hour: int = 12):
+    """Build Monday-Friday business hours without breaks."""
+    return {
+        DayOfWeek(day): BusinessHours(DayOfWeek(day), time(open_hour), time(close_hour))
+        for day in range(5)
+    }
+
+
+def _naive_slots(date_to_check, business_hours, duration, buffer_time, appointments):
+    """Reference nested-loop implementation used to check the engine."""
+    hours = business_hours.get(DayOfWeek(date_to_check.weekday()))
+    if hours is None or hours.is_closed:
+        return []
+    current = datetime.combine(date_to_check, hours.open_time, UTC)
+    end = datetime.combine(date_to_check, hours.close_time, UTC)
+    slots = []
+    while current + duration <= end:
+        slot_end = current + duration
+        if not any(current < e and slot_end > s for s, e in appointments):
+            slots.append(current)
+        current += duration + buffer_time
+    return slots
+
+
+class TestScheduleParsing:
+    """Test cases for converting schedule JSON into BusinessHours."""
+
+    def test_parse_clinic_operating_hours(self):
+        """Test clinic hours with a lunch break and a closed day."""
+        hours = parse_clinic_operating_hours(
+            {
+                "monday": {
+                    "is_open": True,
+                    "open_time": "08:00",
+                    "close_time": "17:00",
+                    "lunch_break": {"start": "12:00", "end": "13:00"},
+                },
+                "sunday": {"is_open": False},
+            }
+        )
+
+        assert hours[DayOfWeek.MONDAY].open_time == time(8)
+        assert hours[DayOfWeek.MONDAY].close_time == time(17)
+        assert hours[DayOfWeek.MONDAY].breaks == [(time(12), time(13))]
+        assert hours[DayOfWeek.SUNDAY].is_closed is True
+        assert DayOfWeek.TUESDAY not in hours
+
+    def test_parse_veterinarian_availability(self):
+        """Test veterinarian availability in both break formats."""
+        hours = parse_veterinarian_availability(
+            {
+                "tuesday": {
+                    "is_available": True,
+                    "start_time": "09:00",
+                    "end_time": "18:00",
+                    "breaks": [
+                        {"start": "15:00", "end": "15:30"},
+                        {"start_time": "12:00", "end_time": "12:30"},
+                    ],
+                }
+            }
+        )
+
+        assert hours[DayOfWeek.TUESDAY].breaks == [
+            (time(12), time(12, 30)),
+            (time(15), time(15, 30)),
+        ]
+
+    def test_intersect_business_hours(self):
+        """Test intersecting clinic and veterinarian schedules."""
+        clinic = {
+            DayOfWeek.MONDAY: BusinessHours(
+                DayOfWeek.MONDAY, time(8), time(17), breaks=[(time(12), time(13))]
+            ),
+            DayOfWeek.TUESDAY: BusinessHours(DayOfWeek.TUESDAY, time(8), time(17)),
+        }
+        vet = {
+            DayOfWeek.MONDAY: BusinessHours(
+                DayOfWeek.MONDAY, time(10), time(19), breaks=[(time(15), time(16))]
+            ),
+            DayOfWeek.TUESDAY: BusinessHours(
+                DayOfWeek.TUESDAY, time(8), time(17), is_closed=True
+            ),
+        }
+
+        hours = intersect_business_hours(clinic, vet)
+
+        assert hours[DayOfWeek.MONDAY].open_time == time(10)
+        assert hours[DayOfWeek.MONDAY].close_time == time(17)
+        assert len(hours[DayOfWeek.MONDAY].breaks) == 2
+        assert hours[DayOfWeek.TUESDAY].is_closed is True
+
+
+class TestAppointmentSlotEngine:
+    """Test cases for the sweep-line slot availability engine."""
+
+    def test_slots_without_appointments(self):
+        """Test that an empty day yields every slot."""
+        slots = get_available_appointment_slots(
+            MONDAY,
+            _weekday_hours(),
+            appointment_duration=timedelta(minutes=30),
+            buffer_time=timedelta(minutes=15),
+        )
+
+        assert slots[0] == datetime(2030, 1, 7, 9, 0, tzinfo=UTC)
+        assert len(slots) == 4  # 9:00, 9:45, 10:30, 11:15
+
+    def test_slots_skip_existing_appointments(self):
+        """Test that overlapping appointments remove slots."""
+        booked = [
+            (
+                datetime(2030, 1, 7, 9, 50, tzinfo=UTC),
+                datetime(2030, 1, 7, 10, 10, tzinfo=UTC),
+            )
+        ]
+
+        slots = get_available_appointment_slots(
+            MONDAY, _weekday_hours(), existing_appointments=booked
+        )
+
+        assert datetime(2030, 1, 7, 9, 45, tzinfo=UTC) not in slots
+        assert datetime(2030, 1, 7, 9, 0, tzinfo=UTC) in slots
+
+    def test_breaks_block_slots(self):
+        """Test that lunch breaks are treated as busy time."""
+        hours = parse_clinic_operating_hours(
+            {
+                "monday": {
+                    "is_open": True,
+                    "open_time": "11:00",
+                    "close_time": "14:00",
+                    "lunch_break": {"start": "12:00", "end": "13:00"},
+                }
+            }
+        )
+
+        slots = get_available_appointment_slots(MONDAY, hours, buffer_time=timedelta(0))
+
+        assert [slot.hour * 60 + slot.minute for slot in slots] == [
+            660,
+            690,
+            780,
+            810,
+        ]
+
+    def test_closed_day_has_no_slots(self):
+        """Test that closed and missing days have no slots."""
+        sunday = MONDAY - timedelta(days=1)
+
+        assert get_available_appointment_slots(sunday, _weekday_hours()) == []
+
+    def test_matches_nested_loop_reference(self):
+        """Test that the engine matches the reference implementation."""
+        rng = random.Random(7)
+        business_hours = _weekday_hours(8, 18)
+        duration = timedelta(minutes=20)
+        buffer_time = timedelta(minutes=5)
+        appointments = []
+        for _ in range(200):
+            start = datetime.combine(
+                MONDAY + timedelta(days=rng.randrange(14)), time(8), UTC
+            ) + timedelta(minutes=rng.randrange(0, 600, 5))
+            appointments.append(
+                (start, start + timedelta(minutes=rng.choice([0, 15, 45])))
+            )
+
+        engine = AppointmentSlotEngine(
+            business_hours,
+            appointments,
+            appointment_duration=duration,
+            buffer_time=buffer_time,
+        )
+        result = engine.get_slots_for_range(MONDAY, MONDAY + timedelta(days=13))
+
+        assert len(result) == 14
+        for day, slots in result.items():
+            assert slots == _naive_slots(
+                day, business_hours, duration, buffer_time, appointments
+            )
+
+    def test_range_with_datetime_window(self):
+        """Test that datetime bounds trim slots outside the window."""
+        result = get_available_slots_for_range(
+            datetime(2030, 1, 7, 10, 0, tzinfo=UTC),
+            datetime(2030, 1, 8, 10, 0, tzinfo=UTC),
+            _weekday_hours(),
+            buffer_time=timedelta(0),
+        )
+
+        assert result[MONDAY][0] == datetime(2030, 1, 7, 10, 0, tzinfo=UTC)
+        assert result[MONDAY + timedelta(days=1)] == [
+            datetime(2030, 1, 8, 9, 0, tzinfo=UTC),
+            datetime(2030, 1, 8, 9, 30, tzinfo=UTC),
+        ]
+
+    def test_invalid_arguments(self):
+        """Test validation of duration and range order."""
+        with pytest.raises(ValueError):
+            AppointmentSlotEngine(_weekday_hours(), appointment_duration=timedelta(0))
+
+        engine = AppointmentSlotEngine(_weekday_hours())
+        with pytest.raises(ValueError):
+            engine.get_slots_for_range(MONDAY, MONDAY - timedelta(days=1))
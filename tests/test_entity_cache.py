@@ -0,0 +1,261 @@
+"""
+Tests for the second-level entity cache.
+
+This module tests the LRU and TTL bounds of the in-process cache, read-through
+lookups of clinics through ClinicRepository, eviction of rows written by
+committed transactions, and sharing entries through a backend, with a local
+SQLite database so committed rows stay out of the shared test database.
+"""
+
+import pytest
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from vet_core.database import CacheBackend, LRUCache, SessionManager
+from vet_core.models import Clinic, User, Veterinarian
+from vet_core.repositories import ClinicRepository
+
+
+class Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class DictBackend(CacheBackend):
+    """Shared backend kept in a dictionary."""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl):
+        self.values[key] = value
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+    async def clear(self, prefix):
+        for key in [key for key in self.values if key.startswith(prefix)]:
+            del self.values[key]
+
+
+def _clinic(name, **kwargs):
+    """Build a clinic with the required fields filled in."""
+    defaults = {
+        "name": name,
+        "phone_number": "555-123-4567",
+        "address_line1": "1 Main Street",
+        "city": "Springfield",
+        "state": "IL",
+        "postal_code": "62701",
+        "operating_hours": {"monday": {"open": "08:00", "close": "18:00"}},
+    }
+    defaults.update(kwargs)
+    return Clinic(**defaults)
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    """Create a session manager with the entity cache over a local database."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'cache.db'}")
+    tables = [User.__table__, Clinic.__table__, Veterinarian.__table__]
+    async with engine.begin() as conn:
+        await conn.run_sync(Clinic.metadata.create_all, tables=tables)
+    manager = SessionManager(engine)
+    manager.enable_entity_cache()
+    yield manager
+    manager.disable_entity_cache()
+    await engine.dispose()
+
+
+@pytest.fixture
+def statements(manager):
+    """Record the statements sent to the database."""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(manager.engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(manager.engine.sync_engine, "before_cursor_execute", record)
+
+
+async def _add_clinic(manager, name="Alpha Vet", **kwargs):
+    """Store a clinic and return its ID."""
+    async with manager.get_transaction() as session:
+        clinic = _clinic(name, **kwargs)
+        session.add(clinic)
+    return clinic.id
+
+
+async def _get_clinic(manager, clinic_id, **kwargs):
+    """Look a clinic up through its repository in a new session."""
+    async with manager.get_session() as session:
+        return await ClinicRepository(session).get_by_id(clinic_id, **kwargs)
+
+
+class TestLRUCache:
+    """Test cases for the in-process cache bounds."""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the size bound evicts the least recently used entry."""
+        cache = LRUCache(max_entries=2)
+        cache.set("a", {"id": 1})
+        cache.set("b", {"id": 2})
+        assert cache.get("a") == {"id": 1}
+
+        cache.set("c", {"id": 3})
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == ({"id": 1}, {"id": 3})
+        assert (len(cache), cache.evictions) == (2, 1)
+
+    def test_entries_expire(self):
+        """Test that entries are dropped after the TTL."""
+        clock = Clock()
+        cache = LRUCache(ttl=10, clock=clock)
+        cache.set("clinics:1", {"id": 1})
+        cache.set("users:1", {"id": 1})
+
+        clock.now += 9.9
+        assert cache.get("clinics:1") is not None
+        clock.now += 0.1
+        assert cache.get("clinics:1") is None
+        assert cache.clear("users:") == 1
+        assert len(cache) == 0
+
+        with pytest.raises(ValueError):
+            LRUCache(max_entries=0)
+
+
+class TestEntityCache:
+    """Test cases for read-through lookups and eviction."""
+
+    async def test_hit_needs_no_query(self, manager, statements):
+        """Test that a cached clinic is attached without a query."""
+        clinic_id = await _add_clinic(manager)
+
+        assert (await _get_clinic(manager, clinic_id)).name == "Alpha Vet"
+        statements.clear()
+        async with manager.get_session() as session:
+            clinic = await ClinicRepository(session).get_by_id(clinic_id)
+            assert clinic in session
+            assert clinic.operating_hours["monday"]["open"] == "08:00"
+
+        assert statements == []
+        stats = manager.get_cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    async def test_entities_do_not_share_values(self, manager):
+        """Test that changing a cached entity in memory leaves the cache alone."""
+        clinic_id = await _add_clinic(manager)
+        await _get_clinic(manager, clinic_id)
+
+        async with manager.get_session() as session:
+            clinic = await ClinicRepository(session).get_by_id(clinic_id)
+            clinic.operating_hours["monday"]["open"] = "06:00"
+            clinic.name = "Changed"
+
+        clinic = await _get_clinic(manager, clinic_id)
+        assert clinic.operating_hours["monday"]["open"] == "08:00"
+        assert clinic.name == "Alpha Vet"
+
+    async def test_commit_evicts_changed_rows(self, manager):
+        """Test that committed changes are visible on the next lookup."""
+        clinic_id = await _add_clinic(manager)
+        await _get_clinic(manager, clinic_id)
+
+        async with manager.get_transaction() as session:
+            clinic = await ClinicRepository(session).get_by_id(clinic_id)
+            clinic.name = "Renamed Vet"
+            await session.flush()
+            assert manager.get_cache_stats().invalidations == 0
+
+        assert (await _get_clinic(manager, clinic_id)).name == "Renamed Vet"
+        stats = manager.get_cache_stats()
+        assert stats.invalidations == 1
+        assert (stats.hits, stats.misses) == (1, 2)
+
+    async def test_rollback_keeps_entries(self, manager):
+        """Test that rolled back changes do not evict."""
+        clinic_id = await _add_clinic(manager)
+        await _get_clinic(manager, clinic_id)
+
+        async with manager.get_session() as session:
+            clinic = await ClinicRepository(session).get_by_id(clinic_id)
+            clinic.name = "Renamed Vet"
+            await session.flush()
+            await session.rollback()
+
+        assert (await _get_clinic(manager, clinic_id)).name == "Alpha Vet"
+        assert manager.get_cache_stats().invalidations == 0
+
+    async def test_bulk_update_evicts_model(self, manager):
+        """Test that an ORM UPDATE evicts every cached clinic."""
+        first = await _add_clinic(manager, "Alpha Vet")
+        second = await _add_clinic(manager, "Beta Vet")
+        await _get_clinic(manager, first)
+        await _get_clinic(manager, second)
+
+        async with manager.get_transaction() as session:
+            await session.execute(update(Clinic).values(city="Chicago"))
+
+        assert manager.get_cache_stats().size == 0
+        assert (await _get_clinic(manager, second)).city == "Chicago"
+
+    async def test_soft_deleted_clinics(self, manager):
+        """Test that soft-deleted clinics are only returned when asked for."""
+        clinic_id = await _add_clinic(manager, is_deleted=True)
+
+        assert await _get_clinic(manager, clinic_id) is None
+        clinic = await _get_clinic(manager, clinic_id, include_deleted=True)
+        assert clinic.is_deleted
+
+    async def test_shared_backend(self, manager, statements):
+        """Test that a second process reads entries through the backend."""
+        backend = DictBackend()
+        clinic_id = await _add_clinic(manager)
+        manager.enable_entity_cache(backend=backend)
+        await _get_clinic(manager, clinic_id)
+        assert list(backend.values) == [f"clinics:{clinic_id}"]
+
+        other = SessionManager(manager.engine)
+        other_cache = other.enable_entity_cache(backend=backend)
+        statements.clear()
+        assert (await _get_clinic(other, clinic_id)).name == "Alpha Vet"
+        assert statements == []
+        assert other_cache.stats().backend_hits == 1
+
+        async with manager.get_transaction() as session:
+            clinic = await ClinicRepository(session).get_by_id(clinic_id)
+            clinic.name = "Renamed Vet"
+        await other_cache.wait_for_backend()
+        await manager.entity_cache.wait_for_backend()
+        other.disable_entity_cache()
+
+        assert backend.values == {}
+
+    async def test_pool_status_reports_cache(self, manager):
+        """Test that the cache counters appear in the pool status."""
+        clinic_id = await _add_clinic(manager)
+        await _get_clinic(manager, clinic_id)
+        await _get_clinic(manager, clinic_id)
+
+        status = await manager.get_pool_status()
+
+        assert status["entity_cache_hits"] == "1"
+        assert status["entity_cache_misses"] == "1"
+        assert status["entity_cache_hit_rate"] == "0.50"
+        assert status["entity_cache_size"] == "1"
+
+        manager.disable_entity_cache()
+        assert "entity_cache_hits" not in await manager.get_pool_status()
+        assert manager.get_cache_stats() is None
@@ -0,0 +1,193 @@
+"""
+Tests for streaming export utilities.
+
+This module tests streaming model rows through server-side cursors and
+writing them as NDJSON or CSV to files and writers.
+"""
+
+import csv
+import io
+import json
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from vet_core.database import ExportFormat, export_rows, iter_export, stream_rows
+from vet_core.database.export import resolve_format
+from vet_core.models import Appointment, Pet, ServiceType
+
+
+@pytest.fixture
+async def owner_pets(async_session, user_factory, pet_factory):
+    """Create pets with medical history for one owner, one soft-deleted."""
+    owner = await user_factory.create(async_session)
+    pets = [
+        pet_factory.build_with_medical_history(owner_id=owner.id, name=f"Pet {i}")
+        for i in range(5)
+    ]
+    pets[1].soft_delete()
+    async_session.add_all(pets)
+    await async_session.flush()
+    return owner, pets
+
+
+class TestStreamRows:
+    """Test cases for stream_rows."""
+
+    async def test_chunks_without_orm_objects(self, async_session, owner_pets):
+        """Test that rows arrive in chunks as dictionaries of every column."""
+        owner, pets = owner_pets
+        async_session.expunge_all()
+        stmt = select(Pet).where(Pet.owner_id == owner.id)
+
+        chunks = [rows async for rows in stream_rows(async_session, stmt, chunk_size=2)]
+
+        assert [len(rows) for rows in chunks] == [2, 2]
+        rows = [row for chunk in chunks for row in chunk]
+        assert {row["id"] for row in rows} == {
+            pet.id for pet in pets if not pet.is_deleted
+        }
+        assert set(rows[0]) == set(Pet.__table__.columns.keys())
+        assert len(async_session.identity_map) == 0
+
+    async def test_include_deleted(self, async_session, owner_pets):
+        """Test that soft-deleted rows are streamed when requested."""
+        owner, pets = owner_pets
+        stmt = select(Pet.id, Pet.name).where(Pet.owner_id == owner.id)
+
+        rows = [
+            row
+            async for chunk in stream_rows(async_session, stmt, include_deleted=True)
+            for row in chunk
+        ]
+
+        assert {row["id"] for row in rows} == {pet.id for pet in pets}
+        assert set(rows[0]) == {"id", "name"}
+
+    async def test_requires_model_select(self, async_session):
+        """Test that selects without a model are rejected."""
+        with pytest.raises(ValueError):
+            async for _ in stream_rows(async_session, select(1)):
+                pass
+
+
+class TestExportRows:
+    """Test cases for NDJSON and CSV export."""
+
+    async def test_ndjson_file(self, async_session, owner_pets, tmp_path):
+        """Test that each row is written as one JSON object per line."""
+        owner, pets = owner_pets
+        path = tmp_path / "pets.ndjson"
+
+        count = await export_rows(
+            async_session,
+            select(Pet).where(Pet.owner_id == owner.id),
+            path,
+            chunk_size=3,
+        )
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert count == len(lines) == 4
+        record = json.loads(lines[0])
+        pet = next(pet for pet in pets if str(pet.id) == record["id"])
+        assert record["species"] == pet.species.value
+        assert record["medical_history"] == pet.medical_history
+        assert Decimal(record["weight_kg"]) == pet.weight_kg
+
+    async def test_csv_writer(self, async_session, owner_pets):
+        """Test CSV output with a header row and JSON cells."""
+        owner, _ = owner_pets
+        output = io.StringIO()
+
+        count = await export_rows(
+            async_session,
+            select(Pet).where(Pet.owner_id == owner.id),
+            output,
+            format="csv",
+            chunk_size=2,
+        )
+
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        assert count == len(rows) == 4
+        assert list(rows[0]) == list(Pet.__table__.columns.keys())
+        assert rows[0]["is_deleted"] == "False"
+        assert isinstance(json.loads(rows[0]["medical_history"]), dict)
+
+    async def test_csv_header_without_rows(self, async_session):
+        """Test that an empty CSV export still has its header."""
+        stmt = select(Pet.id, Pet.name).where(Pet.owner_id == uuid.uuid4())
+
+        chunks = [
+            chunk async for chunk in iter_export(async_session, stmt, ExportFormat.CSV)
+        ]
+
+        assert "".join(chunks) == "id,name\n"
+
+    async def test_async_writer(self, async_session):
+        """Test that an async write method is awaited."""
+        clinic_id = uuid.uuid4()
+        start = datetime.now().replace(microsecond=0) + timedelta(days=30)
+        async_session.add_all(
+            Appointment(
+                pet_id=uuid.uuid4(),
+                veterinarian_id=uuid.uuid4(),
+                clinic_id=clinic_id,
+                scheduled_at=start + timedelta(hours=i),
+                service_type=ServiceType.WELLNESS_EXAM,
+            )
+            for i in range(3)
+        )
+        await async_session.flush()
+
+        class Sink:
+            def __init__(self):
+                self.chunks = []
+
+            async def write(self, text):
+                self.chunks.append(text)
+
+        sink = Sink()
+        stmt = select(Appointment).where(Appointment.clinic_id == clinic_id)
+        count = await export_rows(async_session, stmt, sink, format="ndjson")
+
+        assert count == 3
+        records = [json.loads(line) for line in "".join(sink.chunks).splitlines()]
+        assert {record["service_type"] for record in records} == {"wellness_exam"}
+
+    async def test_session_manager_export(self, test_session_manager, tmp_path):
+        """Test exporting through the session manager."""
+        path = tmp_path / "empty.csv"
+
+        count = await test_session_manager.export_rows(
+            select(Pet.id).where(Pet.owner_id == uuid.uuid4()), path
+        )
+
+        assert count == 0
+        assert path.read_text(encoding="utf-8") == "id\n"
+
+
+class TestResolveFormat:
+    """Test cases for choosing the export format."""
+
+    @pytest.mark.parametrize(
+        "destination, expected",
+        [
+            ("export.csv", ExportFormat.CSV),
+            ("export.NDJSON", ExportFormat.NDJSON),
+            ("export.jsonl", ExportFormat.NDJSON),
+        ],
+    )
+    def test_from_suffix(self, destination, expected):
+        """Test that the format is taken from the file suffix."""
+        assert resolve_format(None, destination) is expected
+
+    @pytest.mark.parametrize(
+        "format, destination", [("xml", "export.csv"), (None, "export.txt")]
+    )
+    def test_unknown_format(self, format, destination):
+        """Test that unknown or missing formats are rejected."""
+        with pytest.raises(ValueError):
+            resolve_format(format, destination)
@@ -0,0 +1,187 @@
+"""
+Tests for background database health monitoring.
+
+This module tests the probe window and snapshot published by HealthMonitor,
+pool saturation trends, and the cached health, readiness and liveness
+checks on SessionManager.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from vet_core.database import HealthMonitor, SessionManager
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """Create a SQLite engine with a queue pool."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'health.db'}", pool_size=4
+    )
+    yield engine
+    await engine.dispose()
+
+
+def _failing_probe(monitor):
+    """Make the monitor's probes fail with an operational error."""
+    monitor._probe = AsyncMock(
+        side_effect=OperationalError("SELECT 1", {}, Exception("refused"))
+    )
+
+
+class TestHealthMonitor:
+    """Test cases for HealthMonitor."""
+
+    async def test_probe_publishes_snapshot(self, engine):
+        """Test that a successful probe makes the database ready."""
+        monitor = HealthMonitor(engine)
+        assert monitor.snapshot.status == "unknown"
+        assert not monitor.snapshot.ready
+
+        snapshot = await monitor.probe_once()
+
+        assert snapshot is monitor.snapshot
+        assert snapshot.status == "healthy"
+        assert snapshot.ready
+        assert snapshot.probes == 1
+        assert snapshot.latency_ms > 0
+        assert snapshot.latency_p50_ms <= snapshot.latency_p95_ms
+        assert snapshot.pool.size == 4
+        assert snapshot.to_dict()["ready"] is True
+
+    async def test_failures_degrade_then_fail(self, engine):
+        """Test that consecutive failures make the database unhealthy."""
+        monitor = HealthMonitor(engine, failure_threshold=2)
+        await monitor.probe_once()
+        _failing_probe(monitor)
+
+        snapshot = await monitor.probe_once()
+        assert snapshot.status == "degraded"
+        assert snapshot.ready
+        assert "OperationalError" in snapshot.last_error
+
+        snapshot = await monitor.probe_once()
+        assert snapshot.status == "unhealthy"
+        assert not snapshot.ready
+        assert snapshot.consecutive_failures == 2
+        assert snapshot.failure_rate == pytest.approx(2 / 3)
+
+    async def test_probe_timeout(self, engine):
+        """Test that a probe exceeding the timeout counts as failed."""
+        monitor = HealthMonitor(engine, timeout=0.01, failure_threshold=1)
+        monitor._probe = lambda: asyncio.sleep(1)
+
+        snapshot = await monitor.probe_once()
+
+        assert snapshot.status == "unhealthy"
+        assert "timed out" in snapshot.last_error
+
+    async def test_slow_probes_degrade(self, engine):
+        """Test that p95 latency above the limit degrades the status."""
+        monitor = HealthMonitor(engine, degraded_latency_ms=0.0)
+
+        assert (await monitor.probe_once()).status == "degraded"
+
+    async def test_saturation_trend(self, engine):
+        """Test that growing pool usage is reported as a rising trend."""
+        monitor = HealthMonitor(engine, saturation_threshold=0.75)
+        connections = []
+        try:
+            for _ in range(4):
+                monitor.sample_pool()
+                connections.append(await engine.connect())
+            monitor.sample_pool()
+            snapshot = await monitor.probe_once()
+        finally:
+            for conn in connections:
+                await conn.close()
+
+        assert snapshot.pool.peak == 1.0
+        assert snapshot.pool.trend == "rising"
+        assert snapshot.status == "degraded"
+        assert 0 < snapshot.pool.average < snapshot.pool.peak
+
+    async def test_background_task(self, engine):
+        """Test that the started monitor probes on its own and stops."""
+        monitor = HealthMonitor(engine, interval=0.01).start()
+        try:
+            for _ in range(100):
+                if monitor.snapshot.probes >= 2:
+                    break
+                await asyncio.sleep(0.01)
+            assert monitor.snapshot.probes >= 2
+            assert monitor.snapshot.live
+        finally:
+            await monitor.stop()
+
+        assert not monitor.is_running
+        assert not monitor.snapshot.live
+
+
+class TestSessionManagerHealth:
+    """Test cases for the health monitor on SessionManager."""
+
+    async def test_checks_read_cached_snapshot(self, engine):
+        """Test that checks read the snapshot without database I/O."""
+        manager = SessionManager(engine)
+        assert manager.get_health_snapshot() is None
+        assert manager.readiness()["ready"] is False
+
+        monitor = manager.start_health_monitor(interval=60)
+        try:
+            await monitor.probe_once()
+            monitor._probe = AsyncMock()
+
+            assert manager.readiness()["ready"] is True
+            assert manager.liveness()["live"] is True
+            health = await manager.health_check()
+            assert health["status"] == "healthy"
+            assert health["checks"]["basic_query"]["status"] == "pass"
+            assert health["pool_info"]["size"] == 4
+            monitor._probe.assert_not_awaited()
+
+            await manager.health_check(force=True)
+            monitor._probe.assert_not_awaited()
+        finally:
+            await manager.close_all_sessions()
+
+        assert manager.health_monitor is None
+        assert not monitor.is_running
+
+    async def test_forced_checks_probe_once_per_interval(self, engine):
+        """Test that forced checks share one probe within the interval."""
+        manager = SessionManager(engine)
+        monitor = manager.start_health_monitor(interval=60)
+        monitor._probe = AsyncMock()
+        try:
+            while monitor.snapshot.checked_at is None:
+                await asyncio.sleep(0)
+            monitor._probe.assert_awaited_once()
+
+            health = await manager.health_check(force=True)
+            assert health["status"] == "healthy"
+            monitor._probe.assert_awaited_once()
+
+            monitor.snapshot.checked_at -= 60
+            await asyncio.gather(*(manager.health_check(force=True) for _ in range(5)))
+            assert monitor._probe.await_count == 2
+        finally:
+            await manager.stop_health_monitor()
+
+    async def test_forced_check_reports_failed_probe(self, engine):
+        """Test that a forced check returns the result of its probe."""
+        manager = SessionManager(engine)
+        monitor = manager.start_health_monitor(interval=60)
+        try:
+            _failing_probe(monitor)
+
+            health = await manager.health_check(force=True)
+            assert health["status"] == "unhealthy"
+            assert "refused" in health["checks"]["basic_query"]["error"]
+            assert manager.readiness()["ready"] is False
+        finally:
+            await manager.stop_health_monitor()
@@ -0,0 +1,136 @@
+"""
+Tests for model loading profiles.
+
+This module tests the "summary", "scheduling" and "full" column loading
+profiles, both as explicit query options and when selected for a whole
+session.
+"""
+
+import pytest
+from sqlalchemy import inspect, select
+from sqlalchemy.dialects import postgresql
+
+from vet_core.models import Clinic, Pet, User, Veterinarian
+from vet_core.models.base import LOADING_PROFILES
+
+
+def _selected_sql(stmt) -> str:
+    """Compile a statement for PostgreSQL."""
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestLoadingOptions:
+    """Test cases for BaseModel.loading_options."""
+
+    def test_summary_defers_medical_documents(self):
+        """Test that the summary profile leaves out the pet's JSON documents."""
+        sql = _selected_sql(select(Pet).options(*Pet.loading_options("summary")))
+
+        assert "pets.name" in sql
+        assert "medical_history" not in sql
+        assert "vaccination_records" not in sql
+        assert "medication_history" not in sql
+
+    def test_scheduling_keeps_schedules(self):
+        """Test that the scheduling profile loads hours and availability."""
+        clinic_sql = _selected_sql(
+            select(Clinic).options(*Clinic.loading_options("scheduling"))
+        )
+        vet_sql = _selected_sql(
+            select(Veterinarian).options(*Veterinarian.loading_options("scheduling"))
+        )
+
+        assert "operating_hours" in clinic_sql
+        assert "equipment_available" not in clinic_sql
+        assert "availability" in vet_sql
+        assert "additional_certifications" not in vet_sql
+
+        summary_sql = _selected_sql(
+            select(Clinic).options(*Clinic.loading_options("summary"))
+        )
+        assert "operating_hours" not in summary_sql
+
+    @pytest.mark.parametrize("model", [Pet, Clinic, Veterinarian, User])
+    def test_full_profile_loads_everything(self, model):
+        """Test that the full profile and undeclared profiles defer nothing."""
+        assert model.loading_options("full") == []
+
+    def test_models_without_profiles(self):
+        """Test that a model without profiles loads every column."""
+        for profile in LOADING_PROFILES:
+            assert User.loading_options(profile) == []
+
+    def test_unknown_profile(self):
+        """Test that unknown profile names are rejected."""
+        with pytest.raises(ValueError, match="Unknown loading profile"):
+            Pet.loading_options("tiny")
+
+
+class TestSessionLoadingProfile:
+    """Test cases for applying profiles to whole sessions."""
+
+    @pytest.fixture
+    async def pet_id(self, async_session, user_factory, pet_factory):
+        """Create a pet with medical history and return its ID."""
+        owner = await user_factory.create(async_session)
+        pet = pet_factory.build_with_medical_history(owner_id=owner.id)
+        async_session.add(pet)
+        await async_session.flush()
+        async_session.expunge_all()
+        return pet.id
+
+    async def test_session_profile_defers_columns(self, async_session, pet_id):
+        """Test that the session profile applies to plain selects."""
+        async_session.info["loading_profile"] = "summary"
+
+        pet = await async_session.get(Pet, pet_id)
+        unloaded = inspect(pet).unloaded
+
+        assert "medical_history" in unloaded
+        assert "vaccination_records" in unloaded
+        assert "name" not in unloaded
+
+    async def test_statement_option_overrides_session(self, async_session, pet_id):
+        """Test that a statement can ask for every column."""
+        async_session.info["loading_profile"] = "summary"
+
+        stmt = (
+            select(Pet)
+            .where(Pet.id == pet_id)
+            .execution_options(loading_profile="full")
+        )
+        pet = (await async_session.scalars(stmt)).one()
+
+        assert "medical_history" not in inspect(pet).unloaded
+        assert pet.medical_history is not None
+
+    async def test_deferred_column_loads_on_refresh(self, async_session, pet_id):
+        """Test that deferred columns can be loaded explicitly."""
+        stmt = (
+            select(Pet)
+            .where(Pet.id == pet_id)
+            .execution_options(loading_profile="summary")
+        )
+        pet = (await async_session.scalars(stmt)).one()
+
+        await async_session.refresh(pet, ["medical_history"])
+
+        assert pet.medical_history is not None
+
+    async def test_column_selects_are_untouched(self, async_session, pet_id):
+        """Test that selecting individual columns ignores the profile."""
+        async_session.info["loading_profile"] = "summary"
+
+        stmt = select(Pet.name, Pet.medical_history).where(Pet.id == pet_id)
+        name, medical_history = (await async_session.execute(stmt)).one()
+
+        assert name
+        assert medical_history is not None
+
+    async def test_session_manager_sets_profile(self, test_session_manager):
+        """Test that the session helpers record the requested profile."""
+        async with test_session_manager.get_session("scheduling") as session:
+            assert session.info["loading_profile"] == "scheduling"
+
+        async with test_session_manager.get_transaction() as session:
+            assert "loading_profile" not in session.info
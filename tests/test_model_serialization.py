@@ -0,0 +1,101 @@
+"""Tests for the compiled model serializers behind BaseModel.to_dict."""
+
+import uuid
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import configure_mappers
+
+from vet_core.models import BaseModel, Clinic, Pet, User, serialization
+from vet_core.models.serialization import compile_serializer, get_serializer, to_dicts
+
+
+def reflect_to_dict(instance):
+    """Convert an instance the way BaseModel.to_dict originally did."""
+    result = {}
+    for column in instance.__table__.columns:
+        value = getattr(instance, column.name)
+        if isinstance(value, datetime):
+            result[column.name] = value.isoformat()
+        elif isinstance(value, uuid.UUID):
+            result[column.name] = str(value)
+        else:
+            result[column.name] = value
+    return result
+
+
+class TestCompiledSerializers:
+    """Test cases for compiled model serializers."""
+
+    def test_serializers_compiled_when_mappers_configured(self):
+        """Test every model gets its serializer when mappers are configured."""
+        configure_mappers()
+
+        for model_class in (Pet, Clinic, User):
+            assert model_class in serialization._serializers
+            assert (
+                get_serializer(model_class) is serialization._serializers[model_class]
+            )
+
+    def test_matches_reflection_for_transient_rows(self, pet_factory):
+        """Test unloaded attributes fall back to attribute access."""
+        pet = pet_factory.build(
+            birth_date=date(2019, 5, 4),
+            medical_history={"records": [{"date": "2023-01-15"}]},
+        )
+        pet.created_at = datetime(2024, 1, 1, 12, 30)
+
+        data = pet.to_dict()
+
+        assert data == reflect_to_dict(pet)
+        assert data["id"] == str(pet.id)
+        assert data["owner_id"] == str(pet.owner_id)
+        assert data["created_at"] == "2024-01-01T12:30:00"
+        # Dates are not datetimes and are left unchanged
+        assert data["birth_date"] == date(2019, 5, 4)
+        assert data["breed"] == "Golden Retriever"
+        assert list(data) == [column.name for column in Pet.__table__.columns]
+
+    async def test_matches_reflection_for_loaded_rows(
+        self, async_session, pet_factory, test_user
+    ):
+        """Test loaded rows of several models serialize as before."""
+        await pet_factory.create(async_session, owner=test_user)
+        await pet_factory.create_cat(async_session, owner=test_user)
+
+        rows = [*(await async_session.execute(select(Pet))).scalars(), test_user]
+
+        assert to_dicts(rows) == [reflect_to_dict(row) for row in rows]
+        assert [row.to_dict() for row in rows] == to_dicts(rows)
+
+    def test_to_dicts_excludes_deleted_rows(self, pet_factory):
+        """Test soft-deleted rows are left out unless requested."""
+        pets = [pet_factory.build(name=f"Pet {index}") for index in range(3)]
+        pets[1].soft_delete()
+
+        assert [data["name"] for data in Pet.to_dicts(pets)] == ["Pet 0", "Pet 2"]
+        assert len(BaseModel.to_dicts(pets, exclude_deleted=False)) == 3
+        assert Pet.to_dicts([]) == []
+
+    def test_conversions_resolved_by_column_type(self):
+        """Test only columns that can hold datetimes or UUIDs are converted."""
+        assert serialization._conversion(Pet.__table__.c.created_at.type) == (
+            "datetime"
+        )
+        assert serialization._conversion(Pet.__table__.c.id.type) == "any"
+        assert serialization._conversion(Pet.__table__.c.name.type) == "none"
+        assert serialization._conversion(Pet.__table__.c.species.type) == "none"
+        assert serialization._conversion(Pet.__table__.c.medical_history.type) == "none"
+
+    def test_compile_serializer_names_function(self):
+        """Test compiled serializers are named after their model."""
+        assert compile_serializer(Pet).__qualname__ == "serialize_Pet"
+
+    @pytest.mark.parametrize("model_class", [Pet, Clinic, User])
+    def test_serializer_covers_all_columns(self, model_class):
+        """Test each serializer produces one key per table column."""
+        instance = model_class()
+
+        data = get_serializer(model_class)(instance)
+        assert list(data) == [column.name for column in model_class.__table__.columns]
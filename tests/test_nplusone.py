@@ -0,0 +1,166 @@
+"""
+Tests for N+1 query detection.
+
+This module tests counting session statements per scope, reporting
+repeated statements and lazy-loaded relationships, enabling detection on
+SessionManager and the nplusone_guard fixture of the vet-core pytest plugin.
+"""
+
+import logging
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from vet_core.database import NPlusOneDetector, detect_nplusone
+from vet_core.exceptions import NPlusOneQueryException
+from vet_core.models import Pet, User
+
+
+@pytest.fixture
+async def pet_ids(async_session, user_factory, pet_factory):
+    """Create six pets, each with its own owner, and clear the session."""
+    pets = []
+    for i in range(6):
+        owner = await user_factory.create(async_session)
+        pets.append(pet_factory.build(owner_id=owner.id, name=f"Pet {i}"))
+    async_session.add_all(pets)
+    await async_session.flush()
+    async_session.expunge_all()
+    return [pet.id for pet in pets]
+
+
+async def _load_pets(session, pet_ids, *options):
+    """Load the fixture's pets."""
+    stmt = select(Pet).where(Pet.id.in_(pet_ids)).options(*options)
+    return (await session.scalars(stmt)).all()
+
+
+async def _walk_owners(session, pets):
+    """Touch each pet's lazy-loaded owner, one query per pet."""
+    return await session.run_sync(lambda _: [pet.owner.email for pet in pets])
+
+
+class TestNPlusOneDetector:
+    """Test cases for NPlusOneDetector."""
+
+    async def test_lazy_load_raises_with_relationship(self, async_session, pet_ids):
+        """Test that a lazy load in a loop names its relationship."""
+        pets = await _load_pets(async_session, pet_ids)
+
+        with detect_nplusone(async_session, threshold=5) as scope:
+            with pytest.raises(NPlusOneQueryException) as exc_info:
+                await _walk_owners(async_session, pets)
+
+        assert exc_info.value.details["relationship"] == "Pet.owner"
+        assert exc_info.value.details["count"] == 5
+        assert not exc_info.value.is_retryable()
+        assert "lazy load of Pet.owner" in str(exc_info.value)
+        assert scope.detections[0].relationship == "Pet.owner"
+
+    async def test_repeated_statement_warns(self, async_session, pet_ids, caplog):
+        """Test that per-row lookups differing in parameters are reported."""
+        detector = NPlusOneDetector(threshold=3, action="warn")
+
+        with caplog.at_level(logging.WARNING, logger="vet_core.database.nplusone"):
+            with detector.scope(async_session) as scope:
+                for pet_id in pet_ids:
+                    await async_session.get(Pet, pet_id)
+
+        (detection,) = scope.detections
+        assert detection.relationship is None
+        assert detection.count == 3
+        assert "FROM pets" in detection.statement
+        assert scope.repeated()[0].count == len(pet_ids)
+        assert "Possible N+1 query" in caplog.text
+
+    async def test_eager_loading_passes(self, async_session, pet_ids):
+        """Test that loading the relationship up front is not reported."""
+        with detect_nplusone(async_session, threshold=2) as scope:
+            pets = await _load_pets(async_session, pet_ids, selectinload(Pet.owner))
+            await _walk_owners(async_session, pets)
+
+        assert scope.detections == []
+        assert scope.total == 2
+
+    async def test_ignored_relationship(self, async_session, pet_ids):
+        """Test that ignored relationships are never reported."""
+        pets = await _load_pets(async_session, pet_ids)
+
+        with detect_nplusone(async_session, ignore=["Pet.owner"]) as scope:
+            await _walk_owners(async_session, pets)
+
+        assert scope.detections == []
+        assert scope.counts
+
+    async def test_scopes_count_separately(self, async_session, pet_ids):
+        """Test that each scope starts counting from zero."""
+        detector = NPlusOneDetector(threshold=4, action="raise")
+        detector.attach(async_session)
+
+        for batch in (pet_ids[:3], pet_ids[3:]):
+            with detector.scope(async_session) as scope:
+                for pet_id in batch:
+                    await async_session.get(Pet, pet_id)
+            assert scope.total == 3
+
+        assert detector.get_scope(async_session).total == 0
+        assert detector.detach(async_session) is not None
+        assert detector.get_scope(async_session) is None
+
+    def test_threshold_must_allow_repetition(self):
+        """Test that a threshold below two is rejected."""
+        with pytest.raises(ValueError):
+            NPlusOneDetector(threshold=1)
+
+
+class TestSessionManagerDetection:
+    """Test cases for enabling detection on SessionManager."""
+
+    async def test_sessions_are_watched(self, test_session_manager, user_factory):
+        """Test that sessions created after enabling detection are watched."""
+        detector = test_session_manager.enable_nplusone_detection(
+            threshold=3, action="raise"
+        )
+        try:
+            async with test_session_manager.get_session() as session:
+                assert detector.get_scope(session) is not None
+                users = [user_factory.build() for _ in range(3)]
+                session.add_all(users)
+                await session.flush()
+                session.expunge_all()
+
+                with pytest.raises(NPlusOneQueryException):
+                    for user in users:
+                        await session.get(User, user.id)
+                await session.rollback()
+        finally:
+            test_session_manager.disable_nplusone_detection()
+
+        async with test_session_manager.get_session() as session:
+            assert detector.get_scope(session) is None
+
+
+class TestNPlusOneGuardFixture:
+    """Test cases for the nplusone_guard fixture."""
+
+    async def test_guard_allows_eager_loading(
+        self, async_session, pet_ids, nplusone_guard
+    ):
+        """Test that the guard passes queries without N+1 patterns."""
+        pets = await _load_pets(async_session, pet_ids, selectinload(Pet.owner))
+
+        assert len(await _walk_owners(async_session, pets)) == len(pet_ids)
+        assert nplusone_guard.detections == []
+
+    async def test_guard_raises_on_lazy_loads(
+        self, async_session, pet_ids, nplusone_guard
+    ):
+        """Test that the guard stops a lazy load in a loop."""
+        pets = await _load_pets(async_session, pet_ids)
+
+        with pytest.raises(NPlusOneQueryException):
+            await _walk_owners(async_session, pets)
+
+        # Expected here, so keep the fixture from failing the test
+        nplusone_guard.detections.clear()
@@ -0,0 +1,185 @@
+"""
+Tests for keyset pagination utilities.
+
+This module tests cursor encoding and the generic paginate() helper over
+entity and column selects, in both sort directions and with soft deletes.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import literal, select
+
+from vet_core.database import decode_cursor, encode_cursor, paginate
+from vet_core.exceptions import ValidationException
+from vet_core.models import Appointment, Pet, ServiceType
+
+
+async def _collect(session, stmt, order_by, limit, **kwargs):
+    """Follow cursors until the last page and return every item."""
+    items = []
+    cursor = None
+    while True:
+        page = await paginate(
+            session, stmt, order_by=order_by, after=cursor, limit=limit, **kwargs
+        )
+        items.extend(page.items)
+        if not page.has_more:
+            return items
+        cursor = page.next_cursor
+
+
+@pytest.fixture
+async def owner_pets(async_session, user_factory, pet_factory):
+    """Create pets for one owner with repeated names, one soft-deleted."""
+    owner = await user_factory.create(async_session)
+    pets = [
+        pet_factory.build(owner_id=owner.id, name=name, weight_kg=Decimal(weight))
+        for name, weight in [
+            ("Bella", "12.5"),
+            ("Max", "30"),
+            ("Bella", "8.25"),
+            ("Charlie", "12.5"),
+            ("Max", "21"),
+            ("Daisy", "4"),
+        ]
+    ]
+    pets[3].soft_delete()
+    async_session.add_all(pets)
+    await async_session.flush()
+    return owner, pets
+
+
+class TestCursorEncoding:
+    """Test cases for cursor encoding."""
+
+    def test_round_trip(self):
+        """Test that cursor values decode to their JSON representation."""
+        entity_id = uuid.uuid4()
+        cursor = encode_cursor([datetime(2024, 1, 15, 10, 30), entity_id])
+
+        assert decode_cursor(cursor, expected_length=2) == [
+            "2024-01-15T10:30:00",
+            str(entity_id),
+        ]
+
+    @pytest.mark.parametrize("cursor", ["not base64!", encode_cursor([1, 2, 3])])
+    def test_invalid_cursor(self, cursor):
+        """Test that malformed or mismatched cursors are rejected."""
+        with pytest.raises(ValidationException):
+            decode_cursor(cursor, expected_length=2)
+
+
+class TestPaginate:
+    """Test cases for paginate()."""
+
+    async def test_pages_in_order_without_duplicates(self, async_session, owner_pets):
+        """Test that following cursors visits every active row once."""
+        owner, pets = owner_pets
+        stmt = select(Pet).where(Pet.owner_id == owner.id)
+
+        items = await _collect(async_session, stmt, [Pet.name], limit=2)
+
+        expected = sorted(
+            (pet for pet in pets if not pet.is_deleted),
+            key=lambda pet: (pet.name, str(pet.id)),
+        )
+        assert [pet.id for pet in items] == [pet.id for pet in expected]
+
+    async def test_descending_order(self, async_session, owner_pets):
+        """Test descending sort keys, with the tie-breaker following them."""
+        owner, pets = owner_pets
+        stmt = select(Pet).where(Pet.owner_id == owner.id)
+
+        items = await _collect(async_session, stmt, [Pet.name.desc()], limit=2)
+
+        keys = [(pet.name, str(pet.id)) for pet in items]
+        assert keys == sorted(keys, reverse=True)
+        assert len(items) == 5
+
+    async def test_decimal_sort_key(self, async_session, owner_pets):
+        """Test that numeric cursor values are restored as decimals."""
+        owner, _ = owner_pets
+        stmt = select(Pet).where(Pet.owner_id == owner.id)
+
+        items = await _collect(async_session, stmt, [Pet.weight_kg], limit=1)
+
+        weights = [pet.weight_kg for pet in items]
+        assert weights == sorted(weights)
+        assert len(items) == 5
+
+    async def test_include_deleted(self, async_session, owner_pets):
+        """Test that soft-deleted rows are returned when requested."""
+        owner, pets = owner_pets
+        stmt = select(Pet).where(Pet.owner_id == owner.id)
+
+        items = await _collect(
+            async_session, stmt, [Pet.name], limit=4, include_deleted=True
+        )
+
+        assert {pet.id for pet in items} == {pet.id for pet in pets}
+
+    async def test_column_select(self, async_session, owner_pets):
+        """Test that column selects get rows with the sort keys added."""
+        owner, _ = owner_pets
+        stmt = select(Pet.name).where(Pet.owner_id == owner.id)
+
+        page = await paginate(async_session, stmt, order_by=[Pet.name], limit=3)
+
+        assert [row.name for row in page.items] == ["Bella", "Bella", "Daisy"]
+        assert all(row.id is not None for row in page.items)
+        assert page.has_more
+
+    async def test_existing_order_by_is_replaced(self, async_session, owner_pets):
+        """Test that the statement's own ORDER BY does not break the seek."""
+        owner, _ = owner_pets
+        stmt = select(Pet).where(Pet.owner_id == owner.id).order_by(Pet.weight_kg)
+
+        page = await paginate(async_session, stmt, order_by=[Pet.name], limit=2)
+
+        assert [pet.name for pet in page.items] == ["Bella", "Bella"]
+
+    async def test_appointments_by_clinic_schedule(self, async_session):
+        """Test paging a clinic's appointments by scheduled time."""
+        clinic_id = uuid.uuid4()
+        start = datetime.now().replace(microsecond=0) + timedelta(days=30)
+        appointments = [
+            Appointment(
+                pet_id=uuid.uuid4(),
+                veterinarian_id=uuid.uuid4(),
+                clinic_id=clinic_id,
+                scheduled_at=start + timedelta(minutes=30 * (i // 2)),
+                service_type=ServiceType.WELLNESS_EXAM,
+            )
+            for i in range(7)
+        ]
+        async_session.add_all(appointments)
+        await async_session.flush()
+
+        stmt = select(Appointment).where(Appointment.clinic_id == clinic_id)
+        items = await _collect(async_session, stmt, [Appointment.scheduled_at], limit=3)
+
+        keys = [(item.scheduled_at, str(item.id)) for item in items]
+        assert keys == sorted(keys)
+        assert len(items) == 7
+
+    async def test_requires_model_select(self, async_session):
+        """Test that selects without a model are rejected."""
+        with pytest.raises(ValueError):
+            await paginate(async_session, select(literal(1)), order_by=[])
+
+    @pytest.mark.parametrize(
+        "values",
+        [["yesterday", str(uuid.uuid4())], ["2024-06-15T09:00:00", "not-a-uuid"]],
+    )
+    async def test_invalid_cursor_value(self, async_session, values):
+        """Test that a cursor with an unparseable sort key is rejected."""
+        with pytest.raises(ValidationException):
+            await paginate(
+                async_session,
+                select(Appointment),
+                order_by=[Appointment.scheduled_at],
+                after=encode_cursor(values),
+            )
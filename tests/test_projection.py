@@ -0,0 +1,168 @@
+"""
+Tests for list response projections.
+
+This module tests deriving column lists from list response schemas, building
+response objects from result rows and paginating them with BaseRepository.
+"""
+
+import pytest
+from pydantic import BaseModel as SchemaModel
+from sqlalchemy.dialects import postgresql
+
+from vet_core.database import encode_cursor
+from vet_core.exceptions import ConfigurationException, ValidationException
+from vet_core.models import Appointment, Clinic, Pet, Veterinarian
+from vet_core.repositories import BaseRepository, Projection
+from vet_core.schemas.appointment import AppointmentListResponse
+from vet_core.schemas.clinic import ClinicListResponse
+from vet_core.schemas.pet import PetListResponse
+from vet_core.schemas.veterinarian import VeterinarianListResponse
+
+
+class PetRepository(BaseRepository[Pet]):
+    """Minimal repository used to exercise the generic list method."""
+
+    model = Pet
+
+
+@pytest.fixture
+async def pets(async_session, user_factory, pet_factory):
+    """Create pets with medical history, one of them soft-deleted."""
+    owner = await user_factory.create(async_session)
+    pets = [
+        pet_factory.build_with_medical_history(owner_id=owner.id, name=f"Pet {i}")
+        for i in range(5)
+    ]
+    pets[2].soft_delete()
+    async_session.add_all(pets)
+    await async_session.flush()
+    return pets
+
+
+class TestProjection:
+    """Test cases for compiling projections."""
+
+    @pytest.mark.parametrize(
+        "model, schema",
+        [
+            (Pet, PetListResponse),
+            (Appointment, AppointmentListResponse),
+            (Clinic, ClinicListResponse),
+            (Veterinarian, VeterinarianListResponse),
+        ],
+    )
+    def test_columns_follow_schema_fields(self, model, schema):
+        """Test that exactly the schema fields are selected."""
+        projection = Projection.for_schema(model, schema)
+
+        assert projection.column_names == list(schema.model_fields)
+
+    def test_heavy_columns_not_selected(self):
+        """Test that JSON documents outside the schema are not loaded."""
+        stmt = Projection.for_schema(Pet, PetListResponse).select()
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "medical_history" not in sql
+        assert "vaccination_records" not in sql
+
+    def test_projection_is_cached(self):
+        """Test that projections are compiled once per model and schema."""
+        assert Projection.for_schema(Pet, PetListResponse) is Projection.for_schema(
+            Pet, PetListResponse
+        )
+
+    def test_missing_required_column(self):
+        """Test that a required field without a column is rejected."""
+
+        class Summary(SchemaModel):
+            name: str
+            nickname: str
+
+        with pytest.raises(ConfigurationException):
+            Projection(Pet, Summary)
+
+    def test_missing_optional_column_uses_default(self):
+        """Test that optional fields without a column keep their default."""
+
+        class Summary(SchemaModel):
+            name: str
+            nickname: str = "buddy"
+
+        projection = Projection(Pet, Summary)
+
+        assert projection.column_names == ["name"]
+
+    async def test_from_rows_matches_orm_validation(self, async_session, pets):
+        """Test that rows build the same responses as loaded ORM objects."""
+        projection = Projection.for_schema(Pet, PetListResponse)
+        stmt = projection.select().where(Pet.id == pets[0].id)
+        rows = (await async_session.execute(stmt)).all()
+
+        (response,) = projection.from_rows(rows)
+
+        assert response == PetListResponse.model_validate(pets[0])
+
+
+class TestListAs:
+    """Test cases for BaseRepository.list_as."""
+
+    async def test_list_excludes_deleted(self, async_session, pets):
+        """Test that soft-deleted rows are skipped unless requested."""
+        repository = PetRepository(async_session)
+
+        ids = {pet.id for pet in pets}
+
+        page = await repository.list_as(PetListResponse, limit=100)
+        assert all(isinstance(pet, PetListResponse) for pet in page.items)
+        listed = {pet.id for pet in page.items} & ids
+        assert listed == ids - {pets[2].id}
+
+        page = await repository.list_as(
+            PetListResponse, limit=100, include_deleted=True
+        )
+        assert {pet.id for pet in page.items} & ids == ids
+
+    async def test_list_does_not_load_orm_objects(self, async_session, pets):
+        """Test that listing leaves the identity map untouched."""
+        async_session.expunge_all()
+
+        await PetRepository(async_session).list_as(PetListResponse)
+
+        assert len(async_session.identity_map) == 0
+
+    async def test_list_paginates_with_cursor(self, async_session, pets):
+        """Test that following cursors visits every row once, newest first."""
+        repository = PetRepository(async_session)
+
+        seen = []
+        cursor = None
+        while True:
+            page = await repository.list_as(PetListResponse, limit=3, after=cursor)
+            seen.extend(page.items)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        seen_ids = [pet.id for pet in seen]
+        assert len(seen_ids) == len(set(seen_ids))
+        assert {pet.id for pet in pets} - set(seen_ids) == {pets[2].id}
+        keys = [(pet.created_at, str(pet.id)) for pet in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    async def test_list_with_schema_without_sort_keys(self, async_session, pets):
+        """Test that sort keys are selected even if the schema omits them."""
+
+        class Name(SchemaModel):
+            name: str
+
+        page = await PetRepository(async_session).list_as(Name, limit=2)
+
+        assert len(page) == 2
+        assert page.has_more is True
+
+    async def test_invalid_cursor(self, async_session):
+        """Test that a cursor without a timestamp is rejected."""
+        with pytest.raises(ValidationException):
+            await PetRepository(async_session).list_as(
+                PetListResponse, after=encode_cursor(["not a date", "id"])
+            )
@@ -0,0 +1,229 @@
+"""
+Tests for read-replica routing.
+
+This module tests routing read-only sessions to replicas with two local
+SQLite databases standing in for the primary and its replicas, including
+the round-robin and least-connections strategies, read-your-writes
+stickiness and fallback to the primary when replicas are unhealthy.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import Integer, String, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from vet_core.database import (
+    SessionManager,
+    clear_write,
+    get_session,
+    initialize_session_manager,
+)
+from vet_core.database import session as session_module
+
+
+class Base(DeclarativeBase):
+    """Declarative base for the routing tests."""
+
+
+class Source(Base):
+    """Row naming the database it is stored in."""
+
+    __tablename__ = "sources"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(20))
+
+
+async def _database(path, name):
+    """Create a SQLite database holding one row with its name."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path / name}.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text("INSERT INTO sources (name) VALUES (:n)"), {"n": name})
+    return engine
+
+
+async def _read_source(manager, **kwargs):
+    """Read the name of the database a session is served from."""
+    async with manager.get_session(readonly=True, **kwargs) as session:
+        return (await session.scalars(select(Source.name))).first()
+
+
+@pytest.fixture
+async def databases(tmp_path):
+    """Create a primary and two replica databases."""
+    engines = [
+        await _database(tmp_path, name)
+        for name in ("primary", "replica_a", "replica_b")
+    ]
+    yield engines
+    for engine in engines:
+        await engine.dispose()
+
+
+class TestReplicaRouting:
+    """Test cases for routing read-only sessions."""
+
+    async def test_readonly_sessions_use_replicas(self, databases):
+        """Test that only read-only sessions are served by replicas."""
+        primary, replica_a, _ = databases
+        manager = SessionManager(primary, replicas=[replica_a])
+
+        assert await _read_source(manager) == "replica_a"
+        async with manager.get_session() as session:
+            assert (await session.scalars(select(Source.name))).first() == "primary"
+
+        replica = manager.replica_router.replicas[0]
+        assert replica.sessions == 1
+        assert replica.active_sessions == 0
+
+    async def test_round_robin(self, databases):
+        """Test that replicas take turns."""
+        primary, replica_a, replica_b = databases
+        manager = SessionManager(primary, replicas=[replica_a, replica_b])
+
+        sources = [await _read_source(manager) for _ in range(4)]
+
+        assert sources == ["replica_a", "replica_b", "replica_a", "replica_b"]
+
+    async def test_least_connections(self, databases):
+        """Test that the replica with fewer open sessions is chosen."""
+        primary, replica_a, replica_b = databases
+        manager = SessionManager(
+            primary,
+            replicas=[replica_a, replica_b],
+            replica_strategy="least_connections",
+        )
+
+        async with manager.get_session(readonly=True) as held:
+            assert held.info["replica"].endswith("replica_a.db")
+            assert await _read_source(manager) == "replica_b"
+        assert await _read_source(manager) == "replica_a"
+
+    async def test_read_your_writes(self, databases):
+        """Test that reads stay on the primary after committing a write."""
+        primary, replica_a, _ = databases
+        manager = SessionManager(primary, replicas=[replica_a], sticky_seconds=60)
+
+        async with manager.get_session() as session:
+            await session.scalars(select(Source))
+            await session.commit()
+        assert await _read_source(manager) == "replica_a"
+
+        async with manager.get_session() as session:
+            session.add(Source(name="new"))
+            await session.commit()
+        assert await _read_source(manager) == "primary"
+
+        clear_write()
+        assert await _read_source(manager) == "replica_a"
+
+    async def test_unchecked_replica_skipped_after_write(self, databases):
+        """Test that a replica with unknown lag is not used after a write."""
+        primary, replica_a, _ = databases
+        manager = SessionManager(primary, replicas=[replica_a], sticky_seconds=0)
+
+        async with manager.get_transaction() as session:
+            session.add(Source(name="new"))
+        assert await _read_source(manager) == "primary"
+
+        await manager.check_replicas()
+        assert await _read_source(manager) == "replica_a"
+
+    async def test_global_get_session(self, databases, monkeypatch):
+        """Test that the module-level get_session reaches the replicas."""
+        primary, replica_a, _ = databases
+        monkeypatch.setattr(session_module, "_session_manager", None)
+        initialize_session_manager(primary, replicas=[replica_a])
+
+        async with get_session(readonly=True) as session:
+            assert (await session.scalars(select(Source.name))).first() == "replica_a"
+        async with get_session() as session:
+            assert (await session.scalars(select(Source.name))).first() == "primary"
+
+    async def test_lagging_replica_skipped_after_write(self, databases):
+        """Test that a replica behind the last write is not used."""
+        primary, replica_a, _ = databases
+        manager = SessionManager(primary, replicas=[replica_a], sticky_seconds=0)
+        manager.replica_router.replicas[0].lag_seconds = 30.0
+
+        async with manager.get_transaction() as session:
+            session.add(Source(name="new"))
+
+        assert await _read_source(manager) == "primary"
+        assert manager.get_replica_status()["primary_fallbacks"] == 1
+
+
+class TestReplicaFallback:
+    """Test cases for falling back to the primary."""
+
+    async def test_failed_check_ejects_replica(self, databases, tmp_path):
+        """Test that an unreachable replica is skipped after a check."""
+        primary, replica_a, _ = databases
+        broken = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}"
+        )
+        manager = SessionManager(primary, replicas=[broken, replica_a])
+
+        states = await manager.check_replicas()
+
+        assert [state["healthy"] for state in states] == [False, True]
+        assert "OperationalError" in states[0]["last_error"]
+        assert {await _read_source(manager) for _ in range(3)} == {"replica_a"}
+        await broken.dispose()
+
+    async def test_session_error_ejects_replica(self, databases):
+        """Test that a connection error on a replica ejects it."""
+        primary, replica_a, _ = databases
+        manager = SessionManager(primary, replicas=[replica_a])
+
+        with pytest.raises(OperationalError):
+            async with manager.get_session(readonly=True):
+                raise OperationalError("SELECT 1", {}, Exception("server closed"))
+
+        assert await _read_source(manager) == "primary"
+        status = manager.get_replica_status()
+        assert status["replicas"][0]["healthy"] is False
+        assert status["primary_fallbacks"] == 1
+
+    async def test_lag_over_limit_ejects_replica(self, databases):
+        """Test that check_replicas ejects replicas lagging over the limit."""
+        primary, replica_a, _ = databases
+        manager = SessionManager(primary, replicas=[replica_a], max_replica_lag=0)
+        router = manager.replica_router
+
+        assert (await manager.check_replicas())[0]["lag_seconds"] == 0.0
+        assert router.replicas[0].healthy
+
+        router.max_lag_seconds = -1
+        await manager.check_replicas()
+        assert not router.replicas[0].healthy
+        assert await _read_source(manager) == "primary"
+
+        # The cooldown alone does not bring a lagging replica back
+        router.replicas[0].ejected_until = 0.0
+        assert await _read_source(manager) == "primary"
+
+        router.max_lag_seconds = 0
+        assert (await manager.check_replicas())[0]["lagging"] is False
+        assert await _read_source(manager) == "replica_a"
+
+    async def test_health_monitor_checks_replicas(self, databases):
+        """Test that starting the health monitor starts the replica checks."""
+        primary, replica_a, _ = databases
+        manager = SessionManager(primary, replicas=[replica_a], max_replica_lag=-1)
+        router = manager.replica_router
+
+        manager.start_health_monitor(interval=60)
+        try:
+            while router.replicas[0].last_checked_at is None:
+                await asyncio.sleep(0.01)
+            assert router.replicas[0].lagging
+            assert await _read_source(manager) == "primary"
+        finally:
+            await manager.stop_health_monitor()
+
+        assert router._check_task is None
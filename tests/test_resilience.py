@@ -0,0 +1,269 @@
+"""
+Tests for resilient execution of database operations.
+
+This module tests full-jitter backoff, error classification, the circuit
+breaker states, request deadlines, and retries through SessionManager and
+handle_database_retry.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlalchemy.exc import DisconnectionError, IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from vet_core.database import (
+    CircuitBreaker,
+    CircuitState,
+    ResilientExecutor,
+    RetryPolicy,
+    SessionManager,
+    deadline,
+    get_resilient_executor,
+    is_transient_error,
+    remaining_time,
+)
+from vet_core.exceptions import (
+    CircuitOpenException,
+    ConnectionException,
+    DatabaseException,
+    DeadlineExceededException,
+    handle_database_retry,
+)
+
+FAST = RetryPolicy(max_retries=3, base_delay=0.001, jitter=False)
+
+
+class Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _flaky(failures, error=None):
+    """Build an operation failing a number of times before succeeding."""
+    calls = []
+
+    async def operation():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error or DisconnectionError("Connection lost")
+        return "ok"
+
+    operation.calls = calls
+    return operation
+
+
+class TestRetryPolicyAndClassification:
+    """Test cases for backoff delays and error classification."""
+
+    def test_full_jitter_within_capped_backoff(self):
+        """Test that jittered delays spread between zero and the backoff."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+        delays = [policy.compute_delay(4) for _ in range(200)]
+
+        assert all(0.0 <= delay <= 5.0 for delay in delays)
+        assert len(set(delays)) > 100
+        assert RetryPolicy(jitter=False).compute_delay(2) == 4.0
+        assert RetryPolicy(jitter=False, exponential=False).compute_delay(2) == 1.0
+
+    @pytest.mark.parametrize(
+        "error, transient",
+        [
+            (DisconnectionError("Connection lost"), True),
+            (OperationalError("SELECT 1", {}, Exception("server closed")), True),
+            (
+                OperationalError("", {}, Exception("password authentication failed")),
+                False,
+            ),
+            (IntegrityError("INSERT", {}, Exception("duplicate key")), False),
+            (ConnectionException("Connection timeout"), True),
+            (DatabaseException("Gave up", retry_count=3, max_retries=3), False),
+            (ValueError("bad input"), False),
+        ],
+    )
+    def test_classification(self, error, transient):
+        """Test that retry decisions follow DatabaseException.is_retryable."""
+        assert is_transient_error(error) is transient
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test_opens_then_half_opens_then_closes(self):
+        """Test the closed, open and half-open transitions."""
+        clock = Clock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenException) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.details["retry_after"] == 10
+        assert not exc_info.value.is_retryable()
+
+        clock.now += 10
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitOpenException):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        assert (breaker.trips, breaker.rejected) == (1, 2)
+
+    def test_failed_trial_reopens(self):
+        """Test that a failed half-open trial opens the breaker again."""
+        clock = Clock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=clock)
+        breaker.record_failure()
+        clock.now += 5
+
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.trips == 2
+
+
+class TestResilientExecutor:
+    """Test cases for ResilientExecutor."""
+
+    async def test_retries_transient_failures(self):
+        """Test that transient failures are retried and counted."""
+        executor = ResilientExecutor(CircuitBreaker(failure_threshold=10))
+        operation = _flaky(2)
+
+        assert await executor.run(operation, FAST) == "ok"
+
+        stats = executor.stats()
+        assert len(operation.calls) == 3
+        assert (stats.calls, stats.retries, stats.successes) == (1, 2, 1)
+        assert stats.consecutive_failures == 0
+
+    async def test_non_transient_errors_are_not_retried(self):
+        """Test that errors such as integrity violations are raised at once."""
+        executor = ResilientExecutor(CircuitBreaker())
+        operation = _flaky(5, IntegrityError("INSERT", {}, Exception("duplicate")))
+
+        with pytest.raises(IntegrityError):
+            await executor.run(operation, FAST)
+
+        assert len(operation.calls) == 1
+        assert executor.stats().consecutive_failures == 0
+
+    async def test_breaker_is_shared_and_rejects_calls(self):
+        """Test that failures of one caller open the breaker for others."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        first, second = ResilientExecutor(breaker), ResilientExecutor(breaker)
+
+        failing = _flaky(10)
+        with pytest.raises(CircuitOpenException):
+            await first.run(failing, FAST)
+        operation = _flaky(0)
+        with pytest.raises(CircuitOpenException):
+            await second.run(operation, FAST)
+
+        assert len(failing.calls) == 3
+        assert operation.calls == []
+        stats = second.stats()
+        assert stats.circuit_state == "open"
+        assert (stats.circuit_trips, stats.circuit_rejections) == (1, 2)
+
+    async def test_deadline_stops_retries(self):
+        """Test that backoff sleeps never run past the deadline."""
+        executor = ResilientExecutor()
+        policy = RetryPolicy(max_retries=10, base_delay=1.0, jitter=False)
+
+        with deadline(0.2):
+            with pytest.raises(DeadlineExceededException) as exc_info:
+                await executor.run(_flaky(10), policy, "list_pets")
+
+        assert exc_info.value.details["attempts"] == 1
+        assert exc_info.value.details["operation"] == "list_pets"
+        assert executor.stats().deadline_exceeded == 1
+
+    async def test_deadline_bounds_an_attempt(self):
+        """Test that a slow attempt is cut off at the deadline."""
+
+        async def slow():
+            await asyncio.sleep(1)
+
+        with deadline(0.05):
+            with pytest.raises(DeadlineExceededException):
+                await ResilientExecutor().run(slow, FAST)
+
+    async def test_nested_deadlines_never_extend(self):
+        """Test that an inner deadline keeps the earlier outer one."""
+        assert remaining_time() is None
+        with deadline(0.5) as outer:
+            with deadline(60) as inner:
+                assert inner == outer
+                assert 0 < await asyncio.create_task(_remaining()) <= 0.5
+        assert remaining_time() is None
+
+
+async def _remaining():
+    """Read the remaining time from another task."""
+    return remaining_time()
+
+
+class TestRetryIntegration:
+    """Test cases for SessionManager and handle_database_retry."""
+
+    async def test_session_manager_uses_engine_breaker(self):
+        """Test that execute_with_retry shares the engine's breaker."""
+        engine = Mock(spec=AsyncEngine)
+        engine.sync_engine = Mock()
+        manager = SessionManager(engine)
+        executor = get_resilient_executor(engine)
+        assert get_resilient_executor(engine) is executor
+
+        async def failing_operation(session):
+            raise DisconnectionError("Connection lost")
+
+        with patch.object(manager, "get_transaction") as mock_get_transaction:
+            mock_get_transaction.return_value.__aenter__.return_value = AsyncMock()
+            with pytest.raises(DatabaseException, match="after 3 attempts"):
+                await manager.execute_with_retry(
+                    failing_operation, max_retries=2, retry_delay=0.001
+                )
+            # The fifth consecutive failure opens the breaker mid-retry
+            with pytest.raises(CircuitOpenException):
+                await manager.execute_with_retry(
+                    failing_operation, max_retries=2, retry_delay=0.001
+                )
+
+        stats = manager.get_resilience_stats()
+        assert stats.circuit_state == "open"
+        assert stats.retries == 4
+        assert stats.circuit_trips == 1
+
+    async def test_decorator_retries_with_jitter(self):
+        """Test that handle_database_retry draws jittered delays."""
+        calls = []
+
+        @handle_database_retry("load_pets", max_retries=2, base_delay=0.01)
+        async def load_pets():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ConnectionException("Connection timeout")
+            return "ok"
+
+        with patch(
+            "vet_core.database.resilience.random.uniform", return_value=0.0
+        ) as mock_uniform:
+            assert await load_pets() == "ok"
+
+        assert len(calls) == 3
+        assert [call.args for call in mock_uniform.call_args_list] == [
+            (0.0, 0.01),
+            (0.0, 0.02),
+        ]
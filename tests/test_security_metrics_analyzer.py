@@ -3,13 +3,18 @@
 import json
 import sqlite3
 import tempfile
+from collections import Counter
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from vet_core.security.audit_trail import AuditEvent, AuditEventType
+from vet_core.security.audit_trail import (
+    AuditEvent,
+    AuditEventType,
+    SecurityAuditTrail,
+)
 from vet_core.security.metrics_analyzer import (
     MetricPoint,
     SecurityMetrics,
@@ -661,3 +666,235 @@ class TestSecurityMetricsAnalyzer:
         finally:
             if temp_path.exists():
                 temp_path.unlink()
+
+
+class TestSecurityMetricsRollups:
+    """Test cases for the incremental metrics rollups."""
+
+    BASE = datetime(2030, 1, 7, 9, 30)
+
+    @pytest.fixture
+    def audit_trail(self, tmp_path):
+        """Create a real audit trail to roll up."""
+        trail = SecurityAuditTrail(
+            audit_db_path=tmp_path / "audit.db", log_file_path=tmp_path / "audit.log"
+        )
+        yield trail
+        trail.close()
+
+    @pytest.fixture
+    def analyzer(self, audit_trail, tmp_path):
+        """Create an analyzer over the real audit trail."""
+        mock_tracker = Mock()
+        mock_tracker.get_all_tracking_records.return_value = []
+        return SecurityMetricsAnalyzer(
+            audit_trail=audit_trail,
+            status_tracker=mock_tracker,
+            metrics_db_path=tmp_path / "metrics.db",
+        )
+
+    def _log(self, audit_trail, event_type, timestamp, vulnerability_id=None):
+        """Log an audit event at a given time."""
+        audit_trail.log_event(
+            AuditEvent(
+                event_type=event_type,
+                timestamp=timestamp,
+                vulnerability_id=vulnerability_id,
+            )
+        )
+
+    def _rollup(self, analyzer, granularity, event_type):
+        """Read a rollup as a dictionary of bucket to count."""
+        with sqlite3.connect(analyzer.metrics_db_path) as conn:
+            return dict(
+                conn.execute(
+                    "SELECT bucket, event_count FROM event_rollups "
+                    "WHERE granularity = ? AND event_type = ?",
+                    (granularity, event_type.value),
+                )
+            )
+
+    def test_refresh_only_processes_new_events(self, analyzer, audit_trail):
+        """Test each refresh rolls up the events after the watermark."""
+        for minutes in (0, 10, 45, 24 * 60):
+            self._log(
+                audit_trail,
+                AuditEventType.SCAN_COMPLETED,
+                self.BASE + timedelta(minutes=minutes),
+            )
+
+        assert analyzer.refresh_rollups() == 4
+        assert analyzer.refresh_rollups() == 0
+
+        self._log(
+            audit_trail, AuditEventType.SCAN_COMPLETED, self.BASE + timedelta(minutes=5)
+        )
+        assert analyzer.refresh_rollups() == 1
+
+        assert self._rollup(analyzer, "hourly", AuditEventType.SCAN_COMPLETED) == {
+            "2030-01-07T09:00:00": 3,
+            "2030-01-07T10:00:00": 1,
+            "2030-01-08T09:00:00": 1,
+        }
+        assert self._rollup(analyzer, "daily", AuditEventType.SCAN_COMPLETED) == {
+            "2030-01-07T00:00:00": 4,
+            "2030-01-08T00:00:00": 1,
+        }
+
+    def test_count_events_matches_raw_events(self, analyzer, audit_trail):
+        """Test rollup-backed counts equal counting the raw events."""
+        event_types = [
+            AuditEventType.SCAN_COMPLETED,
+            AuditEventType.VULNERABILITY_DETECTED,
+            AuditEventType.POLICY_VIOLATION,
+        ]
+        for index in range(300):
+            self._log(
+                audit_trail,
+                event_types[index % 3],
+                self.BASE + timedelta(minutes=index * 37),
+            )
+        analyzer.refresh_rollups()
+
+        for start, end in [
+            (self.BASE + timedelta(minutes=13), self.BASE + timedelta(days=6, hours=5)),
+            (self.BASE + timedelta(hours=2), self.BASE + timedelta(hours=3)),
+            (self.BASE, self.BASE + timedelta(minutes=20)),
+        ]:
+            expected = Counter(
+                event.event_type.value
+                for event in audit_trail.get_audit_events(
+                    start_date=start, end_date=end
+                )
+            )
+            assert analyzer._count_events(start, end) == expected
+
+    def test_time_metrics_match_raw_events(self, analyzer, audit_trail):
+        """Test milestone rollups give the same lifecycle metrics as raw events."""
+        for index in range(5):
+            detected = self.BASE + timedelta(hours=index)
+            vulnerability_id = f"vuln-{index}"
+            self._log(
+                audit_trail,
+                AuditEventType.VULNERABILITY_DETECTED,
+                detected,
+                vulnerability_id,
+            )
+            self._log(
+                audit_trail,
+                AuditEventType.RISK_ASSESSMENT_PERFORMED,
+                detected + timedelta(hours=2),
+                vulnerability_id,
+            )
+            if index % 2:
+                self._log(
+                    audit_trail,
+                    AuditEventType.VULNERABILITY_RESOLVED,
+                    detected + timedelta(hours=index * 10),
+                    vulnerability_id,
+                )
+        analyzer.refresh_rollups()
+
+        start, end = self.BASE - timedelta(days=1), self.BASE + timedelta(days=3)
+        expected = analyzer._calculate_time_based_metrics(
+            audit_trail.get_audit_events(start_date=start, end_date=end), []
+        )
+
+        assert analyzer._calculate_time_based_metrics_from_rollups(
+            start, end
+        ) == pytest.approx(expected)
+
+    def test_analyze_event_trends_from_rollups(self, analyzer, audit_trail):
+        """Test event metrics trend over daily and weekly rollup points."""
+        now = datetime.now()
+        for days_ago, scans in ((20, 1), (12, 2), (5, 4), (1, 6)):
+            for _ in range(scans):
+                self._log(
+                    audit_trail,
+                    AuditEventType.SCAN_COMPLETED,
+                    now - timedelta(days=days_ago),
+                )
+
+        with patch.object(analyzer, "_get_trend_data") as mock_get_trend:
+            daily = analyzer.analyze_trends(["scan_completed"], period_days=30)
+            weekly = analyzer.analyze_trends(
+                ["scan_completed"], period_days=30, granularity="weekly"
+            )
+
+        mock_get_trend.assert_not_called()
+        assert [point.value for point in daily[0].data_points] == [1, 2, 4, 6]
+        assert daily[0].trend_direction == "increasing"
+        assert daily[0].r_squared > 0.9
+        assert daily[0].to_dict()["moving_average"] == [1.0, 1.5, 7 / 3, 3.25]
+        assert sum(point.value for point in weekly[0].data_points) == 13
+        assert all(point.timestamp.weekday() == 0 for point in weekly[0].data_points)
+
+    def test_current_metrics_from_rollups(self, analyzer, audit_trail):
+        """Test current metrics read event counts from the rollups."""
+        now = datetime.now()
+        for days_ago in range(10):
+            self._log(
+                audit_trail,
+                AuditEventType.SCAN_COMPLETED,
+                now - timedelta(days=days_ago, minutes=1),
+            )
+            self._log(
+                audit_trail,
+                AuditEventType.VULNERABILITY_DETECTED,
+                now - timedelta(days=days_ago, minutes=2),
+            )
+
+        with patch.object(audit_trail, "get_audit_events") as mock_get_events:
+            metrics = analyzer.calculate_current_metrics(
+                period_days=30, include_trends=False
+            )
+
+        mock_get_events.assert_not_called()
+        assert metrics.scan_frequency == pytest.approx(10 / 30)
+        assert metrics.detection_rate == pytest.approx(1.0)
+
+    def test_rollups_rebuilt_for_new_audit_database(self, analyzer, tmp_path):
+        """Test pointing the analyzer at another audit database starts over."""
+        self._log(analyzer.audit_trail, AuditEventType.SCAN_COMPLETED, self.BASE)
+        assert analyzer.refresh_rollups() == 1
+
+        other = SecurityAuditTrail(
+            audit_db_path=tmp_path / "other.db", log_file_path=tmp_path / "other.log"
+        )
+        try:
+            for _ in range(2):
+                self._log(other, AuditEventType.POLICY_VIOLATION, self.BASE)
+            analyzer.audit_trail = other
+
+            assert analyzer.refresh_rollups() == 2
+            assert self._rollup(analyzer, "daily", AuditEventType.SCAN_COMPLETED) == {}
+        finally:
+            other.close()
+
+    def test_counts_kept_after_cleanup(self, analyzer, audit_trail):
+        """Test cleaned up events stay counted and reused rowids are rolled up."""
+        old = datetime(2020, 1, 6, 9, 30)
+        for _ in range(2):
+            self._log(audit_trail, AuditEventType.SCAN_COMPLETED, old)
+        assert analyzer.refresh_rollups() == 2
+
+        assert audit_trail.cleanup_old_events() == 2
+        for _ in range(3):
+            self._log(audit_trail, AuditEventType.SCAN_COMPLETED, self.BASE)
+
+        assert analyzer.refresh_rollups() == 3
+        assert analyzer.refresh_rollups() == 0
+        assert self._rollup(analyzer, "daily", AuditEventType.SCAN_COMPLETED) == {
+            "2020-01-06T00:00:00": 2,
+            "2030-01-07T00:00:00": 3,
+        }
+
+    def test_no_rollups_without_audit_database(self, tmp_path):
+        """Test refresh is skipped when the audit trail has no database."""
+        analyzer = SecurityMetricsAnalyzer(
+            audit_trail=Mock(),
+            status_tracker=Mock(),
+            metrics_db_path=tmp_path / "metrics.db",
+        )
+
+        assert analyzer.refresh_rollups() is None
@@ -657,6 +657,291 @@ class TestVulnerabilityStatusTracker:
         record = tracker._load_tracking_record(non_existent_id)
         assert record is None
 
+    def _track_many(self, tracker, count):
+        """Track several vulnerabilities and move some of them forward."""
+        for i in range(count):
+            tracker.track_vulnerability(
+                Vulnerability(
+                    id=f"bulk-{i}",
+                    package_name=f"package-{i}",
+                    installed_version="1.0.0",
+                    fix_versions=["1.0.1"],
+                    severity=(
+                        VulnerabilitySeverity.HIGH
+                        if i % 2
+                        else VulnerabilitySeverity.LOW
+                    ),
+                    description=f"Desc {i}",
+                ),
+                assigned_to="team-a" if i % 3 == 0 else None,
+            )
+            if i % 2:
+                tracker.update_status(
+                    f"bulk-{i}", VulnerabilityStatus.DETECTED, reason="Triaged"
+                )
+                tracker.update_status(
+                    f"bulk-{i}", VulnerabilityStatus.ASSESSED, reason="Assessed"
+                )
+
+    def test_bulk_load_matches_single_record_load(
+        self, tracker, mock_audit_trail, temp_db_path
+    ):
+        """Test bulk loaded records equal records loaded one at a time."""
+        self._track_many(tracker, 6)
+
+        fresh = VulnerabilityStatusTracker(
+            audit_trail=mock_audit_trail, tracking_db_path=temp_db_path
+        )
+        bulk = {r.vulnerability_id: r for r in fresh.get_all_tracking_records()}
+
+        assert len(bulk) == 6
+        for vulnerability_id, record in bulk.items():
+            single = fresh._load_tracking_record(vulnerability_id)
+            assert record.current_status == single.current_status
+            assert record.assigned_to == single.assigned_to
+            assert [c.change_id for c in record.status_history] == [
+                c.change_id for c in single.status_history
+            ]
+            assert (
+                record.progress_metrics.current_stage
+                == single.progress_metrics.current_stage
+            )
+        assert [c.new_status for c in bulk["bulk-1"].status_history] == [
+            VulnerabilityStatus.NEW,
+            VulnerabilityStatus.DETECTED,
+            VulnerabilityStatus.ASSESSED,
+        ]
+
+        filtered = fresh.get_all_tracking_records(
+            status_filter=VulnerabilityStatus.ASSESSED,
+            assigned_to_filter="team-a",
+        )
+        assert [r.vulnerability_id for r in filtered] == ["bulk-3"]
+        assert len(filtered[0].status_history) == 3
+
+    def test_bulk_load_uses_three_queries_on_one_connection(
+        self, tracker, mock_audit_trail, temp_db_path
+    ):
+        """Test loading all records costs three queries however many exist."""
+        self._track_many(tracker, 20)
+        fresh = VulnerabilityStatusTracker(
+            audit_trail=mock_audit_trail, tracking_db_path=temp_db_path
+        )
+
+        connections = []
+        statements = []
+        real_connect = sqlite3.connect
+
+        def _connect(*args, **kwargs):
+            conn = real_connect(*args, **kwargs)
+            conn.set_trace_callback(statements.append)
+            connections.append(conn)
+            return conn
+
+        with patch(
+            "vet_core.security.status_tracker.sqlite3.connect", side_effect=_connect
+        ):
+            records = fresh.get_all_tracking_records()
+
+        assert len(records) == 20
+        assert len(connections) == 1
+        assert len(statements) == 3
+
+    def test_get_all_tracking_records_returns_cached_instances(
+        self, tracker, sample_vulnerability
+    ):
+        """Test cached records are returned so in-memory updates are kept."""
+        record = tracker.track_vulnerability(sample_vulnerability)
+
+        assert tracker.get_all_tracking_records() == [record]
+        assert tracker.get_all_tracking_records()[0] is record
+
+    def _track_at(self, tracker, vulnerability_id, severity, created_at, **kwargs):
+        """Track a vulnerability as if it had been detected at created_at."""
+        with patch("vet_core.security.status_tracker.datetime") as mock_datetime:
+            mock_datetime.now.return_value = created_at
+            tracker.track_vulnerability(
+                Vulnerability(
+                    id=vulnerability_id,
+                    package_name=f"{vulnerability_id}-package",
+                    installed_version="1.0.0",
+                    fix_versions=["1.0.1"],
+                    severity=severity,
+                    description="Desc",
+                ),
+                **kwargs,
+            )
+
+    def test_progress_summary_aggregates_in_sql(self, tracker):
+        """Test summary counts, progress and overdue totals."""
+        now = datetime.now()
+        self._track_at(
+            tracker,
+            "late-critical",
+            VulnerabilitySeverity.CRITICAL,
+            now - timedelta(days=3),
+        )
+        self._track_at(
+            tracker,
+            "late-closed",
+            VulnerabilitySeverity.CRITICAL,
+            now - timedelta(days=3),
+            initial_status=VulnerabilityStatus.CLOSED,
+        )
+        self._track_at(tracker, "fresh-low", VulnerabilitySeverity.LOW, now)
+        self._track_at(
+            tracker,
+            "fresh-testing",
+            VulnerabilitySeverity.LOW,
+            now,
+            initial_status=VulnerabilityStatus.TESTING,
+        )
+
+        summary = tracker.get_progress_summary()
+
+        assert summary["total_vulnerabilities"] == 4
+        assert summary["status_distribution"]["new"] == 2
+        assert summary["status_distribution"]["closed"] == 1
+        assert summary["status_distribution"]["testing"] == 1
+        assert summary["severity_distribution"]["critical"] == 2
+        assert summary["severity_distribution"]["low"] == 2
+        progress = summary["progress_metrics"]
+        assert progress["average_progress_percentage"] == pytest.approx(50.0)
+        assert progress["completed_count"] == 1
+        assert progress["completion_rate"] == pytest.approx(25.0)
+        assert progress["overdue_count"] == 1
+
+    def test_progress_summary_empty(self, tracker):
+        """Test the summary of a tracker with no records."""
+        summary = tracker.get_progress_summary()
+
+        assert summary["total_vulnerabilities"] == 0
+        assert summary["progress_metrics"]["average_progress_percentage"] == 0.0
+        assert summary["progress_metrics"]["completion_rate"] == 0.0
+
+    def test_overdue_vulnerabilities_most_overdue_first(self, tracker):
+        """Test only open records past their SLA are returned, oldest first."""
+        now = datetime.now()
+        self._track_at(
+            tracker, "high-late", VulnerabilitySeverity.HIGH, now - timedelta(days=4)
+        )
+        self._track_at(
+            tracker,
+            "critical-later",
+            VulnerabilitySeverity.CRITICAL,
+            now - timedelta(days=10),
+        )
+        self._track_at(
+            tracker,
+            "closed-late",
+            VulnerabilitySeverity.CRITICAL,
+            now - timedelta(days=10),
+            initial_status=VulnerabilityStatus.CLOSED,
+        )
+        self._track_at(tracker, "medium-ok", VulnerabilitySeverity.MEDIUM, now)
+
+        overdue = tracker.get_overdue_vulnerabilities()
+
+        assert [r.vulnerability_id for r in overdue] == ["critical-later", "high-late"]
+        assert all(r.progress_metrics.is_overdue for r in overdue)
+
+    def test_summary_queries_use_covering_indexes(self, tracker):
+        """Test the aggregate queries are planned on the new indexes."""
+        with sqlite3.connect(tracker.tracking_db_path) as conn:
+            grouped_plan = " ".join(
+                row[-1]
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT current_status, severity, COUNT(*) "
+                    "FROM tracking_records GROUP BY current_status, severity"
+                )
+            )
+            overdue_plan = " ".join(
+                row[-1]
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM tracking_records "
+                    "WHERE sla_deadline < ? AND current_status NOT IN (?, ?)",
+                    ["2030-01-01T00:00:00", "closed", "ignored"],
+                )
+            )
+
+        assert "COVERING INDEX idx_tracking_status_severity" in grouped_plan
+        assert "COVERING INDEX idx_tracking_sla_deadline" in overdue_plan
+
+    def test_sla_deadline_backfilled_for_existing_database(
+        self, mock_audit_trail, temp_db_path
+    ):
+        """Test older databases get the sla_deadline column on startup."""
+        deadline = (datetime.now() - timedelta(days=1)).isoformat()
+        created_at = (datetime.now() - timedelta(days=5)).isoformat()
+        with sqlite3.connect(temp_db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE tracking_records (
+                    vulnerability_id TEXT PRIMARY KEY, package_name TEXT NOT NULL,
+                    severity TEXT NOT NULL, current_status TEXT NOT NULL,
+                    created_at TEXT NOT NULL, updated_at TEXT NOT NULL,
+                    assigned_to TEXT, priority_score REAL DEFAULT 0.0,
+                    estimated_effort_hours REAL, actual_effort_hours REAL,
+                    tags TEXT, metadata TEXT
+                )
+                """
+            )
+            conn.execute(
+                "INSERT INTO tracking_records VALUES "
+                "('legacy', 'pkg', 'high', 'new', ?, ?, NULL, 0.0, NULL, NULL, '[]', '{}')",
+                (created_at, created_at),
+            )
+            conn.execute(
+                """
+                CREATE TABLE progress_metrics (
+                    vulnerability_id TEXT PRIMARY KEY, current_stage TEXT NOT NULL,
+                    progress_percentage REAL NOT NULL, estimated_completion_time TEXT,
+                    sla_deadline TEXT, completion_confidence REAL DEFAULT 0.5,
+                    calculated_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "INSERT INTO progress_metrics VALUES "
+                "('legacy', 'discovery', 10.0, NULL, ?, 0.5, ?)",
+                (deadline, created_at),
+            )
+
+        tracker = VulnerabilityStatusTracker(
+            audit_trail=mock_audit_trail, tracking_db_path=temp_db_path
+        )
+
+        assert tracker.get_progress_summary()["progress_metrics"]["overdue_count"] == 1
+        assert [r.vulnerability_id for r in tracker.get_overdue_vulnerabilities()] == [
+            "legacy"
+        ]
+
+    def test_progress_summary_survives_database_errors(self, tracker, temp_db_path):
+        """Test that a broken database yields a zeroed summary instead of raising."""
+        with sqlite3.connect(temp_db_path) as conn:
+            conn.execute("DROP TABLE tracking_records")
+
+        summary = tracker.get_progress_summary()
+
+        assert summary["total_vulnerabilities"] == 0
+        assert summary["progress_metrics"]["overdue_count"] == 0
+        assert summary["progress_metrics"]["completion_rate"] == 0.0
+        assert set(summary["status_distribution"].values()) == {0}
+
+    def test_overdue_condition_follows_final_statuses(self, tracker):
+        """Test that the final status placeholders match FINAL_STATUSES."""
+        tracker.FINAL_STATUSES = (
+            VulnerabilityStatus.CLOSED,
+            VulnerabilityStatus.IGNORED,
+            VulnerabilityStatus.RESOLVED,
+        )
+
+        condition, params = tracker._open_status_condition()
+
+        assert condition == "current_status NOT IN (?, ?, ?)"
+        assert params == ["closed", "ignored", "resolved"]
+        assert tracker.get_progress_summary()["progress_metrics"]["overdue_count"] == 0
+
     def test_database_initialization(self, mock_audit_trail, temp_db_path):
         """Test that database is properly initialized."""
         # Create tracker (this should initialize the database)
@@ -0,0 +1,200 @@
+"""
+Tests for clinic-keyed sharding.
+
+This module tests the consistent hash directory, routing sessions by clinic
+context, and scatter-gather queries across shards, with local SQLite
+databases standing in for the shards.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import Integer, String, func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from vet_core.database import (
+    ConsistentHashDirectory,
+    ShardRouter,
+    clinic_context,
+    get_current_clinic,
+    get_shard_router,
+    get_shard_session,
+    initialize_shard_router,
+)
+from vet_core.exceptions import DatabaseException, ShardRoutingException
+
+SHARDS = ("shard_a", "shard_b", "shard_c")
+
+
+class Base(DeclarativeBase):
+    """Declarative base for the sharding tests."""
+
+
+class Visit(Base):
+    """Clinic-owned row stored on the clinic's shard."""
+
+    __tablename__ = "visits"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    clinic_id: Mapped[str] = mapped_column(String(36))
+    position: Mapped[int] = mapped_column(Integer)
+
+
+@pytest.fixture
+async def router(tmp_path):
+    """Create a router over three SQLite shards."""
+    engines = {}
+    for name in SHARDS:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        engines[name] = engine
+    yield ShardRouter(engines)
+    for engine in engines.values():
+        await engine.dispose()
+
+
+def _clinics(count):
+    """Generate clinic IDs."""
+    return [str(uuid.UUID(int=index + 1)) for index in range(count)]
+
+
+async def _add_visits(router, clinic_ids):
+    """Store one visit per clinic on the clinic's shard."""
+    for position, clinic_id in enumerate(clinic_ids):
+        with clinic_context(clinic_id):
+            async with router.get_transaction() as session:
+                session.add(Visit(clinic_id=clinic_id, position=position))
+
+
+class TestConsistentHashDirectory:
+    """Test cases for ConsistentHashDirectory."""
+
+    def test_spreads_clinics_and_is_stable(self):
+        """Test that clinics spread over shards the same way every time."""
+        clinics = _clinics(3000)
+        directory = ConsistentHashDirectory(SHARDS)
+        placement = [directory.shard_for(clinic) for clinic in clinics]
+
+        assert placement == [
+            ConsistentHashDirectory(SHARDS).shard_for(clinic) for clinic in clinics
+        ]
+        for shard in SHARDS:
+            assert 700 < placement.count(shard) < 1300
+
+    def test_adding_a_shard_moves_few_clinics(self):
+        """Test that a new shard only takes clinics from the others."""
+        clinics = _clinics(3000)
+        directory = ConsistentHashDirectory(SHARDS)
+        before = {clinic: directory.shard_for(clinic) for clinic in clinics}
+
+        directory.add_shard("shard_d")
+        moved = [
+            clinic
+            for clinic in clinics
+            if directory.shard_for(clinic) != before[clinic]
+        ]
+
+        assert all(directory.shard_for(clinic) == "shard_d" for clinic in moved)
+        assert 500 < len(moved) < 1100
+
+        directory.remove_shard("shard_d")
+        assert {clinic: directory.shard_for(clinic) for clinic in clinics} == before
+
+    def test_pinned_clinics(self):
+        """Test that pinned clinics ignore the ring."""
+        clinic = _clinics(1)[0]
+        directory = ConsistentHashDirectory(SHARDS, pinned={clinic: "shard_c"})
+        assert directory.shard_for(clinic) == "shard_c"
+
+        directory.unpin(clinic)
+        directory.pin(uuid.UUID(clinic), "shard_a")
+        assert directory.shard_for(clinic) == "shard_a"
+
+        with pytest.raises(ShardRoutingException):
+            directory.pin(clinic, "shard_z")
+
+
+class TestShardRouter:
+    """Test cases for ShardRouter."""
+
+    async def test_sessions_follow_clinic_context(self, router):
+        """Test that each clinic's rows are stored on its own shard."""
+        clinics = _clinics(12)
+        await _add_visits(router, clinics)
+
+        for clinic in clinics:
+            shard = router.shard_for(clinic)
+            with clinic_context(clinic):
+                assert get_current_clinic() == clinic
+                async with router.get_session() as session:
+                    assert session.info["shard"] == shard
+                    stored = await session.scalar(
+                        select(Visit.clinic_id).where(Visit.clinic_id == clinic)
+                    )
+                    assert stored == clinic
+        assert get_current_clinic() is None
+
+    async def test_missing_clinic_is_rejected(self, router):
+        """Test that sessions need a clinic."""
+        with pytest.raises(ShardRoutingException) as exc_info:
+            async with router.get_session():
+                pass
+
+        assert exc_info.value.error_code == "DATABASE_SHARD_ROUTING_ERROR"
+        with pytest.raises(ShardRoutingException):
+            ShardRouter(router.managers, ConsistentHashDirectory(["other"]))
+
+    async def test_scatter_gather(self, router):
+        """Test that an operation runs on every shard."""
+        await _add_visits(router, _clinics(30))
+
+        async def count(session):
+            return await session.scalar(select(func.count()).select_from(Visit))
+
+        counts = await router.scatter_gather(count)
+
+        assert set(counts) == set(SHARDS)
+        assert sum(counts.values()) == 30
+        assert all(counts.values())
+
+    async def test_fetch_all_merges_in_order(self, router):
+        """Test that sorted shard results are merged in order with a limit."""
+        await _add_visits(router, _clinics(30))
+
+        visits = await router.fetch_all(
+            select(Visit).order_by(Visit.position.desc()),
+            key=lambda visit: visit.position,
+            reverse=True,
+            limit=10,
+        )
+        positions = await router.fetch_all(select(Visit.position))
+
+        assert [visit.position for visit in visits] == list(range(29, 19, -1))
+        assert sorted(positions) == list(range(30))
+
+    async def test_failed_shard_is_reported(self, router):
+        """Test that a failure on one shard names the shard."""
+
+        async def fail_on_b(session):
+            if session.info["shard"] == "shard_b":
+                raise RuntimeError("shard down")
+            return 1
+
+        with pytest.raises(DatabaseException) as exc_info:
+            await router.scatter_gather(fail_on_b)
+
+        assert list(exc_info.value.details["failed_shards"]) == ["shard_b"]
+
+    async def test_global_router(self, router, monkeypatch):
+        """Test the module-level router helpers."""
+        monkeypatch.setattr("vet_core.database.sharding._shard_router", None)
+        with pytest.raises(RuntimeError):
+            get_shard_router()
+
+        initialize_shard_router(router.managers)
+        clinic = _clinics(1)[0]
+
+        async with get_shard_session(clinic) as session:
+            assert session.info["shard"] == get_shard_router().shard_for(clinic)
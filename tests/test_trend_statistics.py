@@ -0,0 +1,163 @@
+"""Tests for the batched trend statistics used by SecurityMetricsAnalyzer."""
+
+import random
+import statistics
+from datetime import datetime, timedelta
+
+import pytest
+
+from vet_core.security import trend_statistics
+from vet_core.security.trend_statistics import (
+    aggregate_series,
+    compute_series_statistics,
+)
+
+numpy_required = pytest.mark.skipif(
+    not trend_statistics.NUMPY_AVAILABLE, reason="NumPy is not installed"
+)
+
+
+@pytest.fixture
+def series():
+    """Create metric series of different lengths, including edge cases."""
+    rng = random.Random(7)
+    return {
+        "rising": [float(i) * 2 + rng.random() for i in range(40)],
+        "noisy": [rng.gauss(10, 3) for _ in range(25)],
+        "flat": [5.0] * 10,
+        "single": [3.0],
+        "empty": [],
+        "spike": [1.0] * 30 + [50.0] + [1.0] * 30,
+    }
+
+
+class TestComputeSeriesStatistics:
+    """Test cases for compute_series_statistics."""
+
+    def test_matches_reference_statistics(self, series):
+        """Test the Python path against the statistics module."""
+        results = compute_series_statistics(series, window=5, use_numpy=False)
+
+        for name in ("rising", "noisy"):
+            values = series[name]
+            stats = results[name]
+            reference = statistics.linear_regression(range(len(values)), values)
+            correlation = statistics.correlation(range(len(values)), values)
+
+            assert stats.count == len(values)
+            assert stats.mean == pytest.approx(statistics.mean(values))
+            assert stats.variance == pytest.approx(statistics.variance(values))
+            assert stats.slope == pytest.approx(reference.slope)
+            assert stats.intercept == pytest.approx(reference.intercept)
+            assert stats.r_squared == pytest.approx(correlation**2)
+            assert stats.moving_average[-1] == pytest.approx(
+                statistics.mean(values[-5:])
+            )
+            assert stats.moving_average[1] == pytest.approx(statistics.mean(values[:2]))
+
+    def test_edge_cases(self, series):
+        """Test flat, single-point and empty series."""
+        results = compute_series_statistics(series, use_numpy=False)
+
+        assert results["flat"].slope == 0.0
+        assert results["flat"].r_squared == 0.0
+        assert results["flat"].z_scores == [0.0] * 10
+        assert results["single"].variance == 0.0
+        assert results["single"].mean == 3.0
+        assert results["empty"].count == 0
+        assert results["spike"].anomalies() == [30]
+
+    @numpy_required
+    def test_numpy_matches_python(self, series):
+        """Test the vectorized path gives the same results as the Python path."""
+        python = compute_series_statistics(series, window=4, use_numpy=False)
+        vectorized = compute_series_statistics(series, window=4, use_numpy=True)
+
+        assert set(vectorized) == set(python)
+        for name, expected in python.items():
+            actual = vectorized[name]
+            assert actual.count == expected.count
+            for attribute in (
+                "mean",
+                "minimum",
+                "maximum",
+                "variance",
+                "slope",
+                "intercept",
+                "r_squared",
+            ):
+                assert getattr(actual, attribute) == pytest.approx(
+                    getattr(expected, attribute), abs=1e-9
+                )
+            assert actual.moving_average == pytest.approx(expected.moving_average)
+            assert actual.z_scores == pytest.approx(expected.z_scores, abs=1e-9)
+            assert actual.anomalies() == expected.anomalies()
+
+    def test_falls_back_without_numpy(self, series, monkeypatch):
+        """Test the Python path is used when NumPy is missing."""
+        monkeypatch.setattr(trend_statistics, "NUMPY_AVAILABLE", False)
+        monkeypatch.setattr(trend_statistics, "NUMPY_MIN_POINTS", 0)
+
+        results = compute_series_statistics(series)
+        assert results["rising"].slope == pytest.approx(2.0, abs=0.1)
+
+        with pytest.raises(ImportError):
+            compute_series_statistics(series, use_numpy=True)
+
+    def test_rejects_invalid_window(self):
+        """Test the moving average window must be positive."""
+        with pytest.raises(ValueError):
+            compute_series_statistics({"values": [1.0, 2.0]}, window=0)
+
+
+class TestAggregateSeries:
+    """Test cases for aggregate_series."""
+
+    @pytest.fixture
+    def points(self):
+        """Create points every five hours from January into March."""
+        start = datetime(2030, 1, 1, 3, 15)
+        timestamps = [start + timedelta(hours=5 * i) for i in range(300)]
+        return timestamps, [float(i % 17) for i in range(300)]
+
+    def test_daily_weekly_and_monthly_periods(self, points):
+        """Test each period is averaged and stamped with its latest point."""
+        timestamps, values = points
+
+        daily = aggregate_series(timestamps, values, "daily", use_numpy=False)
+        weekly = aggregate_series(timestamps, values, "weekly", use_numpy=False)
+        monthly = aggregate_series(timestamps, values, "monthly", use_numpy=False)
+
+        assert daily[0] == (datetime(2030, 1, 1, 23, 15), 2.0, 5)
+        assert sum(count for _, _, count in weekly) == 300
+        assert [latest.month for latest, _, _ in monthly] == [1, 2, 3]
+        # 2030-01-06 is a Sunday, so the first week ends on it
+        assert weekly[0][0] == datetime(2030, 1, 6, 23, 15)
+
+    @numpy_required
+    @pytest.mark.parametrize("granularity", ["daily", "weekly", "monthly", "hourly"])
+    @pytest.mark.parametrize("shuffled", [False, True])
+    def test_numpy_matches_python(self, points, granularity, shuffled):
+        """Test vectorized grouping matches the Python grouping in any order."""
+        timestamps, values = points
+        if shuffled:
+            pairs = list(zip(timestamps, values))
+            random.Random(3).shuffle(pairs)
+            timestamps, values = map(list, zip(*pairs))
+
+        python = aggregate_series(timestamps, values, granularity, use_numpy=False)
+        vectorized = aggregate_series(timestamps, values, granularity, use_numpy=True)
+
+        assert [latest for latest, _, _ in vectorized] == [
+            latest for latest, _, _ in python
+        ]
+        assert [mean for _, mean, _ in vectorized] == pytest.approx(
+            [mean for _, mean, _ in python]
+        )
+        assert [count for _, _, count in vectorized] == [
+            count for _, _, count in python
+        ]
+
+    def test_empty(self):
+        """Test aggregating no points."""
+        assert aggregate_series([], []) == []
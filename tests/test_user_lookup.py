@@ -0,0 +1,303 @@
+"""
+Tests for the user lookup cache.
+
+This module tests lookups of user snapshots by email and ID, negative
+caching of unknown emails, eviction when users change, and coalescing of
+concurrent lookups of a cold key, with a local SQLite database so committed
+rows stay out of the shared test database.
+"""
+
+import asyncio
+import dataclasses
+
+import pytest
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from vet_core.database import SessionManager
+from vet_core.models import User, UserRole, UserStatus
+from vet_core.repositories import (
+    UserLookupCache,
+    UserSnapshot,
+    get_user_lookup_cache,
+    initialize_user_lookup_cache,
+    user_lookup,
+)
+
+
+class Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    """Create a session manager over a local database with a users table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(User.metadata.create_all, tables=[User.__table__])
+    yield SessionManager(engine)
+    await engine.dispose()
+
+
+@pytest.fixture
+def clock():
+    """Provide a manually advanced clock."""
+    return Clock()
+
+
+@pytest.fixture
+def cache(clock):
+    """Create a lookup cache evicting users written by any session."""
+    cache = UserLookupCache(ttl=60, negative_ttl=10, clock=clock)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def statements(manager):
+    """Record the statements sent to the database."""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(manager.engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(manager.engine.sync_engine, "before_cursor_execute", record)
+
+
+async def _add_user(manager, email="owner@example.com", **kwargs):
+    """Store a user and return its ID."""
+    async with manager.get_transaction() as session:
+        user = User(
+            clerk_user_id=f"clerk_{email}",
+            email=email,
+            first_name="Pat",
+            last_name="Owner",
+            status=UserStatus.ACTIVE,
+            **kwargs,
+        )
+        session.add(user)
+    return user.id
+
+
+async def _by_email(manager, cache, email):
+    """Look a user up by email in a new session."""
+    async with manager.get_session() as session:
+        return await cache.get_by_email(session, email)
+
+
+class TestUserLookupCache:
+    """Test cases for UserLookupCache."""
+
+    async def test_snapshots_by_email_and_id(self, manager, cache, statements):
+        """Test that one email lookup serves later lookups by email and ID."""
+        user_id = await _add_user(manager, role=UserRole.VETERINARIAN)
+        statements.clear()
+
+        user = await _by_email(manager, cache, "  Owner@Example.COM ")
+        async with manager.get_session() as session:
+            assert await cache.get_by_id(session, user_id) is user
+        assert await _by_email(manager, cache, "owner@example.com") is user
+
+        assert len(statements) == 1
+        assert isinstance(user, UserSnapshot)
+        assert (user.id, user.role, user.is_active) == (
+            user_id,
+            UserRole.VETERINARIAN,
+            True,
+        )
+        assert user.can_access_role(UserRole.VET_TECH)
+        assert not user.can_access_role(UserRole.CLINIC_ADMIN)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            user.role = UserRole.PLATFORM_ADMIN
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (2, 1, 2)
+
+    async def test_unknown_emails_are_cached(self, manager, cache, clock, statements):
+        """Test that unknown emails are cached until the negative TTL."""
+        assert await _by_email(manager, cache, "new@example.com") is None
+        assert await _by_email(manager, cache, "new@example.com") is None
+        assert len(statements) == 1
+        assert cache.stats().negative_hits == 1
+
+        clock.now += 10
+        assert await _by_email(manager, cache, "new@example.com") is None
+        assert len(statements) == 2
+
+    async def test_new_user_evicts_unknown_email(self, manager, cache):
+        """Test that committing a user with a cached unknown email evicts it."""
+        assert await _by_email(manager, cache, "new@example.com") is None
+
+        user_id = await _add_user(manager, "new@example.com")
+
+        assert (await _by_email(manager, cache, "new@example.com")).id == user_id
+
+    @pytest.mark.parametrize(
+        "change, status",
+        [
+            (lambda user: user.suspend(), UserStatus.SUSPENDED),
+            (lambda user: user.deactivate(), UserStatus.INACTIVE),
+            (lambda user: user.update_profile(first_name="Sam"), UserStatus.ACTIVE),
+        ],
+    )
+    async def test_changes_evict_user(self, manager, cache, change, status):
+        """Test that changing a user evicts it at once and on commit."""
+        user_id = await _add_user(manager)
+        await _by_email(manager, cache, "owner@example.com")
+
+        async with manager.get_transaction() as session:
+            user = await session.get(User, user_id)
+            change(user)
+            assert cache.stats().size == 0
+            # Lookups in the writing transaction are not cached
+            assert (await cache.get_by_id(session, user_id)).status == status
+            assert cache.stats().size == 0
+            await _by_email(manager, cache, "owner@example.com")
+
+        snapshot = await _by_email(manager, cache, "owner@example.com")
+        assert snapshot.status == status
+        assert snapshot.can_access_role(UserRole.PET_OWNER) is (
+            status == UserStatus.ACTIVE
+        )
+
+    async def test_email_change_evicts_both_emails(self, manager, cache):
+        """Test that a changed email evicts the old and the new address."""
+        user_id = await _add_user(manager)
+        await _by_email(manager, cache, "owner@example.com")
+        assert await _by_email(manager, cache, "moved@example.com") is None
+
+        async with manager.get_transaction() as session:
+            user = await session.get(User, user_id)
+            user.email = "moved@example.com"
+
+        assert await _by_email(manager, cache, "owner@example.com") is None
+        assert (await _by_email(manager, cache, "moved@example.com")).id == user_id
+
+    async def test_bulk_update_and_soft_delete(self, manager, cache):
+        """Test that bulk updates clear the cache and deleted users are unknown."""
+        user_id = await _add_user(manager)
+        await _by_email(manager, cache, "owner@example.com")
+
+        async with manager.get_transaction() as session:
+            await session.execute(
+                update(User).values(status=UserStatus.SUSPENDED, is_deleted=True)
+            )
+
+        assert cache.stats().size == 0
+        assert await _by_email(manager, cache, "owner@example.com") is None
+        async with manager.get_session() as session:
+            assert await cache.get_by_id(session, user_id) is None
+
+    async def test_cold_key_is_fetched_once(self, manager, cache, statements):
+        """Test that concurrent lookups of a cold key share one query."""
+        user_id = await _add_user(manager)
+        statements.clear()
+
+        users = await asyncio.gather(
+            *(_by_email(manager, cache, "owner@example.com") for _ in range(10))
+        )
+
+        assert len(statements) == 1
+        assert {user.id for user in users} == {user_id}
+        stats = cache.stats()
+        assert (stats.misses, stats.coalesced) == (1, 9)
+
+    async def test_failed_fetch_reaches_waiters(self, manager, cache):
+        """Test that a failed query is raised to every waiting lookup."""
+        await manager.engine.dispose()
+        async with manager.engine.begin() as conn:
+            await conn.exec_driver_sql("DROP TABLE users")
+
+        results = await asyncio.gather(
+            *(_by_email(manager, cache, "owner@example.com") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, Exception) for result in results)
+        assert cache.stats().size == 0
+
+    async def test_cancelled_fetch_is_retried_by_waiters(
+        self, manager, cache, monkeypatch
+    ):
+        """Test that cancelling the querying lookup leaves its waiters to query."""
+        user_id = await _add_user(manager)
+        fetch = user_lookup._fetch
+        started = asyncio.Event()
+        calls = []
+
+        async def blocking_fetch(session, condition):
+            calls.append(condition)
+            if len(calls) == 1:
+                started.set()
+                await asyncio.Event().wait()
+            return await fetch(session, condition)
+
+        monkeypatch.setattr(user_lookup, "_fetch", blocking_fetch)
+        leader = asyncio.create_task(_by_email(manager, cache, "owner@example.com"))
+        await started.wait()
+        waiters = [
+            asyncio.create_task(_by_email(manager, cache, "owner@example.com"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        users = await asyncio.gather(*waiters)
+
+        assert leader.cancelled()
+        assert {user.id for user in users} == {user_id}
+        assert len(calls) == 2
+
+    async def test_uncommitted_user_not_shared_with_waiters(
+        self, manager, cache, monkeypatch
+    ):
+        """Test that waiters do not get a row read in a writing transaction."""
+        user_id = await _add_user(manager)
+        fetch = user_lookup._fetch
+        release = asyncio.Event()
+        calls = []
+
+        async def blocking_fetch(session, condition):
+            calls.append(condition)
+            if len(calls) == 1:
+                await release.wait()
+            return await fetch(session, condition)
+
+        monkeypatch.setattr(user_lookup, "_fetch", blocking_fetch)
+        async with manager.get_transaction() as session:
+            user = await session.get(User, user_id)
+            user.suspend()
+            await session.flush()
+
+            leader = asyncio.create_task(cache.get_by_id(session, user_id))
+            await asyncio.sleep(0)
+            async with manager.get_session() as other:
+                waiter = asyncio.create_task(cache.get_by_id(other, user_id))
+                await asyncio.sleep(0)
+                release.set()
+                assert (await leader).status == UserStatus.SUSPENDED
+                assert (await waiter).status == UserStatus.ACTIVE
+            await session.rollback()
+
+        assert len(calls) == 2
+        assert cache.stats().coalesced == 1
+
+    def test_global_cache(self, monkeypatch):
+        """Test the module-level cache helpers."""
+        monkeypatch.setattr(
+            "vet_core.repositories.user_lookup._user_lookup_cache", None
+        )
+        with pytest.raises(RuntimeError):
+            get_user_lookup_cache()
+
+        cache = initialize_user_lookup_cache(ttl=5)
+        assert get_user_lookup_cache() is cache
+        assert initialize_user_lookup_cache() is not cache
+        get_user_lookup_cache().close()
@@ -0,0 +1,225 @@
+"""
+Tests for the Veterinarian repository.
+
+This module tests compiling VeterinarianSearchFilters into JSONB containment
+predicates and paginating veterinarians ranked by rating.
+"""
+
+import uuid
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from vet_core.database import encode_cursor
+from vet_core.exceptions import ValidationException
+from vet_core.models import Clinic, User, UserRole, Veterinarian
+from vet_core.models.veterinarian import EmploymentType, VeterinarianStatus
+from vet_core.repositories import VeterinarianRepository
+from vet_core.schemas.veterinarian import VeterinarianSearchFilters
+
+
+@pytest.fixture
+async def clinic(async_session):
+    """Create the clinic the veterinarians work at."""
+    clinic = Clinic(
+        name="Main Street Vet",
+        phone_number="555-123-4567",
+        address_line1="1 Main Street",
+        city="Springfield",
+        state="IL",
+        postal_code="62701",
+    )
+    async_session.add(clinic)
+    await async_session.flush()
+    return clinic
+
+
+async def _veterinarian(session, clinic, license_number: str, **kwargs):
+    """Create a veterinarian, and the user it belongs to, at a clinic."""
+    user = User(
+        clerk_user_id=f"user_{license_number}",
+        email=f"{license_number.lower()}@example.com",
+        first_name="Test",
+        last_name="Vet",
+        role=UserRole.VETERINARIAN,
+    )
+    session.add(user)
+    await session.flush()
+
+    veterinarian = Veterinarian(
+        user_id=user.id,
+        clinic_id=clinic.id,
+        license_number=license_number,
+        license_state="IL",
+        **kwargs,
+    )
+    session.add(veterinarian)
+    return veterinarian
+
+
+@pytest.fixture
+async def veterinarians(async_session, clinic):
+    """Create veterinarians with varied ratings and expertise."""
+    specs = [
+        ("4.90", 120, ["surgery", "cardiology"], ["canine", "feline"], ["en"]),
+        ("4.90", 80, ["surgery"], ["canine"], ["en", "es"]),
+        ("4.50", 300, ["dermatology"], ["feline"], ["fr"]),
+        ("3.20", 10, ["surgery", "cardiology"], ["equine"], ["es"]),
+    ]
+    veterinarians = []
+    for index, (rating, reviews, specializations, species, languages) in enumerate(
+        specs
+    ):
+        veterinarians.append(
+            await _veterinarian(
+                async_session,
+                clinic,
+                f"VET{index:04d}",
+                rating=Decimal(rating),
+                total_reviews=reviews,
+                years_of_experience=index * 5,
+                specializations=specializations,
+                species_expertise=species,
+                languages_spoken=languages,
+            )
+        )
+
+    await _veterinarian(
+        async_session,
+        clinic,
+        "VET9998",
+        rating=Decimal("5.00"),
+        status=VeterinarianStatus.INACTIVE,
+    )
+    deleted = await _veterinarian(
+        async_session, clinic, "VET9999", rating=Decimal("5.00")
+    )
+    deleted.soft_delete()
+
+    await async_session.flush()
+    return veterinarians
+
+
+def _licenses(page):
+    """Return the license numbers of a page of veterinarians."""
+    return [veterinarian.license_number for veterinarian in page.items]
+
+
+class TestVeterinarianRepository:
+    """Test cases for VeterinarianRepository.search."""
+
+    async def test_search_ranks_by_rating_and_reviews(
+        self, async_session, veterinarians
+    ):
+        """Test results are ordered by rating, then review count."""
+        page = await VeterinarianRepository(async_session).search(
+            VeterinarianSearchFilters()
+        )
+
+        assert _licenses(page) == ["VET0000", "VET0001", "VET0002", "VET0003"]
+        assert page.has_more is False
+
+    async def test_search_requires_all_specializations(
+        self, async_session, veterinarians
+    ):
+        """Test that every requested specialization must be present."""
+        page = await VeterinarianRepository(async_session).search(
+            VeterinarianSearchFilters(specializations=["surgery", "cardiology"])
+        )
+
+        assert _licenses(page) == ["VET0000", "VET0003"]
+
+    async def test_search_matches_any_language(self, async_session, veterinarians):
+        """Test that speaking any requested language is enough."""
+        page = await VeterinarianRepository(async_session).search(
+            VeterinarianSearchFilters(languages_spoken=["es", "fr"])
+        )
+
+        assert _licenses(page) == ["VET0001", "VET0002", "VET0003"]
+
+    async def test_search_by_scalar_filters(self, async_session, veterinarians, clinic):
+        """Test rating, experience, clinic and employment filters."""
+        repository = VeterinarianRepository(async_session)
+
+        page = await repository.search(
+            VeterinarianSearchFilters(min_rating=4.5, min_experience_years=5)
+        )
+        assert _licenses(page) == ["VET0001", "VET0002"]
+
+        page = await repository.search(
+            VeterinarianSearchFilters(
+                clinic_id=clinic.id,
+                employment_type=EmploymentType.FULL_TIME,
+                species_expertise=["feline"],
+            )
+        )
+        assert _licenses(page) == ["VET0000", "VET0002"]
+
+        page = await repository.search(
+            VeterinarianSearchFilters(clinic_id=uuid.uuid4())
+        )
+        assert page.items == []
+
+    async def test_keyset_pagination_with_rating_ties(
+        self, async_session, veterinarians
+    ):
+        """Test paging through tied ratings without gaps or repeats."""
+        repository = VeterinarianRepository(async_session)
+        filters = VeterinarianSearchFilters()
+
+        first = await repository.search(filters, limit=1)
+        second = await repository.search(filters, limit=1, after=first.next_cursor)
+        rest = await repository.search(filters, limit=5, after=second.next_cursor)
+
+        assert _licenses(first) == ["VET0000"]
+        assert _licenses(second) == ["VET0001"]
+        assert _licenses(rest) == ["VET0002", "VET0003"]
+        assert rest.has_more is False
+
+    async def test_iter_search_streams_all_pages(self, async_session, veterinarians):
+        """Test streaming every match across several pages."""
+        repository = VeterinarianRepository(async_session)
+
+        licenses = [
+            veterinarian.license_number
+            async for veterinarian in repository.iter_search(
+                VeterinarianSearchFilters(), page_size=3
+            )
+        ]
+
+        assert licenses == ["VET0000", "VET0001", "VET0002", "VET0003"]
+
+    async def test_invalid_cursor(self, async_session):
+        """Test that a cursor from another query is rejected."""
+        with pytest.raises(ValidationException):
+            await VeterinarianRepository(async_session).search(
+                VeterinarianSearchFilters(), after=encode_cursor(["Name", "id"])
+            )
+
+    async def test_tampered_cursor(self, async_session):
+        """Test that a cursor with a malformed rating is rejected."""
+        with pytest.raises(ValidationException):
+            await VeterinarianRepository(async_session).search(
+                VeterinarianSearchFilters(), after=encode_cursor(["abc", 1, "id"])
+            )
+
+    def test_postgresql_query_uses_jsonb_operators(self):
+        """Test the PostgreSQL query uses @>, ?| and the rating index order."""
+
+        class _PostgresRepository(VeterinarianRepository):
+            dialect_name = "postgresql"
+
+        stmt = _PostgresRepository(None).build_search_query(
+            VeterinarianSearchFilters(
+                specializations=["surgery"], languages_spoken=["en", "es"]
+            )
+        )
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "veterinarians.specializations @>" in sql
+        assert "veterinarians.languages_spoken ?|" in sql
+        assert (
+            "ORDER BY veterinarians.rating DESC, veterinarians.total_reviews DESC"
+            in sql
+        )